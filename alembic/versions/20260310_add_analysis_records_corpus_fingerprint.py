@@ -0,0 +1,32 @@
+"""Add corpus_fingerprint to analysis_records (skip unchanged re-analysis).
+
+Revision ID: 20260310_analysis_fingerprint
+Revises: 20260309_ore_draft_version
+Create Date: 2026-03-10
+
+Additive only: corpus_fingerprint (String(64), nullable) stores the SHA-256 of the
+analysis inputs (signal content hashes, pack config checksum, prompt templates).
+Existing rows stay NULL and are re-analyzed on their next scan.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20260310_analysis_fingerprint"
+down_revision: str | None = "20260309_ore_draft_version"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "analysis_records",
+        sa.Column("corpus_fingerprint", sa.String(64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("analysis_records", "corpus_fingerprint")
@@ -0,0 +1,47 @@
+"""add score_dirty_companies table (incremental rescoring queue)
+
+Revision ID: 20260311_score_dirty_companies
+Revises: 20260310_analysis_fingerprint
+Create Date: 2026-03-11
+
+One row per company whose scoring inputs changed (new events, derived instances,
+outreach, watchlist). enqueued_at is bumped on every change; incremental score
+runs rescore companies enqueued since the pack's previous score run.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20260311_score_dirty_companies"
+down_revision: str | None = "20260310_analysis_fingerprint"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "score_dirty_companies",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("reason", sa.String(length=32), nullable=False),
+        sa.Column(
+            "enqueued_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id"),
+    )
+    op.create_index(
+        "ix_score_dirty_companies_enqueued_at",
+        "score_dirty_companies",
+        ["enqueued_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_score_dirty_companies_enqueued_at", table_name="score_dirty_companies")
+    op.drop_table("score_dirty_companies")
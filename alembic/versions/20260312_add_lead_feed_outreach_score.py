@@ -0,0 +1,62 @@
+"""add outreach_score, esl_score, cadence_blocked to lead_feed with covering index
+
+Revision ID: 20260312_lead_feed_outreach_score
+Revises: 20260311_score_dirty_companies
+Create Date: 2026-03-12
+
+Materializes OutreachScore (round(TRS x ESL)) and the ESL inputs the lead list
+filters on, so briefing / weekly review / companies top read one index range
+(workspace_id, pack_id, as_of, outreach_score DESC, entity_id DESC) instead of
+re-joining engagement_snapshots and filtering in Python. Existing rows are
+backfilled from the engagement snapshot of their as_of.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20260312_lead_feed_outreach_score"
+down_revision: str | None = "20260311_score_dirty_companies"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("lead_feed", sa.Column("outreach_score", sa.Integer(), nullable=True))
+    op.add_column("lead_feed", sa.Column("esl_score", sa.Float(), nullable=True))
+    op.add_column(
+        "lead_feed",
+        sa.Column("cadence_blocked", sa.Boolean(), server_default=sa.text("false"), nullable=False),
+    )
+    op.execute(
+        """
+        UPDATE lead_feed lf
+        SET outreach_score = coalesce(
+                es.outreach_score,
+                round((lf.composite_score * es.esl_score)::double precision)::integer
+            ),
+            esl_score = es.esl_score,
+            cadence_blocked = es.cadence_blocked
+        FROM engagement_snapshots es
+        WHERE es.company_id = lf.entity_id
+          AND es.as_of = lf.as_of
+          AND es.pack_id = lf.pack_id
+        """
+    )
+    op.execute("UPDATE lead_feed SET outreach_score = composite_score WHERE outreach_score IS NULL")
+    op.create_index(
+        "ix_lead_feed_workspace_pack_as_of_outreach",
+        "lead_feed",
+        ["workspace_id", "pack_id", "as_of", "outreach_score", "entity_id"],
+        postgresql_ops={"outreach_score": "DESC", "entity_id": "DESC"},
+        postgresql_include=["composite_score", "cadence_blocked"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_lead_feed_workspace_pack_as_of_outreach", table_name="lead_feed")
+    op.drop_column("lead_feed", "cadence_blocked")
+    op.drop_column("lead_feed", "esl_score")
+    op.drop_column("lead_feed", "outreach_score")
@@ -0,0 +1,102 @@
+"""add company_display_scores table maintained from readiness_snapshots
+
+Revision ID: 20260313_company_display_scores
+Revises: 20260312_lead_feed_outreach_score
+Create Date: 2026-03-13
+
+Latest readiness composite per (company, pack), so the companies list can sort
+and keyset-paginate by display score in SQL. Statement-level triggers with
+transition tables recompute the affected (company, pack) pairs after every
+insert, update or delete on readiness_snapshots, covering all snapshot writers.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20260313_company_display_scores"
+down_revision: str | None = "20260312_lead_feed_outreach_score"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_FUNCTION_NAME = "refresh_company_display_scores"
+# Transition tables require one trigger per event. Updates never move a snapshot
+# to another company, and pack deletion cascades here, so NEW rows suffice.
+_TRIGGERS = {
+    "tr_readiness_snapshots_display_insert": ("INSERT", "NEW"),
+    "tr_readiness_snapshots_display_update": ("UPDATE", "NEW"),
+    "tr_readiness_snapshots_display_delete": ("DELETE", "OLD"),
+}
+
+# Latest snapshot per (company, pack) among the given pairs; as_of ties cannot
+# occur (readiness_snapshots is unique on company_id, as_of).
+_LATEST_SELECT = """
+    SELECT DISTINCT ON (r.company_id, r.pack_id) r.company_id, r.pack_id, r.composite, r.as_of
+    FROM readiness_snapshots r
+    {join}
+    WHERE r.pack_id IS NOT NULL
+    ORDER BY r.company_id, r.pack_id, r.as_of DESC
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "company_display_scores",
+        sa.Column("company_id", sa.Integer(), nullable=False),
+        sa.Column("pack_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("score", sa.Integer(), nullable=False),
+        sa.Column("as_of", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(["company_id"], ["companies.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["pack_id"], ["signal_packs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("company_id", "pack_id"),
+    )
+    op.create_index(
+        "ix_company_display_scores_pack_score",
+        "company_display_scores",
+        ["pack_id", "score", "company_id"],
+    )
+    op.execute(
+        "INSERT INTO company_display_scores (company_id, pack_id, score, as_of)"
+        + _LATEST_SELECT.format(join="")
+    )
+    latest_for_changed = _LATEST_SELECT.format(
+        join="JOIN (SELECT DISTINCT company_id, pack_id FROM changed_rows) c "
+        "USING (company_id, pack_id)"
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION {_FUNCTION_NAME}()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            DELETE FROM company_display_scores d
+            USING (SELECT DISTINCT company_id, pack_id FROM changed_rows) c
+            WHERE d.company_id = c.company_id AND d.pack_id = c.pack_id;
+            INSERT INTO company_display_scores (company_id, pack_id, score, as_of)
+            {latest_for_changed}
+            ON CONFLICT (company_id, pack_id) DO UPDATE
+            SET score = EXCLUDED.score, as_of = EXCLUDED.as_of;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    for name, (event, transition) in _TRIGGERS.items():
+        op.execute(
+            f"""
+            CREATE TRIGGER {name}
+            AFTER {event} ON readiness_snapshots
+            REFERENCING {transition} TABLE AS changed_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {_FUNCTION_NAME}();
+            """
+        )
+
+
+def downgrade() -> None:
+    for name in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON readiness_snapshots;")
+    op.execute(f"DROP FUNCTION IF EXISTS {_FUNCTION_NAME}();")
+    op.drop_index("ix_company_display_scores_pack_score", table_name="company_display_scores")
+    op.drop_table("company_display_scores")
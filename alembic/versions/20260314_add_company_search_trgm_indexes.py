@@ -0,0 +1,54 @@
+"""add pg_trgm GIN indexes for company search
+
+Revision ID: 20260314_company_search_trgm
+Revises: 20260313_company_display_scores
+Create Date: 2026-03-14
+
+Trigram indexes on lower(name), lower(domain), lower(founder_name) and
+lower(notes) serve the '%term%' and similarity predicates in
+app/services/company_search.py. Skipped (with a warning) when the server does
+not ship pg_trgm; search then falls back to unindexed substring matching.
+"""
+
+import logging
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20260314_company_search_trgm"
+down_revision: str | None = "20260313_company_display_scores"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+_INDEXES = {
+    "ix_companies_name_trgm": "name",
+    "ix_companies_domain_trgm": "domain",
+    "ix_companies_founder_name_trgm": "founder_name",
+    "ix_companies_notes_trgm": "notes",
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    available = conn.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if not available:
+        logger.warning("pg_trgm is not available; company search indexes not created")
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in _INDEXES.items():
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON companies "
+            f"USING gin (lower({column}) gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    # The extension is left installed: other objects may depend on it
+    for name in _INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
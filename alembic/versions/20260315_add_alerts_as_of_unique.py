@@ -0,0 +1,53 @@
+"""add alerts.as_of with unique (company_id, alert_type, as_of)
+
+Revision ID: 20260315_alerts_as_of_unique
+Revises: 20260314_company_search_trgm
+Create Date: 2026-03-15
+
+Replaces the JSON-path duplicate check (payload->>'as_of') in the readiness
+alert scan with an indexed column. Backfills as_of from payload, keeps the
+oldest alert per (company_id, alert_type, as_of), then adds the unique
+constraint the scan's ON CONFLICT DO NOTHING relies on. Alerts without a date
+(as_of NULL) are not constrained.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20260315_alerts_as_of_unique"
+down_revision: str | None = "20260314_company_search_trgm"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("alerts", sa.Column("as_of", sa.Date(), nullable=True))
+    op.execute(
+        """
+        UPDATE alerts SET as_of = (payload->>'as_of')::date
+        WHERE payload->>'as_of' ~ '^\\d{4}-\\d{2}-\\d{2}$'
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM alerts a
+        USING alerts b
+        WHERE a.company_id = b.company_id
+          AND a.alert_type = b.alert_type
+          AND a.as_of = b.as_of
+          AND a.id > b.id
+        """
+    )
+    op.create_unique_constraint(
+        "uq_alerts_company_type_as_of",
+        "alerts",
+        ["company_id", "alert_type", "as_of"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_alerts_company_type_as_of", "alerts", type_="unique")
+    op.drop_column("alerts", "as_of")
@@ -0,0 +1,85 @@
+"""add pipeline_jobs (durable job queue for the pipeline worker)
+
+Revision ID: 20260316_pipeline_jobs
+Revises: 20260315_alerts_as_of_unique
+Create Date: 2026-03-16
+
+Queue of STAGE_REGISTRY stages claimed with SELECT ... FOR UPDATE SKIP LOCKED
+by app.pipeline.worker, so scans and ingest no longer run inside web requests.
+Partial indexes cover the two claim predicates (queued and due; running with a
+lapsed lease) and enforce one active job per (job_type, dedupe_key).
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20260316_pipeline_jobs"
+down_revision: str | None = "20260315_alerts_as_of_unique"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "pipeline_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_type", sa.String(length=64), nullable=False),
+        sa.Column("status", sa.String(length=16), server_default="queued", nullable=False),
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("pack_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column(
+            "params",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column("idempotency_key", sa.String(length=255), nullable=True),
+        sa.Column("dedupe_key", sa.String(length=255), nullable=True),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("max_attempts", sa.Integer(), server_default="3", nullable=False),
+        sa.Column(
+            "run_after", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("locked_by", sa.String(length=128), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("result", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(["workspace_id"], ["workspaces.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["pack_id"], ["signal_packs.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_pipeline_jobs_queued_run_after",
+        "pipeline_jobs",
+        ["run_after", "id"],
+        postgresql_where=sa.text("status = 'queued'"),
+    )
+    op.create_index(
+        "ix_pipeline_jobs_running_lease",
+        "pipeline_jobs",
+        ["lease_expires_at"],
+        postgresql_where=sa.text("status = 'running'"),
+    )
+    op.create_index(
+        "uq_pipeline_jobs_active_dedupe_key",
+        "pipeline_jobs",
+        ["job_type", "dedupe_key"],
+        unique=True,
+        postgresql_where=sa.text("status IN ('queued', 'running') AND dedupe_key IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_pipeline_jobs_active_dedupe_key", table_name="pipeline_jobs")
+    op.drop_index("ix_pipeline_jobs_running_lease", table_name="pipeline_jobs")
+    op.drop_index("ix_pipeline_jobs_queued_run_after", table_name="pipeline_jobs")
+    op.drop_table("pipeline_jobs")
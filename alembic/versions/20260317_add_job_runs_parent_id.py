@@ -0,0 +1,40 @@
+"""add job_runs.parent_id for per-node runs of pipelined jobs
+
+Revision ID: 20260317_job_runs_parent_id
+Revises: 20260316_pipeline_jobs
+Create Date: 2026-03-17
+
+The pipelined daily aggregation (app.pipeline.dag) records each DAG node
+(adapter fetch, store, derive and score partitions) as a child JobRun of the
+daily_aggregation run, with its own timing and status.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20260317_job_runs_parent_id"
+down_revision: str | None = "20260316_pipeline_jobs"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("job_runs", sa.Column("parent_id", sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        "fk_job_runs_parent_id",
+        "job_runs",
+        "job_runs",
+        ["parent_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+    op.create_index("ix_job_runs_parent_id", "job_runs", ["parent_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_runs_parent_id", table_name="job_runs")
+    op.drop_constraint("fk_job_runs_parent_id", "job_runs", type_="foreignkey")
+    op.drop_column("job_runs", "parent_id")
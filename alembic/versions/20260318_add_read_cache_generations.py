@@ -0,0 +1,41 @@
+"""add read_cache_generations table (read API response cache invalidation)
+
+Revision ID: 20260318_read_cache_generations
+Revises: 20260317_job_runs_parent_id
+Create Date: 2026-03-18
+
+/api/companies/top and /api/briefing/daily cache responses per process and
+send ETags keyed by a generation counter. Score, lead_feed update, briefing,
+outreach and company writes bump the counter in the same transaction, so every
+process sees the change on its next request.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20260318_read_cache_generations"
+down_revision: str | None = "20260317_job_runs_parent_id"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "read_cache_generations",
+        sa.Column("scope", sa.String(length=32), nullable=False),
+        sa.Column("generation", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("scope"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("read_cache_generations")
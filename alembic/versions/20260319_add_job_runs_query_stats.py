@@ -0,0 +1,31 @@
+"""add job_runs.query_count and db_time_ms
+
+Revision ID: 20260319_job_runs_query_stats
+Revises: 20260318_read_cache_generations
+Create Date: 2026-03-19
+
+SQL statements issued and cumulative DB time per job run (app.db.profiling),
+recorded by run_stage and for each pipelined DAG node, so N+1 regressions in
+stage code show up as a jump in query_count between runs.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "20260319_job_runs_query_stats"
+down_revision: str | None = "20260318_read_cache_generations"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("job_runs", sa.Column("query_count", sa.Integer(), nullable=True))
+    op.add_column("job_runs", sa.Column("db_time_ms", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("job_runs", "db_time_ms")
+    op.drop_column("job_runs", "query_count")
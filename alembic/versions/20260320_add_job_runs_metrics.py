@@ -0,0 +1,33 @@
+"""add job_runs.metrics (per-span timing breakdown)
+
+Revision ID: 20260320_job_runs_metrics
+Revises: 20260319_job_runs_query_stats
+Create Date: 2026-03-20
+
+JSONB breakdown of a run by job_span (app.services.job_metrics): count, total,
+max, statements and a duration histogram per span, and the slowest companies.
+Written by run_stage and for each pipelined DAG node.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20260320_job_runs_metrics"
+down_revision: str | None = "20260319_job_runs_query_stats"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_runs",
+        sa.Column("metrics", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("job_runs", "metrics")
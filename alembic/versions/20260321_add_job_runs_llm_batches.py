@@ -0,0 +1,33 @@
+"""add job_runs.llm_batches (submitted LLM batches, for resuming)
+
+Revision ID: 20260321_job_runs_llm_batches
+Revises: 20260320_job_runs_metrics
+Create Date: 2026-03-21
+
+JSONB list of the LLM batches a run submitted (app.llm.batch): batch id, a hash
+per request and whether the results were collected. A briefing run restarted
+after a crash resumes an uncollected batch instead of submitting it again.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "20260321_job_runs_llm_batches"
+down_revision: str | None = "20260320_job_runs_metrics"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "job_runs",
+        sa.Column("llm_batches", postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("job_runs", "llm_batches")
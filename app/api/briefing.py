@@ -4,12 +4,14 @@ from __future__ import annotations
 
 from datetime import date
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.briefing_views import get_briefing_data
-from app.api.deps import get_db, require_auth, validate_uuid_param_or_422
+from app.api.briefing_views import get_briefing_data_async
+from app.api.caching import cached_json_response, read_cache_state
+from app.api.deps import require_auth_async, validate_uuid_param_or_422
 from app.config import get_settings
+from app.db.session import get_async_db
 from app.schemas.briefing import (
     BriefingItemRead,
     BriefingResponse,
@@ -49,8 +51,13 @@ def _item_to_read(item, display_scores: dict, esl_by_company: dict) -> BriefingI
     )
 
 
-@router.get("/daily", response_model=BriefingResponse)
-def api_briefing_daily(
+@router.get(
+    "/daily",
+    response_model=BriefingResponse,
+    responses={304: {"description": "Not modified since the ETag in If-None-Match"}},
+)
+async def api_briefing_daily(
+    request: Request,
     date_param: date | None = Query(
         None,
         alias="date",
@@ -64,9 +71,9 @@ def api_briefing_daily(
         None,
         description="Workspace ID (when multi_workspace_enabled). Default workspace if omitted.",
     ),
-    db: Session = Depends(get_db),
-    _auth: None = Depends(require_auth),
-) -> BriefingResponse:
+    db: AsyncSession = Depends(get_async_db),
+    _auth: None = Depends(require_auth_async),
+) -> Response:
     """Get daily briefing as JSON (Issue #110).
 
     Returns briefing items and emerging companies with ESL score, outreach
@@ -74,14 +81,28 @@ def api_briefing_daily(
 
     When multi_workspace_enabled, pass workspace_id to scope emerging companies.
     Invalid workspace_id returns 422.
+
+    Responses are cached and carry an ETag (app.api.caching); If-None-Match
+    with the current ETag returns 304.
     """
     briefing_date = date_param if date_param is not None else date.today()
     settings = get_settings()
     ws_id = workspace_id if settings.multi_workspace_enabled else None
     if ws_id is not None:
         validate_uuid_param_or_422(ws_id, "workspace_id")
-    data = get_briefing_data(db, briefing_date, sort, workspace_id=ws_id)
 
+    generation, pack_id = await db.run_sync(read_cache_state, ws_id)
+
+    async def build() -> BriefingResponse:
+        data = await get_briefing_data_async(db, briefing_date, sort, workspace_id=ws_id)
+        return _briefing_response(briefing_date, data)
+
+    key = ("briefing_daily", ws_id, str(pack_id), briefing_date.isoformat(), sort)
+    return await cached_json_response(request, key, generation, build)
+
+
+def _briefing_response(briefing_date: date, data: dict) -> BriefingResponse:
+    """Build BriefingResponse from get_briefing_data output."""
     items = [
         _item_to_read(
             item,
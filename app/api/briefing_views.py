@@ -9,6 +9,7 @@ from pathlib import Path
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
 from app.api.deps import get_db, require_ui_auth, validate_uuid_param_or_422
@@ -82,7 +83,8 @@ def briefing_generate(
             )
             if workspace_id is not None:
                 validate_uuid_param_or_422(workspace_id, "workspace_id")
-        generate_briefing(db, workspace_id=workspace_id)
+        # Interactive: never wait on the batch API here (BRIEFING_LLM_BATCH is for the worker)
+        generate_briefing(db, workspace_id=workspace_id, llm_batch=False)
         # Always show briefing page; partial failures are shown via job_has_failures banner (issue #32)
         redirect_url = "/briefing"
         if workspace_id:
@@ -278,6 +280,22 @@ def get_briefing_data(
     }
 
 
+async def get_briefing_data_async(
+    db: AsyncSession,
+    briefing_date: date,
+    sort: str = _SORT_SCORE,
+    workspace_id: str | None = None,
+) -> dict:
+    """get_briefing_data on an AsyncSession.
+
+    Items are returned with company and analysis loaded, so they can be read
+    after the await.
+    """
+    return await db.run_sync(
+        lambda session: get_briefing_data(session, briefing_date, sort, workspace_id=workspace_id)
+    )
+
+
 def _render_briefing(
     request: Request,
     db: Session,
@@ -0,0 +1,62 @@
+"""Cached JSON responses with ETag / If-None-Match for read endpoints.
+
+The ETag is derived from the cache key and the read_api generation
+(app.services.read_cache), so a matching If-None-Match is answered with 304
+before the response is built or looked up.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Awaitable, Callable, Hashable
+from uuid import UUID
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from app.metrics import record_cache
+from app.services.pack_resolver import get_pack_for_workspace
+from app.services.read_cache import get_read_generation, response_cache
+
+# Authenticated responses: browsers may store them but must revalidate every time
+CACHE_CONTROL = "private, no-cache"
+
+
+def read_cache_state(db: Session, workspace_id: str | None) -> tuple[int, UUID | None]:
+    """(generation, pack_id) for a cache key. Generation is read first, before any data."""
+    generation = get_read_generation(db)
+    return generation, get_pack_for_workspace(db, workspace_id)
+
+
+def make_etag(key: Hashable, generation: int) -> str:
+    digest = hashlib.sha256(repr((key, generation)).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of If-None-Match (comma-separated or *) against etag."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+async def cached_json_response(
+    request: Request,
+    key: Hashable,
+    generation: int,
+    build: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """304 when If-None-Match matches, else the cached or freshly built body as JSON."""
+    etag = make_etag(key, generation)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    body = response_cache.get(key, generation)
+    record_cache("read_api", hit=body is not None)
+    if body is None:
+        body = (await build()).model_dump_json().encode()
+        response_cache.put(key, generation, body)
+    return Response(content=body, media_type="application/json", headers=headers)
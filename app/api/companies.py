@@ -6,14 +6,17 @@ import csv
 import io
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.api.deps import require_auth, validate_uuid_param_or_422
+from app.api.caching import cached_json_response, read_cache_state
+from app.api.concurrency import run_sync
+from app.api.deps import require_auth, require_auth_async, validate_uuid_param_or_422
 from app.api.views import _require_workspace_access
 from app.config import get_settings
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.models.user import User
 from app.schemas.company import (
     BulkImportResponse,
@@ -25,13 +28,15 @@ from app.schemas.company import (
 from app.schemas.ranked_companies import RankedCompaniesResponse
 from app.services.company import (
     bulk_import_companies,
+    count_companies_async,
     delete_company,
     get_company,
-    list_companies,
+    list_companies_after_async,
+    list_companies_async,
     update_company,
 )
 from app.services.company_resolver import resolve_or_create_company
-from app.services.ranked_companies import get_ranked_companies_for_api
+from app.services.ranked_companies import get_ranked_companies_for_api_async
 
 router = APIRouter()
 
@@ -56,9 +61,15 @@ results. Invalid workspace_id returns 422. Users must have access to the workspa
 (403 if not).
 
 **Empty DB**: Returns ``{"companies": [], "total": 0}``.
+
+**Caching**: Responses are cached per process until score, lead_feed, briefing,
+outreach or company data changes, and carry an ``ETag``; send it back in
+``If-None-Match`` to get ``304 Not Modified`` while nothing changed.
 """,
+    responses={304: {"description": "Not modified since the ETag in If-None-Match"}},
 )
-def api_companies_top(
+async def api_companies_top(
+    request: Request,
     since: date | None = Query(
         None,
         description="Snapshot date (YYYY-MM-DD). Default: today.",
@@ -73,40 +84,81 @@ def api_companies_top(
         None,
         description="Workspace ID (when multi_workspace_enabled). Default workspace if omitted.",
     ),
-    db: Session = Depends(get_db),
-    user: User = Depends(require_auth),
-) -> RankedCompaniesResponse:
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(require_auth_async),
+) -> Response:
     """Get top ranked companies for Daily Briefing (Issue #247)."""
     as_of = since if since is not None else date.today()
     settings = get_settings()
     ws_id = workspace_id if settings.multi_workspace_enabled else None
     if ws_id is not None:
         validate_uuid_param_or_422(ws_id, "workspace_id")
-        _require_workspace_access(db, user, ws_id)
-    companies = get_ranked_companies_for_api(db, as_of, limit=limit, workspace_id=ws_id)
-    return RankedCompaniesResponse(companies=companies, total=len(companies))
+        await db.run_sync(_require_workspace_access, user, ws_id)
+
+    generation, pack_id = await db.run_sync(read_cache_state, ws_id)
+
+    async def build() -> RankedCompaniesResponse:
+        companies = await get_ranked_companies_for_api_async(
+            db, as_of, limit=limit, workspace_id=ws_id
+        )
+        return RankedCompaniesResponse(companies=companies, total=len(companies))
+
+    key = ("companies_top", ws_id, str(pack_id), as_of.isoformat(), limit)
+    return await cached_json_response(request, key, generation, build)
 
 
 @router.get("", response_model=CompanyList)
-def api_list_companies(
+async def api_list_companies(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    sort_by: str = Query("created_at", pattern="^(score|name|last_scan_at|created_at)$"),
+    sort_by: str = Query("created_at", pattern="^(score|name|last_scan_at|created_at|relevance)$"),
     order: str = Query("desc", pattern="^(asc|desc)$"),
     search: str | None = Query(None),
-    db: Session = Depends(get_db),
-    _auth: None = Depends(require_auth),
+    cursor: str | None = Query(
+        None,
+        description="next_cursor from the previous page (sort_by=score); replaces page.",
+    ),
+    estimate_total: bool = Query(
+        False,
+        description="Return the planner's row estimate as total instead of counting.",
+    ),
+    db: AsyncSession = Depends(get_async_db),
+    _auth: None = Depends(require_auth_async),
 ) -> CompanyList:
-    """List companies with pagination, sorting, and optional search."""
-    items, total = list_companies(
-        db,
-        page=page,
-        page_size=page_size,
-        sort_by=sort_by,
-        sort_order=order,
-        search=search,
+    """List companies with pagination, sorting, and optional search.
+
+    sort_by=score pages by keyset: the first page (or any cursor page) returns
+    next_cursor, so deep pages cost the same as the first. Reads use the async
+    session (get_async_db).
+    """
+    if cursor is not None and sort_by != "score":
+        raise HTTPException(status_code=422, detail="cursor requires sort_by=score")
+    next_cursor = None
+    if sort_by == "score" and (cursor is not None or page == 1):
+        try:
+            items, next_cursor = await list_companies_after_async(
+                db,
+                after=cursor,
+                page_size=page_size,
+                sort_order=order,
+                search=search,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        total = await count_companies_async(db, search=search, estimate=estimate_total)
+    else:
+        items, total = await list_companies_async(
+            db,
+            page=page,
+            page_size=page_size,
+            sort_by=sort_by,
+            sort_order=order,
+            search=search,
+            estimate_total=estimate_total,
+        )
+    return CompanyList(
+        items=items, total=total, page=page, page_size=page_size, next_cursor=next_cursor
     )
-    return CompanyList(items=items, total=total, page=page, page_size=page_size)
 
 
 @router.get("/{company_id}", response_model=CompanyRead)
@@ -141,6 +193,46 @@ class _BulkImportBody(BaseModel):
     companies: list[CompanyCreate]
 
 
+def _import_csv(db: Session, content: str) -> BulkImportResponse:
+    """Parse CSV rows (company_name required) and bulk import them."""
+    reader = csv.DictReader(io.StringIO(content))
+    companies: list[CompanyCreate] = []
+    error_rows: list[tuple[int, str]] = []  # (row_number, detail)
+    for idx, row in enumerate(reader, start=1):
+        name = (row.get("company_name") or "").strip()
+        if not name:
+            error_rows.append((idx, "Missing company_name"))
+            continue
+        companies.append(
+            CompanyCreate(
+                company_name=name,
+                website_url=row.get("website_url") or None,
+                founder_name=row.get("founder_name") or None,
+                founder_linkedin_url=row.get("founder_linkedin_url") or None,
+                company_linkedin_url=row.get("company_linkedin_url") or None,
+                notes=row.get("notes") or None,
+            )
+        )
+    result = bulk_import_companies(db, companies)
+    # Merge CSV validation errors into the result
+    from app.schemas.company import BulkImportRow
+
+    for row_num, detail in error_rows:
+        result.rows.append(
+            BulkImportRow(
+                row=row_num,
+                company_name="(empty)",
+                status="error",
+                detail=detail,
+            )
+        )
+        result.errors += 1
+        result.total += 1
+    # Sort rows by row number for consistent output
+    result.rows.sort(key=lambda r: r.row)
+    return result
+
+
 @router.post("/import", response_model=BulkImportResponse)
 async def api_import_companies(
     request: Request,
@@ -151,6 +243,8 @@ async def api_import_companies(
 
     - JSON: ``{"companies": [CompanyCreate, ...]}``
     - CSV: multipart file upload with a field named ``file``.
+
+    Async only to read the body; parsing and the import run on the thread pool.
     """
     content_type = request.headers.get("content-type", "")
 
@@ -164,47 +258,12 @@ async def api_import_companies(
             content = (await file.read()).decode("utf-8")
         finally:
             await file.close()
-        reader = csv.DictReader(io.StringIO(content))
-        companies: list[CompanyCreate] = []
-        error_rows: list[tuple[int, str]] = []  # (row_number, detail)
-        for idx, row in enumerate(reader, start=1):
-            name = (row.get("company_name") or "").strip()
-            if not name:
-                error_rows.append((idx, "Missing company_name"))
-                continue
-            companies.append(
-                CompanyCreate(
-                    company_name=name,
-                    website_url=row.get("website_url") or None,
-                    founder_name=row.get("founder_name") or None,
-                    founder_linkedin_url=row.get("founder_linkedin_url") or None,
-                    company_linkedin_url=row.get("company_linkedin_url") or None,
-                    notes=row.get("notes") or None,
-                )
-            )
-        result = bulk_import_companies(db, companies)
-        # Merge CSV validation errors into the result
-        from app.schemas.company import BulkImportRow
-
-        for row_num, detail in error_rows:
-            result.rows.append(
-                BulkImportRow(
-                    row=row_num,
-                    company_name="(empty)",
-                    status="error",
-                    detail=detail,
-                )
-            )
-            result.errors += 1
-            result.total += 1
-        # Sort rows by row number for consistent output
-        result.rows.sort(key=lambda r: r.row)
-        return result
+        return await run_sync(_import_csv, db, content)
 
     # Default: JSON body
     raw = await request.json()
     body = _BulkImportBody(**raw)
-    return bulk_import_companies(db, body.companies)
+    return await run_sync(bulk_import_companies, db, body.companies)
 
 
 @router.put("/{company_id}", response_model=CompanyRead)
@@ -0,0 +1,33 @@
+"""Execution model for request handlers.
+
+Sessions are synchronous (app.db.session), so request handlers that touch the
+database or call pipeline/service code are plain ``def``: FastAPI runs them on
+the anyio worker thread pool and the event loop keeps serving other requests.
+A handler that must be ``async`` (e.g. to await ``request.form()``) hands its
+sync work to run_sync. tests/test_async_handlers.py fails on a blocking call
+made directly in an async handler.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+from typing import ParamSpec, TypeVar
+
+import anyio.to_thread
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+async def run_sync(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Run a blocking call on the shared worker thread pool and await its result."""
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs))
+
+
+def configure_threadpool(size: int) -> None:
+    """Size the thread pool shared by sync handlers, sync dependencies and run_sync.
+
+    Call from the running event loop (app lifespan).
+    """
+    anyio.to_thread.current_default_thread_limiter().total_tokens = max(1, size)
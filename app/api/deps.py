@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 from fastapi import Cookie, Depends, Header, HTTPException, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
-from app.db.session import get_db  # re-export
+from app.db.session import get_async_db, get_db  # get_db re-exported
 from app.models.user import User
-from app.services.auth import get_user_from_token
+from app.services.auth import get_user_from_token, get_user_from_token_async
 
 __all__ = [
     "get_db",
     "get_current_user",
+    "get_current_user_async",
     "require_auth",
+    "require_auth_async",
     "require_ui_auth",
     "require_workspace_access",
     "validate_uuid_param_or_422",
@@ -55,20 +58,36 @@ def get_current_user(
     1. Authorization: Bearer <token> header
     2. access_token cookie
     """
-    token: str | None = None
+    token = _request_token(authorization, access_token)
+    if token is None:
+        return None
+
+    return get_user_from_token(db, token)
 
-    # Check Authorization header
-    if authorization and authorization.startswith("Bearer "):
-        token = authorization[len("Bearer ") :]
 
-    # Fall back to cookie
-    if token is None and access_token:
-        token = access_token
+async def get_current_user_async(
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    authorization: str | None = Header(None),
+    access_token: str | None = Cookie(None),
+) -> User | None:
+    """get_current_user on the request's AsyncSession (get_async_db).
 
+    For async routes: the user lookup shares the route's async session, so the
+    request checks out no sync connection or threadpool slot.
+    """
+    token = _request_token(authorization, access_token)
     if token is None:
         return None
 
-    return get_user_from_token(db, token)
+    return await get_user_from_token_async(db, token)
+
+
+def _request_token(authorization: str | None, access_token: str | None) -> str | None:
+    """Bearer token from the Authorization header, else the access_token cookie."""
+    if authorization and authorization.startswith("Bearer "):
+        return authorization[len("Bearer ") :]
+    return access_token or None
 
 
 def require_auth(
@@ -88,6 +107,14 @@ def require_auth(
     return user
 
 
+async def require_auth_async(
+    request: Request,
+    user: User | None = Depends(get_current_user_async),
+) -> User:
+    """require_auth for async routes on get_async_db (see get_current_user_async)."""
+    return require_auth(request, user)
+
+
 def require_ui_auth(
     request: Request,
     user: User | None = Depends(get_current_user),
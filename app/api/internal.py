@@ -2,22 +2,28 @@
 
 These endpoints are secured with a static token (X-Internal-Token header),
 NOT cookie-based auth.  They are meant for automated triggers only.
+
+Handlers are plain ``def`` so FastAPI runs them on its thread pool: a long job
+never blocks the event loop serving the UI. Async services (scan, monitor,
+scout) run to completion with asyncio.run on that worker thread.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import secrets
 import uuid
 from datetime import date, datetime
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.api.deps import validate_uuid_param_or_422
 from app.config import get_settings
 from app.db.session import get_db
 from app.schemas.evidence import StoreEvidenceRequest
+from app.schemas.job_queue import EnqueueJobRequest, PipelineJobRead
 from app.schemas.scout import (
     RunScoutRequest,
     ScoutAnalyticsResponse,
@@ -29,6 +35,8 @@ from app.schemas.seeder import SeedFromBundlesRequest
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/internal", include_in_schema=False)
+# GET /metrics: Prometheus scrape path, outside /internal by convention
+metrics_router = APIRouter(include_in_schema=False)
 
 
 # ── Token dependency ────────────────────────────────────────────────
@@ -50,7 +58,7 @@ def _require_internal_token(x_internal_token: str = Header(...)) -> None:
 
 
 @router.post("/run_scan")
-async def run_scan(
+def run_scan(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     workspace_id: str | None = Query(
@@ -70,7 +78,7 @@ async def run_scan(
     ws_id = workspace_id.strip() if workspace_id and workspace_id.strip() else None
 
     try:
-        job = await run_scan_all(db, workspace_id=ws_id)
+        job = asyncio.run(run_scan_all(db, workspace_id=ws_id))
         return {
             "status": job.status,
             "job_run_id": job.id,
@@ -82,7 +90,7 @@ async def run_scan(
 
 
 @router.post("/run_briefing")
-async def run_briefing(
+def run_briefing(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     workspace_id: str | None = Query(
@@ -94,15 +102,26 @@ async def run_briefing(
 
     When workspace_id provided (Phase 3), generates briefing for that
     workspace's pack. Omit for default workspace.
-    Returns the number of briefing items generated.
+    Returns the number of briefing items generated. With BRIEFING_LLM_BATCH a
+    batch can take hours, so the run is queued as a ``briefing`` job for the
+    worker instead and the response carries its job_id.
     """
     from app.services.briefing import generate_briefing
 
     validate_uuid_param_or_422(workspace_id, "workspace_id")
     ws_id = workspace_id.strip() if workspace_id and workspace_id.strip() else None
 
+    if get_settings().briefing_llm_batch:
+        from app.pipeline.queue import enqueue_job
+        from app.pipeline.stages import DEFAULT_WORKSPACE_ID
+
+        ws = ws_id or DEFAULT_WORKSPACE_ID
+        job_id = enqueue_job(db, "briefing", workspace_id=ws, dedupe_key=f"briefing:{ws}")
+        db.commit()
+        return {"status": "queued", "job_id": job_id}
+
     try:
-        items = generate_briefing(db, workspace_id=ws_id)
+        items = generate_briefing(db, workspace_id=ws_id, llm_batch=False)
         return {"status": "completed", "items_generated": len(items)}
     except Exception as exc:
         logger.exception("Internal briefing generation failed")
@@ -110,7 +129,7 @@ async def run_briefing(
 
 
 @router.post("/run_score")
-async def run_score(
+def run_score(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     x_idempotency_key: str | None = Header(None, alias="X-Idempotency-Key"),
@@ -118,12 +137,21 @@ async def run_score(
     pack_id: str | None = Query(
         None, description="Pack UUID; uses workspace active pack if omitted"
     ),
+    mode: str = Query(
+        "full",
+        pattern="^(full|incremental)$",
+        description="incremental: rescore changed companies only, carry the rest forward",
+    ),
 ):
     """Trigger nightly TRS scoring (Issue #104).
 
     Scores all companies with SignalEvents in last 365 days or on watchlist.
     Returns job summary with companies_scored, companies_skipped.
 
+    mode=incremental rescores only companies in the dirty queue or crossing a
+    scoring breakpoint and carries the rest forward; falls back to full when the
+    pack has no score run since yesterday (response ``mode`` says which ran).
+
     Idempotency: Pass X-Idempotency-Key to skip duplicate runs. Use
     workspace-scoped keys (e.g. ``{workspace_id}:{timestamp}``) to avoid
     collisions across workspaces.
@@ -147,11 +175,14 @@ async def run_score(
             workspace_id=ws_id,
             pack_id=pack_uuid,
             idempotency_key=x_idempotency_key,
+            mode=mode,
         )
         return {
             "status": result["status"],
             "job_run_id": result["job_run_id"],
+            "mode": result.get("mode", mode),
             "companies_scored": result["companies_scored"],
+            "companies_carried_forward": result.get("companies_carried_forward", 0),
             "companies_engagement": result.get("companies_engagement", 0),
             "companies_esl_suppressed": result.get("companies_esl_suppressed", 0),
             "companies_skipped": result["companies_skipped"],
@@ -164,8 +195,61 @@ async def run_score(
         return {"status": "failed", "error": str(exc)}
 
 
+@router.post("/run_readiness_backfill")
+def run_readiness_backfill_endpoint(
+    db: Session = Depends(get_db),
+    _token: None = Depends(_require_internal_token),
+    x_idempotency_key: str | None = Header(None, alias="X-Idempotency-Key"),
+    workspace_id: str | None = Query(None, description="Workspace ID; uses default if omitted"),
+    pack_id: str | None = Query(
+        None, description="Pack UUID; uses workspace active pack if omitted"
+    ),
+    start: date | None = Query(
+        None, description="First as_of (YYYY-MM-DD). Default: 89 days before end."
+    ),
+    end: date | None = Query(None, description="Last as_of (YYYY-MM-DD). Default: today."),
+):
+    """Rebuild readiness snapshot history for a date range (default: last 90 days).
+
+    Loads each company's events once and scores every day in memory; use after
+    onboarding a pack or fixing scoring so SPI has history. Idempotent (upserts).
+    """
+    from uuid import UUID
+
+    from app.pipeline.executor import run_stage
+
+    validate_uuid_param_or_422(workspace_id, "workspace_id")
+    validate_uuid_param_or_422(pack_id, "pack_id")
+
+    try:
+        pack_uuid = UUID(pack_id.strip()) if pack_id and pack_id.strip() else None
+        ws_id = workspace_id.strip() if workspace_id and workspace_id.strip() else None
+        result = run_stage(
+            db,
+            job_type="readiness_backfill",
+            workspace_id=ws_id,
+            pack_id=pack_uuid,
+            idempotency_key=x_idempotency_key,
+            start=start,
+            end=end,
+        )
+        return {
+            "status": result["status"],
+            "job_run_id": result.get("job_run_id"),
+            "days": result.get("days", 0),
+            "companies_processed": result.get("companies_processed", 0),
+            "snapshots_written": result.get("snapshots_written", 0),
+            "error": result.get("error"),
+        }
+    except HTTPException:
+        raise
+    except Exception as exc:
+        logger.exception("Internal readiness backfill job failed")
+        return {"status": "failed", "error": str(exc)}
+
+
 @router.post("/run_alert_scan")
-async def run_alert_scan_endpoint(
+def run_alert_scan_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     workspace_id: str | None = Query(
@@ -202,7 +286,7 @@ async def run_alert_scan_endpoint(
 
 
 @router.post("/run_derive")
-async def run_derive_endpoint(
+def run_derive_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     x_idempotency_key: str | None = Header(None, alias="X-Idempotency-Key"),
@@ -250,7 +334,7 @@ async def run_derive_endpoint(
 
 
 @router.post("/run_ingest")
-async def run_ingest_endpoint(
+def run_ingest_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     x_idempotency_key: str | None = Header(None, alias="X-Idempotency-Key"),
@@ -304,7 +388,7 @@ async def run_ingest_endpoint(
 
 
 @router.post("/run_update_lead_feed")
-async def run_update_lead_feed_endpoint(
+def run_update_lead_feed_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     x_idempotency_key: str | None = Header(None, alias="X-Idempotency-Key"),
@@ -355,7 +439,7 @@ async def run_update_lead_feed_endpoint(
 
 
 @router.post("/run_backfill_lead_feed")
-async def run_backfill_lead_feed_endpoint(
+def run_backfill_lead_feed_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     as_of: date | None = Query(
@@ -365,7 +449,7 @@ async def run_backfill_lead_feed_endpoint(
 ):
     """Backfill lead_feed for all workspaces (Phase 3, Issue #225).
 
-    Runs build_lead_feed_from_snapshots for each workspace with a resolved pack.
+    Builds the projection for all workspaces with a resolved pack, one set-based pass per pack.
     Idempotent: safe to re-run.
     """
     from app.services.lead_feed.run_update import run_backfill_lead_feed
@@ -384,7 +468,7 @@ async def run_backfill_lead_feed_endpoint(
 
 
 @router.post("/run_daily_aggregation")
-async def run_daily_aggregation_endpoint(
+def run_daily_aggregation_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     x_idempotency_key: str | None = Header(None, alias="X-Idempotency-Key"),
@@ -392,12 +476,22 @@ async def run_daily_aggregation_endpoint(
     pack_id: str | None = Query(
         None, description="Pack UUID; uses workspace active pack if omitted"
     ),
+    mode: str | None = Query(
+        None,
+        pattern="^(sequential|pipelined)$",
+        description="pipelined: overlap adapter fetches with derive/score; "
+        "default DAILY_AGGREGATION_MODE",
+    ),
 ):
     """Trigger daily aggregation: ingest → derive → score (Issue #246).
 
     Unified entry point for cron. Returns status, job_run_id, inserted,
     companies_scored, ranked_count, ranked_companies, error. Idempotent with X-Idempotency-Key.
 
+    mode=pipelined runs the stages as a DAG (per-adapter fetch → store → derive →
+    score, then a final score pass); the response ``nodes`` has per-node status and
+    duration_ms, each also recorded as a child JobRun of job_run_id.
+
     ranked_count: count of all companies with any readiness score for today
     (outreach_score_threshold=0 is applied by the orchestrator). This is the
     monitoring population; it is NOT filtered by the configured outreach threshold.
@@ -424,6 +518,7 @@ async def run_daily_aggregation_endpoint(
             workspace_id=ws_id,
             pack_id=pack_uuid,
             idempotency_key=x_idempotency_key,
+            mode=mode,
         )
         inserted = result.get("ingest_result", {}).get("inserted", result.get("inserted", 0))
         companies_scored = result.get("score_result", {}).get(
@@ -437,6 +532,8 @@ async def run_daily_aggregation_endpoint(
             "ranked_count": result.get("ranked_count", 0),
             "ranked_companies": result.get("ranked_companies", []),
             "error": result.get("error"),
+            "mode": result.get("mode"),
+            "nodes": result.get("nodes", {}),
         }
     except HTTPException:
         raise
@@ -446,7 +543,7 @@ async def run_daily_aggregation_endpoint(
 
 
 @router.post("/run_watchlist_seed")
-async def run_watchlist_seed_endpoint(
+def run_watchlist_seed_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     x_idempotency_key: str | None = Header(None, alias="X-Idempotency-Key"),
@@ -511,7 +608,7 @@ async def run_watchlist_seed_endpoint(
 
 
 @router.post("/run_monitor")
-async def run_monitor_endpoint(
+def run_monitor_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     workspace_id: str | None = Query(
@@ -548,11 +645,7 @@ async def run_monitor_endpoint(
             ) from None
 
     try:
-        result = await run_monitor_full(
-            db,
-            workspace_id=ws_id,
-            company_ids=company_ids_list,
-        )
+        result = asyncio.run(run_monitor_full(db, workspace_id=ws_id, company_ids=company_ids_list))
         return {
             "status": result["status"],
             "change_events_count": result["change_events_count"],
@@ -610,7 +703,7 @@ def scout_analytics_endpoint(
 
 
 @router.post("/run_scout")
-async def run_scout_endpoint(
+def run_scout_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     body: RunScoutRequest = ...,
@@ -625,13 +718,15 @@ async def run_scout_endpoint(
     from app.services.scout.discovery_scout_service import run as run_scout
 
     try:
-        run_id, bundles, _metadata = await run_scout(
-            db,
-            icp_definition=body.icp_definition,
-            exclusion_rules=body.exclusion_rules,
-            pack_id=body.pack_id,
-            page_fetch_limit=body.page_fetch_limit,
-            workspace_id=body.workspace_id,
+        run_id, bundles, _metadata = asyncio.run(
+            run_scout(
+                db,
+                icp_definition=body.icp_definition,
+                exclusion_rules=body.exclusion_rules,
+                pack_id=body.pack_id,
+                page_fetch_limit=body.page_fetch_limit,
+                workspace_id=body.workspace_id,
+            )
         )
         return {
             "run_id": run_id,
@@ -645,7 +740,7 @@ async def run_scout_endpoint(
 
 
 @router.get("/scout_runs", response_model=ScoutRunListResponse)
-async def list_scout_runs(
+def list_scout_runs(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     workspace_id: str = Query(
@@ -681,7 +776,7 @@ async def list_scout_runs(
 
 
 @router.post("/evidence/store")
-async def store_evidence_endpoint(
+def store_evidence_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     body: StoreEvidenceRequest = ...,
@@ -773,7 +868,7 @@ async def store_evidence_endpoint(
 
 
 @router.get("/evidence/bundles")
-async def list_evidence_bundles_for_workspace(
+def list_evidence_bundles_for_workspace(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     run_id: str = Query(..., min_length=1, max_length=64),
@@ -794,7 +889,7 @@ async def list_evidence_bundles_for_workspace(
 
 
 @router.get("/evidence/quarantine")
-async def list_evidence_quarantine(
+def list_evidence_quarantine(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     limit: int = Query(100, ge=1, le=500, description="Max entries to return"),
@@ -829,7 +924,7 @@ async def list_evidence_quarantine(
 
 
 @router.get("/evidence/quarantine/{quarantine_id}")
-async def get_evidence_quarantine(
+def get_evidence_quarantine(
     quarantine_id: uuid.UUID,
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
@@ -848,7 +943,7 @@ async def get_evidence_quarantine(
 
 
 @router.post("/run_bias_audit")
-async def run_bias_audit_endpoint(
+def run_bias_audit_endpoint(
     db: Session = Depends(get_db),
     _token: None = Depends(_require_internal_token),
     month: date | None = Query(
@@ -890,3 +985,134 @@ async def run_bias_audit_endpoint(
     except Exception as exc:
         logger.exception("Internal bias audit failed")
         return {"status": "failed", "error": str(exc)}
+
+
+# ── Job queue ───────────────────────────────────────────────────────
+
+
+@router.post("/jobs", status_code=202)
+def enqueue_job_endpoint(
+    body: EnqueueJobRequest,
+    db: Session = Depends(get_db),
+    _token: None = Depends(_require_internal_token),
+    x_idempotency_key: str | None = Header(None, alias="X-Idempotency-Key"),
+):
+    """Queue a pipeline stage for the worker and return its job id immediately.
+
+    job_type is any STAGE_REGISTRY stage (ingest, derive, score, scan, ...);
+    params are the stage kwargs the matching /internal/run_* endpoint takes.
+    The workspace rate limit applies at enqueue time (429). Poll
+    GET /internal/jobs/{job_id} for the result.
+
+    Idempotency: X-Idempotency-Key returns the already queued or running job
+    with the same key, and the worker skips the stage when a completed run
+    with that key exists. Use workspace-scoped keys.
+    """
+    from app.pipeline.queue import enqueue_job
+    from app.pipeline.rate_limits import check_workspace_rate_limit
+    from app.pipeline.stages import DEFAULT_WORKSPACE_ID, STAGE_REGISTRY
+
+    if body.job_type not in STAGE_REGISTRY:
+        raise HTTPException(status_code=422, detail=f"Unknown job_type: {body.job_type}")
+    ws_id = str(body.workspace_id) if body.workspace_id is not None else DEFAULT_WORKSPACE_ID
+    if not check_workspace_rate_limit(db, ws_id, body.job_type):
+        raise HTTPException(status_code=429, detail="Workspace job rate limit exceeded")
+
+    job_id = enqueue_job(
+        db,
+        body.job_type,
+        workspace_id=ws_id,
+        pack_id=body.pack_id,
+        params=body.params,
+        idempotency_key=x_idempotency_key,
+        dedupe_key=x_idempotency_key,
+    )
+    db.commit()
+    return {"status": "queued", "job_id": job_id}
+
+
+@router.get("/jobs/{job_id}", response_model=PipelineJobRead)
+def get_job_endpoint(
+    job_id: int,
+    db: Session = Depends(get_db),
+    _token: None = Depends(_require_internal_token),
+):
+    """Status and result of a queued pipeline job."""
+    from app.models.pipeline_job import PipelineJob
+
+    job = db.get(PipelineJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/query_stats")
+def query_stats_endpoint(
+    db: Session = Depends(get_db),
+    _token: None = Depends(_require_internal_token),
+    limit: int = Query(50, ge=1, le=500, description="Max rows per list"),
+    reset: bool = Query(False, description="Clear this process's aggregates after reading"),
+):
+    """SQL statement counts and slow queries (app.db.profiling).
+
+    routes and slow_queries are aggregates of the process serving the request
+    (since start or the last reset): per route, requests, statements and DB
+    time; per slow statement fingerprint (slower than SLOW_QUERY_MS), count and
+    time. jobs lists the latest job runs with their statement counts.
+    """
+    from app.db.profiling import query_profile
+    from app.models.job_run import JobRun
+
+    stats = query_profile.snapshot(limit)
+    if reset:
+        query_profile.reset()
+    jobs = (
+        db.query(JobRun)
+        .filter(JobRun.query_count.is_not(None))
+        .order_by(JobRun.id.desc())
+        .limit(limit)
+        .all()
+    )
+    return {
+        **stats,
+        "slow_query_ms": get_settings().slow_query_ms,
+        "jobs": [
+            {
+                "job_run_id": job.id,
+                "job_type": job.job_type,
+                "status": job.status,
+                "started_at": job.started_at.isoformat() if job.started_at else None,
+                "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+                "query_count": job.query_count,
+                "db_time_ms": job.db_time_ms,
+            }
+            for job in jobs
+        ],
+    }
+
+
+@router.get("/job_metrics")
+def job_metrics_endpoint(
+    db: Session = Depends(get_db),
+    _token: None = Depends(_require_internal_token),
+    job_type: str = Query("score", description="JobRun.job_type to compare"),
+    limit: int = Query(20, ge=1, le=200, description="Max runs, newest first"),
+):
+    """Per-span timing of recent job runs (JobRun.metrics, app.services.job_metrics).
+
+    Each run carries its duration, statement count and DB time plus, per span,
+    count, total/avg/max ms, statements, DB time and a duration histogram, and
+    the companies that took longest.
+    """
+    from app.services.job_metrics import recent_job_metrics
+
+    return {"job_type": job_type, "runs": recent_job_metrics(db, job_type, limit)}
+
+
+@metrics_router.get("/metrics")
+def metrics_endpoint(_token: None = Depends(_require_internal_token)) -> Response:
+    """Prometheus metrics (app.metrics), merged across worker processes under gunicorn."""
+    from app.metrics import render_metrics
+
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
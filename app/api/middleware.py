@@ -0,0 +1,75 @@
+"""ASGI middleware."""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import get_settings
+from app.db.profiling import query_profile, track_queries
+from app.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+
+def route_template(scope: Scope) -> str:
+    """Matched route as a path template (/api/companies/{company_id}), or <unmatched>."""
+    route = scope.get("route")
+    path_format = getattr(route, "path_format", None)
+    if path_format is None:
+        return "<unmatched>"
+    path = scope.get("path", "")
+    try:
+        rendered = path_format.format(**scope.get("path_params", {}))
+    except (KeyError, IndexError, ValueError):
+        return path_format
+    # route.path_format lacks the prefix of the router it was included with
+    if rendered and path.endswith(rendered):
+        return path[: len(path) - len(rendered)] + path_format
+    return path_format
+
+
+class QueryProfilingMiddleware:
+    """Count SQL statements and DB time per request (app.db.profiling).
+
+    Aggregates per route in query_profile; warns when a request issues more
+    than REQUEST_QUERY_WARN_COUNT statements. Also exports request counts and
+    durations per route and status (app.metrics).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500  # unless the app starts a response
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        with track_queries() as stats:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                duration_ms = (time.perf_counter() - started) * 1000
+                template = route_template(scope)
+                route = f"{scope['method']} {template}"
+                query_profile.record_request(route, stats, duration_ms)
+                HTTP_REQUESTS.labels(scope["method"], template, str(status)).inc()
+                HTTP_REQUEST_SECONDS.labels(scope["method"], template).observe(duration_ms / 1000)
+                if stats.count > get_settings().request_query_warn_count:
+                    logger.warning(
+                        "%s issued %d SQL statements (%.0f ms in DB)",
+                        route,
+                        stats.count,
+                        stats.db_ms,
+                    )
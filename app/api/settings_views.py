@@ -7,15 +7,16 @@ import logging
 import re
 from pathlib import Path
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Form, Request
+from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, require_ui_auth
-from app.db.session import SessionLocal
 from app.models.job_run import JobRun
 from app.models.user import User
+from app.pipeline.queue import enqueue_job
+from app.services.job_metrics import recent_job_metrics
 from app.services.pack_resolver import get_default_pack_id, resolve_pack
 from app.services.scan_metrics import get_scan_change_rate_30d
 from app.services.settings_service import (
@@ -179,24 +180,12 @@ def settings_save(
     return RedirectResponse(url="/settings?success=Settings+saved", status_code=303)
 
 
-def _run_ingest_background() -> None:
-    """Background task: run daily ingestion. Uses its own DB session."""
-    from app.services.ingestion.ingest_daily import run_ingest_daily
-
-    db = SessionLocal()
-    try:
-        run_ingest_daily(db)
-    finally:
-        db.close()
-
-
 @router.post("/settings/run-ingest")
 def settings_run_ingest(
-    background_tasks: BackgroundTasks,
     user: User = Depends(require_ui_auth),
     db: Session = Depends(get_db),
 ):
-    """Queue ingestion job and redirect back to settings (Issue #90)."""
+    """Queue ingestion job for the queue worker and redirect back to settings (Issue #90)."""
     ingest_running = (
         db.query(JobRun).filter(JobRun.job_type == "ingest", JobRun.status == "running").first()
     )
@@ -206,7 +195,8 @@ def settings_run_ingest(
             status_code=303,
         )
 
-    background_tasks.add_task(_run_ingest_background)
+    enqueue_job(db, "ingest", dedupe_key="ingest")
+    db.commit()
     return RedirectResponse(
         url="/settings?success=Ingest+queued",
         status_code=303,
@@ -235,6 +225,36 @@ def profile_page(
     )
 
 
+@router.get("/settings/job-metrics", response_class=HTMLResponse)
+def job_metrics_page(
+    request: Request,
+    job_type: str = "score",
+    user: User = Depends(require_ui_auth),
+    db: Session = Depends(get_db),
+):
+    """Compare per-span timing across recent runs of one job type (JobRun.metrics)."""
+    runs = recent_job_metrics(db, job_type, limit=20)
+    span_names = sorted({name for run in runs for name in run["metrics"].get("spans", {})})
+    job_types = [
+        row[0]
+        for row in db.query(JobRun.job_type)
+        .filter(JobRun.metrics.is_not(None))
+        .distinct()
+        .order_by(JobRun.job_type)
+    ]
+    return templates.TemplateResponse(
+        request,
+        "settings/job_metrics.html",
+        {
+            "user": user,
+            "job_type": job_type,
+            "job_types": job_types,
+            "runs": runs,
+            "span_names": span_names,
+        },
+    )
+
+
 @router.post("/settings/profile")
 def profile_save(
     request: Request,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import csv
 import io
 import json
@@ -15,7 +14,6 @@ from uuid import UUID
 
 from fastapi import (
     APIRouter,
-    BackgroundTasks,
     Depends,
     File,
     Form,
@@ -33,12 +31,12 @@ from sqlalchemy.orm import Session
 
 from app.api.deps import AUTH_COOKIE, get_current_user, get_db, validate_uuid_param_or_422
 from app.config import get_settings
-from app.db.session import SessionLocal
 from app.models.analysis_record import AnalysisRecord
 from app.models.briefing_item import BriefingItem
 from app.models.job_run import JobRun
 from app.models.signal_record import SignalRecord
 from app.models.user import User
+from app.pipeline.queue import enqueue_job
 from app.pipeline.stages import DEFAULT_WORKSPACE_ID
 from app.schemas.company import CompanyCreate, CompanySource, CompanyUpdate
 from app.services.analysis import ALLOWED_STAGES
@@ -905,25 +903,16 @@ def company_edit_submit(
 # ── Companies: scan all ──────────────────────────────────────────────
 
 
-def _run_scan_all_background(workspace_id: str | None = None) -> None:
-    """Background task: run full scan across all companies. Uses its own DB session."""
-    from app.services.scan_orchestrator import run_scan_all
-
-    db = SessionLocal()
-    try:
-        asyncio.run(run_scan_all(db, workspace_id=workspace_id))
-    finally:
-        db.close()
-
-
 @router.post("/companies/scan-all")
-async def companies_scan_all(
+def companies_scan_all(
     request: Request,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: User = Depends(_require_ui_auth),
 ):
-    """Queue a full scan across all companies, then redirect back to companies list."""
+    """Queue a full scan across all companies, then redirect back to companies list.
+
+    The scan runs on the queue worker (app.pipeline.worker), not in the web process.
+    """
     # Phase 3: resolve workspace, enforce access when multi_workspace enabled
     workspace_id = _resolve_workspace_id(request)
     if get_settings().multi_workspace_enabled and workspace_id is None:
@@ -949,7 +938,8 @@ async def companies_scan_all(
             url += f"&workspace_id={workspace_id}"
         return RedirectResponse(url=url, status_code=303)
 
-    background_tasks.add_task(_run_scan_all_background, workspace_id)
+    enqueue_job(db, "scan", workspace_id=workspace_id, dedupe_key=f"scan:{ws_uuid}")
+    db.commit()
     url = "/companies?scan_all=queued"
     if workspace_id:
         url += f"&workspace_id={workspace_id}"
@@ -959,26 +949,18 @@ async def companies_scan_all(
 # ── Companies: rescan ────────────────────────────────────────────────
 
 
-def _run_rescan_background(company_id: int, job_id: int) -> None:
-    """Background task: run scan pipeline and update JobRun. Uses its own DB session."""
-    from app.services.scan_orchestrator import run_scan_company_with_job
-
-    db = SessionLocal()
-    try:
-        asyncio.run(run_scan_company_with_job(db, company_id, job_id=job_id))
-    finally:
-        db.close()
-
-
 @router.post("/companies/{company_id}/rescan")
-async def company_rescan(
+def company_rescan(
     request: Request,
     company_id: int,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     user: User = Depends(_require_ui_auth),
 ):
-    """Queue scan + analysis + scoring for a company, then redirect back."""
+    """Queue scan + analysis + scoring for a company, then redirect back.
+
+    The scan runs on the queue worker; the JobRun is created here so the page
+    shows it as running until the worker finishes.
+    """
     company = get_company(db, company_id)
     if company is None:
         raise HTTPException(status_code=404, detail="Company not found")
@@ -1013,7 +995,7 @@ async def company_rescan(
             params["workspace_id"] = workspace_id
         return RedirectResponse(url=_company_redirect_url(company_id, params), status_code=302)
 
-    # Create JobRun and queue background task (pack_id, workspace_id for audit)
+    # Create JobRun and queue the scan (pack_id, workspace_id for audit)
     job = JobRun(
         job_type="company_scan",
         company_id=company_id,
@@ -1025,7 +1007,14 @@ async def company_rescan(
     db.commit()
     db.refresh(job)
 
-    background_tasks.add_task(_run_rescan_background, company_id, job.id)
+    enqueue_job(
+        db,
+        "company_scan",
+        workspace_id=ws_uuid,
+        pack_id=pack_id,
+        params={"company_id": company_id, "job_run_id": job.id},
+    )
+    db.commit()
 
     params = {"rescan": "queued"}
     if workspace_id:
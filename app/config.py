@@ -31,6 +31,21 @@ class Settings:
     # Database (postgresql+psycopg for psycopg3; use postgresql:// for psycopg2)
     database_url: str = "postgresql+psycopg://localhost:5432/signalforge_dev"
     db_connect_timeout: int = 10  # seconds
+    # Threads for sync request handlers and app.api.concurrency.run_sync (anyio default 40)
+    threadpool_size: int = 40
+    # Async engine (app.db.session.get_async_db) for high-concurrency read endpoints:
+    # connections are held only while awaiting the DB, so a small pool serves many requests
+    async_db_pool_size: int = 5
+    async_db_max_overflow: int = 5
+    # Per-process cache of /api/companies/top and /api/briefing/daily bodies
+    # (app.services.read_cache); 0 disables storage, ETag/304 still apply
+    response_cache_max_entries: int = 256
+    # Query profiling (app.db.profiling): log statements slower than this (0 = off) and
+    # requests issuing more statements than request_query_warn_count (likely N+1)
+    slow_query_ms: int = 500
+    request_query_warn_count: int = 200
+    # Prometheus metrics (app.metrics): distinct fetch hosts labelled per process, rest "other"
+    metrics_max_hosts: int = 200
 
     # Security
     secret_key: str = ""
@@ -50,12 +65,25 @@ class Settings:
     )
     llm_timeout: float = 60.0
     llm_max_retries: int = 3
+    # Offline batch mode (app.llm.batch): poll interval and give-up timeout, seconds
+    llm_batch_poll_interval: float = 30.0
+    llm_batch_timeout: float = 86400.0
 
     # Pipeline (Phase 1, Issue #192) — per-workspace rate limit for /internal/* jobs.
     # 0 = disabled. Default 10 (Phase 3) limits each workspace to 10 jobs/hour per job_type.
     # Set WORKSPACE_JOB_RATE_LIMIT_PER_HOUR=0 to disable (e.g. for tests or heavy cron).
     workspace_job_rate_limit_per_hour: int = 10
 
+    # Daily aggregation (Issue #246): sequential (ingest -> derive -> score) or pipelined
+    # (adapters fetched concurrently; derive and score each adapter's batch as it lands)
+    daily_aggregation_mode: str = "sequential"
+
+    # Job queue worker (app.pipeline.worker): queued pipeline_jobs run outside the web process
+    worker_concurrency: int = 2  # jobs executed in parallel per worker process
+    worker_poll_interval: float = 2.0  # seconds between claims when the queue is empty
+    job_lease_seconds: int = 300  # a running job whose lease lapses is reclaimed
+    job_max_attempts: int = 3  # attempts before a failing job is marked failed
+
     # Multi-workspace (Issue #225): when True, briefing/review scope by workspace_id
     multi_workspace_enabled: bool = False
 
@@ -74,6 +102,8 @@ class Settings:
     briefing_email_enabled: bool = False
     briefing_frequency: str = "daily"  # daily or weekly (issue #29)
     briefing_day_of_week: int = 0  # 0=Monday .. 6=Sunday
+    briefing_max_concurrency: int = 4  # parallel briefing/outreach LLM calls per run
+    briefing_llm_batch: bool = False  # submit briefing LLM calls via the batch API (nightly)
 
     # SMTP / Email
     smtp_host: str = ""
@@ -111,6 +141,19 @@ class Settings:
             raw_url = raw_url.replace("postgresql://", "postgresql+psycopg://", 1)
         self.database_url = raw_url
         self.db_connect_timeout = int(os.getenv("DB_CONNECT_TIMEOUT", str(self.db_connect_timeout)))
+        self.threadpool_size = int(os.getenv("THREADPOOL_SIZE", str(self.threadpool_size)))
+        self.async_db_pool_size = int(os.getenv("ASYNC_DB_POOL_SIZE", str(self.async_db_pool_size)))
+        self.async_db_max_overflow = int(
+            os.getenv("ASYNC_DB_MAX_OVERFLOW", str(self.async_db_max_overflow))
+        )
+        self.response_cache_max_entries = int(
+            os.getenv("RESPONSE_CACHE_MAX_ENTRIES", str(self.response_cache_max_entries))
+        )
+        self.slow_query_ms = int(os.getenv("SLOW_QUERY_MS", str(self.slow_query_ms)))
+        self.request_query_warn_count = int(
+            os.getenv("REQUEST_QUERY_WARN_COUNT", str(self.request_query_warn_count))
+        )
+        self.metrics_max_hosts = int(os.getenv("METRICS_MAX_HOSTS", str(self.metrics_max_hosts)))
 
         self.secret_key = os.getenv("SECRET_KEY", "")
         self.internal_job_token = os.getenv("INTERNAL_JOB_TOKEN", "")
@@ -140,6 +183,10 @@ class Settings:
         self.llm_model_scout = os.getenv("LLM_MODEL_SCOUT") or legacy_model or self.llm_model_scout
         self.llm_timeout = float(os.getenv("LLM_TIMEOUT", str(self.llm_timeout)))
         self.llm_max_retries = int(os.getenv("LLM_MAX_RETRIES", str(self.llm_max_retries)))
+        self.llm_batch_poll_interval = float(
+            os.getenv("LLM_BATCH_POLL_INTERVAL", str(self.llm_batch_poll_interval))
+        )
+        self.llm_batch_timeout = float(os.getenv("LLM_BATCH_TIMEOUT", str(self.llm_batch_timeout)))
 
         self.workspace_job_rate_limit_per_hour = int(
             os.getenv(
@@ -147,6 +194,15 @@ class Settings:
                 str(self.workspace_job_rate_limit_per_hour),
             )
         )
+        self.daily_aggregation_mode = os.getenv(
+            "DAILY_AGGREGATION_MODE", self.daily_aggregation_mode
+        ).lower()
+        self.worker_concurrency = int(os.getenv("WORKER_CONCURRENCY", str(self.worker_concurrency)))
+        self.worker_poll_interval = float(
+            os.getenv("WORKER_POLL_INTERVAL", str(self.worker_poll_interval))
+        )
+        self.job_lease_seconds = int(os.getenv("JOB_LEASE_SECONDS", str(self.job_lease_seconds)))
+        self.job_max_attempts = int(os.getenv("JOB_MAX_ATTEMPTS", str(self.job_max_attempts)))
         self.multi_workspace_enabled = (
             os.getenv("MULTI_WORKSPACE_ENABLED", "false").lower() == "true"
         )
@@ -169,6 +225,10 @@ class Settings:
         self.briefing_day_of_week = int(
             os.getenv("BRIEFING_DAY_OF_WEEK", str(self.briefing_day_of_week))
         )
+        self.briefing_max_concurrency = int(
+            os.getenv("BRIEFING_MAX_CONCURRENCY", str(self.briefing_max_concurrency))
+        )
+        self.briefing_llm_batch = os.getenv("BRIEFING_LLM_BATCH", "false").lower() == "true"
 
         self.smtp_host = os.getenv("SMTP_HOST", "")
         self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
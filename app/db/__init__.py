@@ -1,5 +1,14 @@
 """Database session and connection management."""
 
-from app.db.session import Base, SessionLocal, engine, get_db
+from typing import Any
 
-__all__ = ["Base", "SessionLocal", "engine", "get_db"]
+from app.db.session import Base, SessionLocal, get_async_db, get_db, get_engine
+
+__all__ = ["Base", "SessionLocal", "engine", "get_async_db", "get_db", "get_engine"]
+
+
+def __getattr__(name: str) -> Any:
+    # engine is created on first use (app.db.session.get_engine)
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,185 @@
+"""SQL statement counting and slow-query profiling.
+
+install_query_profiling() hooks before/after_cursor_execute on every Engine
+(sync and the async engine's sync_engine). Each statement is added to the
+QueryStats of every active track_queries() block in the current context, so a
+request (app.api.middleware.QueryProfilingMiddleware) and a job run inside it
+(app.pipeline.executor.run_stage) are both counted. Statements slower than
+SLOW_QUERY_MS are logged and aggregated by fingerprint (literals and parameters
+replaced, IN lists collapsed) in query_profile, which /internal/query_stats
+reports.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Distinct slow fingerprints kept per process; further new ones are only counted
+MAX_SLOW_FINGERPRINTS = 500
+FINGERPRINT_MAX_LEN = 1000
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"%\(\w+\)s|%s|\$\d+|\?")
+_PARAM_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_REPEATED_LIST = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+_START_ATTR = "_signalforge_query_start"
+
+
+def fingerprint(statement: str) -> str:
+    """Statement with literals and bind parameters as ?, IN / VALUES lists as (...)."""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _BIND_PARAM.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PARAM_LIST.sub("(...)", sql)
+    sql = _REPEATED_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()[:FINGERPRINT_MAX_LEN]
+
+
+@dataclass
+class QueryStats:
+    """Statements, cumulative DB time and slow statements seen in a track_queries() block."""
+
+    count: int = 0
+    db_ms: float = 0.0
+    slow: int = 0
+
+
+_active: ContextVar[tuple[QueryStats, ...]] = ContextVar("active_query_stats", default=())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count statements executed in this context (threads started inside are not included)."""
+    stats = QueryStats()
+    token = _active.set((*_active.get(), stats))
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+class QueryProfile:
+    """Per-process aggregates: per-route request stats and slow statements by fingerprint."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[str, dict] = {}
+        self._slow: dict[str, dict] = {}
+        self._slow_dropped = 0
+
+    def record_request(self, route: str, stats: QueryStats, duration_ms: float) -> None:
+        with self._lock:
+            entry = self._routes.setdefault(
+                route,
+                {
+                    "requests": 0,
+                    "statements": 0,
+                    "max_statements": 0,
+                    "db_ms": 0.0,
+                    "total_ms": 0.0,
+                },
+            )
+            entry["requests"] += 1
+            entry["statements"] += stats.count
+            entry["max_statements"] = max(entry["max_statements"], stats.count)
+            entry["db_ms"] += stats.db_ms
+            entry["total_ms"] += duration_ms
+
+    def record_slow(self, fp: str, duration_ms: float) -> None:
+        with self._lock:
+            entry = self._slow.get(fp)
+            if entry is None:
+                if len(self._slow) >= MAX_SLOW_FINGERPRINTS:
+                    self._slow_dropped += 1
+                    return
+                entry = self._slow[fp] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+            entry["count"] += 1
+            entry["total_ms"] += duration_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+
+    def snapshot(self, limit: int = 50) -> dict:
+        """Routes by cumulative DB time and slow fingerprints by total time, limit each."""
+        with self._lock:
+            routes = [
+                {
+                    "route": route,
+                    **entry,
+                    "avg_statements": round(entry["statements"] / entry["requests"], 1),
+                    "db_ms": round(entry["db_ms"], 1),
+                    "total_ms": round(entry["total_ms"], 1),
+                }
+                for route, entry in self._routes.items()
+            ]
+            slow = [
+                {
+                    "fingerprint": fp,
+                    "count": entry["count"],
+                    "total_ms": round(entry["total_ms"], 1),
+                    "max_ms": round(entry["max_ms"], 1),
+                }
+                for fp, entry in self._slow.items()
+            ]
+            slow_dropped = self._slow_dropped
+        routes.sort(key=lambda r: r["db_ms"], reverse=True)
+        slow.sort(key=lambda s: s["total_ms"], reverse=True)
+        return {
+            "routes": routes[:limit],
+            "slow_queries": slow[:limit],
+            "slow_dropped": slow_dropped,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+            self._slow.clear()
+            self._slow_dropped = 0
+
+
+query_profile = QueryProfile()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        setattr(context, _START_ATTR, time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = getattr(context, _START_ATTR, None)
+    if started is None:
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    active = _active.get()
+    for stats in active:
+        stats.count += 1
+        stats.db_ms += elapsed_ms
+    threshold = get_settings().slow_query_ms
+    if threshold and elapsed_ms >= threshold:
+        fp = fingerprint(statement)
+        for stats in active:
+            stats.slow += 1
+        query_profile.record_slow(fp, elapsed_ms)
+        logger.warning("Slow query (%.0f ms): %s", elapsed_ms, fp)
+
+
+def install_query_profiling() -> None:
+    """Register the cursor listeners on all engines. Idempotent."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
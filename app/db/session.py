@@ -1,27 +1,75 @@
 """
 Database session management. SQLAlchemy 2.x style.
+
+Sync engine/SessionLocal/get_db for most code. get_async_db yields an
+AsyncSession (same URL, psycopg async driver) for read endpoints that serve
+high concurrency; async services run their sync query code through
+AsyncSession.run_sync, so I/O is awaited instead of holding a thread.
+
+Every engine counts and times its statements (app.db.profiling), and its pool
+reports connection checkout time to app.metrics.
+
+Both engines are created on first use (get_engine, get_async_engine), so
+importing this module (every script, worker and model does) neither builds a
+pool nor loads the psycopg driver. ``engine`` is still importable from here
+and from app.db; it resolves to get_engine().
 """
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from functools import lru_cache
+from typing import Any
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.config import get_settings
+from app.db.profiling import install_query_profiling
+from app.metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool
+
+install_query_profiling()
 
 settings = get_settings()
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    echo=settings.debug,
-    connect_args={
-        "connect_timeout": settings.db_connect_timeout,
-        "options": "-c timezone=UTC",
-    },
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    """Sync engine, created on first use."""
+    return create_engine(
+        settings.database_url,
+        poolclass=TimedQueuePool,
+        pool_pre_ping=True,
+        pool_size=5,
+        max_overflow=10,
+        echo=settings.debug,
+        connect_args={
+            "connect_timeout": settings.db_connect_timeout,
+            "options": "-c timezone=UTC",
+        },
+    )
+
+
+class _LazySessionmaker(sessionmaker[Session]):
+    """sessionmaker bound to get_engine() when the first session is made."""
+
+    def __call__(self, **local_kw: Any) -> Session:
+        if self.kw.get("bind") is None:
+            self.configure(bind=get_engine())
+        return super().__call__(**local_kw)
+
+
+SessionLocal = _LazySessionmaker(autocommit=False, autoflush=False)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Base(DeclarativeBase):
@@ -33,7 +81,7 @@ def check_db_connection() -> None:
     Verify database connectivity. Raises if unreachable.
     Call during application startup.
     """
-    with engine.connect() as conn:
+    with get_engine().connect() as conn:
         conn.execute(text("SELECT 1"))
 
 
@@ -44,3 +92,38 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+@lru_cache(maxsize=1)
+def get_async_engine() -> AsyncEngine:
+    """Async engine, created on first use (ASYNC_DB_POOL_SIZE, ASYNC_DB_MAX_OVERFLOW)."""
+    return create_async_engine(
+        settings.database_url,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_pre_ping=True,
+        pool_size=settings.async_db_pool_size,
+        max_overflow=settings.async_db_max_overflow,
+        echo=settings.debug,
+        connect_args={
+            "connect_timeout": settings.db_connect_timeout,
+            "options": "-c timezone=UTC",
+        },
+    )
+
+
+@lru_cache(maxsize=1)
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    # expire_on_commit=False: returned objects stay readable without a lazy refresh
+    return async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for FastAPI to get an async database session."""
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close the async pool if it was created (app shutdown)."""
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from app.models.signal_event import SignalEvent
 from app.services.pack_resolver import get_default_pack_id
+from app.services.readiness.dirty_queue import enqueue_dirty_companies
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,7 @@ def store_signal_event(
     confidence: float | None = 0.7,
     pack_id: UUID | None = None,
     evidence_bundle_id: UUID | None = None,
+    enqueue_dirty: bool = True,
 ) -> SignalEvent | None:
     """Store a signal event with deduplication.
 
@@ -57,6 +59,9 @@ def store_signal_event(
     evidence_bundle_id : UUID | None
         FK to evidence_bundles.id (Watchlist Seeder M1). When set, event
         originated from that evidence bundle.
+    enqueue_dirty : bool
+        Enqueue company_id for incremental scoring. Batch callers (store_raw_events)
+        pass False and enqueue the batch's companies once.
 
     Returns
     -------
@@ -110,6 +115,8 @@ def store_signal_event(
         evidence_bundle_id=evidence_bundle_id,
     )
     db.add(event)
+    if enqueue_dirty:
+        enqueue_dirty_companies(db, [company_id], "ingest")
     db.commit()
     db.refresh(event)
     return event
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 from uuid import UUID
 
@@ -11,8 +12,11 @@ from sqlalchemy.orm import Session
 from app.ingestion.base import SourceAdapter
 from app.ingestion.event_storage import store_signal_event
 from app.ingestion.normalize import normalize_raw_event
+from app.metrics import INGEST_EVENTS
+from app.schemas.signal import RawEvent
 from app.services.company_resolver import resolve_or_create_company
 from app.services.pack_resolver import get_default_pack_id, resolve_pack
+from app.services.readiness.dirty_queue import enqueue_dirty_companies
 
 logger = logging.getLogger(__name__)
 
@@ -37,15 +41,36 @@ def run_ingest(
     Returns
     -------
     dict
-        {inserted: int, skipped_duplicate: int, skipped_invalid: int, errors: list}
+        {inserted: int, skipped_duplicate: int, skipped_invalid: int, errors: list,
+        company_ids: list}
+    """
+    return store_raw_events(db, adapter.source_name, adapter.fetch_events(since), pack_id=pack_id)
+
+
+def store_raw_events(
+    db: Session,
+    source: str,
+    raw_events: Iterable[RawEvent],
+    pack_id: UUID | str | None = None,
+) -> dict:
+    """Normalize, resolve and store already-fetched events from one source.
+
+    Split from run_ingest so fetches can run concurrently (pipelined daily
+    aggregation) while storage stays on the caller's session.
+
+    Returns
+    -------
+    dict
+        {inserted, skipped_duplicate, skipped_invalid, errors, company_ids}; company_ids
+        are the companies that received a new event (sorted), enqueued for incremental
+        scoring in one batch. Commits.
     """
     inserted = 0
     skipped_duplicate = 0
     skipped_invalid = 0
     errors: list[str] = []
+    company_ids: set[int] = set()
 
-    raw_events = adapter.fetch_events(since)
-    source = adapter.source_name
     resolved_pack_id = pack_id or get_default_pack_id(db)
     if isinstance(resolved_pack_id, str):
         resolved_pack_id = UUID(resolved_pack_id) if resolved_pack_id else None
@@ -63,18 +88,31 @@ def run_ingest(
             event_data["company_id"] = company.id
             event_data["pack_id"] = resolved_pack_id
 
-            result = store_signal_event(db, **event_data)
+            result = store_signal_event(db, **event_data, enqueue_dirty=False)
             if result is None:
                 skipped_duplicate += 1
             else:
                 inserted += 1
+                company_ids.add(company.id)
         except Exception as e:
             errors.append(f"{source}:{getattr(raw, 'source_event_id', '?')}: {e}")
             logger.exception("Ingest failed for event: %s", raw)
 
+    # One dirty-queue upsert for the batch instead of a SAVEPOINT per event
+    enqueue_dirty_companies(db, company_ids, "ingest")
+    db.commit()
+
+    for outcome, count in (
+        ("inserted", inserted),
+        ("duplicate", skipped_duplicate),
+        ("invalid", skipped_invalid),
+        ("error", len(errors)),
+    ):
+        INGEST_EVENTS.labels(source, outcome).inc(count)
     return {
         "inserted": inserted,
         "skipped_duplicate": skipped_duplicate,
         "skipped_invalid": skipped_invalid,
         "errors": errors,
+        "company_ids": sorted(company_ids),
     }
@@ -1,12 +1,39 @@
-"""LLM provider abstraction. LLM is reasoning only, never orchestration."""
+"""LLM provider abstraction. LLM is reasoning only, never orchestration.
 
-from app.llm.anthropic_provider import AnthropicProvider
+AnthropicProvider and TokenUsage are loaded on first access: importing the
+Anthropic SDK is the largest single import cost, and most callers (scoring,
+scripts, the queue worker) never create a provider.
+"""
+
+from typing import Any
+
+from app.llm.batch import (
+    BatchSession,
+    BatchStore,
+    FileBatchBackend,
+    LLMBatchError,
+    get_batch_backend,
+)
 from app.llm.provider import LLMProvider
 from app.llm.router import ModelRole, get_llm_provider
 
 __all__ = [
     "AnthropicProvider",
+    "BatchSession",
+    "BatchStore",
+    "FileBatchBackend",
+    "LLMBatchError",
     "LLMProvider",
     "ModelRole",
+    "TokenUsage",
+    "get_batch_backend",
     "get_llm_provider",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in ("AnthropicProvider", "TokenUsage"):
+        from app.llm import anthropic_provider
+
+        return getattr(anthropic_provider, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
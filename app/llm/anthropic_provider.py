@@ -4,6 +4,14 @@ Anthropic LLM provider implementation.
 Uses the anthropic Python SDK (>=0.39.0) with synchronous client.
 Supports retry with exponential backoff for rate-limit, timeout, and connection errors.
 
+Prompt caching: when a prompt contains a cache-break marker (see
+app.prompts.loader.split_cache_prefix), the static prefix is sent as a separate
+content block with cache_control so repeated calls (e.g. a briefing batch) reuse it.
+The API ignores cache_control on prefixes shorter than the model's minimum
+cacheable length, so shorter prefixes (estimated offline) are sent unmarked.
+Cache write/read token counts are logged and accumulated on the provider.
+Calls, tokens and latency are also exported per model role (app.metrics).
+
 Security: API keys are never logged; only model, prompt preview, token counts, and
 latency are logged at INFO/DEBUG.
 """
@@ -11,7 +19,9 @@ latency are logged at INFO/DEBUG.
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from dataclasses import dataclass
 from typing import Any
 
 from anthropic import (
@@ -22,6 +32,8 @@ from anthropic import (
 )
 
 from app.llm.provider import LLMProvider
+from app.metrics import LLM_CALLS, LLM_SECONDS, LLM_TOKENS
+from app.prompts.loader import split_cache_prefix
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +48,48 @@ _RETRYABLE_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError)
 # Instruction appended when caller requests JSON output (prompt-based; no structured output)
 _JSON_INSTRUCTION = " Respond with valid JSON only, no markdown or explanation."
 
+_EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+# Shortest prefix the API caches: 1024 tokens (Sonnet/Opus), 2048 (Haiku)
+MIN_CACHEABLE_TOKENS = 1024
+MIN_CACHEABLE_TOKENS_HAIKU = 2048
+# Conservative chars-per-token estimate for English prompt text
+_CHARS_PER_TOKEN = 4
+
+
+def is_cacheable(text: str, model: str) -> bool:
+    """True if *text* is (estimated) long enough for cache_control to take effect on *model*."""
+    minimum = MIN_CACHEABLE_TOKENS_HAIKU if "haiku" in model else MIN_CACHEABLE_TOKENS
+    return len(text) >= minimum * _CHARS_PER_TOKEN
+
+
+def response_text(message: Any) -> str:
+    """Return the text of the first text block in a Messages API response ("" if none)."""
+    for block in getattr(message, "content", None) or ():
+        if getattr(block, "type", None) == "text":
+            return getattr(block, "text", "") or ""
+    return ""
+
+
+@dataclass
+class TokenUsage:
+    """Cumulative token usage for a provider instance."""
+
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+
+def _usage_count(response: Any, name: str) -> int:
+    """Read a usage counter from response.usage, falling back to a top-level attribute."""
+    for source in (getattr(response, "usage", None), response):
+        value = getattr(source, name, None) if source is not None else None
+        if isinstance(value, int):
+            return value
+    return 0
+
 
 class AnthropicProvider(LLMProvider):
     """Concrete LLM provider backed by the Anthropic Messages API."""
@@ -46,11 +100,15 @@ class AnthropicProvider(LLMProvider):
         model: str = "claude-sonnet-4-20250514",
         timeout: float = 60.0,
         max_retries: int = 3,
+        role: str = "default",
     ) -> None:
         self.model = model
+        self.role = role  # metrics label (ModelRole value)
         self.timeout = timeout
         self.max_retries = max_retries
         self._client = Anthropic(api_key=api_key, timeout=timeout)
+        self.usage = TokenUsage()
+        self._usage_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # LLMProvider interface
@@ -68,73 +126,123 @@ class AnthropicProvider(LLMProvider):
             temperature (float): Sampling temperature (default 0.7).
             max_tokens (int): Maximum tokens in the response (default 4096).
             response_format (dict): E.g. {"type": "json_object"} — adds JSON instruction to prompt.
+            cache_system_prompt (bool): Mark the system prompt as cacheable (default False).
+
+        A prompt rendered with resolve_prompt_content(..., cache_split=True) is sent as
+        two content blocks: the static prefix (cached) and the dynamic suffix. A prefix
+        or system prompt below the model's minimum cacheable length is sent unmarked.
         """
+        return self._call_with_retry(self.build_message_params(prompt, system_prompt, **kwargs))
+
+    def build_message_params(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build Messages API parameters for *prompt* (shared by complete() and batch mode)."""
         max_tokens = kwargs.get("max_tokens", DEFAULT_MAX_TOKENS)
         temperature = kwargs.get("temperature", 0.7)
         response_format = kwargs.get("response_format")
 
-        system = system_prompt or ""
-        user_content = prompt
+        static_prefix, dynamic = split_cache_prefix(prompt)
         if response_format == {"type": "json_object"}:
-            user_content = prompt.rstrip() + _JSON_INSTRUCTION
+            dynamic = dynamic.rstrip() + _JSON_INSTRUCTION
 
-        return self._call_with_retry(
-            system=system or None,
-            user_content=user_content,
-            max_tokens=max_tokens,
-            temperature=temperature,
-        )
+        user_content: str | list[dict[str, Any]] = static_prefix + dynamic
+        if static_prefix and is_cacheable(static_prefix, self.model):
+            user_content = [
+                {"type": "text", "text": static_prefix, "cache_control": _EPHEMERAL_CACHE},
+                {"type": "text", "text": dynamic},
+            ]
+        elif static_prefix:
+            logger.debug(
+                "Prompt prefix (%d chars) below the cacheable minimum for %s; sent unmarked",
+                len(static_prefix),
+                self.model,
+            )
+
+        params: dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": user_content}],
+            "temperature": temperature,
+        }
+        if system_prompt:
+            params["system"] = (
+                [{"type": "text", "text": system_prompt, "cache_control": _EPHEMERAL_CACHE}]
+                if kwargs.get("cache_system_prompt") and is_cacheable(system_prompt, self.model)
+                else system_prompt
+            )
+        return params
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    def _call_with_retry(
-        self,
-        *,
-        system: str | None,
-        user_content: str,
-        max_tokens: int,
-        temperature: float,
-    ) -> str:
+    def _record_usage(
+        self, input_tokens: int, output_tokens: int, cache_write: int, cache_read: int
+    ) -> None:
+        """Add one call's token counts to the provider's cumulative usage (thread-safe)."""
+        with self._usage_lock:
+            self.usage.calls += 1
+            self.usage.input_tokens += input_tokens
+            self.usage.output_tokens += output_tokens
+            self.usage.cache_creation_input_tokens += cache_write
+            self.usage.cache_read_input_tokens += cache_read
+        for kind, count in (
+            ("input", input_tokens),
+            ("output", output_tokens),
+            ("cache_write", cache_write),
+            ("cache_read", cache_read),
+        ):
+            LLM_TOKENS.labels(self.role, kind).inc(count)
+
+    def _call_with_retry(self, params: dict[str, Any]) -> str:
         """Call the Anthropic API with exponential-backoff retry on rate limit/timeout/connection."""
         backoff = INITIAL_BACKOFF
+        user_content = params["messages"][0]["content"]
 
         for attempt in range(1, self.max_retries + 1):
             try:
                 start = time.monotonic()
-                response = self._client.messages.create(
-                    model=self.model,
-                    max_tokens=max_tokens,
-                    system=system,
-                    messages=[{"role": "user", "content": user_content}],
-                    temperature=temperature,
-                )
+                try:
+                    response = self._client.messages.create(**params)
+                except Exception:
+                    LLM_CALLS.labels(self.role, "error").inc()
+                    raise
                 elapsed = time.monotonic() - start
+                LLM_CALLS.labels(self.role, "ok").inc()
+                LLM_SECONDS.labels(self.role).observe(elapsed)
+                text = response_text(response)
+
+                # Token usage (Anthropic exposes these on response.usage)
+                input_tokens = _usage_count(response, "input_tokens")
+                output_tokens = _usage_count(response, "output_tokens")
+                cache_write = _usage_count(response, "cache_creation_input_tokens")
+                cache_read = _usage_count(response, "cache_read_input_tokens")
+                self._record_usage(input_tokens, output_tokens, cache_write, cache_read)
 
-                # Content is a list of blocks; extract text from the first text block
-                text = ""
-                if getattr(response, "content", None):
-                    for block in response.content:
-                        if getattr(block, "type", None) == "text":
-                            text = getattr(block, "text", "") or ""
-                            break
-
-                # Token usage (Anthropic exposes input_tokens, output_tokens)
-                input_tokens = getattr(response, "input_tokens", None) or 0
-                output_tokens = getattr(response, "output_tokens", None) or 0
+                prompt_text = (
+                    user_content
+                    if isinstance(user_content, str)
+                    else "".join(block["text"] for block in user_content)
+                )
                 prompt_preview = (
-                    (user_content[:100] + "...") if len(user_content) > 100 else user_content
+                    (prompt_text[:100] + "...") if len(prompt_text) > 100 else prompt_text
                 )
                 logger.info(
-                    "LLM call: model=%s prompt_preview=%r tokens_in=%s tokens_out=%s latency=%.2fs",
+                    "LLM call: model=%s prompt_preview=%r tokens_in=%s tokens_out=%s "
+                    "cache_write=%s cache_read=%s latency=%.2fs",
                     self.model,
                     prompt_preview,
                     input_tokens,
                     output_tokens,
+                    cache_write,
+                    cache_read,
                     elapsed,
                 )
-                logger.debug("LLM prompt (full): %s", user_content)
+                logger.debug("LLM prompt (full): %s", prompt_text)
 
                 return text
 
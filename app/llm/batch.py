@@ -0,0 +1,390 @@
+"""
+Offline batch execution for LLM calls.
+
+Nightly jobs (e.g. briefing generation) do not need interactive latency. A
+BatchSession runs one worker thread per item (e.g. per company); every
+``complete()`` those workers make through ``get_llm_provider`` is queued instead of
+sent. Once every live worker is waiting on a call, the queued calls are submitted
+together as one batch, polled until the backend reports completion, and each
+worker resumes with its own result. Multi-step flows (retries, follow-up prompts)
+simply produce another batch round.
+
+Backends:
+- AnthropicBatchBackend: Message Batches API (``client.messages.batches``).
+- FileBatchBackend: local file-backed stand-in; requests and results are JSONL
+  files and a responder callable produces the completions (tests, local runs).
+
+Custom IDs are ``{worker_key}-{n}`` so each result maps back to its worker
+(e.g. ``company-42-0``).
+
+A BatchStore records each submitted batch (its id and a hash of every request)
+until its results are collected. A session with a store first looks for an
+uncollected batch holding the same requests, so a run restarted after a crash
+resumes polling the batch it already paid for instead of submitting it again.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import itertools
+import json
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from app.llm.provider import LLMProvider
+
+if TYPE_CHECKING:
+    from app.config import Settings
+
+logger = logging.getLogger(__name__)
+
+# Active (session, worker_key) for the current worker thread; None outside batch mode
+_current_worker: contextvars.ContextVar[tuple[BatchSession, str] | None] = contextvars.ContextVar(
+    "llm_batch_worker", default=None
+)
+
+
+class LLMBatchError(RuntimeError):
+    """A batched LLM request failed, expired, or was not returned by the backend."""
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batched request: completion text, or an error description."""
+
+    custom_id: str
+    text: str | None = None
+    error: str | None = None
+
+
+class BatchBackend(ABC):
+    """Submit a list of Messages API requests as one batch and fetch the results."""
+
+    @abstractmethod
+    def submit(self, requests: Sequence[tuple[str, dict[str, Any]]]) -> str:
+        """Submit (custom_id, params) requests; return the batch id."""
+        ...
+
+    @abstractmethod
+    def is_done(self, batch_id: str) -> bool:
+        """Return True once the batch has finished processing."""
+        ...
+
+    @abstractmethod
+    def results(self, batch_id: str) -> dict[str, BatchResult]:
+        """Return results keyed by custom_id for a finished batch."""
+        ...
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """Backend for the Anthropic Message Batches API."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    def submit(self, requests: Sequence[tuple[str, dict[str, Any]]]) -> str:
+        batch = self._client.messages.batches.create(
+            requests=[{"custom_id": custom_id, "params": params} for custom_id, params in requests]
+        )
+        return batch.id
+
+    def is_done(self, batch_id: str) -> bool:
+        return self._client.messages.batches.retrieve(batch_id).processing_status == "ended"
+
+    def results(self, batch_id: str) -> dict[str, BatchResult]:
+        from app.llm.anthropic_provider import response_text
+
+        out: dict[str, BatchResult] = {}
+        for entry in self._client.messages.batches.results(batch_id):
+            result = entry.result
+            if result.type == "succeeded":
+                out[entry.custom_id] = BatchResult(
+                    entry.custom_id, text=response_text(result.message)
+                )
+            else:
+                detail = getattr(getattr(result, "error", None), "error", None)
+                message = getattr(detail, "message", None)
+                error = f"{result.type}: {message}" if message else result.type
+                out[entry.custom_id] = BatchResult(entry.custom_id, error=error)
+        return out
+
+
+class FileBatchBackend(BatchBackend):
+    """File-backed stand-in for a batch API.
+
+    submit() writes ``{directory}/{batch_id}.requests.jsonl``; the first is_done()
+    call answers every request with *responder* and writes
+    ``{batch_id}.results.jsonl``. A responder exception becomes that request's error.
+    """
+
+    def __init__(self, directory: Path, responder: Callable[[dict[str, Any]], str]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._responder = responder
+
+    def _path(self, batch_id: str, kind: str) -> Path:
+        return self.directory / f"{batch_id}.{kind}.jsonl"
+
+    def submit(self, requests: Sequence[tuple[str, dict[str, Any]]]) -> str:
+        batch_id = f"batch_{uuid.uuid4().hex}"
+        lines = [json.dumps({"custom_id": cid, "params": params}) for cid, params in requests]
+        self._path(batch_id, "requests").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return batch_id
+
+    def is_done(self, batch_id: str) -> bool:
+        results_path = self._path(batch_id, "results")
+        if not results_path.exists():
+            lines = []
+            for line in self._path(batch_id, "requests").read_text(encoding="utf-8").splitlines():
+                request = json.loads(line)
+                try:
+                    row = {
+                        "custom_id": request["custom_id"],
+                        "text": self._responder(request["params"]),
+                    }
+                except Exception as exc:
+                    row = {"custom_id": request["custom_id"], "error": str(exc)}
+                lines.append(json.dumps(row))
+            results_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return True
+
+    def results(self, batch_id: str) -> dict[str, BatchResult]:
+        out: dict[str, BatchResult] = {}
+        for line in self._path(batch_id, "results").read_text(encoding="utf-8").splitlines():
+            row = json.loads(line)
+            out[row["custom_id"]] = BatchResult(row["custom_id"], row.get("text"), row.get("error"))
+        return out
+
+
+class BatchStore(ABC):
+    """Persist submitted batches so a restarted run can resume them."""
+
+    @abstractmethod
+    def find(self, request_hashes: set[str]) -> tuple[str, dict[str, str]] | None:
+        """Return (batch_id, {custom_id: request_hash}) of an uncollected batch.
+
+        The batch must hold every hash in request_hashes; None if there is none.
+        """
+        ...
+
+    @abstractmethod
+    def save(self, batch_id: str, requests: dict[str, str]) -> None:
+        """Record a submitted batch and its {custom_id: request_hash}."""
+        ...
+
+    @abstractmethod
+    def mark_collected(self, batch_id: str) -> None:
+        """Record that the batch's results were fetched; it is no longer resumable."""
+        ...
+
+
+def request_hash(params: dict[str, Any]) -> str:
+    """Stable hash of one request's params (matches requests across runs)."""
+    payload = json.dumps(params, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+@dataclass
+class _PendingCall:
+    custom_id: str
+    params: dict[str, Any]
+    done: threading.Event = field(default_factory=threading.Event)
+    result: BatchResult | None = None
+
+
+class _BatchedProvider(LLMProvider):
+    """LLMProvider that queues complete() into the worker's BatchSession."""
+
+    def __init__(self, base: LLMProvider) -> None:
+        self._base = base
+
+    def complete(self, prompt: str, system_prompt: str | None = None, **kwargs: Any) -> str:
+        worker = _current_worker.get()
+        build = getattr(self._base, "build_message_params", None)
+        if worker is None or build is None:
+            return self._base.complete(prompt, system_prompt, **kwargs)
+        session, key = worker
+        return session.complete(key, build(prompt, system_prompt, **kwargs))
+
+
+class BatchSession:
+    """Run per-item work in worker threads, batching their LLM calls round by round."""
+
+    def __init__(
+        self,
+        backend: BatchBackend,
+        *,
+        poll_interval: float = 30.0,
+        timeout: float = 24 * 3600.0,
+        store: BatchStore | None = None,
+    ) -> None:
+        self.backend = backend
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.store = store
+        self.batches_submitted = 0
+        self._lock = threading.Lock()
+        self._active = 0
+        self._pending: list[_PendingCall] = []
+        self._seq = itertools.count()
+
+    def run(
+        self,
+        fn: Callable[..., Any],
+        args_list: Sequence[tuple[Any, ...]],
+        keys: Sequence[str],
+    ) -> list[Future]:
+        """Call ``fn(*args)`` for each args tuple in its own worker; return futures in order.
+
+        *keys* label each worker's requests (custom_id prefix, [A-Za-z0-9_-]).
+        Blocks until every worker has finished.
+        """
+        futures: list[Future] = [Future() for _ in args_list]
+        with self._lock:
+            self._active += len(args_list)
+        threads = []
+        for key, args, future in zip(keys, args_list, futures, strict=True):
+            ctx = contextvars.copy_context()
+            thread = threading.Thread(
+                target=ctx.run,
+                args=(self._work, key, fn, args, future),
+                name=f"llm-batch-{key}",
+                daemon=True,
+            )
+            threads.append(thread)
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return futures
+
+    def wrap(self, provider: LLMProvider) -> LLMProvider:
+        """Return a provider whose complete() is batched inside this session's workers."""
+        return _BatchedProvider(provider)
+
+    def complete(self, key: str, params: dict[str, Any]) -> str:
+        """Queue one request for worker *key* and block until its batch finishes."""
+        call = _PendingCall(f"{key}-{next(self._seq)}", params)
+        with self._lock:
+            self._pending.append(call)
+            ready = self._take_ready_locked()
+        if ready:
+            self._flush(ready)
+        call.done.wait()
+        assert call.result is not None
+        if call.result.error is not None or call.result.text is None:
+            raise LLMBatchError(
+                f"Batched request {call.custom_id} failed: {call.result.error or 'no result'}"
+            )
+        return call.result.text
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+
+    def _work(
+        self, key: str, fn: Callable[..., Any], args: tuple[Any, ...], future: Future
+    ) -> None:
+        _current_worker.set((self, key))
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with self._lock:
+                self._active -= 1
+                ready = self._take_ready_locked()
+            if ready:
+                self._flush(ready)
+
+    def _take_ready_locked(self) -> list[_PendingCall]:
+        """Hand back the queued calls once every live worker is waiting on one."""
+        if self._pending and len(self._pending) >= self._active:
+            ready, self._pending = self._pending, []
+            return ready
+        return []
+
+    def _flush(self, calls: list[_PendingCall]) -> None:
+        hashes = {c.custom_id: request_hash(c.params) for c in calls}
+        by_hash: dict[str, BatchResult] = {}
+        failure: str | None = None
+        try:
+            batch_id, submitted = self._submit_or_resume(calls, hashes)
+            deadline = time.monotonic() + self.timeout
+            while not self.backend.is_done(batch_id):
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"LLM batch {batch_id} not finished after {self.timeout}s")
+                time.sleep(self.poll_interval)
+            results = self.backend.results(batch_id)
+            logger.info("LLM batch finished: batch_id=%s results=%d", batch_id, len(results))
+            by_hash = {submitted[cid]: r for cid, r in results.items() if cid in submitted}
+            if self.store is not None:
+                try:
+                    self.store.mark_collected(batch_id)
+                except Exception:
+                    logger.exception("Could not mark LLM batch %s collected", batch_id)
+        except Exception as exc:
+            logger.exception("LLM batch failed")
+            failure = str(exc)
+        for call in calls:
+            result = by_hash.get(hashes[call.custom_id])
+            call.result = (
+                BatchResult(call.custom_id, result.text, result.error)
+                if result is not None
+                else BatchResult(call.custom_id, error=failure or "missing from batch results")
+            )
+            call.done.set()
+
+    def _submit_or_resume(
+        self, calls: list[_PendingCall], hashes: dict[str, str]
+    ) -> tuple[str, dict[str, str]]:
+        """Resume a stored batch holding these requests, else submit (and store) one.
+
+        Returns the batch id and its {custom_id: request_hash}.
+        """
+        if self.store is not None:
+            found = self.store.find(set(hashes.values()))
+            if found is not None:
+                logger.info("LLM batch resumed: batch_id=%s requests=%d", found[0], len(calls))
+                return found
+        batch_id = self.backend.submit([(c.custom_id, c.params) for c in calls])
+        self.batches_submitted += 1
+        logger.info("LLM batch submitted: batch_id=%s requests=%d", batch_id, len(calls))
+        if self.store is not None:
+            try:
+                self.store.save(batch_id, hashes)
+            except Exception:
+                logger.exception("Could not record LLM batch %s; it cannot be resumed", batch_id)
+        return batch_id, hashes
+
+
+def current_batch_session() -> BatchSession | None:
+    """Return the BatchSession whose worker is running on this thread, if any."""
+    worker = _current_worker.get()
+    return worker[0] if worker is not None else None
+
+
+def get_batch_backend(settings: Settings | None = None) -> BatchBackend:
+    """Return the batch backend for the configured LLM provider (Anthropic only)."""
+    if settings is None:
+        from app.config import get_settings
+
+        settings = get_settings()
+    api_key = getattr(settings, "anthropic_api_key", None) or settings.llm_api_key
+    if not api_key:
+        raise ValueError(
+            "LLM_API_KEY or ANTHROPIC_API_KEY required for Anthropic provider. "
+            "Set one in your environment or .env file."
+        )
+    from anthropic import Anthropic
+
+    return AnthropicBatchBackend(Anthropic(api_key=api_key, timeout=settings.llm_timeout))
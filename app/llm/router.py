@@ -3,6 +3,8 @@ LLM provider router / factory.
 
 Returns the correct LLMProvider implementation based on application settings.
 Provider instances are cached per (provider_name, role) to reuse connections.
+Inside a BatchSession worker (app.llm.batch) the provider is wrapped so its calls
+are queued into the session's batch instead of sent immediately.
 
 Security: API keys are never logged; only provider name, role, and model are logged.
 """
@@ -13,6 +15,7 @@ import logging
 from enum import Enum
 from typing import TYPE_CHECKING
 
+from app.llm.batch import current_batch_session
 from app.llm.provider import LLMProvider
 
 if TYPE_CHECKING:
@@ -45,7 +48,8 @@ def get_llm_provider(
         settings: Application settings. If *None*, loads from ``get_settings()``.
 
     Returns:
-        A cached LLMProvider instance configured for the role.
+        A cached LLMProvider instance configured for the role (batch-wrapped when
+        called from a BatchSession worker).
 
     Raises:
         ValueError: If the configured provider is not supported or API key is missing.
@@ -58,8 +62,10 @@ def get_llm_provider(
     provider_name = settings.llm_provider.lower()
     cache_key = f"{provider_name}:{role.value}"
 
+    batch_session = current_batch_session()
     if cache_key in _provider_cache:
-        return _provider_cache[cache_key]
+        provider = _provider_cache[cache_key]
+        return batch_session.wrap(provider) if batch_session is not None else provider
 
     if provider_name == "anthropic":
         anthropic_api_key = getattr(settings, "anthropic_api_key", None) or settings.llm_api_key
@@ -83,13 +89,14 @@ def get_llm_provider(
             model=model,
             timeout=settings.llm_timeout,
             max_retries=settings.llm_max_retries,
+            role=role.value,
         )
     else:
         raise ValueError(f"Unknown LLM provider: '{provider_name}'. Supported provider: anthropic")
 
     _provider_cache[cache_key] = provider
     logger.info("Created LLM provider: %s role=%s model=%s", provider_name, role.value, model)
-    return provider
+    return batch_session.wrap(provider) if batch_session is not None else provider
 
 
 def clear_provider_cache() -> None:
@@ -11,7 +11,7 @@ from fastapi import FastAPI
 
 from app import __version__
 from app.config import get_settings
-from app.db.session import check_db_connection, engine
+from app.db.session import check_db_connection, dispose_async_engine, get_engine
 
 logging.basicConfig(
     level=logging.INFO,
@@ -24,6 +24,9 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan: startup and shutdown."""
     logger.info("SignalForge starting")
+    from app.api.concurrency import configure_threadpool
+
+    configure_threadpool(get_settings().threadpool_size)
     try:
         try:
             check_db_connection()
@@ -55,7 +58,8 @@ async def lifespan(app: FastAPI):
         yield
     finally:
         logger.info("SignalForge shutting down")
-        engine.dispose()
+        get_engine().dispose()
+        await dispose_async_engine()
         logger.info("Database connection pool closed")
 
 
@@ -70,6 +74,11 @@ def create_app() -> FastAPI:
         redoc_url="/redoc" if settings.debug else None,
     )
 
+    # Per-request SQL statement counts and DB time (app.db.profiling)
+    from app.api.middleware import QueryProfilingMiddleware
+
+    app.add_middleware(QueryProfilingMiddleware)
+
     # Mount API routes
     from app.api.auth import router as auth_router
     from app.api.bias_views import router as bias_views_router
@@ -96,9 +105,11 @@ def create_app() -> FastAPI:
     app.include_router(settings_views_router, tags=["settings-views"])
 
     # Internal job endpoints (cron/scripts — token-authenticated)
+    from app.api.internal import metrics_router
     from app.api.internal import router as internal_router
 
     app.include_router(internal_router, tags=["internal"])
+    app.include_router(metrics_router, tags=["internal"])
 
     @app.get("/health")
     def health() -> dict:
@@ -106,7 +117,7 @@ def create_app() -> FastAPI:
         from sqlalchemy import text
 
         try:
-            with engine.connect() as conn:
+            with get_engine().connect() as conn:
                 conn.execute(text("SELECT 1"))
             return {
                 "status": "ok",
@@ -0,0 +1,155 @@
+"""Prometheus metrics for pipeline and HTTP throughput, served at GET /metrics.
+
+Counters and histograms are module-level and updated where the work happens
+(ingest, derive, score, LLM calls, page fetches, caches, DB pool checkouts,
+HTTP requests). Under gunicorn each worker is a separate process: with
+PROMETHEUS_MULTIPROC_DIR set (gunicorn.conf.py sets it) prometheus_client
+writes every process's values to files in that directory and render_metrics()
+merges them, so a scrape of any worker reports totals for all of them. Without
+it (uvicorn, tests) the process's own registry is served.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.config import get_settings
+
+# Host label for fetches once METRICS_MAX_HOSTS distinct hosts have been seen
+OTHER_HOST = "other"
+
+_FAST_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+_SLOW_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+HTTP_REQUESTS = Counter(
+    "signalforge_http_requests_total",
+    "HTTP requests served, by route template and status code",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_SECONDS = Histogram(
+    "signalforge_http_request_seconds",
+    "HTTP request duration",
+    ["method", "route"],
+    buckets=_FAST_BUCKETS,
+)
+INGEST_EVENTS = Counter(
+    "signalforge_ingest_events_total",
+    "Raw events stored by ingest, by source and outcome (inserted, duplicate, invalid, error)",
+    ["source", "outcome"],
+)
+DERIVE_INSTANCES = Counter(
+    "signalforge_derive_instances_upserted_total",
+    "SignalInstances upserted by derive runs",
+)
+COMPANIES_SCORED = Counter(
+    "signalforge_companies_scored_total",
+    "Companies given a readiness snapshot, by job type (score, score_partition)",
+    ["job_type"],
+)
+LLM_CALLS = Counter(
+    "signalforge_llm_calls_total",
+    "LLM API calls, by model role and outcome (ok, error)",
+    ["role", "outcome"],
+)
+LLM_TOKENS = Counter(
+    "signalforge_llm_tokens_total",
+    "LLM tokens, by model role and kind (input, output, cache_write, cache_read)",
+    ["role", "kind"],
+)
+LLM_SECONDS = Histogram(
+    "signalforge_llm_request_seconds",
+    "LLM API call latency (successful calls)",
+    ["role"],
+    buckets=_SLOW_BUCKETS,
+)
+FETCH_SECONDS = Histogram(
+    "signalforge_http_fetch_seconds",
+    "Outbound page fetch latency, by host and outcome (ok, http_error, error)",
+    ["host", "outcome"],
+    buckets=_SLOW_BUCKETS,
+)
+CACHE_REQUESTS = Counter(
+    "signalforge_cache_requests_total",
+    "Cache lookups, by cache (robots, scoring_profile, read_api) and result (hit, miss)",
+    ["cache", "result"],
+)
+PACK_LOAD_SECONDS = Histogram(
+    "signalforge_pack_load_seconds",
+    "Time to load a pack config from disk",
+    buckets=_FAST_BUCKETS,
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "signalforge_db_pool_checkout_seconds",
+    "Time to check a connection out of the pool (waiting, connecting, pre-ping)",
+    ["engine"],
+    buckets=_FAST_BUCKETS,
+)
+
+_hosts_lock = threading.Lock()
+_hosts: set[str] = set()
+
+
+def host_label(url: str) -> str:
+    """Host of url; OTHER_HOST past METRICS_MAX_HOSTS distinct hosts (bounds series count)."""
+    host = (urlsplit(url).hostname or "").lower() or OTHER_HOST
+    with _hosts_lock:
+        if host in _hosts:
+            return host
+        if len(_hosts) >= get_settings().metrics_max_hosts:
+            return OTHER_HOST
+        _hosts.add(host)
+    return host
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class _TimedCheckout:
+    """Pool mixin observing connect() duration in DB_POOL_CHECKOUT_SECONDS."""
+
+    engine_label = "sync"
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(self.engine_label).observe(
+                time.perf_counter() - started
+            )
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    """QueuePool for the sync engine that times checkouts."""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool for the async engine that times checkouts."""
+
+    engine_label = "async"
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Text exposition of all metrics (merged across processes in multiprocess mode)."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -7,6 +7,7 @@ from app.models.bias_report import BiasReport
 from app.models.briefing_item import BriefingItem
 from app.models.company import Company
 from app.models.company_alias import CompanyAlias
+from app.models.company_display_score import CompanyDisplayScore
 from app.models.engagement_snapshot import EngagementSnapshot
 from app.models.evidence_bundle import EvidenceBundle
 from app.models.evidence_bundle_source import EvidenceBundleSource
@@ -19,7 +20,10 @@ from app.models.operator_profile import OperatorProfile
 from app.models.outreach_history import OutreachHistory
 from app.models.outreach_recommendation import OutreachRecommendation
 from app.models.page_snapshot import PageSnapshot
+from app.models.pipeline_job import PipelineJob
+from app.models.read_cache_generation import ReadCacheGeneration
 from app.models.readiness_snapshot import ReadinessSnapshot
+from app.models.score_dirty_company import ScoreDirtyCompany
 from app.models.scout_evidence_bundle import ScoutEvidenceBundle
 from app.models.scout_run import ScoutRun
 from app.models.signal_event import SignalEvent
@@ -39,6 +43,7 @@ __all__ = [
     "BriefingItem",
     "Company",
     "CompanyAlias",
+    "CompanyDisplayScore",
     "EngagementSnapshot",
     "EvidenceBundle",
     "EvidenceBundleSource",
@@ -48,10 +53,13 @@ __all__ = [
     "OutreachHistory",
     "OutreachRecommendation",
     "PageSnapshot",
+    "PipelineJob",
     "JobRun",
     "LeadFeed",
     "OperatorProfile",
+    "ReadCacheGeneration",
     "ReadinessSnapshot",
+    "ScoreDirtyCompany",
     "ScoutEvidenceBundle",
     "ScoutRun",
     "SignalEvent",
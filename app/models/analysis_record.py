@@ -21,6 +21,8 @@ class AnalysisRecord(Base):
     """LLM analysis result for a company (stage classification + pain signals).
 
     pack_id attributes this analysis to a pack (Phase 2). NULL treated as default pack.
+    corpus_fingerprint hashes the analysis inputs (signal content hashes, pack config
+    checksum, prompt templates) so unchanged companies can reuse this record.
     """
 
     __tablename__ = "analysis_records"
@@ -44,6 +46,7 @@ class AnalysisRecord(Base):
         ForeignKey("signal_packs.id", ondelete="SET NULL"),
         nullable=True,
     )
+    corpus_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     company: Mapped[Company] = relationship("Company", back_populates="analysis_records")
     briefing_items: Mapped[list[BriefingItem]] = relationship(
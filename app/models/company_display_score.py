@@ -0,0 +1,38 @@
+"""CompanyDisplayScore model — latest readiness composite per (company, pack)."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Index, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class CompanyDisplayScore(Base):
+    """Denormalized display score: the composite of the latest ReadinessSnapshot.
+
+    Maintained by statement-level triggers on readiness_snapshots (see migration
+    20260313_company_display_scores), so every snapshot writer keeps it current.
+    Read-only from the application; backs score-sorted company lists.
+    """
+
+    __tablename__ = "company_display_scores"
+
+    __table_args__ = (
+        Index("ix_company_display_scores_pack_score", "pack_id", "score", "company_id"),
+    )
+
+    company_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True
+    )
+    pack_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("signal_packs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    score: Mapped[int] = mapped_column(Integer, nullable=False)
+    as_of: Mapped[date] = mapped_column(Date, nullable=False)
@@ -4,6 +4,7 @@ from datetime import UTC, datetime
 from uuid import UUID
 
 from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -45,4 +46,15 @@ class JobRun(Base):
         nullable=True,
     )
     retry_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Per-node child runs of a pipelined job (app.pipeline.dag)
+    parent_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("job_runs.id", ondelete="CASCADE"), nullable=True, index=True
+    )
     idempotency_key: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # SQL statements issued and cumulative DB time of the run (app.db.profiling)
+    query_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    db_time_ms: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Per-span timing, statements and slowest companies (app.services.job_metrics)
+    metrics: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    # LLM batches the run submitted: id, request hashes, collected (app.llm.batch resume)
+    llm_batches: Mapped[list | None] = mapped_column(JSONB, nullable=True)
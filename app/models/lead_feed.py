@@ -10,7 +10,7 @@ import uuid
 from datetime import UTC, date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Date, DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -29,6 +29,20 @@ class LeadFeed(Base):
 
     __tablename__ = "lead_feed"
 
+    __table_args__ = (
+        # Lead list: one index range per workspace/pack/day, ranked by outreach_score
+        Index(
+            "ix_lead_feed_workspace_pack_as_of_outreach",
+            "workspace_id",
+            "pack_id",
+            "as_of",
+            "outreach_score",
+            "entity_id",
+            postgresql_ops={"outreach_score": "DESC", "entity_id": "DESC"},
+            postgresql_include=["composite_score", "cadence_blocked"],
+        ),
+    )
+
     workspace_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("workspaces.id", ondelete="CASCADE"),
@@ -45,6 +59,10 @@ class LeadFeed(Base):
         primary_key=True,
     )
     composite_score: Mapped[int] = mapped_column(Integer, nullable=False)
+    # OutreachScore = round(TRS x ESL) and ESL inputs, materialized at projection time
+    outreach_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    esl_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    cadence_blocked: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     top_signal_ids: Mapped[list | None] = mapped_column(JSONB, nullable=True)
     esl_decision: Mapped[str | None] = mapped_column(String(32), nullable=True)
     sensitivity_level: Mapped[str | None] = mapped_column(String(32), nullable=True)
@@ -0,0 +1,22 @@
+"""ReadCacheGeneration model — change counters for cached read API responses."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class ReadCacheGeneration(Base):
+    """One counter per cache scope; bumped when the data behind cached responses changes."""
+
+    __tablename__ = "read_cache_generations"
+
+    scope: Mapped[str] = mapped_column(String(32), primary_key=True)
+    generation: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
@@ -0,0 +1,26 @@
+"""ScoreDirtyCompany model — companies whose scoring inputs changed (incremental scoring)."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.session import Base
+
+
+class ScoreDirtyCompany(Base):
+    """Queue entry: company needs rescoring (one row per company; enqueued_at bumped)."""
+
+    __tablename__ = "score_dirty_companies"
+
+    __table_args__ = (Index("ix_score_dirty_companies_enqueued_at", "enqueued_at"),)
+
+    company_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("companies.id", ondelete="CASCADE"), primary_key=True
+    )
+    reason: Mapped[str] = mapped_column(String(32), nullable=False)
+    enqueued_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
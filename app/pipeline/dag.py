@@ -0,0 +1,196 @@
+"""Small DAG executor for pipeline stages (pipelined daily aggregation).
+
+Nodes run as soon as their dependencies complete. I/O nodes (io=True, e.g.
+adapter fetches) run on a thread pool and must not touch the session; every
+other node runs on the calling thread with the caller's session, in the order
+it became ready. So stage work for one branch (store -> derive -> score) runs
+while other branches are still fetching.
+
+Each node's timing, status, error, SQL statement count and span metrics
+(session-bound nodes; app.db.profiling, app.services.job_metrics) are recorded
+on a child JobRun (parent_id = the parent run, job_type = node name).
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.db.profiling import track_queries
+from app.models.job_run import JobRun
+from app.services.job_metrics import collect_job_metrics
+
+logger = logging.getLogger(__name__)
+
+# Node callable: results of its dependencies by node name -> node result
+NodeFn = Callable[[dict[str, Any]], Any]
+
+
+@dataclass
+class DagNode:
+    """One unit of work in a PipelineDag."""
+
+    name: str
+    run: NodeFn
+    deps: tuple[str, ...] = ()
+    io: bool = False  # run on the thread pool (no DB session)
+    run_on_failure: bool = False  # run even if a dependency failed or was skipped
+
+
+@dataclass
+class NodeRun:
+    """Outcome of a node: status completed, failed or skipped."""
+
+    status: str
+    result: Any = None
+    error: str | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    duration_ms: int = 0
+    query_count: int | None = None  # session-bound nodes only
+    db_time_ms: int | None = None
+    metrics: dict[str, Any] | None = field(default=None, repr=False)
+    job_run_id: int | None = field(default=None, repr=False)
+
+
+class PipelineDag:
+    """Register nodes with add(), then run() once.
+
+    Dependencies must be added before their dependents, so the graph is acyclic
+    by construction.
+    """
+
+    def __init__(self, db: Session, *, parent: JobRun | None = None, max_workers: int = 4) -> None:
+        self.db = db
+        self.parent = parent
+        self.max_workers = max(1, max_workers)
+        self.nodes: dict[str, DagNode] = {}
+
+    def add(
+        self,
+        name: str,
+        run: NodeFn,
+        deps: Iterable[str] = (),
+        *,
+        io: bool = False,
+        run_on_failure: bool = False,
+    ) -> str:
+        """Add a node. Returns its name. Raises ValueError on a duplicate or unknown dep."""
+        if name in self.nodes:
+            raise ValueError(f"Duplicate DAG node: {name}")
+        deps = tuple(deps)
+        unknown = [dep for dep in deps if dep not in self.nodes]
+        if unknown:
+            raise ValueError(f"DAG node {name} depends on unknown nodes: {unknown}")
+        self.nodes[name] = DagNode(name, run, deps, io=io, run_on_failure=run_on_failure)
+        return name
+
+    def run(self) -> dict[str, NodeRun]:
+        """Execute every node; a node whose dependency did not complete is skipped."""
+        runs: dict[str, NodeRun] = {}
+        pending = list(self.nodes)  # insertion order breaks ties among ready nodes
+        inflight: dict[Future, tuple[str, datetime, float]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="dag") as pool:
+            while pending or inflight:
+                for name in [n for n in pending if self._deps_done(n, runs)]:
+                    node = self.nodes[name]
+                    if not self._deps_ok(node, runs):
+                        pending.remove(name)
+                        runs[name] = NodeRun(status="skipped", error="dependency did not complete")
+                        self._record(name, runs[name])
+                    elif node.io:
+                        pending.remove(name)
+                        future = pool.submit(node.run, self._inputs(node, runs))
+                        inflight[future] = (name, datetime.now(UTC), time.perf_counter())
+
+                ready = next(
+                    (n for n in pending if not self.nodes[n].io and self._deps_done(n, runs)),
+                    None,
+                )
+                if ready is not None:
+                    # One session-bound node, then check for newly finished I/O
+                    pending.remove(ready)
+                    node = self.nodes[ready]
+                    started, clock = datetime.now(UTC), time.perf_counter()
+                    with track_queries() as stats, collect_job_metrics() as metrics:
+                        try:
+                            result = node.run(self._inputs(node, runs))
+                            runs[ready] = self._finished(result, None, started, clock)
+                        except Exception as exc:
+                            logger.exception("DAG node %s failed", ready)
+                            self.db.rollback()
+                            runs[ready] = self._finished(None, str(exc), started, clock)
+                    runs[ready].query_count = stats.count
+                    runs[ready].db_time_ms = round(stats.db_ms)
+                    runs[ready].metrics = metrics.to_dict()
+                    self._record(ready, runs[ready])
+                    done = [f for f in inflight if f.done()]
+                elif inflight:
+                    done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                else:
+                    done = []
+
+                for future in done:
+                    name, started, clock = inflight.pop(future)
+                    try:
+                        runs[name] = self._finished(future.result(), None, started, clock)
+                    except Exception as exc:
+                        logger.warning("DAG node %s failed: %s", name, exc)
+                        runs[name] = self._finished(None, str(exc), started, clock)
+                    self._record(name, runs[name])
+        return runs
+
+    def _deps_done(self, name: str, runs: dict[str, NodeRun]) -> bool:
+        return all(dep in runs for dep in self.nodes[name].deps)
+
+    def _deps_ok(self, node: DagNode, runs: dict[str, NodeRun]) -> bool:
+        return node.run_on_failure or all(runs[dep].status == "completed" for dep in node.deps)
+
+    @staticmethod
+    def _inputs(node: DagNode, runs: dict[str, NodeRun]) -> dict[str, Any]:
+        return {dep: runs[dep].result for dep in node.deps}
+
+    @staticmethod
+    def _finished(result: Any, error: str | None, started: datetime, clock: float) -> NodeRun:
+        # A stage that reports status failed fails the node, so dependents are skipped
+        if error is None and isinstance(result, dict) and result.get("status") == "failed":
+            error = result.get("error") or "stage failed"
+        return NodeRun(
+            status="failed" if error else "completed",
+            result=result,
+            error=error,
+            started_at=started,
+            finished_at=datetime.now(UTC),
+            duration_ms=round((time.perf_counter() - clock) * 1000),
+        )
+
+    def _record(self, name: str, run: NodeRun) -> None:
+        """Child JobRun for the node (skipped when there is no parent run)."""
+        if self.parent is None:
+            return
+        now = datetime.now(UTC)
+        child = JobRun(
+            job_type=name[:64],
+            status=run.status,
+            parent_id=self.parent.id,
+            workspace_id=self.parent.workspace_id,
+            pack_id=self.parent.pack_id,
+            started_at=run.started_at or now,
+            finished_at=run.finished_at or now,
+            error_message=run.error,
+            query_count=run.query_count,
+            db_time_ms=run.db_time_ms,
+            metrics=run.metrics,
+        )
+        self.db.add(child)
+        self.db.commit()
+        run.job_run_id = child.id
+        logger.info("DAG node %s %s in %d ms", name, run.status, run.duration_ms)
@@ -11,20 +11,22 @@ Issue #285, Milestone 6: derive uses core derivers only; pack deriver fallback r
 from __future__ import annotations
 
 import logging
-from collections.abc import Mapping
+from collections.abc import Collection, Mapping
 from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, text
+from sqlalchemy import func, or_, text
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.core_derivers.loader import get_core_passthrough_map, get_core_pattern_derivers
+from app.metrics import DERIVE_INSTANCES
 from app.models.job_run import JobRun
 from app.models.signal_event import SignalEvent
 from app.models.signal_instance import SignalInstance
 from app.services.pack_resolver import get_core_pack_id
+from app.services.readiness.dirty_queue import enqueue_dirty_companies
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,41 @@ logger = logging.getLogger(__name__)
 _DEFAULT_PATTERN_SOURCE_FIELDS = ("title", "summary")
 
 
+def _changed_entity_ids(db: Session, pack_uuid: UUID, values: list[dict[str, Any]]) -> set[int]:
+    """Entities whose instances the upsert will create or change (for rescoring).
+
+    Re-derives re-upsert every instance; only new instances, a later last_seen, a
+    new confidence or new evidence events change what readiness reads.
+    """
+    if not values:
+        return set()
+    existing = {
+        (inst.entity_id, inst.signal_id): inst
+        for inst in db.query(SignalInstance).filter(
+            SignalInstance.pack_id == pack_uuid,
+            SignalInstance.entity_id.in_({v["entity_id"] for v in values}),
+        )
+    }
+    changed: set[int] = set()
+    for v in values:
+        inst = existing.get((v["entity_id"], v["signal_id"]))
+        if (
+            inst is None
+            or (
+                v["last_seen"] is not None
+                and (inst.last_seen is None or v["last_seen"] > inst.last_seen)
+            )
+            or (
+                v["first_seen"] is not None
+                and (inst.first_seen is None or v["first_seen"] < inst.first_seen)
+            )
+            or (v["confidence"] is not None and v["confidence"] != inst.confidence)
+            or not set(v["evidence_event_ids"] or []) <= set(inst.evidence_event_ids or [])
+        ):
+            changed.add(v["entity_id"])
+    return changed
+
+
 def _load_core_derivers() -> tuple[dict[str, str], list[dict[str, Any]]]:
     """Load core passthrough map and pattern derivers (Issue #285).
 
@@ -92,6 +129,7 @@ def run_deriver(
     workspace_id: str | UUID | None = None,
     pack_id: str | UUID | None = None,
     company_ids: list[int] | None = None,
+    skip_company_ids: Collection[int] | None = None,
 ) -> dict[str, Any]:
     """Run deriver: read SignalEvents, apply core derivers, upsert signal_instances.
 
@@ -102,8 +140,11 @@ def run_deriver(
     produces same signal_instances (upsert by natural key). Creates JobRun record for audit.
 
     Args:
-        company_ids: Optional list of company IDs to scope events (test-only; not
-            exposed via API). When None, processes all events in the read pack.
+        company_ids: Optional list of company IDs to scope events (one partition of
+            the pipelined daily aggregation; not exposed via API). When None,
+            processes all events in the read pack.
+        skip_company_ids: Optional company IDs whose events are left out (already
+            derived by a partition of the same pipelined run).
 
     Returns:
         dict with status, job_run_id, instances_upserted, events_processed, events_skipped
@@ -138,7 +179,9 @@ def run_deriver(
     db.refresh(job)
 
     try:
-        return _run_deriver_core(db, job, core_uuid, company_ids=company_ids)
+        return _run_deriver_core(
+            db, job, core_uuid, company_ids=company_ids, skip_company_ids=skip_company_ids
+        )
     except Exception as exc:
         logger.exception("Deriver job failed")
         job.finished_at = datetime.now(UTC)
@@ -160,6 +203,7 @@ def _run_deriver_core(
     job: JobRun,
     pack_uuid: UUID,
     company_ids: list[int] | None = None,
+    skip_company_ids: Collection[int] | None = None,
 ) -> dict[str, Any]:
     """Core deriver logic. Updates job in-place, commits, returns result dict.
 
@@ -195,6 +239,13 @@ def _run_deriver_core(
     q = db.query(SignalEvent)
     if company_ids is not None:
         q = q.filter(SignalEvent.company_id.in_(company_ids))
+    if skip_company_ids:
+        q = q.filter(
+            or_(
+                SignalEvent.company_id.is_(None),
+                SignalEvent.company_id.notin_(list(skip_company_ids)),
+            )
+        )
     events = q.all()
 
     # Aggregate by (entity_id, signal_id): min first_seen, max last_seen, latest confidence
@@ -266,6 +317,7 @@ def _run_deriver_core(
             }
         )
 
+    changed_entity_ids = _changed_entity_ids(db, pack_uuid, values)
     if values:
         stmt = insert(SignalInstance).values(values)
         # Merge evidence_event_ids and deduplicate (avoids unbounded growth on re-runs)
@@ -297,7 +349,10 @@ def _run_deriver_core(
         )
         db.execute(stmt)
 
+    enqueue_dirty_companies(db, changed_entity_ids, "derive")
+
     upserted = len(values)
+    DERIVE_INSTANCES.inc(upserted)
     job.finished_at = datetime.now(UTC)
     job.status = "completed"
     job.companies_processed = upserted
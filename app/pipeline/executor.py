@@ -5,12 +5,14 @@ from __future__ import annotations
 import logging
 from uuid import UUID
 
-from fastapi import HTTPException
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
+from app.db.profiling import QueryStats, track_queries
 from app.models.job_run import JobRun
 from app.pipeline.rate_limits import check_workspace_rate_limit
 from app.pipeline.stages import DEFAULT_WORKSPACE_ID
+from app.services.job_metrics import JobMetrics, collect_job_metrics
 from app.services.pack_resolver import get_pack_for_workspace
 
 logger = logging.getLogger(__name__)
@@ -22,6 +24,7 @@ def run_stage(
     workspace_id: str | UUID | None = None,
     pack_id: UUID | None = None,
     idempotency_key: str | None = None,
+    check_rate_limit: bool = True,
     **stage_kwargs: object,
 ) -> dict:
     """Run a pipeline stage with idempotency and rate limit checks.
@@ -29,7 +32,8 @@ def run_stage(
     Resolves default workspace and pack when not provided.
     Returns cached result if idempotency_key matches a recent completed run
     for the same workspace and job_type.
-    Raises HTTPException 429 if rate limit exceeded.
+    Raises HTTPException 429 if rate limit exceeded. The queue worker passes
+    check_rate_limit=False: queued jobs were rate limited when enqueued.
 
     Idempotency keys are workspace-scoped. Callers should use
     workspace-scoped keys (e.g. ``{workspace_id}:{timestamp}``) to avoid
@@ -64,7 +68,11 @@ def run_stage(
             )
             return _cached_result(existing, job_type)
 
-    if not check_workspace_rate_limit(db, ws_id, job_type):
+    if check_rate_limit and not check_workspace_rate_limit(db, ws_id, job_type):
+        # Imported here: only API callers check the rate limit, and fastapi is
+        # a large import for the worker and cron scripts.
+        from fastapi import HTTPException
+
         raise HTTPException(
             status_code=429,
             detail="Workspace job rate limit exceeded",
@@ -78,7 +86,37 @@ def run_stage(
 
     if idempotency_key:
         stage_kwargs = {**stage_kwargs, "idempotency_key": idempotency_key}
-    return stage(db, workspace_id=ws_id, pack_id=pack_str, **stage_kwargs)
+    with track_queries() as stats, collect_job_metrics() as metrics:
+        result = stage(db, workspace_id=ws_id, pack_id=pack_str, **stage_kwargs)
+    _record_run_stats(db, result, stats, metrics)
+    return result
+
+
+def _record_run_stats(db: Session, result: object, stats: QueryStats, metrics: JobMetrics) -> None:
+    """Store the stage's SQL statement count, DB time and span metrics on its JobRun."""
+    job_run_id = result.get("job_run_id") if isinstance(result, dict) else None
+    if job_run_id is None:
+        return
+    try:
+        db.execute(
+            update(JobRun)
+            .where(JobRun.id == job_run_id)
+            .values(
+                query_count=stats.count,
+                db_time_ms=round(stats.db_ms),
+                metrics=metrics.to_dict(),
+            )
+        )
+        db.commit()
+    except Exception:
+        db.rollback()
+        logger.exception("Failed to record run stats for job_run_id=%s", job_run_id)
+    logger.info(
+        "Stage job_run_id=%s issued %d SQL statements (%.0f ms in DB)",
+        job_run_id,
+        stats.count,
+        stats.db_ms,
+    )
 
 
 def _cached_result(job: JobRun, job_type: str) -> dict:
@@ -111,6 +149,14 @@ def _cached_result(job: JobRun, job_type: str) -> dict:
             "companies_skipped": 0,
             "error": job.error_message,
         }
+    if job_type == "readiness_backfill":
+        return {
+            **base,
+            "days": 0,
+            "companies_processed": job.companies_processed or 0,
+            "snapshots_written": 0,
+            "error": job.error_message,
+        }
     if job_type == "derive":
         return {
             **base,
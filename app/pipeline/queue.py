@@ -0,0 +1,266 @@
+"""Durable job queue for pipeline stages (pipeline_jobs table).
+
+Web endpoints enqueue_job() and return the job id; app.pipeline.worker claims
+due jobs with SELECT ... FOR UPDATE SKIP LOCKED, so any number of workers can
+poll the same table without double-running a job. A claimed job holds a lease
+its worker renews (heartbeat_job); if the worker dies the lease lapses and
+the job is claimed again, up to max_attempts. A job that fails for good also
+fails the JobRun its enqueuer created (params job_run_id, e.g. company_scan),
+so that run does not stay running.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable, Mapping
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.job_run import JobRun
+from app.models.pipeline_job import PipelineJob
+from app.pipeline.stages import STAGE_REGISTRY
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+# Stage kwargs carried as ISO dates in params JSON (readiness_backfill, update_lead_feed)
+DATE_PARAMS = frozenset({"start", "end", "as_of"})
+# Retry delay after a failed attempt: RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+RETRY_BASE_SECONDS = 30
+# A job hitting the workspace rate limit waits out most of the hourly window
+RATE_LIMITED_RETRY_SECONDS = 600
+ERROR_MESSAGE_MAX_LEN = 2000
+
+
+def encode_params(params: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Stage kwargs -> JSON-safe params (dates as ISO strings, UUIDs as str)."""
+    return json.loads(json.dumps(dict(params or {}), default=str))
+
+
+def decode_params(params: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Stored params -> stage kwargs (inverse of encode_params for DATE_PARAMS)."""
+    decoded = dict(params or {})
+    for key in DATE_PARAMS & decoded.keys():
+        if isinstance(decoded[key], str):
+            decoded[key] = date.fromisoformat(decoded[key])
+    return decoded
+
+
+def enqueue_job(
+    db: Session,
+    job_type: str,
+    *,
+    workspace_id: str | UUID | None = None,
+    pack_id: str | UUID | None = None,
+    params: Mapping[str, Any] | None = None,
+    idempotency_key: str | None = None,
+    dedupe_key: str | None = None,
+    max_attempts: int | None = None,
+) -> int:
+    """Queue a STAGE_REGISTRY stage for the worker. Caller commits. Returns the job id.
+
+    With dedupe_key, an active (queued or running) job of the same job_type and
+    key is returned instead of queueing a duplicate.
+    Raises ValueError for an unknown job_type.
+    """
+    if job_type not in STAGE_REGISTRY:
+        raise ValueError(f"Unknown job_type: {job_type}")
+    values = {
+        "job_type": job_type,
+        "workspace_id": UUID(str(workspace_id)) if workspace_id else None,
+        "pack_id": UUID(str(pack_id)) if pack_id else None,
+        "params": encode_params(params),
+        "idempotency_key": idempotency_key,
+        "dedupe_key": dedupe_key,
+        "max_attempts": max_attempts or get_settings().job_max_attempts,
+    }
+    stmt = insert(PipelineJob).values(**values).returning(PipelineJob.id)
+    if dedupe_key is None:
+        return db.execute(stmt).scalar_one()
+
+    stmt = stmt.on_conflict_do_nothing(
+        index_elements=["job_type", "dedupe_key"],
+        index_where=and_(
+            PipelineJob.status.in_(ACTIVE_STATUSES), PipelineJob.dedupe_key.is_not(None)
+        ),
+    )
+    # Second pass covers the active job finishing between the conflict and the lookup
+    for _ in range(2):
+        job_id = db.execute(stmt).scalar_one_or_none()
+        if job_id is not None:
+            return job_id
+        job_id = db.execute(
+            select(PipelineJob.id).where(
+                PipelineJob.job_type == job_type,
+                PipelineJob.dedupe_key == dedupe_key,
+                PipelineJob.status.in_(ACTIVE_STATUSES),
+            )
+        ).scalar_one_or_none()
+        if job_id is not None:
+            logger.info("Job already active: job_type=%s dedupe_key=%s", job_type, dedupe_key)
+            return job_id
+    raise RuntimeError(f"Could not enqueue {job_type} job (dedupe_key={dedupe_key})")
+
+
+def claim_jobs(
+    db: Session, worker_id: str, limit: int = 1, lease_seconds: int | None = None
+) -> list[int]:
+    """Claim up to limit due jobs for worker_id. Commits. Returns claimed job ids.
+
+    Claims queued jobs whose run_after has passed and running jobs whose lease
+    lapsed (their worker died); rows locked by a concurrent claim are skipped.
+    Lapsed jobs with no attempts left are marked failed instead, along with
+    the JobRun named by their params job_run_id.
+    """
+    lease = timedelta(seconds=lease_seconds or get_settings().job_lease_seconds)
+    # clock_timestamp(), not now(): the transaction start time can be stale
+    now = func.clock_timestamp()
+    lapsed = and_(PipelineJob.status == "running", PipelineJob.lease_expires_at < now)
+    expired_error = "Lease expired (worker lost) with no attempts left"
+    expired = db.execute(
+        update(PipelineJob)
+        .where(lapsed, PipelineJob.attempts >= PipelineJob.max_attempts)
+        .values(
+            status="failed",
+            finished_at=now,
+            locked_by=None,
+            lease_expires_at=None,
+            error_message=expired_error,
+        )
+        .returning(PipelineJob.params)
+    ).scalars()
+    _fail_job_runs(db, expired, expired_error)
+    due = (
+        select(PipelineJob.id)
+        .where(
+            or_(
+                and_(PipelineJob.status == "queued", PipelineJob.run_after <= now),
+                lapsed,
+            )
+        )
+        .order_by(PipelineJob.run_after, PipelineJob.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    claimed = (
+        db.execute(
+            update(PipelineJob)
+            .where(PipelineJob.id.in_(due.scalar_subquery()))
+            .values(
+                status="running",
+                locked_by=worker_id,
+                lease_expires_at=now + lease,
+                started_at=now,
+                attempts=PipelineJob.attempts + 1,
+            )
+            .returning(PipelineJob.id)
+        )
+        .scalars()
+        .all()
+    )
+    db.commit()
+    return sorted(claimed)
+
+
+def heartbeat_job(
+    db: Session, job_id: int, worker_id: str, lease_seconds: int | None = None
+) -> bool:
+    """Extend the lease on a running job. Commits. False if worker_id lost the job."""
+    lease = timedelta(seconds=lease_seconds or get_settings().job_lease_seconds)
+    renewed = db.execute(
+        update(PipelineJob)
+        .where(
+            PipelineJob.id == job_id,
+            PipelineJob.locked_by == worker_id,
+            PipelineJob.status == "running",
+        )
+        .values(lease_expires_at=func.clock_timestamp() + lease)
+        .returning(PipelineJob.id)
+    ).scalar_one_or_none()
+    db.commit()
+    return renewed is not None
+
+
+def complete_job(
+    db: Session, job_id: int, worker_id: str, result: Mapping[str, Any], status: str = "completed"
+) -> bool:
+    """Record a finished job (status completed or failed, no retry). Commits.
+
+    False if worker_id no longer holds the job (its lease lapsed and it was reclaimed).
+    """
+    done = db.execute(
+        update(PipelineJob)
+        .where(PipelineJob.id == job_id, PipelineJob.locked_by == worker_id)
+        .values(
+            status=status,
+            result=encode_params(result),
+            error_message=_truncate(result.get("error")),
+            finished_at=func.clock_timestamp(),
+            locked_by=None,
+            lease_expires_at=None,
+        )
+        .returning(PipelineJob.id)
+    ).scalar_one_or_none()
+    db.commit()
+    return done is not None
+
+
+def fail_job(
+    db: Session,
+    job_id: int,
+    worker_id: str,
+    error: str,
+    *,
+    retry_delay_seconds: int | None = None,
+) -> str | None:
+    """Record a failed attempt. Commits. Returns the job's new status.
+
+    The job is queued again after a backoff (retry_delay_seconds when given)
+    until it has used max_attempts, then marked failed (with the JobRun named by
+    params job_run_id). None if worker_id no longer holds the job.
+    """
+    job = db.get(PipelineJob, job_id, with_for_update=True, populate_existing=True)
+    if job is None or job.locked_by != worker_id:
+        db.rollback()
+        return None
+    job.error_message = _truncate(error)
+    job.locked_by = None
+    job.lease_expires_at = None
+    if job.attempts < job.max_attempts:
+        delay = retry_delay_seconds or RETRY_BASE_SECONDS * 2 ** max(job.attempts - 1, 0)
+        job.status = "queued"
+        job.run_after = func.clock_timestamp() + timedelta(seconds=delay)
+    else:
+        job.status = "failed"
+        job.finished_at = func.clock_timestamp()
+        _fail_job_runs(db, [job.params], job.error_message)
+    status = job.status
+    db.commit()
+    return status
+
+
+def _fail_job_runs(
+    db: Session, params: Iterable[Mapping[str, Any] | None], error: str | None
+) -> None:
+    """Mark the still-running JobRuns named by params job_run_id failed. Caller commits."""
+    job_run_ids = [p["job_run_id"] for p in params if p and p.get("job_run_id") is not None]
+    if not job_run_ids:
+        return
+    db.execute(
+        update(JobRun)
+        .where(JobRun.id.in_(job_run_ids), JobRun.status == "running")
+        .values(status="failed", finished_at=datetime.now(UTC), error_message=error)
+    )
+
+
+def _truncate(message: Any) -> str | None:
+    if message is None:
+        return None
+    return str(message)[:ERROR_MESSAGE_MAX_LEN]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from typing import Any, Protocol
 from uuid import UUID
@@ -52,10 +53,44 @@ def _score_stage(
     pack_id: str | None,
     **kwargs: Any,
 ) -> StageResult:
-    """Score stage: wraps run_score_nightly."""
+    """Score stage: wraps run_score_nightly.
+
+    kwargs: mode (full or incremental), company_ids (partition run),
+    skip_company_ids (already scored today).
+    """
     from app.services.readiness.score_nightly import run_score_nightly
 
-    return StageResult(run_score_nightly(db, workspace_id=workspace_id, pack_id=pack_id))
+    return StageResult(
+        run_score_nightly(
+            db,
+            workspace_id=workspace_id,
+            pack_id=pack_id,
+            mode=kwargs.get("mode", "full"),
+            company_ids=kwargs.get("company_ids"),
+            skip_company_ids=kwargs.get("skip_company_ids"),
+        )
+    )
+
+
+def _readiness_backfill_stage(
+    db: Session,
+    workspace_id: str,
+    pack_id: str | None,
+    **kwargs: Any,
+) -> StageResult:
+    """Readiness backfill stage: rebuild snapshots for a date range in one pass."""
+    from app.services.readiness.backfill import run_readiness_backfill
+
+    return StageResult(
+        run_readiness_backfill(
+            db,
+            start=kwargs.get("start"),
+            end=kwargs.get("end"),
+            workspace_id=workspace_id,
+            pack_id=pack_id,
+            company_ids=kwargs.get("company_ids"),
+        )
+    )
 
 
 def _derive_stage(
@@ -64,10 +99,22 @@ def _derive_stage(
     pack_id: str | None,
     **kwargs: Any,
 ) -> StageResult:
-    """Derive stage: populates signal_instances from SignalEvents (Phase 2)."""
+    """Derive stage: populates signal_instances from SignalEvents (Phase 2).
+
+    company_ids kwarg limits derive to those companies' events (one partition);
+    skip_company_ids leaves those companies' events out.
+    """
     from app.pipeline.deriver_engine import run_deriver
 
-    return StageResult(run_deriver(db, workspace_id=workspace_id, pack_id=pack_id))
+    return StageResult(
+        run_deriver(
+            db,
+            workspace_id=workspace_id,
+            pack_id=pack_id,
+            company_ids=kwargs.get("company_ids"),
+            skip_company_ids=kwargs.get("skip_company_ids"),
+        )
+    )
 
 
 def _update_lead_feed_stage(
@@ -95,10 +142,17 @@ def _daily_aggregation_stage(
     pack_id: str | None,
     **kwargs: Any,
 ) -> StageResult:
-    """Daily aggregation stage: ingest → derive → score (Issue #246, Phase 1)."""
+    """Daily aggregation stage: ingest → derive → score (Issue #246, Phase 1).
+
+    mode kwarg: sequential or pipelined (default DAILY_AGGREGATION_MODE).
+    """
     from app.services.aggregation.daily_aggregation import run_daily_aggregation
 
-    return StageResult(run_daily_aggregation(db, workspace_id=workspace_id, pack_id=pack_id))
+    return StageResult(
+        run_daily_aggregation(
+            db, workspace_id=workspace_id, pack_id=pack_id, mode=kwargs.get("mode")
+        )
+    )
 
 
 def _watchlist_seed_stage(
@@ -164,12 +218,80 @@ def _watchlist_seed_stage(
         raise
 
 
+def _scan_stage(
+    db: Session,
+    workspace_id: str,
+    pack_id: str | None,
+    **kwargs: Any,
+) -> StageResult:
+    """Scan stage: wraps run_scan_all (full scan across all companies)."""
+    from app.services.scan_orchestrator import run_scan_all
+
+    job = asyncio.run(run_scan_all(db, workspace_id=workspace_id))
+    return StageResult(
+        {
+            "status": job.status,
+            "job_run_id": job.id,
+            "companies_processed": job.companies_processed,
+            "error": job.error_message,
+        }
+    )
+
+
+def _company_scan_stage(
+    db: Session,
+    workspace_id: str,
+    pack_id: str | None,
+    **kwargs: Any,
+) -> StageResult:
+    """Company scan stage: scan + analysis + scoring for company_id (UI rescan).
+
+    job_run_id names a JobRun created by the caller; omitted, one is created.
+    """
+    from app.services.scan_orchestrator import run_scan_company_with_job
+
+    company_id = kwargs.get("company_id")
+    if company_id is None:
+        return StageResult({"status": "failed", "job_run_id": None, "error": "company_id required"})
+    job = asyncio.run(
+        run_scan_company_with_job(db, int(company_id), job_id=kwargs.get("job_run_id"))
+    )
+    return StageResult(
+        {
+            "status": job.status,
+            "job_run_id": job.id,
+            "company_id": job.company_id,
+            "error": job.error_message,
+        }
+    )
+
+
+def _briefing_stage(
+    db: Session,
+    workspace_id: str,
+    pack_id: str | None,
+    **kwargs: Any,
+) -> StageResult:
+    """Briefing stage: wraps generate_briefing (batch API when BRIEFING_LLM_BATCH).
+
+    A retry after a lost worker resumes the LLM batch recorded on the earlier run.
+    """
+    from app.services.briefing import generate_briefing
+
+    items = generate_briefing(db, workspace_id=workspace_id)
+    return StageResult({"status": "completed", "items_generated": len(items)})
+
+
 # Registry: job_type -> callable (db, workspace_id, pack_id, **kwargs) -> dict
 STAGE_REGISTRY: dict[str, PipelineStage] = {
     "ingest": _ingest_stage,
     "derive": _derive_stage,
     "score": _score_stage,
+    "readiness_backfill": _readiness_backfill_stage,
     "update_lead_feed": _update_lead_feed_stage,
     "daily_aggregation": _daily_aggregation_stage,
     "watchlist_seed": _watchlist_seed_stage,
+    "scan": _scan_stage,
+    "company_scan": _company_scan_stage,
+    "briefing": _briefing_stage,
 }
@@ -0,0 +1,199 @@
+"""Queue worker: runs queued pipeline_jobs outside the web process.
+
+Usage:
+    python -m app.pipeline.worker [--concurrency N] [--once]
+
+Claims up to --concurrency due jobs at a time (app.pipeline.queue.claim_jobs),
+runs each through run_stage on its own thread and DB session, and renews the
+leases of in-flight jobs every lease/3 seconds. SIGTERM/SIGINT stop claiming
+and wait for in-flight jobs to finish.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from sqlalchemy.orm import Session
+
+# fastapi.HTTPException's base; importing it skips loading fastapi itself
+from starlette.exceptions import HTTPException
+
+from app.config import get_settings
+from app.db.session import SessionLocal
+from app.models.pipeline_job import PipelineJob
+from app.pipeline.executor import run_stage
+from app.pipeline.queue import (
+    RATE_LIMITED_RETRY_SECONDS,
+    claim_jobs,
+    complete_job,
+    decode_params,
+    fail_job,
+    heartbeat_job,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def default_worker_id() -> str:
+    """hostname:pid — shown in pipeline_jobs.locked_by."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def execute_job(db: Session, job_id: int, worker_id: str) -> str | None:
+    """Run a claimed job and record the outcome. Returns the job's new status.
+
+    Exceptions and rate-limit rejections are retried (fail_job); a stage that
+    returns status failed has already recorded its own JobRun and is not retried.
+    """
+    job = db.get(PipelineJob, job_id)
+    if job is None or job.locked_by != worker_id:
+        return None
+    try:
+        result = run_stage(
+            db,
+            job_type=job.job_type,
+            workspace_id=job.workspace_id,
+            pack_id=job.pack_id,
+            idempotency_key=job.idempotency_key,
+            check_rate_limit=False,
+            **decode_params(job.params),
+        )
+    except HTTPException as exc:
+        db.rollback()
+        delay = RATE_LIMITED_RETRY_SECONDS if exc.status_code == 429 else None
+        return fail_job(db, job_id, worker_id, str(exc.detail), retry_delay_seconds=delay)
+    except Exception as exc:
+        logger.exception("Job %s (%s) failed", job_id, job.job_type)
+        db.rollback()
+        return fail_job(db, job_id, worker_id, str(exc))
+
+    status = "failed" if result.get("status") == "failed" else "completed"
+    if not complete_job(db, job_id, worker_id, result, status=status):
+        logger.warning("Job %s finished after its lease was lost; result not recorded", job_id)
+        return None
+    return status
+
+
+def run_job(
+    job_id: int, worker_id: str, session_factory: Callable[[], Session] = SessionLocal
+) -> str | None:
+    """execute_job on a fresh session (one per worker thread)."""
+    db = session_factory()
+    try:
+        return execute_job(db, job_id, worker_id)
+    finally:
+        db.close()
+
+
+def run_worker(
+    *,
+    concurrency: int | None = None,
+    poll_interval: float | None = None,
+    lease_seconds: int | None = None,
+    once: bool = False,
+    worker_id: str | None = None,
+    stop: threading.Event | None = None,
+    session_factory: Callable[[], Session] = SessionLocal,
+) -> int:
+    """Claim and run jobs until stop is set (or the queue is drained when once).
+
+    Returns the number of jobs run.
+    """
+    settings = get_settings()
+    concurrency = max(1, concurrency or settings.worker_concurrency)
+    poll_interval = poll_interval or settings.worker_poll_interval
+    lease_seconds = lease_seconds or settings.job_lease_seconds
+    worker_id = worker_id or default_worker_id()
+    stop = stop or threading.Event()
+    heartbeat_every = max(lease_seconds / 3, 1.0)
+
+    inflight: dict[Future, int] = {}
+    jobs_run = 0
+    last_heartbeat = time.monotonic()
+    logger.info("Worker %s started (concurrency=%d)", worker_id, concurrency)
+    db = session_factory()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="job") as pool:
+            while True:
+                claimed: list[int] = []
+                if not stop.is_set() and len(inflight) < concurrency:
+                    claimed = claim_jobs(
+                        db,
+                        worker_id,
+                        limit=concurrency - len(inflight),
+                        lease_seconds=lease_seconds,
+                    )
+                    for job_id in claimed:
+                        logger.info("Worker %s claimed job %s", worker_id, job_id)
+                        future = pool.submit(run_job, job_id, worker_id, session_factory)
+                        inflight[future] = job_id
+                    jobs_run += len(claimed)
+
+                if not inflight:
+                    if stop.is_set() or (once and not claimed):
+                        break
+                    stop.wait(poll_interval)
+                    continue
+
+                done, _ = wait(
+                    inflight,
+                    timeout=min(poll_interval, heartbeat_every),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    job_id = inflight.pop(future)
+                    try:
+                        logger.info("Job %s finished: %s", job_id, future.result())
+                    except Exception:
+                        logger.exception("Job %s crashed in worker thread", job_id)
+
+                if time.monotonic() - last_heartbeat >= heartbeat_every:
+                    for job_id in inflight.values():
+                        if not heartbeat_job(db, job_id, worker_id, lease_seconds=lease_seconds):
+                            logger.warning("Worker %s lost the lease on job %s", worker_id, job_id)
+                    last_heartbeat = time.monotonic()
+    finally:
+        db.close()
+    logger.info("Worker %s stopped after %d job(s)", worker_id, jobs_run)
+    return jobs_run
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run queued pipeline jobs.")
+    parser.add_argument("--concurrency", type=int, help="Parallel jobs (WORKER_CONCURRENCY)")
+    parser.add_argument(
+        "--poll-interval", type=float, help="Idle poll seconds (WORKER_POLL_INTERVAL)"
+    )
+    parser.add_argument("--lease-seconds", type=int, help="Job lease (JOB_LEASE_SECONDS)")
+    parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    stop = threading.Event()
+
+    def _request_stop(signum, _frame) -> None:
+        logger.info("Signal %s: finishing in-flight jobs", signum)
+        stop.set()
+
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+    run_worker(
+        concurrency=args.concurrency,
+        poll_interval=args.poll_interval,
+        lease_seconds=args.lease_seconds,
+        once=args.once,
+        stop=stop,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,10 +8,23 @@ Rules:
 """
 
 from app.prompts.loader import (
+    CACHE_BREAK_MARKER,
+    clear_template_cache,
     load_prompt,
     load_prompt_from_pack,
     render_prompt,
     resolve_prompt_content,
+    resolve_prompt_template,
+    split_cache_prefix,
 )
 
-__all__ = ["load_prompt", "load_prompt_from_pack", "render_prompt", "resolve_prompt_content"]
+__all__ = [
+    "CACHE_BREAK_MARKER",
+    "clear_template_cache",
+    "load_prompt",
+    "load_prompt_from_pack",
+    "render_prompt",
+    "resolve_prompt_content",
+    "resolve_prompt_template",
+    "split_cache_prefix",
+]
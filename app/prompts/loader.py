@@ -6,12 +6,20 @@ by substituting {{VARIABLE_NAME}} placeholders.
 
 M4 (Pack v2): resolve_prompt_content() can load from pack prompts dir
 (packs/{pack_id}/prompts/*.md) when pack has schema_version "2".
+
+Prompt caching: a template may contain a CACHE_BREAK_MARKER line separating its
+static instructions (cacheable by the provider) from the per-company inputs. The
+marker is stripped on render unless the caller asks for cache_split=True.
+
+Templates are compiled once into literal chunks and placeholder slots, cached per
+(source path, mtime), and rendered with a single join.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -27,10 +35,85 @@ _PLACEHOLDER_RE = re.compile(r"\{\{([A-Z_][A-Z0-9_]*)\}\}")
 # Template name: safe for path (no path separators, alphanumeric/underscore/hyphen/dot only)
 _TEMPLATE_NAME_SAFE = re.compile(r"^[a-zA-Z0-9_.-]+$")
 
+# Own-line marker ending the static (cacheable) prefix of a template
+CACHE_BREAK_MARKER = "<!-- cache-break -->"
+_CACHE_BREAK_LINE = CACHE_BREAK_MARKER + "\n"
+
 if TYPE_CHECKING:
     from app.packs.loader import Pack
 
 
+@dataclass(frozen=True)
+class _CompiledTemplate:
+    """Template split at its placeholders: literals[i] precedes slots[i]; one trailing literal."""
+
+    source: str
+    literals: tuple[str, ...]
+    plain_literals: tuple[str, ...]  # literals with the cache-break line removed
+    slots: tuple[str, ...]
+    placeholders: frozenset[str]
+
+    def render(self, template_name: str, variables: dict[str, str], *, cache_split: bool) -> str:
+        for var_name in variables:
+            if var_name not in self.placeholders:
+                logger.warning(
+                    "Variable '%s' provided but not found in template '%s'",
+                    var_name,
+                    template_name,
+                )
+        missing = self.placeholders.difference(variables)
+        if missing:
+            raise ValueError(
+                f"Unfilled placeholders in template '{template_name}': "
+                f"{sorted(missing)}. "
+                f"Provide these as keyword arguments."
+            )
+        literals = self.literals if cache_split else self.plain_literals
+        parts = [literals[0]]
+        for slot, literal in zip(self.slots, literals[1:], strict=True):
+            parts.append(str(variables[slot]))
+            parts.append(literal)
+        return "".join(parts)
+
+
+def _compile_template(source: str) -> _CompiledTemplate:
+    literals: list[str] = []
+    slots: list[str] = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(source):
+        literals.append(source[pos : match.start()])
+        slots.append(match.group(1))
+        pos = match.end()
+    literals.append(source[pos:])
+    return _CompiledTemplate(
+        source=source,
+        literals=tuple(literals),
+        plain_literals=tuple(chunk.replace(_CACHE_BREAK_LINE, "") for chunk in literals),
+        slots=tuple(slots),
+        placeholders=frozenset(slots),
+    )
+
+
+# path -> (mtime_ns, compiled); re-read when the file changes on disk
+_compiled_cache: dict[Path, tuple[int, _CompiledTemplate]] = {}
+
+
+def _load_compiled(path: Path) -> _CompiledTemplate:
+    mtime = path.stat().st_mtime_ns
+    cached = _compiled_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    compiled = _compile_template(path.read_text(encoding="utf-8"))
+    _compiled_cache[path] = (mtime, compiled)
+    return compiled
+
+
+def clear_template_cache() -> None:
+    """Drop compiled templates (and load_prompt's cache). Useful for testing."""
+    _compiled_cache.clear()
+    load_prompt.cache_clear()
+
+
 @lru_cache(maxsize=64)
 def load_prompt(template_name: str) -> str:
     """Load a prompt template by name.
@@ -63,68 +146,84 @@ def load_prompt_from_pack(pack_dir: Path, template_name: str) -> str | None:
         template_name: Template file name without .md. Must be safe (no path separators).
 
     Returns:
-        Template content if file exists, else None.
+        Template content if file exists, else None. Cached until the file's mtime changes.
     """
+    compiled = _pack_template(pack_dir, template_name)
+    return compiled.source if compiled is not None else None
+
+
+def _pack_template(pack_dir: Path, template_name: str) -> _CompiledTemplate | None:
     if not _TEMPLATE_NAME_SAFE.match(template_name):
         return None
     path = pack_dir / "prompts" / f"{template_name}.md"
     if not path.is_file():
         return None
-    return path.read_text(encoding="utf-8")
+    return _load_compiled(path)
 
 
-def _render_template_content(template_content: str, template_name: str, **variables: str) -> str:
-    """Fill {{VARIABLE}} placeholders in template string. Shared by render_prompt and resolve_prompt_content."""
-    template_placeholders = set(_PLACEHOLDER_RE.findall(template_content))
-    for var_name in variables:
-        if var_name not in template_placeholders:
-            logger.warning(
-                "Variable '%s' provided but not found in template '%s'",
-                var_name,
-                template_name,
-            )
-    rendered = template_content
-    for var_name, var_value in variables.items():
-        rendered = rendered.replace(f"{{{{{var_name}}}}}", str(var_value))
-    remaining = _PLACEHOLDER_RE.findall(rendered)
-    if remaining:
-        raise ValueError(
-            f"Unfilled placeholders in template '{template_name}': "
-            f"{sorted(set(remaining))}. "
-            f"Provide these as keyword arguments."
-        )
-    return rendered
+def _app_template(template_name: str) -> _CompiledTemplate:
+    path = _PROMPTS_DIR / f"{template_name}.md"
+    if not path.is_file():
+        load_prompt(template_name)  # raises FileNotFoundError listing available templates
+    return _load_compiled(path)
 
 
-def resolve_prompt_content(
-    template_name: str,
-    pack: Pack | None,
-    **variables: str,
-) -> str:
-    """Load template from pack prompts (v2) or app/prompts, then render (M4).
+def resolve_prompt_template(template_name: str, pack: Pack | None) -> str:
+    """Return the raw template that resolve_prompt_content would render (M4).
 
     When pack is provided and has schema_version \"2\", tries pack_dir/prompts/{template_name}.md
     first; if missing, falls back to app/prompts. When pack is None or v1, uses app/prompts only.
     """
-    template_content: str | None = None
+    return _resolve_compiled(template_name, pack).source
+
+
+def _resolve_compiled(template_name: str, pack: Pack | None) -> _CompiledTemplate:
     if pack is not None and isinstance(pack.manifest, dict):
         if pack.manifest.get("schema_version") == "2":
             pack_id = pack.manifest.get("id")
             if pack_id:
                 from app.packs.loader import get_pack_dir
 
-                pack_dir = get_pack_dir(pack_id)
-                template_content = load_prompt_from_pack(pack_dir, template_name)
-    if template_content is None:
-        template_content = load_prompt(template_name)
-    return _render_template_content(template_content, template_name, **variables)
+                compiled = _pack_template(get_pack_dir(pack_id), template_name)
+                if compiled is not None:
+                    return compiled
+    return _app_template(template_name)
+
+
+def split_cache_prefix(prompt: str) -> tuple[str, str]:
+    """Split a prompt at its cache-break marker into (static_prefix, dynamic_suffix).
+
+    Returns ("", prompt) when the prompt has no marker.
+    """
+    prefix, sep, suffix = prompt.partition(_CACHE_BREAK_LINE)
+    if not sep:
+        return "", prompt
+    return prefix, suffix
+
+
+def resolve_prompt_content(
+    template_name: str,
+    pack: Pack | None,
+    *,
+    cache_split: bool = False,
+    **variables: str,
+) -> str:
+    """Load template from pack prompts (v2) or app/prompts, then render (M4).
+
+    See resolve_prompt_template for the lookup order. When cache_split is True the
+    cache-break marker is kept so the LLM provider can send the static prefix as a
+    cacheable block (see split_cache_prefix); otherwise it is stripped.
+    """
+    compiled = _resolve_compiled(template_name, pack)
+    return compiled.render(template_name, variables, cache_split=cache_split)
 
 
 def render_prompt(template_name: str, **variables: str) -> str:
     """Load a template and fill in {{VARIABLE}} placeholders.
 
-    Uses simple string replacement (not str.format or f-strings)
-    to avoid conflicts with JSON in templates.
+    Substitutes only {{NAME}} slots found in the compiled template (not str.format
+    or f-strings) to avoid conflicts with JSON in templates. Values are inserted
+    verbatim and are not themselves scanned for placeholders.
 
     Args:
         template_name: Name of the template file (without .md extension).
@@ -138,5 +237,4 @@ def render_prompt(template_name: str, **variables: str) -> str:
         FileNotFoundError: If the template file does not exist.
         ValueError: If required placeholders remain unfilled after rendering.
     """
-    template = load_prompt(template_name)
-    return _render_template_content(template, template_name, **variables)
+    return _app_template(template_name).render(template_name, variables, cache_split=False)
@@ -75,6 +75,8 @@ class CompanyList(BaseModel):
     total: int
     page: int = 1
     page_size: int = 20
+    # Keyset cursor for the next page (sort_by=score only; None on the last page)
+    next_cursor: str | None = None
 
 
 class BulkImportRow(BaseModel):
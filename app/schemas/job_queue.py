@@ -0,0 +1,44 @@
+"""Pipeline job queue request/response schemas (app.pipeline.queue)."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class EnqueueJobRequest(BaseModel):
+    """Request to queue a pipeline stage for the worker."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    job_type: str = Field(..., description="STAGE_REGISTRY job type, e.g. score or scan")
+    workspace_id: uuid.UUID | None = Field(None, description="Uses default workspace if omitted")
+    pack_id: uuid.UUID | None = Field(None, description="Uses workspace active pack if omitted")
+    params: dict[str, Any] = Field(
+        default_factory=dict,
+        description="Stage kwargs, e.g. {'mode': 'incremental'} or {'start': '2026-01-01'}",
+    )
+
+
+class PipelineJobRead(BaseModel):
+    """Queued job status."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    job_type: str
+    status: str
+    workspace_id: uuid.UUID | None = None
+    pack_id: uuid.UUID | None = None
+    params: dict[str, Any]
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    result: dict[str, Any] | None = None
+    error_message: str | None = None
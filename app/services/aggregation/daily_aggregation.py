@@ -6,24 +6,40 @@ Stage failure: derive/score run on existing data; partial result returned on err
 Unified orchestrator for cron. Runs stages in order, returns ranked companies.
 One adapter failure does not kill ingest. Stage failure: derive/score run on
 existing data; partial result returned on error.
+
+mode="pipelined" runs the same stages as a DAG (app.pipeline.dag): adapters
+fetch concurrently, and as each adapter's batch lands its events are stored,
+derived for the companies it touched and scored as a partition, while slower
+adapters are still fetching. A final derive pass covers every other company's
+events (scans, /internal evidence, watchlist seed), as sequential mode's
+unpartitioned derive does, and a final score pass every other company.
+Wall-clock time approaches the slowest adapter instead of the sum of all stages.
+Each DAG node is recorded as a child JobRun (parent_id = the aggregation run).
 """
 
 from __future__ import annotations
 
 import logging
 from datetime import UTC, date, datetime
+from functools import partial
 from typing import Any, TypedDict
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.models.job_run import JobRun
-from app.pipeline.stages import DEFAULT_WORKSPACE_ID
+from app.pipeline.dag import NodeRun, PipelineDag
+from app.pipeline.stages import DEFAULT_WORKSPACE_ID, STAGE_REGISTRY
 from app.services.briefing import get_emerging_companies
 from app.services.pack_resolver import get_default_pack_id, get_pack_for_workspace
 
 logger = logging.getLogger(__name__)
 
+AGGREGATION_MODES = ("sequential", "pipelined")
+# Concurrent adapter fetches in pipelined mode
+MAX_FETCH_WORKERS = 8
+
 
 class RankedCompany(TypedDict):
     """Single entry in the ranked_companies list returned by run_daily_aggregation."""
@@ -49,15 +65,21 @@ class DailyAggregationResult(TypedDict):
     ranked_companies: list[RankedCompany]
     ranked_count: int
     error: str | None
+    mode: str
+    nodes: dict[str, dict[str, Any]]  # pipelined: status, duration_ms, query_count, job_run_id
 
 
 def run_daily_aggregation(
     db: Session,
     workspace_id: str | UUID | None = None,
     pack_id: str | UUID | None = None,
+    mode: str | None = None,
 ) -> dict[str, Any]:
     """Run unified daily aggregation: ingest, derive, and score stages.
 
+    mode: sequential or pipelined (see module docstring); defaults to
+    DAILY_AGGREGATION_MODE.
+
     Resolves pack via pack_id or get_pack_for_workspace(workspace_id) or
     get_default_pack_id(db). Passes workspace_id and pack_id to each stage.
 
@@ -71,6 +93,9 @@ def run_daily_aggregation(
         derive_result, score_result, ranked_companies, ranked_count, error.
         On no-pack failure: job_run_id is None and no JobRun is created.
     """
+    mode = mode or get_settings().daily_aggregation_mode
+    if mode not in AGGREGATION_MODES:
+        raise ValueError(f"mode must be one of {AGGREGATION_MODES}, got {mode!r}")
     ws_id = str(workspace_id or DEFAULT_WORKSPACE_ID)
     resolved_pack = pack_id or get_pack_for_workspace(db, ws_id) or get_default_pack_id(db)
 
@@ -84,6 +109,8 @@ def run_daily_aggregation(
             "ranked_companies": [],
             "ranked_count": 0,
             "error": "No pack resolved for workspace",
+            "mode": mode,
+            "nodes": {},
         }
 
     job = JobRun(
@@ -100,23 +127,39 @@ def run_daily_aggregation(
     derive_result: dict[str, Any] = {}
     score_result: dict[str, Any] = {}
     ranked_companies: list[dict[str, Any]] = []
+    nodes: dict[str, dict[str, Any]] = {}
     error_msg: str | None = None
 
     try:
-        # Stage 1: Ingest
-        from app.services.ingestion.ingest_daily import run_ingest_daily
+        if mode == "pipelined":
+            ingest_result, derive_result, score_result, node_runs = _run_pipelined(
+                db, job, ws_id, resolved_pack
+            )
+            nodes = {
+                name: {
+                    "status": run.status,
+                    "duration_ms": run.duration_ms,
+                    "query_count": run.query_count,
+                    "job_run_id": run.job_run_id,
+                    "error": run.error,
+                }
+                for name, run in node_runs.items()
+            }
+        else:
+            # Stage 1: Ingest
+            from app.services.ingestion.ingest_daily import run_ingest_daily
 
-        ingest_result = run_ingest_daily(db, workspace_id=ws_id, pack_id=resolved_pack)
+            ingest_result = run_ingest_daily(db, workspace_id=ws_id, pack_id=resolved_pack)
 
-        # Stage 2: Derive (run even if ingest had adapter errors; one failure non-fatal)
-        from app.pipeline.deriver_engine import run_deriver
+            # Stage 2: Derive (run even if ingest had adapter errors; one failure non-fatal)
+            from app.pipeline.deriver_engine import run_deriver
 
-        derive_result = run_deriver(db, workspace_id=ws_id, pack_id=resolved_pack)
+            derive_result = run_deriver(db, workspace_id=ws_id, pack_id=resolved_pack)
 
-        # Stage 3: Score
-        from app.services.readiness.score_nightly import run_score_nightly
+            # Stage 3: Score
+            from app.services.readiness.score_nightly import run_score_nightly
 
-        score_result = run_score_nightly(db, workspace_id=ws_id, pack_id=resolved_pack)
+            score_result = run_score_nightly(db, workspace_id=ws_id, pack_id=resolved_pack)
 
         # Ranked list (same source as briefing); threshold=0 to include all scored companies
         as_of = date.today()
@@ -167,4 +210,205 @@ def run_daily_aggregation(
         "ranked_companies": ranked_companies,
         "ranked_count": len(ranked_companies),
         "error": error_msg,
+        "mode": mode,
+        "nodes": nodes,
+    }
+
+
+# ── Pipelined mode ───────────────────────────────────────────────────
+
+
+def _fetch(adapter: Any, since: datetime, _inputs: dict[str, Any]) -> list:
+    return adapter.fetch_events(since)
+
+
+def _store(
+    db: Session, source: str, fetch_node: str, pack_id: UUID, inputs: dict[str, Any]
+) -> dict[str, Any]:
+    from app.ingestion.ingest import store_raw_events
+
+    return store_raw_events(db, source, inputs[fetch_node], pack_id=pack_id)
+
+
+def _derive_partition(
+    db: Session, ws_id: str, pack_id: str, store_node: str, inputs: dict[str, Any]
+) -> dict[str, Any]:
+    """Derive the companies that received new events from one adapter."""
+    company_ids = inputs[store_node]["company_ids"]
+    if not company_ids:
+        result: dict[str, Any] = {
+            "status": "completed",
+            "job_run_id": None,
+            "instances_upserted": 0,
+            "events_processed": 0,
+            "events_skipped": 0,
+            "error": None,
+        }
+    else:
+        result = dict(
+            STAGE_REGISTRY["derive"](
+                db, workspace_id=ws_id, pack_id=pack_id, company_ids=company_ids
+            )
+        )
+    result["company_ids"] = company_ids
+    return result
+
+
+def _score_partition(
+    db: Session, ws_id: str, pack_id: str, derive_node: str, inputs: dict[str, Any]
+) -> dict[str, Any]:
+    """Score one derived partition (run_score_nightly partition run)."""
+    company_ids = inputs[derive_node]["company_ids"]
+    if not company_ids:
+        result: dict[str, Any] = {"status": "completed", "companies_scored": 0}
+    else:
+        result = dict(
+            STAGE_REGISTRY["score"](
+                db, workspace_id=ws_id, pack_id=pack_id, company_ids=company_ids
+            )
+        )
+    result["company_ids"] = company_ids
+    return result
+
+
+def _derive_rest(db: Session, ws_id: str, pack_id: str, inputs: dict[str, Any]) -> dict[str, Any]:
+    """Derive the events of every company the partitions did not derive."""
+    derived = {
+        company_id
+        for result in inputs.values()
+        if result and result.get("status") == "completed"
+        for company_id in result.get("company_ids", ())
     }
+    return dict(
+        STAGE_REGISTRY["derive"](db, workspace_id=ws_id, pack_id=pack_id, skip_company_ids=derived)
+    )
+
+
+def _score_rest(db: Session, ws_id: str, pack_id: str, inputs: dict[str, Any]) -> dict[str, Any]:
+    """Nightly score of every company the partitions did not score."""
+    scored = {
+        company_id
+        for result in inputs.values()
+        if result and result.get("status") == "completed"
+        for company_id in result.get("company_ids", ())
+    }
+    return dict(
+        STAGE_REGISTRY["score"](db, workspace_id=ws_id, pack_id=pack_id, skip_company_ids=scored)
+    )
+
+
+def _run_pipelined(
+    db: Session, job: JobRun, ws_id: str, pack_id: UUID
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any], dict[str, NodeRun]]:
+    """Run ingest -> derive -> score as a DAG. Returns stage results and node runs.
+
+    Records an aggregate "ingest" JobRun (the next run's fetch window starts at
+    its finished_at, as with run_ingest_daily).
+    """
+    from app.services.ingestion.ingest_daily import _get_adapters, ingest_since
+
+    adapters = _get_adapters()
+    since = ingest_since(db)
+    ingest_job = JobRun(
+        job_type="ingest", status="running", workspace_id=job.workspace_id, pack_id=pack_id
+    )
+    db.add(ingest_job)
+    db.commit()
+    db.refresh(ingest_job)
+
+    pack_str = str(pack_id)
+    dag = PipelineDag(db, parent=job, max_workers=min(MAX_FETCH_WORKERS, max(len(adapters), 1)))
+    branches: list[tuple[str, str, str, str]] = []
+    for adapter in adapters:
+        source = adapter.source_name
+        fetch = dag.add(f"fetch:{source}", partial(_fetch, adapter, since), io=True)
+        store = dag.add(
+            f"store:{source}", partial(_store, db, source, fetch, pack_id), deps=[fetch]
+        )
+        derive = dag.add(
+            f"derive:{source}",
+            partial(_derive_partition, db, ws_id, pack_str, store),
+            deps=[store],
+        )
+        score = dag.add(
+            f"score:{source}",
+            partial(_score_partition, db, ws_id, pack_str, derive),
+            deps=[derive],
+        )
+        branches.append((source, store, derive, score))
+    # Both run even when a branch failed: derive/score run on existing data
+    derive_rest = dag.add(
+        "derive",
+        partial(_derive_rest, db, ws_id, pack_str),
+        deps=[derive for _, _, derive, _ in branches],
+        run_on_failure=True,
+    )
+    dag.add(
+        "score",
+        partial(_score_rest, db, ws_id, pack_str),
+        deps=[derive_rest, *(score for *_, score in branches)],
+        run_on_failure=True,
+    )
+    try:
+        runs = dag.run()
+    except Exception as exc:
+        ingest_job.status = "failed"
+        ingest_job.error_message = str(exc)
+        ingest_job.finished_at = datetime.now(UTC)
+        db.commit()
+        raise
+
+    # Ingest totals (one adapter failure does not fail ingest)
+    totals = {"inserted": 0, "skipped_duplicate": 0, "skipped_invalid": 0}
+    errors: list[str] = []
+    for source, store, _, _ in branches:
+        stored = runs[store]
+        if stored.status == "completed":
+            for key in totals:
+                totals[key] += stored.result[key]
+            errors.extend(stored.result["errors"])
+        else:
+            failed = runs[f"fetch:{source}"]
+            errors.append(
+                f"{source}: {failed.error if failed.status == 'failed' else stored.error}"
+            )
+    ingest_job.status = "completed"
+    ingest_job.companies_processed = totals["inserted"]
+    ingest_job.error_message = "; ".join(errors[:10]) if errors else None
+    ingest_job.finished_at = datetime.now(UTC)
+    db.commit()
+    ingest_result = {
+        "status": "completed",
+        "job_run_id": ingest_job.id,
+        **totals,
+        "errors_count": len(errors),
+        "error": "; ".join(errors) if errors else None,
+    }
+
+    derive_runs = [runs[derive] for _, _, derive, _ in branches] + [runs[derive_rest]]
+    derive_errors = [run.error for run in derive_runs if run.status == "failed"]
+    derive_result = {
+        "status": "failed" if derive_errors else "completed",
+        "job_run_id": None,
+        "job_run_ids": [
+            run.result["job_run_id"]
+            for run in derive_runs
+            if run.result and run.result.get("job_run_id")
+        ],
+        **{
+            key: sum((run.result or {}).get(key, 0) for run in derive_runs)
+            for key in ("instances_upserted", "events_processed", "events_skipped")
+        },
+        "error": "; ".join(derive_errors) if derive_errors else None,
+    }
+
+    final = runs["score"]
+    score_result = dict(final.result or {"status": "failed", "error": final.error})
+    partitions_scored = sum(
+        (runs[score].result or {}).get("companies_scored", 0) for *_, score in branches
+    )
+    score_result["companies_scored"] = score_result.get("companies_scored", 0) + partitions_scored
+    score_result["partitions_scored"] = partitions_scored
+    if final.status != "completed":
+        raise RuntimeError(f"Score failed: {final.error}")
+    return ingest_result, derive_result, score_result, runs
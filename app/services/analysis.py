@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import uuid
@@ -17,7 +18,7 @@ from app.models.analysis_record import AnalysisRecord
 from app.models.company import Company
 from app.models.operator_profile import OperatorProfile
 from app.models.signal_record import SignalRecord
-from app.prompts.loader import resolve_prompt_content
+from app.prompts.loader import resolve_prompt_content, resolve_prompt_template
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,67 @@ _DEFAULT_STAGE = "early_customers"
 # Delimiter used when concatenating raw LLM responses for storage.
 _RAW_RESPONSE_DELIMITER = "\n\n===== PAIN SIGNALS RESPONSE =====\n\n"
 
+# Prompt templates rendered by analyze_company; part of the corpus fingerprint.
+ANALYSIS_PROMPT_TEMPLATES = ("stage_classification_v1", "pain_signals_v1", "explanation_v1")
+
+
+def compute_corpus_fingerprint(
+    content_hashes: list[str],
+    pack: Pack | None,
+    company: Company,
+    operator_profile_md: str,
+) -> str:
+    """Compute SHA-256 fingerprint of everything analyze_company feeds the LLM.
+
+    Covers the set of signal content hashes, the pack config checksum, the resolved
+    prompt templates and the company/operator fields rendered into them. Two
+    analyses with the same fingerprint would send identical prompts.
+    """
+    templates = {
+        name: hashlib.sha256(resolve_prompt_template(name, pack).encode("utf-8")).hexdigest()
+        for name in ANALYSIS_PROMPT_TEMPLATES
+    }
+    payload = {
+        "content_hashes": sorted({str(h) for h in content_hashes}),
+        "pack_config_checksum": pack.config_checksum if pack is not None else None,
+        "prompt_templates": templates,
+        "company": [
+            company.name or "",
+            company.website_url or "",
+            company.founder_name or "",
+            company.notes or "",
+        ],
+        "operator_profile": operator_profile_md,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _load_operator_profile_md(db: Session) -> str:
+    """Return operator profile markdown (first row), or empty string."""
+    op_profile = db.query(OperatorProfile).first()
+    return op_profile.content if op_profile and op_profile.content else ""
+
+
+def get_corpus_fingerprint(
+    db: Session,
+    company_id: int,
+    pack: Pack | None = None,
+) -> str | None:
+    """Return the current corpus fingerprint for a company without loading signal text.
+
+    Returns None when the company does not exist or has no signals (nothing to analyze).
+    """
+    company = db.query(Company).filter(Company.id == company_id).first()
+    if company is None:
+        return None
+    rows = db.query(SignalRecord.content_hash).filter(SignalRecord.company_id == company_id).all()
+    if not rows:
+        return None
+    return compute_corpus_fingerprint(
+        [r[0] for r in rows], pack, company, _load_operator_profile_md(db)
+    )
+
 
 def _parse_json_safe(text: str) -> dict | None:
     """Try to parse *text* as JSON. Return ``None`` on failure."""
@@ -123,8 +185,10 @@ def analyze_company(
     signals_text = "\n\n---\n\n".join(s.content_text for s in signals)
 
     # Load operator profile (first row, or empty string).
-    op_profile = db.query(OperatorProfile).first()
-    operator_profile_md = op_profile.content if op_profile and op_profile.content else ""
+    operator_profile_md = _load_operator_profile_md(db)
+    corpus_fingerprint = compute_corpus_fingerprint(
+        [s.content_hash for s in signals], pack, company, operator_profile_md
+    )
 
     llm = get_llm_provider(role=ModelRole.REASONING)
 
@@ -132,6 +196,7 @@ def analyze_company(
     stage_prompt = resolve_prompt_content(
         "stage_classification_v1",
         pack,
+        cache_split=True,
         COMPANY_NAME=company.name,
         WEBSITE_URL=company.website_url or "",
         FOUNDER_NAME=company.founder_name or "",
@@ -170,6 +235,7 @@ def analyze_company(
     pain_prompt = resolve_prompt_content(
         "pain_signals_v1",
         pack,
+        cache_split=True,
         COMPANY_NAME=company.name,
         WEBSITE_URL=company.website_url or "",
         FOUNDER_NAME=company.founder_name or "",
@@ -226,6 +292,7 @@ def analyze_company(
         explanation=explanation,
         raw_llm_response=raw_llm_response,
         pack_id=resolved_pack_id,
+        corpus_fingerprint=corpus_fingerprint,
     )
     db.add(record)
     db.commit()
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime, timedelta
 
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
@@ -86,3 +87,8 @@ def get_user_from_token(db: Session, token: str) -> User | None:
     if username is None:
         return None
     return db.query(User).filter(User.username == username).first()
+
+
+async def get_user_from_token_async(db: AsyncSession, token: str) -> User | None:
+    """get_user_from_token on an AsyncSession."""
+    return await db.run_sync(get_user_from_token, token)
@@ -5,30 +5,44 @@ from __future__ import annotations
 import json
 import logging
 import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING
 
+from sqlalchemy import Connection, Engine, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
+from app.config import get_settings
+from app.llm.batch import BatchSession, BatchStore, get_batch_backend
 from app.llm.router import ModelRole, get_llm_provider
 from app.models.analysis_record import AnalysisRecord
 from app.models.briefing_item import BriefingItem
 from app.models.company import Company
 from app.models.engagement_snapshot import EngagementSnapshot
 from app.models.job_run import JobRun
+from app.models.operator_profile import OperatorProfile
 from app.models.readiness_snapshot import ReadinessSnapshot
 from app.models.signal_record import SignalRecord
 from app.prompts.loader import resolve_prompt_content
 from app.services.email_service import send_briefing_email
 from app.services.esl.esl_engine import compute_outreach_score
 from app.services.esl.esl_gate_filter import is_suppressed_from_engagement
+from app.services.job_metrics import job_span
 from app.services.outreach import generate_outreach
 from app.services.pack_resolver import (
+    get_default_pack,
     get_default_pack_id,
     get_pack_for_workspace,
     resolve_pack,
 )
+from app.services.read_cache import bump_read_generation
 from app.services.settings_resolver import get_resolved_settings
 
+if TYPE_CHECKING:
+    from app.packs.loader import Pack
+
 logger = logging.getLogger(__name__)
 
 # Companies must have activity within this window to be considered.
@@ -37,6 +51,9 @@ _ACTIVITY_WINDOW_DAYS = 14
 # Companies that appeared in a briefing within this window are excluded.
 _DEDUP_WINDOW_DAYS = 7
 
+# A batch finishes within 24h; uncollected batches older than this are not resumed.
+BATCH_RESUME_WINDOW = timedelta(days=2)
+
 
 def select_top_companies(
     db: Session,
@@ -269,14 +286,16 @@ def _parse_json_safe(text: str) -> dict | None:
 def generate_briefing(
     db: Session,
     workspace_id: str | None = None,
+    *,
+    llm_batch: bool | None = None,
 ) -> list[BriefingItem]:
     """Generate today's briefing for the top companies.
 
-    For each selected company:
-    1. Fetch the latest AnalysisRecord.
-    2. Call the LLM with ``briefing_entry_v1`` to get why_now / risk / angle.
-    3. Call ``generate_outreach()`` for the outreach draft.
-    4. Persist a ``BriefingItem``.
+    1. Prefetch per-run context in bulk: companies already briefed today, the
+       latest pack-scoped AnalysisRecord per company, the pack and operator profile.
+    2. Run the ``briefing_entry_v1`` and ``generate_outreach()`` LLM calls for all
+       companies concurrently (bounded by ``BRIEFING_MAX_CONCURRENCY``).
+    3. Persist all ``BriefingItem`` rows in one transaction.
 
     One company failing does **not** stop the whole run.
 
@@ -285,6 +304,11 @@ def generate_briefing(
 
     When workspace_id is provided, BriefingItems are scoped to that workspace.
     When None, uses default workspace (single-tenant mode).
+
+    llm_batch sends the LLM calls through the batch API (default: BRIEFING_LLM_BATCH).
+    A batch can take hours, so only the queue worker's ``briefing`` stage should
+    use it, never a web request. Submitted batches are recorded on the JobRun and
+    a rerun resumes an uncollected one instead of paying for it again.
     """
     from uuid import UUID
 
@@ -322,28 +346,22 @@ def generate_briefing(
                 db.commit()
                 return []
 
-        companies = select_top_companies(db, workspace_id=ws_id)
-        items: list[BriefingItem] = []
+        with job_span("briefing.select"):
+            companies = select_top_companies(db, workspace_id=ws_id)
         errors: list[str] = []
-
-        for company in companies:
-            try:
-                item = _generate_for_company(db, company, workspace_id=ws_id)
-                if item is not None:
-                    items.append(item)
-            except BaseException as exc:
-                msg = f"Company {company.id} ({company.name}): {exc}"
-                logger.exception(
-                    "Briefing generation failed for company %s (id=%s)",
-                    company.name,
-                    company.id,
-                )
-                errors.append(msg)
+        with job_span("briefing.generate"):
+            if llm_batch is None:
+                llm_batch = get_settings().briefing_llm_batch
+            items = _generate_items(db, companies, ws_id, errors, job=job, llm_batch=llm_batch)
+        with job_span("briefing.persist"):
+            item_ids = _persist_items(db, items, errors)
+        items = [i for i in items if i.id in item_ids] if item_ids is not None else items
 
         job.finished_at = datetime.now(UTC)
         job.status = "completed"
         job.companies_processed = len(items)
         job.error_message = "; ".join(errors) if errors else None
+        bump_read_generation(db)
         db.commit()
 
         # Send briefing email when enabled (issue #29, #32)
@@ -387,16 +405,80 @@ def generate_briefing(
         job.finished_at = datetime.now(UTC)
         job.status = "failed"
         job.error_message = str(exc)
+        bump_read_generation(db)
         db.commit()
         raise
 
 
-def _generate_for_company(
+@dataclass
+class _BriefingContext:
+    """Per-run context loaded once before the concurrent LLM phase.
+
+    Everything the LLM phase needs is resolved here so worker threads never
+    touch the (non-thread-safe) Session.
+    """
+
+    today: date
+    ws_uuid: uuid.UUID
+    pack: Pack | None
+    outreach_pack: Pack | None
+    operator_profile_md: str
+    briefed_company_ids: set[int]
+    analyses: dict[int, AnalysisRecord]
+
+
+@dataclass(frozen=True)
+class _CompanyFields:
+    """Plain copy of the Company columns the LLM phase reads.
+
+    Workers get these instead of ORM instances: a commit on the run's Session
+    expires its instances, and reading one would then lazy-load from the worker.
+    """
+
+    id: int
+    name: str | None
+    founder_name: str | None
+    website_url: str | None
+    notes: str | None
+
+    @classmethod
+    def of(cls, company: Company) -> _CompanyFields:
+        return cls(
+            id=company.id,
+            name=company.name,
+            founder_name=company.founder_name,
+            website_url=company.website_url,
+            notes=company.notes,
+        )
+
+
+@dataclass(frozen=True)
+class _AnalysisFields:
+    """Plain copy of the AnalysisRecord columns the LLM phase reads."""
+
+    id: int
+    stage: str | None
+    stage_confidence: int | None
+    pain_signals_json: dict | None
+    evidence_bullets: list | None
+
+    @classmethod
+    def of(cls, analysis: AnalysisRecord) -> _AnalysisFields:
+        return cls(
+            id=analysis.id,
+            stage=analysis.stage,
+            stage_confidence=analysis.stage_confidence,
+            pain_signals_json=analysis.pain_signals_json,
+            evidence_bullets=analysis.evidence_bullets,
+        )
+
+
+def _prefetch_briefing_context(
     db: Session,
-    company: Company,
+    companies: list[Company],
     workspace_id: str | None = None,
-) -> BriefingItem | None:
-    """Build a single BriefingItem for *company*.  Returns ``None`` when skipped."""
+) -> _BriefingContext:
+    """Load existing items, latest analyses, pack and operator profile for *companies*."""
     from uuid import UUID
 
     from app.pipeline.stages import DEFAULT_WORKSPACE_ID
@@ -405,9 +487,10 @@ def _generate_for_company(
     ws_id = workspace_id or DEFAULT_WORKSPACE_ID
     ws_uuid = UUID(str(ws_id)) if isinstance(ws_id, str) else ws_id
     default_uuid = UUID(DEFAULT_WORKSPACE_ID)
+    company_ids = [c.id for c in companies]
 
-    existing_q = db.query(BriefingItem).filter(
-        BriefingItem.company_id == company.id,
+    existing_q = db.query(BriefingItem.company_id).filter(
+        BriefingItem.company_id.in_(company_ids),
         BriefingItem.briefing_date == today,
     )
     if ws_uuid == default_uuid:
@@ -416,46 +499,235 @@ def _generate_for_company(
         )
     else:
         existing_q = existing_q.filter(BriefingItem.workspace_id == ws_uuid)
-    existing = existing_q.first()
-    if existing:
-        logger.info(
-            "BriefingItem already exists for %s (id=%s) on %s — skipping",
-            company.name,
-            company.id,
-            today,
-        )
-        return None
+    briefed_company_ids = {row[0] for row in existing_q.all()}
 
-    # Latest analysis record (pack-scoped: prefer workspace's active pack).
+    # Latest analysis record per company (pack-scoped: prefer workspace's active pack).
     pack_id = get_pack_for_workspace(db, ws_id) or get_default_pack_id(db)
     default_pack_id = get_default_pack_id(db)
-    analysis_q = (
-        db.query(AnalysisRecord)
-        .filter(AnalysisRecord.company_id == company.id)
-        .order_by(AnalysisRecord.created_at.desc())
-    )
+    analysis_q = db.query(AnalysisRecord).filter(AnalysisRecord.company_id.in_(company_ids))
     if pack_id is not None and default_pack_id is not None:
-        from sqlalchemy import or_
-
         analysis_q = analysis_q.filter(
             or_(
                 AnalysisRecord.pack_id == pack_id,
                 (AnalysisRecord.pack_id.is_(None)) & (pack_id == default_pack_id),
             )
         )
-    analysis: AnalysisRecord | None = analysis_q.first()
-    if analysis is None:
-        logger.info("No analysis for company %s — skipping briefing", company.name)
+    analyses: dict[int, AnalysisRecord] = {}
+    for analysis in analysis_q.order_by(AnalysisRecord.created_at.desc()).all():
+        analyses.setdefault(analysis.company_id, analysis)
+
+    pack = resolve_pack(db, pack_id) if pack_id else None
+    # generate_outreach falls back to the default pack; resolve it here, not in a worker.
+    outreach_pack = pack if pack is not None else get_default_pack(db)
+
+    op_profile = db.query(OperatorProfile).first()
+    operator_profile_md = op_profile.content if op_profile and op_profile.content else ""
+
+    return _BriefingContext(
+        today=today,
+        ws_uuid=ws_uuid,
+        pack=pack,
+        outreach_pack=outreach_pack,
+        operator_profile_md=operator_profile_md,
+        briefed_company_ids=briefed_company_ids,
+        analyses=analyses,
+    )
+
+
+def _generate_items(
+    db: Session,
+    companies: list[Company],
+    workspace_id: str | None,
+    errors: list[str],
+    *,
+    job: JobRun | None = None,
+    llm_batch: bool = False,
+) -> list[BriefingItem]:
+    """Build (unsaved) BriefingItems for *companies*; per-company failures go to *errors*.
+
+    With llm_batch, the LLM calls go through a BatchSession whose batches are
+    recorded on *job* (_JobRunBatchStore).
+    """
+    if not companies:
+        return []
+    ctx = _prefetch_briefing_context(db, companies, workspace_id)
+
+    pending: list[tuple[_CompanyFields, _AnalysisFields]] = []
+    for company in companies:
+        if company.id in ctx.briefed_company_ids:
+            logger.info(
+                "BriefingItem already exists for %s (id=%s) on %s — skipping",
+                company.name,
+                company.id,
+                ctx.today,
+            )
+            continue
+        analysis = ctx.analyses.get(company.id)
+        if analysis is None:
+            logger.info("No analysis for company %s — skipping briefing", company.name)
+            continue
+        pending.append((_CompanyFields.of(company), _AnalysisFields.of(analysis)))
+    if not pending:
+        return []
+
+    settings = get_settings()
+    if llm_batch:
+        session = BatchSession(
+            get_batch_backend(settings),
+            poll_interval=settings.llm_batch_poll_interval,
+            timeout=settings.llm_batch_timeout,
+            store=(
+                _JobRunBatchStore(db.get_bind(), job.id, job.workspace_id)
+                if job is not None
+                else None
+            ),
+        )
+        futures = session.run(
+            _generate_for_company,
+            [(company, analysis, ctx) for company, analysis in pending],
+            keys=[f"company-{company.id}" for company, _ in pending],
+        )
+        logger.info("Briefing LLM calls sent in %d batch(es)", session.batches_submitted)
+        return _collect_items([c for c, _ in pending], futures, errors)
+
+    max_workers = max(1, min(settings.briefing_max_concurrency, len(pending)))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="briefing") as pool:
+        futures = [
+            pool.submit(_generate_for_company, company, analysis, ctx)
+            for company, analysis in pending
+        ]
+        return _collect_items([c for c, _ in pending], futures, errors)
+
+
+class _JobRunBatchStore(BatchStore):
+    """BatchStore on briefing JobRun.llm_batches, searched across the workspace's recent runs.
+
+    Called from the batch worker that flushes a round, so each call uses its own
+    short-lived Session on *bind* and never touches the run's Session.
+    """
+
+    def __init__(
+        self, bind: Engine | Connection, job_id: int, workspace_id: uuid.UUID | None
+    ) -> None:
+        self._bind = bind
+        self._job_id = job_id
+        self._workspace_id = workspace_id
+
+    def _runs(self, session: Session) -> list[JobRun]:
+        since = datetime.now(UTC) - BATCH_RESUME_WINDOW
+        return (
+            session.query(JobRun)
+            .filter(
+                JobRun.job_type == "briefing",
+                JobRun.workspace_id == self._workspace_id,
+                JobRun.started_at >= since,
+                JobRun.llm_batches.is_not(None),
+            )
+            .order_by(JobRun.started_at.desc())
+            .all()
+        )
+
+    def find(self, request_hashes: set[str]) -> tuple[str, dict[str, str]] | None:
+        with Session(bind=self._bind) as session:
+            for run in self._runs(session):
+                for batch in run.llm_batches or []:
+                    if not batch["collected"] and request_hashes <= set(batch["requests"].values()):
+                        return batch["batch_id"], batch["requests"]
+        return None
+
+    def save(self, batch_id: str, requests: dict[str, str]) -> None:
+        entry = {"batch_id": batch_id, "requests": requests, "collected": False}
+        with Session(bind=self._bind) as session:
+            job = session.get(JobRun, self._job_id)
+            if job is None:
+                raise LookupError(f"JobRun {self._job_id} not found")
+            job.llm_batches = [*(job.llm_batches or []), entry]
+            session.commit()
+
+    def mark_collected(self, batch_id: str) -> None:
+        with Session(bind=self._bind) as session:
+            for run in self._runs(session):
+                batches = run.llm_batches or []
+                if any(b["batch_id"] == batch_id for b in batches):
+                    run.llm_batches = [
+                        {**b, "collected": True} if b["batch_id"] == batch_id else b
+                        for b in batches
+                    ]
+            session.commit()
+
+
+def _collect_items(
+    companies: list[_CompanyFields],
+    futures: list[Future],
+    errors: list[str],
+) -> list[BriefingItem]:
+    """Gather per-company results in order; failures are logged and appended to *errors*."""
+    items: list[BriefingItem] = []
+    for company, future in zip(companies, futures, strict=True):
+        try:
+            items.append(future.result())
+        except BaseException as exc:
+            msg = f"Company {company.id} ({company.name}): {exc}"
+            logger.error(
+                "Briefing generation failed for company %s (id=%s)",
+                company.name,
+                company.id,
+                exc_info=exc,
+            )
+            errors.append(msg)
+    return items
+
+
+def _persist_items(
+    db: Session,
+    items: list[BriefingItem],
+    errors: list[str],
+) -> set[int] | None:
+    """Insert *items* in one transaction.
+
+    Returns None when the batch committed. When a concurrent run already created an
+    item for the same company/date (unique constraint), falls back to one commit per
+    item, records the duplicates in *errors*, and returns the ids that were saved.
+    """
+    if not items:
+        return None
+    db.add_all(items)
+    try:
+        db.commit()
         return None
+    except IntegrityError:
+        db.rollback()
+        logger.warning("Batched briefing insert conflicted; retrying item by item")
+
+    saved: set[int] = set()
+    for item in items:
+        db.add(item)
+        try:
+            db.commit()
+            saved.add(item.id)
+        except IntegrityError:
+            db.rollback()
+            errors.append(f"Company {item.company_id}: briefing item already exists")
+    return saved
+
 
+def _generate_for_company(
+    company: _CompanyFields,
+    analysis: _AnalysisFields,
+    ctx: _BriefingContext,
+) -> BriefingItem:
+    """Build a single (unsaved) BriefingItem for *company*.
+
+    Runs in a worker thread: only LLM calls on plain copies, no database access.
+    """
     pain = analysis.pain_signals_json or {}
     evidence_bullets = analysis.evidence_bullets or []
     evidence_text = "\n".join(f"- {b}" for b in evidence_bullets) if evidence_bullets else ""
 
-    pack = resolve_pack(db, pack_id) if pack_id else None
     prompt = resolve_prompt_content(
         "briefing_entry_v1",
-        pack,
+        ctx.pack,
+        cache_split=True,
         COMPANY_NAME=company.name or "",
         FOUNDER_NAME=company.founder_name or "",
         WEBSITE_URL=company.website_url or "",
@@ -478,19 +750,22 @@ def _generate_for_company(
     suggested_angle = parsed.get("suggested_angle", "") if parsed else ""
 
     # Outreach draft (Phase 3: pass pack for offer_type from workspace's active pack).
-    outreach = generate_outreach(db, company, analysis, pack=pack)
-    item = BriefingItem(
+    # db=None: pack and operator profile are prefetched, so no query is issued.
+    outreach = generate_outreach(
+        None,
+        company,
+        analysis,
+        pack=ctx.outreach_pack,
+        operator_profile_md=ctx.operator_profile_md,
+    )
+    return BriefingItem(
         company_id=company.id,
         analysis_id=analysis.id,
-        workspace_id=ws_uuid,
+        workspace_id=ctx.ws_uuid,
         why_now=why_now,
         risk_summary=risk_summary,
         suggested_angle=suggested_angle,
         outreach_subject=outreach.get("subject", ""),
         outreach_message=outreach.get("message", ""),
-        briefing_date=today,
+        briefing_date=ctx.today,
     )
-    db.add(item)
-    db.commit()
-    db.refresh(item)
-    return item
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from sqlalchemy import or_
+from typing import Any
+
+from sqlalchemy import and_, func, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.models.company import Company
+from app.models.company_display_score import CompanyDisplayScore
 from app.schemas.company import (
     BulkImportResponse,
     BulkImportRow,
@@ -14,7 +18,10 @@ from app.schemas.company import (
     CompanyUpdate,
 )
 from app.services.company_resolver import resolve_or_create_company
-from app.services.scoring import get_display_scores_for_companies
+from app.services.company_search import company_search_filter, company_search_rank
+from app.services.pack_resolver import get_default_pack_id, get_pack_for_workspace
+from app.services.read_cache import bump_read_generation
+from app.services.readiness.dirty_queue import enqueue_dirty_companies
 
 # ── Field mapping helpers ────────────────────────────────────────────
 
@@ -70,12 +77,122 @@ def _model_to_read(company: Company) -> CompanyRead:
 
 # ── Sort helpers ─────────────────────────────────────────────────────
 
+# Companies without a display score sort as -1 (below any real score)
+UNSCORED_SORT_VALUE = -1
+# estimate_total: planner estimates below this are replaced by an exact count
+ESTIMATED_COUNT_EXACT_BELOW = 10_000
+
 
 def _order_clause(column, ascending: bool):
     """Return SQLAlchemy order clause for column (asc or desc)."""
     return column.asc() if ascending else column.desc()
 
 
+def _filtered_query(db: Session, search: str | None):
+    """Company query filtered by search (see app.services.company_search)."""
+    query = db.query(Company)
+    if search and search.strip():
+        query = query.filter(company_search_filter(db, search))
+    return query
+
+
+def _with_display_score(db: Session, query, workspace_id: str | None):
+    """Add the display score column to a Company query. Returns (query, score column).
+
+    Same resolution as get_company_scores_batch, in SQL: latest ReadinessSnapshot
+    composite for the workspace's pack (denormalized in company_display_scores),
+    then cto_need_score when the pack is the default pack.
+    """
+    default_pack_id = get_default_pack_id(db)
+    pack_id = get_pack_for_workspace(db, workspace_id) if workspace_id is not None else None
+    pack_id = pack_id or default_pack_id
+    candidates = []
+    if pack_id is not None:
+        query = query.outerjoin(
+            CompanyDisplayScore,
+            and_(
+                CompanyDisplayScore.company_id == Company.id,
+                CompanyDisplayScore.pack_id == pack_id,
+            ),
+        )
+        candidates.append(CompanyDisplayScore.score)
+    if pack_id is None or pack_id == default_pack_id:
+        candidates.append(Company.cto_need_score)
+    score = func.coalesce(*candidates, UNSCORED_SORT_VALUE)
+    return query.add_columns(score), score
+
+
+def _parse_company_cursor(cursor: str) -> tuple[int, int]:
+    """Parse a 'score:company_id' cursor. Raises ValueError when malformed."""
+    score, sep, company_id = cursor.partition(":")
+    if not sep:
+        raise ValueError(f"Invalid company cursor: {cursor!r}")
+    return int(score), int(company_id)
+
+
+def _estimated_count(db: Session, query) -> int:
+    """Planner row estimate for query (EXPLAIN, no execution)."""
+    compiled = query.statement.compile(dialect=db.get_bind().dialect)
+    plan = (
+        db.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+        .scalar()
+    )
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_companies(db: Session, *, search: str | None = None, estimate: bool = False) -> int:
+    """Count companies matching search.
+
+    estimate=True returns the planner's estimate instead of scanning, falling
+    back to an exact count when the estimate is below ESTIMATED_COUNT_EXACT_BELOW.
+    """
+    query = _filtered_query(db, search)
+    if estimate:
+        estimated = _estimated_count(db, query)
+        if estimated >= ESTIMATED_COUNT_EXACT_BELOW:
+            return estimated
+    return query.count()
+
+
+async def count_companies_async(
+    db: AsyncSession, *, search: str | None = None, estimate: bool = False
+) -> int:
+    """count_companies on an AsyncSession."""
+    return await db.run_sync(
+        lambda session: count_companies(session, search=search, estimate=estimate)
+    )
+
+
+def _score_page(
+    db: Session,
+    *,
+    search: str | None,
+    workspace_id: str | None,
+    ascending: bool,
+    page_size: int,
+    offset: int = 0,
+    after: str | None = None,
+) -> tuple[list[Company], str | None]:
+    """One page of companies ordered by (display score, id). Returns (companies, next cursor)."""
+    query, score = _with_display_score(db, _filtered_query(db, search), workspace_id)
+    if after is not None:
+        key = tuple_(score, Company.id)
+        bound = tuple_(*_parse_company_cursor(after))
+        query = query.filter(key > bound if ascending else key < bound)
+    rows = (
+        query.order_by(_order_clause(score, ascending), _order_clause(Company.id, ascending))
+        .offset(offset)
+        .limit(page_size + 1)
+        .all()
+    )
+    next_cursor = None
+    if len(rows) > page_size:
+        last_company, last_score = rows[page_size - 1]
+        next_cursor = f"{last_score}:{last_company.id}"
+    return [company for company, _ in rows[:page_size]], next_cursor
+
+
 # ── CRUD operations ─────────────────────────────────────────────────
 
 
@@ -88,47 +205,36 @@ def list_companies(
     sort_order: str = "desc",
     search: str | None = None,
     workspace_id: str | None = None,
+    estimate_total: bool = False,
 ) -> tuple[list[CompanyRead], int]:
     """Return paginated list of companies with optional search and sort.
 
-    When sort_by='score', sorts by display score (recomputed from latest analysis)
-    so the order matches what users see. Other sorts use stored DB columns.
-    sort_order: 'asc' or 'desc'.
+    When sort_by='score', sorts by display score in SQL (company_display_scores,
+    the same score users see); ties are broken by id in the same direction.
+    sort_by='relevance' ranks search matches best first (created_at without search).
+    Other sorts use stored DB columns. sort_order: 'asc' or 'desc'.
     When workspace_id provided (Phase 3), display scores use workspace's active pack.
+    estimate_total: see count_companies(estimate=True).
     """
     ascending = sort_order == "asc"
-    base_query = db.query(Company)
-    if search:
-        pattern = f"%{search}%"
-        base_query = base_query.filter(
-            or_(
-                Company.name.ilike(pattern),
-                Company.founder_name.ilike(pattern),
-                Company.notes.ilike(pattern),
-            )
-        )
-
-    total = base_query.count()
+    base_query = _filtered_query(db, search)
+    total = count_companies(db, search=search, estimate=estimate_total)
 
+    offset = (page - 1) * page_size
     if sort_by == "score":
-        # Sort by display score (from analysis) so order matches what users see
-        company_ids = [row[0] for row in base_query.with_entities(Company.id).all()]
-        display_scores = get_display_scores_for_companies(
-            db, company_ids, workspace_id=workspace_id
+        companies, _ = _score_page(
+            db,
+            search=search,
+            workspace_id=workspace_id,
+            ascending=ascending,
+            page_size=page_size,
+            offset=offset,
         )
-        # Companies without score use -1; reverse for asc (low first)
-        mult = 1 if ascending else -1
-        sorted_ids = sorted(
-            company_ids,
-            key=lambda cid: (mult * (display_scores.get(cid) or -1), cid),
-        )
-        start = (page - 1) * page_size
-        page_ids = sorted_ids[start : start + page_size]
-        if not page_ids:
-            return [], total
-        # Fetch companies in page order (preserve sort)
-        id_to_company = {c.id: c for c in db.query(Company).filter(Company.id.in_(page_ids)).all()}
-        companies = [id_to_company[cid] for cid in page_ids if cid in id_to_company]
+    elif sort_by == "relevance" and search and search.strip():
+        # Best match first regardless of sort_order
+        rank = company_search_rank(db, search)
+        base_query = base_query.order_by(rank.desc(), Company.id)
+        companies = base_query.offset(offset).limit(page_size).all()
     else:
         column_map = {
             "name": Company.name,
@@ -137,12 +243,50 @@ def list_companies(
         }
         col = column_map.get(sort_by, Company.created_at)
         base_query = base_query.order_by(_order_clause(col, ascending))
-        offset = (page - 1) * page_size
         companies = base_query.offset(offset).limit(page_size).all()
 
     return [_model_to_read(c) for c in companies], total
 
 
+async def list_companies_async(db: AsyncSession, **kwargs: Any) -> tuple[list[CompanyRead], int]:
+    """list_companies on an AsyncSession (same keyword arguments)."""
+    return await db.run_sync(lambda session: list_companies(session, **kwargs))
+
+
+def list_companies_after(
+    db: Session,
+    *,
+    after: str | None = None,
+    page_size: int = 20,
+    sort_order: str = "desc",
+    search: str | None = None,
+    workspace_id: str | None = None,
+) -> tuple[list[CompanyRead], str | None]:
+    """Keyset page of companies sorted by display score.
+
+    after is the cursor returned with the previous page (None for the first
+    page), so every page costs the same as the first. Returns (items,
+    next_cursor); next_cursor is None on the last page. Raises ValueError for a
+    malformed cursor.
+    """
+    companies, next_cursor = _score_page(
+        db,
+        search=search,
+        workspace_id=workspace_id,
+        ascending=sort_order == "asc",
+        page_size=page_size,
+        after=after,
+    )
+    return [_model_to_read(c) for c in companies], next_cursor
+
+
+async def list_companies_after_async(
+    db: AsyncSession, **kwargs: Any
+) -> tuple[list[CompanyRead], str | None]:
+    """list_companies_after on an AsyncSession (same keyword arguments)."""
+    return await db.run_sync(lambda session: list_companies_after(session, **kwargs))
+
+
 def get_company(db: Session, company_id: int) -> CompanyRead | None:
     """Return a single company by ID, or None if not found."""
     company = db.query(Company).filter(Company.id == company_id).first()
@@ -170,6 +314,9 @@ def update_company(db: Session, company_id: int, data: CompanyUpdate) -> Company
     model_data = _schema_to_model_data(data, is_update=True)
     for key, value in model_data.items():
         setattr(company, key, value)
+    # Alignment and status feed scoring
+    enqueue_dirty_companies(db, [company_id], "company")
+    bump_read_generation(db)
 
     db.commit()
     db.refresh(company)
@@ -182,6 +329,7 @@ def delete_company(db: Session, company_id: int) -> bool:
     if company is None:
         return False
     db.delete(company)
+    bump_read_generation(db)
     db.commit()
     return True
 
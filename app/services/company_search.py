@@ -0,0 +1,94 @@
+"""Company search: substring and fuzzy matching on name, domain, founder and notes.
+
+On Postgres with pg_trgm (migration 20260314_company_search_trgm) the
+predicates match the GIN trigram indexes on lower(<column>), so '%term%'
+lookups do not scan the companies table; names and domains also match on
+trigram word similarity (typos), and results rank by where the term appears
+in the name (exact, prefix, substring), then by similarity.
+
+Elsewhere (non-Postgres databases, or servers without pg_trgm) the same
+substring predicates run unindexed and rank by where the term appears in the
+name: exact, prefix, substring, then other columns.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from sqlalchemy import case, func, literal, or_, text
+from sqlalchemy.orm import Session
+
+from app.models.company import Company
+
+logger = logging.getLogger(__name__)
+
+# (column, rank weight): founder and notes matches rank below name/domain matches
+SEARCH_COLUMNS = (
+    (Company.name, 1.0),
+    (Company.domain, 1.0),
+    (Company.founder_name, 0.5),
+    (Company.notes, 0.5),
+)
+# Columns that also match on trigram similarity (pg_trgm word_similarity_threshold)
+FUZZY_COLUMNS = (Company.name, Company.domain)
+
+# Database URL -> pg_trgm installed; checked once per database
+_trigram_support: dict[str, bool] = {}
+
+
+def normalize_search_term(term: str) -> str:
+    """Lowercase and collapse whitespace (matches the lower(<column>) indexes)."""
+    return " ".join(term.lower().split())
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def trigram_search_enabled(db: Session) -> bool:
+    """True when db is Postgres with the pg_trgm extension installed."""
+    bind = db.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    key = str(bind.engine.url)
+    if key not in _trigram_support:
+        installed = db.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+        _trigram_support[key] = installed.scalar() is not None
+        if not _trigram_support[key]:
+            logger.info("pg_trgm not installed; company search runs unindexed")
+    return _trigram_support[key]
+
+
+def company_search_filter(db: Session, term: str):
+    """WHERE clause matching companies for a search term."""
+    normalized = normalize_search_term(term)
+    pattern = _like_pattern(normalized)
+    clauses = [func.lower(col).like(pattern, escape="\\") for col, _ in SEARCH_COLUMNS]
+    if trigram_search_enabled(db):
+        # col %> term: word similarity of term to col above the pg_trgm threshold
+        clauses += [func.lower(col).bool_op("%>")(normalized) for col in FUZZY_COLUMNS]
+    return or_(*clauses)
+
+
+def company_search_rank(db: Session, term: str):
+    """Relevance expression for a search term (higher is better)."""
+    normalized = normalize_search_term(term)
+    name = func.lower(Company.name)
+    name_tier = case(
+        (name == normalized, 3),
+        (name.like(_like_pattern(normalized)[1:], escape="\\"), 2),
+        (name.like(_like_pattern(normalized), escape="\\"), 1),
+        else_=literal(0),
+    )
+    if not trigram_search_enabled(db):
+        return name_tier
+    # word_similarity is 1.0 for exact, prefix and whole-word matches alike, so it
+    # (0..1) only orders companies within a name tier; tiers are 2 apart to stay ahead
+    similarity = func.greatest(
+        *(
+            func.word_similarity(normalized, func.lower(col)) * weight
+            for col, weight in SEARCH_COLUMNS
+        )
+    )
+    return name_tier * 2 + similarity
@@ -2,15 +2,20 @@
 
 Computes ESL from ReadinessSnapshot, SignalEvents, OutreachHistory, Company.
 Runs after readiness scoring; requires ReadinessSnapshot for company/as_of.
+compute_esl_batch / write_engagement_snapshots_batch do the same for a chunk of
+companies with a fixed number of queries (nightly scoring).
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Mapping, Sequence
 from datetime import UTC, date, datetime, timedelta
 from typing import Any, TypedDict
 from uuid import UUID
 
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.models import (
@@ -38,6 +43,8 @@ from app.services.esl.esl_engine import (
 )
 from app.services.pack_resolver import get_default_pack_id, resolve_pack
 
+logger = logging.getLogger(__name__)
+
 
 class EslContextResult(TypedDict, total=True):
     """Return shape of compute_esl_from_context (Issue #106, M1 Issue #120).
@@ -157,13 +164,42 @@ def compute_esl_from_context(
         .scalar()
     )
 
-    be = compute_base_engageability(readiness.composite)
+    signal_ids = _get_signal_ids_for_company(db, company_id, pack_id, core_pack_id=core_pack_id)
+    return _esl_context(
+        pack,
+        pack_id,
+        company_id,
+        as_of,
+        trs=readiness.composite,
+        alignment_ok_to_contact=company.alignment_ok_to_contact,
+        events=events,
+        pressure_snapshots=pressure_snapshots,
+        last_outreach=last_outreach,
+        signal_ids=signal_ids,
+    )
+
+
+def _esl_context(
+    pack: Any,
+    pack_id: UUID | str,
+    company_id: int,
+    as_of: date,
+    *,
+    trs: int,
+    alignment_ok_to_contact: bool | None,
+    events: Sequence[Any],
+    pressure_snapshots: Sequence[Any],
+    last_outreach: datetime | None,
+    signal_ids: set[str],
+) -> EslContextResult:
+    """ESL for one company from its loaded inputs (shared by single and batch paths)."""
+    be = compute_base_engageability(trs)
     svi = compute_svi(events, as_of, pack=pack)
     spi = compute_spi(pressure_snapshots, as_of)
     csi = compute_csi(events, as_of)
     sm = compute_stability_modifier(svi, spi, csi)
     cm = compute_cadence_modifier(last_outreach, as_of)
-    am = compute_alignment_modifier(company.alignment_ok_to_contact)
+    am = compute_alignment_modifier(alignment_ok_to_contact)
     esl_composite = compute_esl_composite(be, sm, cm, am)
     recommendation_type = map_esl_to_recommendation(esl_composite, pack=pack)
 
@@ -172,7 +208,6 @@ def compute_esl_from_context(
     # Stability cap must not override cadence-blocked: Observe Only takes precedence.
     if stability_cap_triggered and not cadence_blocked:
         recommendation_type = "Soft Value Share"
-        logger = logging.getLogger(__name__)
         logger.info(
             "Stability cap triggered: company_id=%s, stability_modifier=%.2f",
             company_id,
@@ -195,7 +230,6 @@ def compute_esl_from_context(
 
     # Issue #175: ESL decision gate (Phase 2); Phase 4: also in dedicated columns
     # Issue #287 M4: signal set from core instances when core_pack_id set
-    signal_ids = _get_signal_ids_for_company(db, company_id, pack_id, core_pack_id=core_pack_id)
     esl_result = evaluate_esl_decision(signal_ids, pack)
     explain["esl_decision"] = esl_result.decision
     explain["esl_reason_code"] = esl_result.reason_code
@@ -208,8 +242,8 @@ def compute_esl_from_context(
         "recommendation_type": recommendation_type,
         "explain": explain,
         "cadence_blocked": cadence_blocked,
-        "alignment_high": company.alignment_ok_to_contact is not False,
-        "trs": readiness.composite,
+        "alignment_high": alignment_ok_to_contact is not False,
+        "trs": trs,
         "pack_id": pack_id,
         "esl_decision": esl_result.decision,
         "esl_reason_code": esl_result.reason_code,
@@ -218,6 +252,162 @@ def compute_esl_from_context(
     }
 
 
+def _group_by_company(rows: Sequence[Any], key: str = "company_id") -> dict[int, list[Any]]:
+    grouped: dict[int, list[Any]] = {}
+    for row in rows:
+        grouped.setdefault(getattr(row, key), []).append(row)
+    return grouped
+
+
+def compute_esl_batch(
+    db: Session,
+    composites: Mapping[int, int],
+    as_of: date,
+    pack_id=None,
+    core_pack_id: UUID | None = None,
+    events_by_company: Mapping[int, Sequence[Any]] | None = None,
+) -> dict[int, EslContextResult]:
+    """Compute ESL for a chunk of companies with a fixed number of queries.
+
+    composites maps company_id -> that company's readiness composite (TRS) for
+    as_of, e.g. captured from the snapshots just written by the scoring loop;
+    plain values, so snapshots expired by a later commit are not reloaded one
+    by one. events_by_company optionally supplies the pack's SignalEvents for the
+    last 365 days when the caller already has them. Pressure history, last
+    outreach, company alignment and signal sets are fetched once for the chunk.
+    Results equal compute_esl_from_context per company; companies that no
+    longer exist are omitted.
+    """
+    pack_id = pack_id or get_default_pack_id(db)
+    ids = list(composites)
+    if pack_id is None or not ids:
+        return {}
+    pack = resolve_pack(db, pack_id)
+
+    alignment = dict(
+        db.query(Company.id, Company.alignment_ok_to_contact).filter(Company.id.in_(ids)).all()
+    )
+    if events_by_company is None:
+        cutoff_dt = datetime.combine(as_of - timedelta(days=365), datetime.min.time()).replace(
+            tzinfo=UTC
+        )
+        events_by_company = _group_by_company(
+            db.query(
+                SignalEvent.company_id,
+                SignalEvent.event_type,
+                SignalEvent.event_time,
+                SignalEvent.confidence,
+            )
+            .filter(
+                SignalEvent.company_id.in_(ids),
+                SignalEvent.event_time >= cutoff_dt,
+                SignalEvent.pack_id == pack_id,
+            )
+            .all()
+        )
+    pressure_by_company = _group_by_company(
+        db.query(ReadinessSnapshot.company_id, ReadinessSnapshot.as_of, ReadinessSnapshot.pressure)
+        .filter(
+            ReadinessSnapshot.company_id.in_(ids),
+            ReadinessSnapshot.as_of >= as_of - timedelta(days=90),
+            ReadinessSnapshot.as_of <= as_of,
+            ReadinessSnapshot.pack_id == pack_id,
+        )
+        .all()
+    )
+    last_outreach = dict(
+        db.query(OutreachHistory.company_id, func.max(OutreachHistory.sent_at))
+        .filter(OutreachHistory.company_id.in_(ids))
+        .group_by(OutreachHistory.company_id)
+        .all()
+    )
+    signal_ids: dict[int, set[str]] = {}
+    signal_pack_id = core_pack_id if core_pack_id is not None else pack_id
+    for entity_id, signal_id in (
+        db.query(SignalInstance.entity_id, SignalInstance.signal_id)
+        .filter(SignalInstance.entity_id.in_(ids), SignalInstance.pack_id == signal_pack_id)
+        .distinct()
+        .all()
+    ):
+        if signal_id:
+            signal_ids.setdefault(entity_id, set()).add(signal_id)
+
+    return {
+        company_id: _esl_context(
+            pack,
+            pack_id,
+            company_id,
+            as_of,
+            trs=composites[company_id],
+            alignment_ok_to_contact=alignment[company_id],
+            events=events_by_company.get(company_id, []),
+            pressure_snapshots=pressure_by_company.get(company_id, []),
+            last_outreach=last_outreach.get(company_id),
+            signal_ids=signal_ids.get(company_id, set()),
+        )
+        for company_id in ids
+        if company_id in alignment
+    }
+
+
+def _engagement_row(company_id: int, as_of: date, ctx: EslContextResult) -> dict[str, Any]:
+    explain = ctx["explain"]
+    return {
+        "company_id": company_id,
+        "as_of": as_of,
+        "esl_score": ctx["esl_composite"],
+        "engagement_type": ctx["recommendation_type"],
+        "stress_volatility_index": explain["svi"],
+        "communication_stability_index": explain["csi"],
+        "sustained_pressure_index": explain["spi"],
+        "cadence_blocked": ctx["cadence_blocked"],
+        "explain": explain,
+        "outreach_score": compute_outreach_score(ctx["trs"], ctx["esl_composite"]),
+        "pack_id": ctx["pack_id"],
+        "esl_decision": ctx.get("esl_decision"),
+        "esl_reason_code": ctx.get("esl_reason_code"),
+        "sensitivity_level": ctx.get("sensitivity_level"),
+        "computed_at": datetime.now(UTC),
+    }
+
+
+def write_engagement_snapshots_batch(
+    db: Session,
+    composites: Mapping[int, int],
+    as_of: date,
+    pack_id=None,
+    core_pack_id: UUID | None = None,
+    events_by_company: Mapping[int, Sequence[Any]] | None = None,
+) -> dict[int, EslContextResult]:
+    """Compute ESL for a chunk (compute_esl_batch) and upsert its EngagementSnapshots.
+
+    One INSERT ... ON CONFLICT for the chunk. Caller commits. Returns the ESL
+    results written, keyed by company_id.
+    """
+    results = compute_esl_batch(
+        db,
+        composites,
+        as_of,
+        pack_id=pack_id,
+        core_pack_id=core_pack_id,
+        events_by_company=events_by_company,
+    )
+    if not results:
+        return results
+    stmt = insert(EngagementSnapshot).values(
+        [_engagement_row(cid, as_of, ctx) for cid, ctx in results.items()]
+    )
+    updated = {
+        col: stmt.excluded[col]
+        for col in _engagement_row(0, as_of, next(iter(results.values())))
+        if col not in ("company_id", "as_of", "pack_id")
+    }
+    db.execute(
+        stmt.on_conflict_do_update(index_elements=["company_id", "as_of", "pack_id"], set_=updated)
+    )
+    return results
+
+
 def write_engagement_snapshot(
     db: Session,
     company_id: int,
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import logging
+import time
 
 import httpx
 
+from app.metrics import FETCH_SECONDS, host_label
 from app.services import robots as robots_module
 
 logger = logging.getLogger(__name__)
@@ -30,7 +32,10 @@ async def fetch_page(url: str, check_robots: bool = False) -> str | None:
         if not allowed:
             logger.debug("Robots.txt disallows %s for %s — skipping fetch", USER_AGENT, url)
             return None
+    host = host_label(url)
     for attempt in range(2):  # attempt 0 = first try, attempt 1 = retry
+        started = time.perf_counter()
+        outcome = "error"
         try:
             async with httpx.AsyncClient(
                 timeout=TIMEOUT,
@@ -39,6 +44,7 @@ async def fetch_page(url: str, check_robots: bool = False) -> str | None:
                 headers={"User-Agent": USER_AGENT},
             ) as client:
                 response = await client.get(url)
+                outcome = "http_error" if response.is_error else "ok"
                 response.raise_for_status()
                 return response.text
         except (httpx.TimeoutException, httpx.ConnectError) as exc:
@@ -53,4 +59,6 @@ async def fetch_page(url: str, check_robots: bool = False) -> str | None:
         except httpx.HTTPError as exc:
             logger.error("HTTP error fetching %s: %s", url, exc)
             return None
+        finally:
+            FETCH_SECONDS.labels(host, outcome).observe(time.perf_counter() - started)
     return None
@@ -77,6 +77,23 @@ def _get_adapters() -> list:
     return adapters
 
 
+def ingest_since(db: Session) -> datetime:
+    """Fetch window start: last completed ingest's finished_at, else now - 24h."""
+    last_job = (
+        db.query(JobRun)
+        .filter(
+            JobRun.job_type == "ingest",
+            JobRun.status == "completed",
+            JobRun.finished_at.isnot(None),
+        )
+        .order_by(JobRun.finished_at.desc())
+        .first()
+    )
+    if last_job and last_job.finished_at:
+        return last_job.finished_at
+    return datetime.now(UTC) - timedelta(hours=24)
+
+
 def run_ingest_daily(
     db: Session,
     workspace_id: str | UUID | None = None,
@@ -112,22 +129,7 @@ def run_ingest_daily(
     db.refresh(job)
 
     try:
-        # Compute since: last ingest finished_at or now - 24h
-        last_job = (
-            db.query(JobRun)
-            .filter(
-                JobRun.job_type == "ingest",
-                JobRun.status == "completed",
-                JobRun.finished_at.isnot(None),
-            )
-            .order_by(JobRun.finished_at.desc())
-            .first()
-        )
-        if last_job and last_job.finished_at:
-            since = last_job.finished_at
-        else:
-            since = datetime.now(UTC) - timedelta(hours=24)
-
+        since = ingest_since(db)
         adapters = _get_adapters()
         total_inserted = 0
         total_skipped_duplicate = 0
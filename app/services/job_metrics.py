@@ -0,0 +1,158 @@
+"""Per-span timing for job runs (JobRun.metrics).
+
+Stage code wraps its phases in job_span("score.events", company_id=...). Inside
+a collect_job_metrics() block (run_stage and pipelined DAG nodes open one per
+run, and run_score_nightly its own so cron runs record too), every span's
+duration, SQL statements and DB time are aggregated per span name: count,
+total, max and a duration histogram, plus the companies that spent the most
+time in spans carrying their company_id. Outside a block job_span does nothing,
+so other instrumented code called directly (scripts, tests) is unaffected.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.db.profiling import QueryStats, track_queries
+from app.models.job_run import JobRun
+
+# Histogram upper bounds in ms; durations above the last land in a final +Inf bucket
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+# Slowest companies kept in JobRun.metrics
+TOP_COMPANIES = 10
+
+
+@dataclass
+class SpanStats:
+    """Aggregate of every run of one span name."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    statements: int = 0
+    db_ms: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS_MS) + 1))
+
+    def add(self, duration_ms: float, queries: QueryStats) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.statements += queries.count
+        self.db_ms += queries.db_ms
+        self.histogram[bisect_left(HISTOGRAM_BUCKETS_MS, duration_ms)] += 1
+
+
+class JobMetrics:
+    """Span aggregates and per-company time for one job run."""
+
+    def __init__(self) -> None:
+        self.spans: dict[str, SpanStats] = {}
+        self.company_ms: dict[int, float] = {}
+
+    def record(
+        self, name: str, duration_ms: float, queries: QueryStats, company_id: int | None = None
+    ) -> None:
+        self.spans.setdefault(name, SpanStats()).add(duration_ms, queries)
+        if company_id is not None:
+            self.company_ms[company_id] = self.company_ms.get(company_id, 0.0) + duration_ms
+
+    def to_dict(self, top_companies: int = TOP_COMPANIES) -> dict[str, Any]:
+        """JSON-safe form stored in JobRun.metrics."""
+        slowest = sorted(self.company_ms.items(), key=lambda item: item[1], reverse=True)
+        return {
+            "histogram_buckets_ms": list(HISTOGRAM_BUCKETS_MS),
+            "spans": {
+                name: {
+                    "count": span.count,
+                    "total_ms": round(span.total_ms, 1),
+                    "avg_ms": round(span.total_ms / span.count, 2),
+                    "max_ms": round(span.max_ms, 1),
+                    "statements": span.statements,
+                    "db_ms": round(span.db_ms, 1),
+                    "histogram": span.histogram,
+                }
+                for name, span in sorted(self.spans.items())
+            },
+            "slowest_companies": [
+                {"company_id": company_id, "ms": round(ms, 1)}
+                for company_id, ms in slowest[:top_companies]
+            ],
+        }
+
+
+_active: ContextVar[tuple[JobMetrics, ...]] = ContextVar("active_job_metrics", default=())
+
+
+@contextmanager
+def collect_job_metrics() -> Iterator[JobMetrics]:
+    """Collect job_span timings run in this context (also into any enclosing block)."""
+    metrics = JobMetrics()
+    token = _active.set((*_active.get(), metrics))
+    try:
+        yield metrics
+    finally:
+        _active.reset(token)
+
+
+@contextmanager
+def job_span(name: str, company_id: int | None = None) -> Iterator[None]:
+    """Time the enclosed block as span name (dotted, e.g. "score.readiness")."""
+    active = _active.get()
+    if not active:
+        yield
+        return
+    started = time.perf_counter()
+    with track_queries() as queries:
+        try:
+            yield
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            for metrics in active:
+                metrics.record(name, duration_ms, queries, company_id)
+
+
+def store_run_stats(job: JobRun, queries: QueryStats, metrics: JobMetrics) -> None:
+    """Set the run's SQL statement count, DB time and span metrics on its JobRun. Caller commits."""
+    job.query_count = queries.count
+    job.db_time_ms = round(queries.db_ms)
+    job.metrics = metrics.to_dict()
+
+
+def recent_job_metrics(db: Session, job_type: str, limit: int = 20) -> list[dict[str, Any]]:
+    """Latest runs of job_type that recorded metrics, newest first, for comparing over time."""
+    jobs = (
+        db.query(JobRun)
+        .filter(JobRun.job_type == job_type, JobRun.metrics.is_not(None))
+        .order_by(JobRun.id.desc())
+        .limit(limit)
+        .all()
+    )
+    return [
+        {
+            "job_run_id": job.id,
+            "status": job.status,
+            "started_at": job.started_at.isoformat() if job.started_at else None,
+            "duration_ms": _duration_ms(job),
+            "companies_processed": job.companies_processed,
+            "query_count": job.query_count,
+            "db_time_ms": job.db_time_ms,
+            "metrics": job.metrics,
+        }
+        for job in jobs
+    ]
+
+
+def _duration_ms(job: JobRun) -> int | None:
+    if job.started_at is None or job.finished_at is None:
+        return None
+    # Columns are naive UTC; finished_at is aware until the row is reloaded
+    elapsed = job.finished_at.replace(tzinfo=None) - job.started_at.replace(tzinfo=None)
+    return round(elapsed.total_seconds() * 1000)
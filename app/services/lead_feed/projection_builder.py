@@ -2,14 +2,36 @@
 
 Builds and upserts lead_feed rows from ReadinessSnapshot + EngagementSnapshot.
 Idempotent: replace existing row for (workspace_id, pack_id, entity_id).
+
+build_lead_feed_for_workspaces() is set-based: one INSERT ... SELECT ... ON
+CONFLICT per chunk of entities (suppression, minimum threshold, top signals,
+last_seen and outreach summary computed in SQL). upsert_lead_feed_from_snapshots()
+is the single-entity equivalent for callers holding snapshot objects.
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 from datetime import UTC, date, datetime
 from uuid import UUID
 
-from sqlalchemy import or_
+from sqlalchemy import (
+    Float,
+    Integer,
+    Numeric,
+    String,
+    and_,
+    case,
+    column,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.models.engagement_snapshot import EngagementSnapshot
@@ -17,10 +39,18 @@ from app.models.lead_feed import LeadFeed
 from app.models.outreach_history import OutreachHistory
 from app.models.readiness_snapshot import ReadinessSnapshot
 from app.models.signal_instance import SignalInstance
+from app.services.esl.esl_engine import compute_outreach_score
 from app.services.esl.esl_gate_filter import is_suppressed_from_engagement
 
+# Entities per INSERT ... SELECT when building the projection
+DEFAULT_PROJECTION_CHUNK_SIZE = 5000
+TOP_SIGNAL_IDS_LIMIT = 8
+_RECOMMENDATION_BANDS = ("IGNORE", "WATCH", "HIGH_PRIORITY")
+
 
-def _top_signal_ids_from_explain(explain: dict | None, limit: int = 8) -> list[str]:
+def _top_signal_ids_from_explain(
+    explain: dict | None, limit: int = TOP_SIGNAL_IDS_LIMIT
+) -> list[str]:
     """Extract top signal_ids from ReadinessSnapshot explain.top_events.
 
     top_events items have event_type (maps to signal_id in taxonomy).
@@ -53,8 +83,6 @@ def _batch_last_seen_for_entities(
     """
     if not entity_ids:
         return {}
-    from sqlalchemy import func
-
     subq = db.query(
         SignalInstance.entity_id,
         func.max(SignalInstance.last_seen).label("last_seen"),
@@ -110,6 +138,9 @@ def upsert_lead_feed_row(
     entity_id: int,
     *,
     composite_score: int,
+    outreach_score: int | None = None,
+    esl_score: float | None = None,
+    cadence_blocked: bool = False,
     top_signal_ids: list[str] | None = None,
     esl_decision: str | None = None,
     sensitivity_level: str | None = None,
@@ -120,6 +151,7 @@ def upsert_lead_feed_row(
 ) -> LeadFeed:
     """Upsert a single lead_feed row. Replaces existing for (workspace_id, pack_id, entity_id).
 
+    outreach_score defaults to composite_score (no engagement snapshot).
     Idempotent: safe to call multiple times for the same entity.
     """
     ws_uuid = UUID(str(workspace_id)) if isinstance(workspace_id, str) else workspace_id
@@ -138,6 +170,9 @@ def upsert_lead_feed_row(
     now = datetime.now(UTC)
     row_data = {
         "composite_score": composite_score,
+        "outreach_score": outreach_score if outreach_score is not None else composite_score,
+        "esl_score": esl_score,
+        "cadence_blocked": cadence_blocked,
         "top_signal_ids": top_signal_ids or [],
         "esl_decision": esl_decision,
         "sensitivity_level": sensitivity_level,
@@ -211,6 +246,11 @@ def upsert_lead_feed_from_snapshots(
     if last_seen is None and readiness_snapshot.computed_at:
         last_seen = readiness_snapshot.computed_at
     outreach_summary = outreach_by.get(entity_id)
+    outreach_score = engagement_snapshot.outreach_score
+    if outreach_score is None:
+        outreach_score = compute_outreach_score(
+            readiness_snapshot.composite, engagement_snapshot.esl_score
+        )
 
     return upsert_lead_feed_row(
         db,
@@ -218,6 +258,9 @@ def upsert_lead_feed_from_snapshots(
         pack_id,
         entity_id,
         composite_score=readiness_snapshot.composite,
+        outreach_score=outreach_score,
+        esl_score=engagement_snapshot.esl_score,
+        cadence_blocked=engagement_snapshot.cadence_blocked,
         top_signal_ids=top_signal_ids,
         esl_decision=esl_decision,
         sensitivity_level=sensitivity_level,
@@ -264,84 +307,206 @@ def refresh_outreach_summary_for_entity(
     return len(rows)
 
 
+def _isoformat_utc(col):
+    """SQL text of a timestamptz matching datetime.isoformat() in UTC."""
+    utc = func.timezone("UTC", col)
+    return (
+        func.to_char(utc, 'YYYY-MM-DD"T"HH24:MI:SS')
+        + case((func.date_trunc("second", col) == col, ""), else_=func.to_char(utc, ".US"))
+        + "+00:00"
+    )
+
+
+def _top_signal_ids_sql(explain_col: str):
+    """SQL equivalent of _top_signal_ids_from_explain for a JSONB explain column."""
+    return literal_column(
+        "(SELECT coalesce(jsonb_agg(t.signal_id ORDER BY t.pos), '[]'::jsonb) FROM ("
+        "SELECT e.value->>'event_type' AS signal_id, min(e.pos) AS pos "
+        "FROM jsonb_array_elements(CASE WHEN jsonb_typeof("
+        f"{explain_col}->'top_events') = 'array' THEN {explain_col}->'top_events' "
+        "ELSE '[]'::jsonb END) WITH ORDINALITY AS e(value, pos) "
+        f"WHERE e.pos <= {TOP_SIGNAL_IDS_LIMIT} AND coalesce(e.value->>'event_type', '') <> '' "
+        "GROUP BY 1) t)"
+    )
+
+
+def _projection_select(
+    workspace_ids: Sequence[UUID],
+    pack_id: UUID,
+    as_of: date,
+    core_pack_id: UUID | None,
+):
+    """SELECT producing lead_feed rows for workspaces x included entities of pack/as_of."""
+    rs = ReadinessSnapshot.__table__
+    es = EngagementSnapshot.__table__
+    ws = values(column("id", PG_UUID(as_uuid=True)), name="ws").data(
+        [(ws_id,) for ws_id in workspace_ids]
+    )
+
+    last_seen = select(func.max(SignalInstance.last_seen)).where(
+        SignalInstance.entity_id == rs.c.company_id,
+        SignalInstance.last_seen.isnot(None),
+    )
+    if core_pack_id is not None:
+        last_seen = last_seen.where(SignalInstance.pack_id == core_pack_id)
+    else:
+        last_seen = last_seen.where(
+            or_(SignalInstance.pack_id == pack_id, SignalInstance.pack_id.is_(None))
+        )
+    outreach = (
+        select(
+            func.jsonb_build_object(
+                literal_column("'last_sent_at'"),
+                _isoformat_utc(OutreachHistory.sent_at),
+                literal_column("'outcome'"),
+                OutreachHistory.outcome,
+                literal_column("'outreach_type'"),
+                OutreachHistory.outreach_type,
+            )
+        )
+        .where(
+            OutreachHistory.company_id == rs.c.company_id,
+            OutreachHistory.workspace_id == ws.c.id,
+        )
+        .order_by(OutreachHistory.sent_at.desc(), OutreachHistory.id.desc())
+        .limit(1)
+    )
+
+    es_explain_decision = es.c.explain["esl_decision"].astext
+    threshold = rs.c.explain["minimum_threshold"]
+    band = rs.c.explain["recommendation_band"].astext
+    return (
+        select(
+            ws.c.id.label("workspace_id"),
+            rs.c.pack_id,
+            rs.c.company_id.label("entity_id"),
+            rs.c.composite.label("composite_score"),
+            # compute_outreach_score: float8 round() is half-to-even like Python's round()
+            func.coalesce(
+                es.c.outreach_score,
+                func.round((rs.c.composite * es.c.esl_score).cast(Float)).cast(Integer),
+            ).label("outreach_score"),
+            es.c.esl_score,
+            es.c.cadence_blocked,
+            _top_signal_ids_sql("readiness_snapshots.explain").label("top_signal_ids"),
+            func.coalesce(func.nullif(es.c.esl_decision, ""), es_explain_decision).label(
+                "esl_decision"
+            ),
+            func.coalesce(
+                func.nullif(es.c.sensitivity_level, ""),
+                es.c.explain["sensitivity_level"].astext,
+            )
+            .cast(String(32))
+            .label("sensitivity_level"),
+            case((band.in_(_RECOMMENDATION_BANDS), band)).label("recommendation_band"),
+            func.coalesce(last_seen.scalar_subquery(), rs.c.computed_at).label("last_seen"),
+            outreach.scalar_subquery().label("outreach_status_summary"),
+            literal(as_of).label("as_of"),
+            func.now().label("updated_at"),
+        )
+        .select_from(ws)
+        .join(rs, literal(True))
+        .join(
+            es,
+            and_(
+                es.c.company_id == rs.c.company_id,
+                es.c.as_of == rs.c.as_of,
+                es.c.pack_id == rs.c.pack_id,
+            ),
+        )
+        .where(
+            rs.c.as_of == as_of,
+            rs.c.pack_id == pack_id,
+            # is_suppressed_from_engagement
+            func.coalesce(es.c.esl_decision, "") != "suppress",
+            func.coalesce(es_explain_decision, "") != "suppress",
+            rs.c.composite
+            >= case(
+                (func.jsonb_typeof(threshold) == "number", threshold.astext.cast(Numeric)),
+                else_=0,
+            ),
+        )
+    )
+
+
+def _entity_chunks(
+    db: Session, pack_id: UUID, as_of: date, chunk_size: int
+) -> Iterator[tuple[int, int | None]]:
+    """Yield inclusive (first, last) company_id ranges of chunk_size snapshots (last None = open)."""
+    ids = (
+        select(ReadinessSnapshot.company_id)
+        .where(ReadinessSnapshot.as_of == as_of, ReadinessSnapshot.pack_id == pack_id)
+        .order_by(ReadinessSnapshot.company_id)
+    )
+    first = db.scalar(ids.limit(1))
+    while first is not None:
+        last = db.scalar(
+            ids.where(ReadinessSnapshot.company_id >= first).offset(chunk_size - 1).limit(1)
+        )
+        yield first, last
+        if last is None:
+            return
+        first = db.scalar(ids.where(ReadinessSnapshot.company_id > last).limit(1))
+
+
+def build_lead_feed_for_workspaces(
+    db: Session,
+    workspace_ids: Sequence[UUID | str],
+    pack_id: UUID | str,
+    as_of: date,
+    core_pack_id: UUID | None = None,
+    entity_ids: Sequence[int] | None = None,
+    chunk_size: int = DEFAULT_PROJECTION_CHUNK_SIZE,
+) -> int:
+    """Upsert lead_feed rows for every workspace from pack snapshots for as_of.
+
+    One INSERT ... SELECT ... ON CONFLICT per chunk of chunk_size entities (by
+    company_id range). Rows match upsert_lead_feed_from_snapshots; suppressed
+    entities and those below explain.minimum_threshold are skipped. entity_ids
+    limits the build to those companies. Caller commits. Returns rows upserted.
+    """
+    ws_uuids = [UUID(str(ws_id)) if isinstance(ws_id, str) else ws_id for ws_id in workspace_ids]
+    pack_uuid = UUID(str(pack_id)) if isinstance(pack_id, str) else pack_id
+    if not ws_uuids or (entity_ids is not None and not entity_ids):
+        return 0
+
+    source = _projection_select(ws_uuids, pack_uuid, as_of, core_pack_id)
+    if entity_ids is not None:
+        source = source.where(ReadinessSnapshot.company_id.in_(list(entity_ids)))
+    columns = [col.name for col in source.selected_columns]
+    count = 0
+    for first, last in _entity_chunks(db, pack_uuid, as_of, chunk_size):
+        chunk = source.where(ReadinessSnapshot.company_id >= first)
+        if last is not None:
+            chunk = chunk.where(ReadinessSnapshot.company_id <= last)
+        stmt = insert(LeadFeed).from_select(columns, chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["workspace_id", "pack_id", "entity_id"],
+            set_={name: stmt.excluded[name] for name in columns[3:]},
+        )
+        count += len(db.execute(stmt.returning(LeadFeed.entity_id)).all())
+    return count
+
+
 def build_lead_feed_from_snapshots(
     db: Session,
     workspace_id: UUID | str,
     pack_id: UUID | None,
     as_of: date,
     core_pack_id: UUID | None = None,
+    entity_ids: Sequence[int] | None = None,
 ) -> int:
     """Build lead_feed projection from latest ReadinessSnapshot + EngagementSnapshot.
 
     Joins snapshots for as_of and pack; excludes suppressed entities.
-    Upserts one row per entity. Returns count of rows upserted.
+    Upserts one row per entity (set-based, see build_lead_feed_for_workspaces).
+    Returns count of rows upserted.
 
-    Pack-scoped: when pack_id is set, filters snapshots by pack_id or NULL (legacy).
     Issue #287 M5: when core_pack_id is set, last_seen is taken from core
     SignalInstances; projection key (workspace_id, pack_id) is unchanged.
     """
-    ws_uuid = UUID(str(workspace_id)) if isinstance(workspace_id, str) else workspace_id
-
     if pack_id is None:
         return 0
-
-    pack_uuid = UUID(str(pack_id)) if isinstance(pack_id, str) else pack_id
-
-    pack_match = ReadinessSnapshot.pack_id == EngagementSnapshot.pack_id
-    pairs = (
-        db.query(ReadinessSnapshot, EngagementSnapshot)
-        .join(
-            EngagementSnapshot,
-            (ReadinessSnapshot.company_id == EngagementSnapshot.company_id)
-            & (ReadinessSnapshot.as_of == EngagementSnapshot.as_of)
-            & pack_match,
-        )
-        .filter(ReadinessSnapshot.as_of == as_of, ReadinessSnapshot.pack_id == pack_uuid)
-        .all()
+    return build_lead_feed_for_workspaces(
+        db, [workspace_id], pack_id, as_of, core_pack_id=core_pack_id, entity_ids=entity_ids
     )
-
-    def _should_include(rs: ReadinessSnapshot, es: EngagementSnapshot) -> bool:
-        if is_suppressed_from_engagement(es.esl_decision, es.explain):
-            return False
-        min_thresh = (rs.explain or {}).get("minimum_threshold", 0) or 0
-        if min_thresh > 0 and rs.composite < min_thresh:
-            return False
-        return True
-
-    entity_ids = [rs.company_id for rs, es in pairs if _should_include(rs, es)]
-    last_seen_by_entity = _batch_last_seen_for_entities(
-        db, entity_ids, pack_uuid, core_pack_id=core_pack_id
-    )
-    outreach_by_entity = _batch_outreach_summary_for_entities(db, entity_ids, workspace_id=ws_uuid)
-
-    count = 0
-    for rs, es in pairs:
-        if not _should_include(rs, es):
-            continue
-
-        entity_id = rs.company_id
-        top_signal_ids = _top_signal_ids_from_explain(rs.explain)
-        esl_decision = es.esl_decision or (es.explain or {}).get("esl_decision")
-        sensitivity_level = es.sensitivity_level or (es.explain or {}).get("sensitivity_level")
-        last_seen = last_seen_by_entity.get(entity_id)
-        if last_seen is None and rs.computed_at:
-            last_seen = rs.computed_at
-
-        outreach_summary = outreach_by_entity.get(entity_id)
-
-        upsert_lead_feed_row(
-            db,
-            ws_uuid,
-            pack_uuid,
-            entity_id,
-            composite_score=rs.composite,
-            top_signal_ids=top_signal_ids,
-            esl_decision=esl_decision,
-            sensitivity_level=sensitivity_level,
-            last_seen=last_seen,
-            outreach_status_summary=outreach_summary,
-            as_of=as_of,
-        )
-        count += 1
-
-    return count
@@ -7,8 +7,11 @@ Returns lead cards with composite_score, outreach_score, esl_decision, etc.
 from __future__ import annotations
 
 from datetime import UTC, date, datetime
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
 from app.models.company import Company
@@ -79,86 +82,105 @@ def get_leads_from_feed(
     *,
     limit: int = 100,
     offset: int = 0,
-    sort_by: str = "composite_score",
+    sort_by: str = "outreach_score",
     outreach_score_threshold: int = 30,
+    after: tuple[int, int] | None = None,
 ) -> list[dict]:
     """Query lead_feed for workspace/pack/as_of.
 
     Returns list of lead cards: entity_id, composite_score, outreach_score,
     top_signal_ids, esl_decision, sensitivity_level, last_seen, etc.
 
-    Sort options: composite_score (DESC), last_seen (DESC).
-    Filters by outreach_score_threshold when outreach_score available from join.
+    Sort options: outreach_score (DESC, the ranking contract of Issue #103;
+    served by ix_lead_feed_workspace_pack_as_of_outreach), composite_score (DESC),
+    last_seen (DESC). Rows below outreach_score_threshold are filtered in SQL,
+    except cadence_blocked ones (Observe Only, Issue #108).
+
+    Keyset pagination (outreach_score sort): pass after=(outreach_score,
+    entity_id) of the last lead of the previous page (see lead_cursor).
     """
     ws_uuid = UUID(str(workspace_id)) if isinstance(workspace_id, str) else workspace_id
+    pack_uuid = UUID(str(pack_id)) if isinstance(pack_id, str) else pack_id
 
-    order_col = LeadFeed.composite_score.desc()
     if sort_by == "last_seen":
-        order_col = LeadFeed.last_seen.desc().nullslast()
+        order_by = (LeadFeed.last_seen.desc().nullslast(),)
+    elif sort_by == "composite_score":
+        order_by = (LeadFeed.composite_score.desc(),)
+    else:
+        order_by = (LeadFeed.outreach_score.desc(), LeadFeed.entity_id.desc())
 
-    pack_uuid = UUID(str(pack_id)) if isinstance(pack_id, str) else pack_id
-    rows = (
-        db.query(LeadFeed)
-        .filter(
-            LeadFeed.workspace_id == ws_uuid,
-            LeadFeed.pack_id == pack_uuid,
-            LeadFeed.as_of == as_of,
-        )
-        .order_by(order_col)
-        .offset(offset)
-        .limit(limit * 2)  # Fetch extra for threshold filtering
-        .all()
+    q = db.query(LeadFeed).filter(
+        LeadFeed.workspace_id == ws_uuid,
+        LeadFeed.pack_id == pack_uuid,
+        LeadFeed.as_of == as_of,
+        or_(
+            LeadFeed.outreach_score >= outreach_score_threshold,
+            LeadFeed.cadence_blocked.is_(True),
+        ),
+    )
+    if after is not None:
+        if sort_by != "outreach_score":
+            raise ValueError("after cursor requires sort_by='outreach_score'")
+        q = q.filter(tuple_(LeadFeed.outreach_score, LeadFeed.entity_id) < tuple_(*after))
+    rows = q.order_by(*order_by).offset(offset).limit(limit).all()
+
+    return [
+        {
+            "entity_id": row.entity_id,
+            "composite_score": row.composite_score,
+            "outreach_score": row.outreach_score,
+            "top_signal_ids": row.top_signal_ids or [],
+            "esl_decision": row.esl_decision,
+            "sensitivity_level": row.sensitivity_level,
+            "recommendation_band": row.recommendation_band,
+            "last_seen": row.last_seen,
+            "outreach_status_summary": row.outreach_status_summary,
+            "as_of": row.as_of,
+        }
+        for row in rows
+    ]
+
+
+async def get_leads_from_feed_async(
+    db: AsyncSession,
+    workspace_id: str | UUID,
+    pack_id: UUID,
+    as_of: date,
+    **kwargs: Any,
+) -> list[dict]:
+    """get_leads_from_feed on an AsyncSession (same keyword arguments)."""
+    return await db.run_sync(
+        lambda session: get_leads_from_feed(session, workspace_id, pack_id, as_of, **kwargs)
     )
 
-    if not rows:
-        return []
 
-    entity_ids = [r.entity_id for r in rows]
-    es_rows = (
-        db.query(EngagementSnapshot)
+def lead_cursor(lead: dict) -> tuple[int, int]:
+    """Keyset cursor (outreach_score, entity_id) for get_leads_from_feed(after=...)."""
+    return lead["outreach_score"], lead["entity_id"]
+
+
+def _snapshots_by_entity(
+    db: Session, entity_ids: list[int], pack_uuid: UUID, as_of: date
+) -> dict[int, tuple[ReadinessSnapshot, EngagementSnapshot, Company]]:
+    """Batch-load (RS, ES, Company) for lead entities (one query)."""
+    pack_match = ReadinessSnapshot.pack_id == EngagementSnapshot.pack_id
+    pairs = (
+        db.query(ReadinessSnapshot, EngagementSnapshot)
+        .join(
+            EngagementSnapshot,
+            (ReadinessSnapshot.company_id == EngagementSnapshot.company_id)
+            & (ReadinessSnapshot.as_of == EngagementSnapshot.as_of)
+            & pack_match,
+        )
+        .options(joinedload(ReadinessSnapshot.company))
         .filter(
-            EngagementSnapshot.company_id.in_(entity_ids),
-            EngagementSnapshot.as_of == as_of,
-            EngagementSnapshot.pack_id == pack_uuid,
+            ReadinessSnapshot.company_id.in_(entity_ids),
+            ReadinessSnapshot.as_of == as_of,
+            ReadinessSnapshot.pack_id == pack_uuid,
         )
         .all()
     )
-    es_by_entity = {es.company_id: es for es in es_rows}
-
-    from app.services.esl.esl_engine import compute_outreach_score
-
-    result: list[dict] = []
-    for row in rows:
-        es = es_by_entity.get(row.entity_id)
-        if es and es.outreach_score is not None:
-            outreach_score = es.outreach_score
-        elif es and es.esl_score is not None:
-            outreach_score = compute_outreach_score(row.composite_score, es.esl_score)
-        else:
-            outreach_score = row.composite_score
-
-        # Include cadence_blocked (Observe Only) even when outreach_score < threshold
-        # (parity with get_emerging_companies legacy path, Issue #108)
-        if outreach_score < outreach_score_threshold and not (es and es.cadence_blocked):
-            continue
-        result.append(
-            {
-                "entity_id": row.entity_id,
-                "composite_score": row.composite_score,
-                "outreach_score": outreach_score,
-                "top_signal_ids": row.top_signal_ids or [],
-                "esl_decision": row.esl_decision,
-                "sensitivity_level": row.sensitivity_level,
-                "recommendation_band": row.recommendation_band,
-                "last_seen": row.last_seen,
-                "outreach_status_summary": row.outreach_status_summary,
-                "as_of": row.as_of,
-            }
-        )
-        if len(result) >= limit:
-            break
-
-    return result
+    return {rs.company_id: (rs, es, rs.company) for rs, es in pairs if rs.company}
 
 
 def get_emerging_companies_from_feed(
@@ -196,35 +218,13 @@ def get_emerging_companies_from_feed(
         as_of,
         limit=limit,
         outreach_score_threshold=outreach_score_threshold,
-        sort_by="composite_score",
+        sort_by="outreach_score",
     )
 
     if not leads:
         return []
 
-    entity_ids = [lead["entity_id"] for lead in leads]
-    pack_match = ReadinessSnapshot.pack_id == EngagementSnapshot.pack_id
-    pairs = (
-        db.query(ReadinessSnapshot, EngagementSnapshot)
-        .join(
-            EngagementSnapshot,
-            (ReadinessSnapshot.company_id == EngagementSnapshot.company_id)
-            & (ReadinessSnapshot.as_of == EngagementSnapshot.as_of)
-            & pack_match,
-        )
-        .options(joinedload(ReadinessSnapshot.company))
-        .filter(
-            ReadinessSnapshot.company_id.in_(entity_ids),
-            ReadinessSnapshot.as_of == as_of,
-            ReadinessSnapshot.pack_id == pack_uuid,
-        )
-        .all()
-    )
-
-    by_entity: dict[int, tuple[ReadinessSnapshot, EngagementSnapshot, Company]] = {}
-    for rs, es in pairs:
-        if rs.company:
-            by_entity[rs.company_id] = (rs, es, rs.company)
+    by_entity = _snapshots_by_entity(db, [lead["entity_id"] for lead in leads], pack_uuid, as_of)
 
     result: list[tuple[ReadinessSnapshot, EngagementSnapshot, Company]] = []
     for lead in leads:
@@ -268,71 +268,56 @@ def get_weekly_review_companies_from_feed(
     if not feed_has_data(db, ws_uuid, pack_uuid, as_of):
         return []
 
-    leads = get_leads_from_feed(
-        db,
-        ws_uuid,
-        pack_uuid,
-        as_of,
-        limit=limit * 3,  # Extra for cooldown filtering
-        outreach_score_threshold=outreach_score_threshold,
-        sort_by="composite_score",
-    )
-
-    if not leads:
-        return []
-
-    entity_ids = [lead["entity_id"] for lead in leads]
-    pack_match = ReadinessSnapshot.pack_id == EngagementSnapshot.pack_id
-    pairs = (
-        db.query(ReadinessSnapshot, EngagementSnapshot)
-        .join(
-            EngagementSnapshot,
-            (ReadinessSnapshot.company_id == EngagementSnapshot.company_id)
-            & (ReadinessSnapshot.as_of == EngagementSnapshot.as_of)
-            & pack_match,
-        )
-        .options(joinedload(ReadinessSnapshot.company))
-        .filter(
-            ReadinessSnapshot.company_id.in_(entity_ids),
-            ReadinessSnapshot.as_of == as_of,
-            ReadinessSnapshot.pack_id == pack_uuid,
-        )
-        .all()
-    )
-
-    by_entity: dict[int, tuple[ReadinessSnapshot, EngagementSnapshot, Company]] = {}
-    for rs, es in pairs:
-        if rs.company:
-            by_entity[rs.company_id] = (rs, es, rs.company)
-
     as_of_dt = datetime.combine(as_of, datetime.min.time()).replace(tzinfo=UTC)
+    page_size = limit * 3  # Extra for cooldown filtering
     results: list[dict] = []
-    for lead in leads:
-        if len(results) >= limit:
-            break
-        eid = lead["entity_id"]
-        if eid not in by_entity:
-            continue
-        rs, es, company = by_entity[eid]
-        cooldown = check_outreach_cooldown(db, company.id, as_of_dt)
-        if not cooldown.allowed:
-            continue
-        outreach_score = (
-            es.outreach_score if es.outreach_score is not None else lead["outreach_score"]
-        )
-        effective_type = get_effective_engagement_type(
-            es.engagement_type, es.explain, es.esl_decision
+    after: tuple[int, int] | None = None
+    # Keyset pages until limit companies pass the cooldown check or the feed runs out
+    while len(results) < limit:
+        leads = get_leads_from_feed(
+            db,
+            ws_uuid,
+            pack_uuid,
+            as_of,
+            limit=page_size,
+            outreach_score_threshold=outreach_score_threshold,
+            sort_by="outreach_score",
+            after=after,
         )
-        results.append(
-            {
-                "company_id": company.id,
-                "company": company,
-                "readiness_snapshot": rs,
-                "engagement_snapshot": es,
-                "outreach_score": outreach_score,
-                "effective_engagement_type": effective_type,
-                "explain": {"readiness": rs.explain or {}, "engagement": es.explain or {}},
-            }
+        if not leads:
+            break
+        by_entity = _snapshots_by_entity(
+            db, [lead["entity_id"] for lead in leads], pack_uuid, as_of
         )
+        for lead in leads:
+            if len(results) >= limit:
+                break
+            eid = lead["entity_id"]
+            if eid not in by_entity:
+                continue
+            rs, es, company = by_entity[eid]
+            cooldown = check_outreach_cooldown(db, company.id, as_of_dt)
+            if not cooldown.allowed:
+                continue
+            outreach_score = (
+                es.outreach_score if es.outreach_score is not None else lead["outreach_score"]
+            )
+            effective_type = get_effective_engagement_type(
+                es.engagement_type, es.explain, es.esl_decision
+            )
+            results.append(
+                {
+                    "company_id": company.id,
+                    "company": company,
+                    "readiness_snapshot": rs,
+                    "engagement_snapshot": es,
+                    "outreach_score": outreach_score,
+                    "effective_engagement_type": effective_type,
+                    "explain": {"readiness": rs.explain or {}, "engagement": es.explain or {}},
+                }
+            )
+        if len(leads) < page_size:
+            break
+        after = lead_cursor(leads[-1])
 
     return results
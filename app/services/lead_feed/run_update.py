@@ -11,7 +11,9 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.models.job_run import JobRun
-from app.services.lead_feed import build_lead_feed_from_snapshots
+from app.services.job_metrics import job_span
+from app.services.lead_feed import build_lead_feed_for_workspaces, build_lead_feed_from_snapshots
+from app.services.read_cache import bump_read_generation
 
 
 def run_update_lead_feed(
@@ -54,17 +56,19 @@ def run_update_lead_feed(
     db.refresh(job)
 
     try:
-        count = build_lead_feed_from_snapshots(
-            db,
-            workspace_id=ws_id,
-            pack_id=pack_uuid,
-            as_of=as_of_date,
-            core_pack_id=core_pack_id,
-        )
+        with job_span("lead_feed.build"):
+            count = build_lead_feed_from_snapshots(
+                db,
+                workspace_id=ws_id,
+                pack_id=pack_uuid,
+                as_of=as_of_date,
+                core_pack_id=core_pack_id,
+            )
         job.finished_at = datetime.now(UTC)
         job.status = "completed"
         job.companies_processed = count
         job.error_message = None
+        bump_read_generation(db)
         db.commit()
         return {
             "status": "completed",
@@ -91,48 +95,46 @@ def run_backfill_lead_feed(
 ) -> dict:
     """Backfill lead_feed for all workspaces with a resolved pack (Phase 3).
 
-    Iterates workspaces, runs build_lead_feed_from_snapshots for each.
-    Idempotent: safe to re-run.
-
-    TODO(performance): Consider rate limiting or batching when many workspaces
-    exist to avoid long-running transactions and connection exhaustion.
+    Groups workspaces by resolved pack (active_pack_id, else default pack) and
+    builds each pack's projection for all its workspaces at once
+    (build_lead_feed_for_workspaces), committing per pack. Idempotent: safe to
+    re-run.
 
-    Rollback behavior: When one workspace fails, db.rollback() rolls back only
-    the current transaction. Prior workspace commits (db.commit() after each
-    successful workspace) are already persisted. This is intentional: per-
-    workspace isolation allows partial success (e.g. 8 of 10 workspaces
-    succeed). Use all-or-nothing behavior only if you wrap the loop in a
-    single transaction and commit once at the end.
+    Rollback behavior: When one pack fails, db.rollback() rolls back only its
+    workspaces; packs already committed are persisted (partial success).
 
     Returns:
         dict with status, workspaces_processed, total_rows_upserted, errors
     """
     from app.models.workspace import Workspace
-    from app.services.pack_resolver import get_core_pack_id, get_pack_for_workspace
+    from app.services.pack_resolver import get_core_pack_id, get_default_pack_id
 
     as_of_date = as_of or date.today()
     # When None (core pack not installed), last_seen is taken from pack-scoped instances; no error.
     core_pack_id = get_core_pack_id(db)
-    workspaces = db.query(Workspace).all()
+    default_pack_id = get_default_pack_id(db)
+    workspaces = db.query(Workspace.id, Workspace.active_pack_id).all()
+    workspaces_by_pack: dict[UUID, list[UUID]] = {}
+    for ws_id, active_pack_id in workspaces:
+        pack = active_pack_id or default_pack_id
+        if pack is not None:
+            workspaces_by_pack.setdefault(pack, []).append(ws_id)
+
     total_rows = 0
     errors: list[str] = []
-
-    for ws in workspaces:
-        pack = get_pack_for_workspace(db, str(ws.id))
-        if pack is None:
-            continue
+    for pack, ws_ids in workspaces_by_pack.items():
         try:
-            count = build_lead_feed_from_snapshots(
+            total_rows += build_lead_feed_for_workspaces(
                 db,
-                workspace_id=str(ws.id),
-                pack_id=pack,
-                as_of=as_of_date,
+                ws_ids,
+                pack,
+                as_of_date,
                 core_pack_id=core_pack_id,
             )
+            bump_read_generation(db)
             db.commit()
-            total_rows += count
         except Exception as exc:
-            errors.append(f"workspace {ws.id}: {exc}")
+            errors.append(f"pack {pack} ({len(ws_ids)} workspaces): {exc}")
             db.rollback()
 
     return {
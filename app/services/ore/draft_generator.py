@@ -80,6 +80,7 @@ def generate_ore_draft(
         prompt = resolve_prompt_content(
             "ore_outreach_v1",
             pack,
+            cache_split=True,
             NAME=name,
             COMPANY=company_name,
             PATTERN_FRAME=pattern_frame,
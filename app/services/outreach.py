@@ -122,25 +122,32 @@ def _build_safe_fallback(
 
 
 def generate_outreach(
-    db: Session,
+    db: Session | None,
     company: Company,
     analysis: AnalysisRecord,
     pack: Pack | None = None,
+    operator_profile_md: str | None = None,
 ) -> dict:
     """Generate a personalised outreach draft for a company.
 
     Returns a dict with keys ``subject`` and ``message``.
     On any LLM failure returns ``{"subject": "", "message": ""}``.
+
+    When *operator_profile_md* and *pack* are provided (e.g. prefetched by batch
+    briefing), no database query is issued and *db* may be None.
     """
     empty = {"subject": "", "message": ""}
 
-    # Load operator profile (first row, or empty string if none).
-    try:
-        op_profile = db.query(OperatorProfile).first()
-    except Exception:
-        logger.exception("Failed to load operator profile")
-        op_profile = None
-    operator_md = op_profile.content if op_profile and op_profile.content else ""
+    if operator_profile_md is not None:
+        operator_md = operator_profile_md
+    else:
+        # Load operator profile (first row, or empty string if none).
+        try:
+            op_profile = db.query(OperatorProfile).first()
+        except Exception:
+            logger.exception("Failed to load operator profile")
+            op_profile = None
+        operator_md = op_profile.content if op_profile and op_profile.content else ""
 
     pain = analysis.pain_signals_json or {}
 
@@ -174,6 +181,7 @@ def generate_outreach(
         prompt = resolve_prompt_content(
             "outreach_v1",
             pack,
+            cache_split=True,
             OFFER_TYPE=offer_type,
             OPERATOR_PROFILE_MARKDOWN=operator_md,
             COMPANY_NAME=company.name or "",
@@ -13,6 +13,7 @@ from app.services.esl.esl_constants import (
     CADENCE_COOLDOWN_DAYS,
     DECLINED_COOLDOWN_DAYS,
 )
+from app.services.read_cache import bump_read_generation
 
 
 class OutreachCooldownBlockedError(Exception):
@@ -89,6 +90,13 @@ def check_outreach_cooldown(
     return CooldownResult(allowed=True, reason=None)
 
 
+def _enqueue_rescore(db: Session, company_id: int) -> None:
+    """Outreach feeds ESL cadence: mark the company for incremental rescoring."""
+    from app.services.readiness.dirty_queue import enqueue_dirty_companies
+
+    enqueue_dirty_companies(db, [company_id], "outreach")
+
+
 def create_outreach_record(
     db: Session,
     company_id: int,
@@ -132,6 +140,8 @@ def create_outreach_record(
     from app.services.lead_feed import refresh_outreach_summary_for_entity
 
     refresh_outreach_summary_for_entity(db, company_id, workspace_id=ws_uuid)
+    _enqueue_rescore(db, company_id)
+    bump_read_generation(db)
     db.commit()
     return record
 
@@ -243,6 +253,8 @@ def update_outreach_outcome(
 
     ws_id = record.workspace_id or UUID(DEFAULT_WORKSPACE_ID)
     refresh_outreach_summary_for_entity(db, company_id, workspace_id=ws_id)
+    _enqueue_rescore(db, company_id)
+    bump_read_generation(db)
     db.commit()
     return record
 
@@ -285,5 +297,7 @@ def delete_outreach_record(
     from app.services.lead_feed import refresh_outreach_summary_for_entity
 
     refresh_outreach_summary_for_entity(db, company_id, workspace_id=ws_id)
+    _enqueue_rescore(db, company_id)
+    bump_read_generation(db)
     db.commit()
     return True
@@ -17,6 +17,7 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
+from app.metrics import PACK_LOAD_SECONDS
 from app.models.signal_pack import SignalPack
 
 if TYPE_CHECKING:
@@ -38,7 +39,8 @@ def resolve_pack(db: Session, pack_id: UUID) -> Pack | None:
     if not row:
         return None
     try:
-        return load_pack(row.pack_id, row.version)
+        with PACK_LOAD_SECONDS.time():
+            return load_pack(row.pack_id, row.version)
     except (FileNotFoundError, ValueError, ValidationError) as e:
         logger.warning("Could not load pack %s v%s: %s", row.pack_id, row.version, e)
         return None
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 from datetime import date
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
@@ -88,3 +89,23 @@ def get_ranked_companies_for_api(
             )
         )
     return result
+
+
+async def get_ranked_companies_for_api_async(
+    db: AsyncSession,
+    as_of: date,
+    *,
+    limit: int = 10,
+    outreach_score_threshold: int | None = None,
+    workspace_id: str | None = None,
+) -> list[RankedCompanyTop]:
+    """get_ranked_companies_for_api on an AsyncSession."""
+    return await db.run_sync(
+        lambda session: get_ranked_companies_for_api(
+            session,
+            as_of,
+            limit=limit,
+            outreach_score_threshold=outreach_score_threshold,
+            workspace_id=workspace_id,
+        )
+    )
@@ -0,0 +1,105 @@
+"""Response cache for the read APIs (/api/companies/top, /api/briefing/daily).
+
+Cached bodies are keyed by (endpoint, workspace, pack, as_of, params) and
+stamped with the generation of the read_api scope in read_cache_generations.
+Jobs and edits that change what those endpoints return call
+bump_read_generation() before their commit: score (nightly, scans, backfills),
+lead_feed update, briefing, outreach and company edits. Every process reads the generation per request, so
+a bump made by a worker invalidates the web processes' caches too.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.read_cache_generation import ReadCacheGeneration
+
+logger = logging.getLogger(__name__)
+
+READ_API_SCOPE = "read_api"
+
+
+def bump_read_generation(db: Session, scope: str = READ_API_SCOPE) -> None:
+    """Invalidate cached responses for scope. Caller commits.
+
+    Never raises: a failed bump is logged and only leaves cached responses
+    stale until the next bump, so it must not fail the job that changed the data.
+    """
+    stmt = insert(ReadCacheGeneration).values(
+        scope=scope, generation=1, updated_at=func.clock_timestamp()
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["scope"],
+        set_={
+            "generation": ReadCacheGeneration.generation + 1,
+            "updated_at": func.clock_timestamp(),
+        },
+    )
+    try:
+        with db.begin_nested():
+            db.execute(stmt)
+    except Exception:
+        logger.exception("Failed to bump read cache generation (scope=%s)", scope)
+
+
+def get_read_generation(db: Session, scope: str = READ_API_SCOPE) -> int:
+    """Current generation for scope (0 before the first bump)."""
+    generation = db.execute(
+        select(ReadCacheGeneration.generation).where(ReadCacheGeneration.scope == scope)
+    ).scalar_one_or_none()
+    return int(generation or 0)
+
+
+class ResponseCache:
+    """Thread-safe LRU of serialized response bodies, each stamped with a generation.
+
+    max_entries=None reads RESPONSE_CACHE_MAX_ENTRIES on each put; 0 stores nothing.
+    """
+
+    def __init__(self, max_entries: int | None = None) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[int, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_entries(self) -> int:
+        if self._max_entries is not None:
+            return self._max_entries
+        return get_settings().response_cache_max_entries
+
+    def get(self, key: Hashable, generation: int) -> bytes | None:
+        """Body cached for key at generation, or None (entries from other generations miss)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != generation:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, generation: int, body: bytes) -> None:
+        max_entries = self.max_entries
+        if max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (generation, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+response_cache = ResponseCache()
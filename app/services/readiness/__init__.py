@@ -1,6 +1,7 @@
 """v2 Readiness Scoring Engine — constants, decay helpers, dimension calculators (Issues #85, #86, #87)."""
 
-from app.services.readiness.alert_scan import run_alert_scan
+from typing import Any
+
 from app.services.readiness.readiness_engine import (
     build_explain_payload,
     compute_complexity,
@@ -9,15 +10,18 @@ from app.services.readiness.readiness_engine import (
     compute_momentum,
     compute_pressure,
     compute_readiness,
+    evaluate_readiness,
 )
 from app.services.readiness.scoring_constants import (
     decay_complexity,
     decay_momentum,
     decay_pressure,
 )
+from app.services.readiness.scoring_profile import ScoringProfile, get_scoring_profile
 from app.services.readiness.snapshot_writer import write_readiness_snapshot
 
 __all__ = [
+    "ScoringProfile",
     "run_alert_scan",
     "build_explain_payload",
     "compute_complexity",
@@ -29,5 +33,16 @@ __all__ = [
     "decay_complexity",
     "decay_momentum",
     "decay_pressure",
+    "evaluate_readiness",
+    "get_scoring_profile",
     "write_readiness_snapshot",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # alert_scan pulls in the ORM models; loaded only when asked for
+    if name == "run_alert_scan":
+        from app.services.readiness.alert_scan import run_alert_scan
+
+        return run_alert_scan
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,10 @@
 Compares latest readiness snapshot to previous day; creates Alert when
 |delta| >= threshold. Prevents duplicate alerts per company+as_of.
 Pack-scoped reads (M2, Issue #193).
+
+The scan is one INSERT ... SELECT over a self-join of readiness_snapshots
+(as_of vs as_of - 1, threshold in SQL); duplicates are skipped by the unique
+(company_id, alert_type, as_of) constraint via ON CONFLICT DO NOTHING.
 """
 
 from __future__ import annotations
@@ -11,7 +15,9 @@ import logging
 from datetime import date, timedelta
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
 
 from app.config import get_settings
 from app.models import Alert, ReadinessSnapshot
@@ -56,69 +62,68 @@ def run_alert_scan(
     threshold = get_settings().alert_delta_threshold
     prev_date = as_of - timedelta(days=1)
 
-    current_snapshots = (
-        db.query(ReadinessSnapshot)
+    companies_scanned = (
+        db.query(func.count(ReadinessSnapshot.id))
         .filter(ReadinessSnapshot.as_of == as_of, ReadinessSnapshot.pack_id == pack_id)
-        .all()
+        .scalar()
     )
 
-    alerts_created = 0
-    companies_scanned = len(current_snapshots)
-
-    for snap in current_snapshots:
-        prev_snap = (
-            db.query(ReadinessSnapshot)
-            .filter(
-                ReadinessSnapshot.company_id == snap.company_id,
-                ReadinessSnapshot.as_of == prev_date,
-                ReadinessSnapshot.pack_id == pack_id,
-            )
-            .first()
+    current = aliased(ReadinessSnapshot)
+    previous = aliased(ReadinessSnapshot)
+    delta = current.composite - previous.composite
+    jumps = (
+        select(
+            current.company_id,
+            literal(ALERT_TYPE_READINESS_JUMP),
+            func.jsonb_build_object(
+                "old_composite",
+                previous.composite,
+                "new_composite",
+                current.composite,
+                "delta",
+                delta,
+                "as_of",
+                str(as_of),
+            ),
+            literal(as_of),
+            literal("pending"),
+            func.now(),
         )
-        if prev_snap is None:
-            continue
-
-        delta = snap.composite - prev_snap.composite
-        if abs(delta) < threshold:
-            continue
-
-        # Check for duplicate: existing alert for same company + as_of
-        existing = (
-            db.query(Alert)
-            .filter(
-                Alert.company_id == snap.company_id,
-                Alert.alert_type == ALERT_TYPE_READINESS_JUMP,
-                Alert.payload["as_of"].astext == str(as_of),
-            )
-            .first()
+        .join(
+            previous,
+            and_(
+                previous.company_id == current.company_id,
+                previous.as_of == prev_date,
+                previous.pack_id == pack_id,
+            ),
         )
-        if existing is not None:
-            continue
-
-        payload = {
-            "old_composite": prev_snap.composite,
-            "new_composite": snap.composite,
-            "delta": delta,
-            "as_of": str(as_of),
-        }
-        alert = Alert(
-            company_id=snap.company_id,
-            alert_type=ALERT_TYPE_READINESS_JUMP,
-            payload=payload,
-            status="pending",
+        .where(
+            current.as_of == as_of,
+            current.pack_id == pack_id,
+            func.abs(delta) >= threshold,
         )
-        db.add(alert)
-        alerts_created += 1
+    )
+    stmt = (
+        insert(Alert)
+        .from_select(
+            ["company_id", "alert_type", "payload", "as_of", "status", "created_at"], jumps
+        )
+        .on_conflict_do_nothing(index_elements=["company_id", "alert_type", "as_of"])
+        .returning(Alert.company_id, Alert.payload)
+    )
+    created = db.execute(stmt).all()
+    db.commit()
+
+    alerts_created = len(created)
+    for company_id, payload in created:
         logger.info(
             "Alert created: company_id=%s delta=%d (%.0f -> %.0f)",
-            snap.company_id,
-            delta,
-            prev_snap.composite,
-            snap.composite,
+            company_id,
+            payload["delta"],
+            payload["old_composite"],
+            payload["new_composite"],
         )
 
-    db.commit()
-
     logger.info(
         "Alert scan completed: as_of=%s scanned=%d alerts_created=%d",
         as_of,
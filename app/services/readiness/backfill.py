@@ -0,0 +1,276 @@
+"""Historical readiness backfill over a date range.
+
+write_readiness_snapshot scores one as_of per call and re-queries the company's
+events each time, so rebuilding 90 days of history (e.g. for SPI after
+onboarding a pack or fixing a scoring bug) costs days x companies full runs.
+The backfill loads events once, a few queries per chunk of companies (no
+per-company queries), slides the 365-day window across
+the range in memory, scores every day with the readiness kernel, carries
+delta_1d forward from the previous day's composite, and upserts snapshots in
+chunks.
+
+Event source per company matches the nightly job: core SignalInstances when the
+core pack is installed, falling back to pack-scoped SignalEvents. A day's
+snapshot uses the events known on that day (dates in [as_of - 365, as_of]).
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models import JobRun, ReadinessSnapshot, Watchlist
+from app.services.pack_resolver import (
+    get_core_pack_id,
+    get_default_pack_id,
+    get_pack_for_workspace,
+    resolve_pack,
+)
+from app.services.read_cache import bump_read_generation
+from app.services.readiness.bulk_scoring import (
+    DEFAULT_WRITE_CHUNK_SIZE,
+    date_range,
+    load_events_by_company,
+    upsert_readiness_snapshots,
+)
+from app.services.readiness.event_resolver import (
+    COMPANY_CHUNK_SIZE,
+    get_event_like_lists_from_core_instances,
+)
+from app.services.readiness.readiness_engine import evaluate_readiness
+from app.services.readiness.scoring_profile import ScoringProfile, get_scoring_profile
+from app.services.readiness.vectorized import _event_ordinal, snapshot_window
+from app.services.signal_scorer import resolve_band
+
+logger = logging.getLogger(__name__)
+
+# SPI reads the last 90 days of snapshots
+DEFAULT_BACKFILL_DAYS = 90
+MAX_BACKFILL_DAYS = 730
+
+
+def iter_window_events(
+    events: Sequence[Any], as_of_dates: Sequence[date]
+) -> Iterator[tuple[date, list[Any]]]:
+    """Yield (as_of, events known that day) for each date, keeping event order.
+
+    Events are sorted by date descending once (stable, so same-day order is kept);
+    each day's window (vectorized.snapshot_window, [as_of - 365, as_of]) is then a
+    contiguous slice found by bisection instead of a rescan.
+    """
+    dated = [
+        (-_event_ordinal(ev.event_time), ev)
+        for ev in events
+        if getattr(ev, "event_time", None) is not None
+    ]
+    dated.sort(key=lambda item: item[0])
+    keys = [key for key, _ in dated]
+    for as_of in as_of_dates:
+        oldest_ordinal, newest_ordinal = snapshot_window(as_of)
+        newest = bisect_left(keys, -newest_ordinal)
+        oldest = bisect_right(keys, -oldest_ordinal)
+        yield as_of, [ev for _, ev in dated[newest:oldest]]
+
+
+def backfill_company_rows(
+    profile: ScoringProfile,
+    pack: Any,
+    pack_id: UUID,
+    company_id: int,
+    events: Sequence[Any],
+    as_of_dates: Sequence[date],
+    prev_composite: int | None = None,
+) -> list[dict[str, Any]]:
+    """Snapshot rows for one company across as_of_dates (days without events are skipped).
+
+    delta_1d is today's composite minus the previous day's (prev_composite seeds
+    the first day); 0 when the previous day has no snapshot. as_of_dates must be
+    consecutive days.
+    """
+    rows: list[dict[str, Any]] = []
+    computed_at = datetime.now(UTC)
+    for as_of, window in iter_window_events(events, as_of_dates):
+        if not window:
+            prev_composite = None
+            continue
+        result = evaluate_readiness(profile, window, as_of)
+        band = resolve_band(result["composite"], pack)
+        if band is not None:
+            result["explain"]["recommendation_band"] = band
+        result["explain"]["delta_1d"] = (
+            result["composite"] - prev_composite if prev_composite is not None else 0
+        )
+        rows.append(
+            {
+                "company_id": company_id,
+                "as_of": as_of,
+                "pack_id": pack_id,
+                "computed_at": computed_at,
+                **result,
+            }
+        )
+        prev_composite = result["composite"]
+    return rows
+
+
+def run_readiness_backfill(
+    db: Session,
+    start: date | None = None,
+    end: date | None = None,
+    workspace_id: str | UUID | None = None,
+    pack_id: str | UUID | None = None,
+    company_ids: Sequence[int] | None = None,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+) -> dict:
+    """Rebuild ReadinessSnapshots for every day in start..end (default: last 90 days).
+
+    Companies: company_ids when given, otherwise those with pack SignalEvents
+    in range or on the watchlist (as the nightly job). Creates a JobRun
+    (job_type readiness_backfill). One company failure does not stop the run.
+
+    Returns:
+        dict with status, job_run_id, days, companies_processed, snapshots_written, error
+    """
+    end = end or date.today()
+    start = start or end - timedelta(days=DEFAULT_BACKFILL_DAYS - 1)
+
+    if pack_id is not None:
+        resolved_pack_id = pack_id
+    elif workspace_id is not None:
+        resolved_pack_id = get_pack_for_workspace(db, workspace_id)
+    else:
+        resolved_pack_id = get_default_pack_id(db)
+    if isinstance(resolved_pack_id, str):
+        resolved_pack_id = UUID(resolved_pack_id) if resolved_pack_id else None
+
+    job = JobRun(job_type="readiness_backfill", status="running")
+    if workspace_id is not None:
+        job.workspace_id = (
+            UUID(str(workspace_id)) if isinstance(workspace_id, str) else workspace_id
+        )
+    job.pack_id = resolved_pack_id
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    try:
+        if resolved_pack_id is None:
+            raise ValueError("No pack resolved for backfill")
+        if end < start:
+            raise ValueError("end must not be before start")
+        days = (end - start).days + 1
+        if days > MAX_BACKFILL_DAYS:
+            raise ValueError(f"Backfill range of {days} days exceeds {MAX_BACKFILL_DAYS}")
+
+        dates = date_range(start, end)
+        pack = resolve_pack(db, resolved_pack_id)
+        profile = get_scoring_profile(pack)
+        core_pack_id = get_core_pack_id(db)
+        pack_events = load_events_by_company(db, resolved_pack_id, start, company_ids)
+        if company_ids is not None:
+            ids = list(dict.fromkeys(company_ids))
+        else:
+            watchlist_ids = {
+                row[0]
+                for row in db.query(Watchlist.company_id)
+                .filter(Watchlist.is_active)
+                .distinct()
+                .all()
+            }
+            ids = sorted(set(pack_events) | watchlist_ids)
+        prev_composite = dict(
+            db.query(ReadinessSnapshot.company_id, ReadinessSnapshot.composite)
+            .filter(
+                ReadinessSnapshot.as_of == start - timedelta(days=1),
+                ReadinessSnapshot.pack_id == resolved_pack_id,
+            )
+            .all()
+        )
+        logger.info(
+            "Starting readiness backfill: %s..%s companies=%d pack_id=%s",
+            start,
+            end,
+            len(ids),
+            resolved_pack_id,
+        )
+
+        pending: list[dict[str, Any]] = []
+        written = 0
+        companies_processed = 0
+        errors: list[str] = []
+        for i in range(0, len(ids), COMPANY_CHUNK_SIZE):
+            chunk = ids[i : i + COMPANY_CHUNK_SIZE]
+            # Core events for the whole chunk in a few queries, grouped by company
+            core_events = (
+                get_event_like_lists_from_core_instances(db, chunk, start, core_pack_id)
+                if core_pack_id is not None
+                else {}
+            )
+            for company_id in chunk:
+                try:
+                    events = core_events.get(company_id) or pack_events.get(company_id, [])
+                    rows = backfill_company_rows(
+                        profile,
+                        pack,
+                        resolved_pack_id,
+                        company_id,
+                        events,
+                        dates,
+                        prev_composite.get(company_id),
+                    )
+                except Exception as exc:
+                    logger.exception("Backfill failed for company %s", company_id)
+                    errors.append(f"Company {company_id}: {exc}")
+                    continue
+                if rows:
+                    companies_processed += 1
+                pending.extend(rows)
+                while len(pending) >= chunk_size:
+                    upsert_readiness_snapshots(db, pending[:chunk_size])
+                    db.commit()
+                    written += chunk_size
+                    pending = pending[chunk_size:]
+        if pending:
+            upsert_readiness_snapshots(db, pending)
+            db.commit()
+            written += len(pending)
+
+        job.finished_at = datetime.now(UTC)
+        job.status = "completed"
+        job.companies_processed = companies_processed
+        job.error_message = "; ".join(errors[:10]) if errors else None
+        bump_read_generation(db)
+        db.commit()
+        logger.info(
+            "Readiness backfill completed: companies=%d snapshots=%d", companies_processed, written
+        )
+        return {
+            "status": "completed",
+            "job_run_id": job.id,
+            "days": days,
+            "companies_processed": companies_processed,
+            "snapshots_written": written,
+            "error": "; ".join(errors) if errors else None,
+        }
+    except Exception as exc:
+        logger.exception("Readiness backfill failed")
+        db.rollback()
+        job.finished_at = datetime.now(UTC)
+        job.status = "failed"
+        job.error_message = str(exc)
+        bump_read_generation(db)
+        db.commit()
+        return {
+            "status": "failed",
+            "job_run_id": job.id,
+            "days": 0,
+            "companies_processed": 0,
+            "snapshots_written": 0,
+            "error": str(exc),
+        }
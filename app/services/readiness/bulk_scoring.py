@@ -0,0 +1,265 @@
+"""Bulk readiness scoring for a date range (what-if runs and snapshot backfills).
+
+Loads the events of all requested companies in a few queries, scores every
+(company, as_of) pair with the vectorized kernel (vectorized.py) and, when
+writing, upserts ReadinessSnapshot rows in chunks (one commit per day).
+
+Event source per company matches write_readiness_snapshot: core SignalInstances
+when the core pack is installed, falling back to pack-scoped SignalEvents.
+Requires numpy (``pip install 'signalforge[analytics]'``).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import ReadinessSnapshot, SignalEvent, Watchlist
+from app.services.pack_resolver import get_core_pack_id, get_default_pack_id, resolve_pack
+from app.services.read_cache import bump_read_generation
+from app.services.readiness.event_resolver import get_event_like_lists_from_core_instances
+from app.services.readiness.scoring_constants import from_pack
+from app.services.readiness.scoring_profile import ScoringProfile, get_scoring_profile
+from app.services.readiness.vectorized import (
+    SNAPSHOT_WINDOW_DAYS,
+    EventColumns,
+    iter_readiness_days,
+    score_readiness_matrix,
+)
+from app.services.signal_scorer import resolve_band
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WRITE_CHUNK_SIZE = 500
+
+
+def date_range(start: date, end: date) -> list[date]:
+    """Inclusive list of dates from start to end."""
+    return [start + timedelta(days=i) for i in range((end - start).days + 1)]
+
+
+def load_events_by_company(
+    db: Session,
+    pack_id: UUID,
+    start: date,
+    company_ids: Sequence[int] | None = None,
+) -> dict[int, list[Any]]:
+    """Load pack SignalEvents needed to score from start on in one query, grouped by company.
+
+    Covers event_time from start - 365 days on (later events count from the day
+    they fall in the window, as in write_readiness_snapshot). Each company's
+    events are ordered by event_time desc, matching the nightly snapshot query.
+    Rows expose event_type, event_time, confidence, source and url.
+    """
+    cutoff_dt = datetime.combine(
+        start - timedelta(days=SNAPSHOT_WINDOW_DAYS), datetime.min.time()
+    ).replace(tzinfo=UTC)
+    query = db.query(
+        SignalEvent.company_id,
+        SignalEvent.event_type,
+        SignalEvent.event_time,
+        SignalEvent.confidence,
+        SignalEvent.source,
+        SignalEvent.url,
+    ).filter(
+        SignalEvent.pack_id == pack_id,
+        SignalEvent.company_id.isnot(None),
+        SignalEvent.event_time >= cutoff_dt,
+    )
+    if company_ids is not None:
+        query = query.filter(SignalEvent.company_id.in_(list(company_ids)))
+    by_company: dict[int, list[Any]] = {}
+    for row in query.order_by(SignalEvent.company_id, SignalEvent.event_time.desc()):
+        by_company.setdefault(row.company_id, []).append(row)
+    return by_company
+
+
+def load_scoring_events(
+    db: Session,
+    pack_id: UUID,
+    start: date,
+    company_ids: Sequence[int] | None = None,
+) -> tuple[list[int], dict[int, list[Any]]]:
+    """Companies to score and their events, from the nightly writer's event source.
+
+    Core SignalInstances when the core pack is installed; companies without any
+    fall back to pack-scoped SignalEvents (write_readiness_snapshot). Companies:
+    company_ids when given, otherwise those with pack SignalEvents from
+    start - 365 days on or on the active watchlist (as the nightly job).
+    """
+    pack_events = load_events_by_company(db, pack_id, start, company_ids)
+    if company_ids is not None:
+        ids = list(dict.fromkeys(company_ids))
+    else:
+        watchlist_ids = {
+            row[0]
+            for row in db.query(Watchlist.company_id).filter(Watchlist.is_active).distinct().all()
+        }
+        ids = sorted(set(pack_events) | watchlist_ids)
+
+    core_pack_id = get_core_pack_id(db)
+    core_events = (
+        get_event_like_lists_from_core_instances(db, ids, start, core_pack_id)
+        if core_pack_id is not None
+        else {}
+    )
+    # TODO(Issue #287): Drop the pack-event fallback with snapshot_writer's.
+    return ids, {cid: core_events.get(cid) or pack_events.get(cid, []) for cid in ids}
+
+
+def load_event_columns(
+    db: Session,
+    pack_id: UUID,
+    start: date,
+    company_ids: Sequence[int] | None = None,
+) -> tuple[list[int], EventColumns]:
+    """Load events needed to score from start on; return (company_ids, columns).
+
+    company_ids[i] is the company at column index i (see load_scoring_events
+    for the companies included when not given).
+    """
+    ids, by_company = load_scoring_events(db, pack_id, start, company_ids)
+    return ids, EventColumns.from_event_lists([by_company[cid] for cid in ids])
+
+
+@dataclass
+class BulkReadinessScores:
+    """Readiness matrices for a date range: arrays are (len(as_of_dates), len(company_ids))."""
+
+    company_ids: list[int]
+    as_of_dates: list[date]
+    scores: dict[str, Any]
+
+
+def _resolve_pack_id(db: Session, pack_id: UUID | str | None) -> UUID | None:
+    pack_id = pack_id or get_default_pack_id(db)
+    if isinstance(pack_id, str):
+        pack_id = UUID(pack_id)
+    return pack_id
+
+
+def compute_bulk_readiness(
+    db: Session,
+    start: date,
+    end: date,
+    pack_id: UUID | str | None = None,
+    company_ids: Sequence[int] | None = None,
+    scoring: dict[str, Any] | None = None,
+) -> BulkReadinessScores:
+    """Score companies for every day in start..end without writing snapshots.
+
+    scoring: optional pack-style scoring config (scoring.yaml contents) to score
+    with instead of the pack's own, for what-if comparisons.
+    """
+    resolved = _resolve_pack_id(db, pack_id)
+    if resolved is None:
+        raise ValueError("No pack_id given and no default pack installed")
+    if scoring is not None:
+        profile = ScoringProfile.from_config(from_pack(scoring))
+    else:
+        profile = get_scoring_profile(resolve_pack(db, resolved))
+    ids, columns = load_event_columns(db, resolved, start, company_ids)
+    dates = date_range(start, end)
+    return BulkReadinessScores(
+        company_ids=ids,
+        as_of_dates=dates,
+        scores=score_readiness_matrix(profile, columns, dates),
+    )
+
+
+def write_bulk_readiness_snapshots(
+    db: Session,
+    start: date,
+    end: date,
+    pack_id: UUID | str | None = None,
+    company_ids: Sequence[int] | None = None,
+    chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+) -> dict[str, Any]:
+    """Compute and upsert ReadinessSnapshots for every day in start..end.
+
+    Snapshots match write_readiness_snapshot run day by day with the core pack
+    (explain, recommendation_band, delta_1d). delta_1d compares with the previous
+    day of the run, or the stored snapshot for start - 1 on the first day.
+    Companies with no events in a day's window get no snapshot for that day.
+
+    Returns dict with pack_id, days, snapshots_written.
+    """
+    resolved = _resolve_pack_id(db, pack_id)
+    if resolved is None:
+        raise ValueError("No pack_id given and no default pack installed")
+    pack = resolve_pack(db, resolved)
+    profile = get_scoring_profile(pack)
+    ids, columns = load_event_columns(db, resolved, start, company_ids)
+
+    prev_query = db.query(ReadinessSnapshot.company_id, ReadinessSnapshot.composite).filter(
+        ReadinessSnapshot.as_of == start - timedelta(days=1),
+        ReadinessSnapshot.pack_id == resolved,
+    )
+    if company_ids is not None:
+        prev_query = prev_query.filter(ReadinessSnapshot.company_id.in_(ids))
+    prev_composite: dict[int, int] = dict(prev_query.all())
+
+    written = 0
+    dates = date_range(start, end)
+    for day in iter_readiness_days(profile, columns, dates):
+        computed_at = datetime.now(UTC)
+        rows: list[dict[str, Any]] = []
+        today: dict[int, int] = {}
+        for idx in day.has_events.nonzero()[0]:
+            company_id = ids[idx]
+            result = day.result(int(idx))
+            band = resolve_band(result["composite"], pack)
+            if band is not None:
+                result["explain"]["recommendation_band"] = band
+            prev = prev_composite.get(company_id)
+            result["explain"]["delta_1d"] = result["composite"] - prev if prev is not None else 0
+            today[company_id] = result["composite"]
+            rows.append(
+                {
+                    "company_id": company_id,
+                    "as_of": day.as_of,
+                    "pack_id": resolved,
+                    "computed_at": computed_at,
+                    **result,
+                }
+            )
+        for i in range(0, len(rows), chunk_size):
+            upsert_readiness_snapshots(db, rows[i : i + chunk_size])
+        db.commit()
+        written += len(rows)
+        prev_composite = today
+        logger.info("Bulk readiness: as_of=%s snapshots=%d", day.as_of, len(rows))
+
+    bump_read_generation(db)
+    db.commit()
+    return {"pack_id": str(resolved), "days": len(dates), "snapshots_written": written}
+
+
+def upsert_readiness_snapshots(db: Session, rows: list[dict[str, Any]]) -> None:
+    """Insert snapshot rows in one statement, updating scores on (company_id, as_of, pack_id)."""
+    if not rows:
+        return
+    stmt = insert(ReadinessSnapshot).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["company_id", "as_of", "pack_id"],
+        set_={
+            col: stmt.excluded[col]
+            for col in (
+                "momentum",
+                "complexity",
+                "pressure",
+                "leadership_gap",
+                "composite",
+                "explain",
+                "computed_at",
+            )
+        },
+    )
+    db.execute(stmt)
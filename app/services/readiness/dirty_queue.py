@@ -0,0 +1,74 @@
+"""Dirty-company queue for incremental readiness scoring.
+
+Ingest, derive, outreach and watchlist changes call enqueue_dirty_companies();
+an incremental score run rescores companies enqueued since the pack's previous
+score run (see score_nightly). Entries are bumped, never consumed, so every
+pack's run sees them; prune_dirty_companies() drops old ones.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models import ScoreDirtyCompany
+
+logger = logging.getLogger(__name__)
+
+# Entries older than this cannot matter: incremental runs need a score run from yesterday
+DIRTY_RETENTION_DAYS = 7
+
+
+def enqueue_dirty_companies(db: Session, company_ids: Iterable[int | None], reason: str) -> int:
+    """Mark companies as needing rescoring. Caller commits. Returns companies enqueued.
+
+    Never raises: a failed enqueue only costs an incremental run accuracy, so it
+    is logged (run a full score to recover) instead of failing the caller.
+    """
+    ids = sorted({cid for cid in company_ids if cid is not None})
+    if not ids:
+        return 0
+    stmt = insert(ScoreDirtyCompany).values(
+        [
+            {"company_id": cid, "reason": reason[:32], "enqueued_at": func.clock_timestamp()}
+            for cid in ids
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["company_id"],
+        set_={"reason": stmt.excluded.reason, "enqueued_at": func.clock_timestamp()},
+    )
+    try:
+        with db.begin_nested():
+            db.execute(stmt)
+    except Exception:
+        logger.exception("Failed to enqueue dirty companies (reason=%s)", reason)
+        return 0
+    return len(ids)
+
+
+def dirty_company_ids_since(db: Session, since: datetime) -> set[int]:
+    """Company IDs enqueued at or after since (naive datetimes are treated as UTC)."""
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return {
+        row[0]
+        for row in db.query(ScoreDirtyCompany.company_id)
+        .filter(ScoreDirtyCompany.enqueued_at >= since)
+        .all()
+    }
+
+
+def prune_dirty_companies(db: Session, retention_days: int = DIRTY_RETENTION_DAYS) -> int:
+    """Delete entries older than retention_days. Caller commits. Returns rows deleted."""
+    cutoff = datetime.now(UTC) - timedelta(days=retention_days)
+    return (
+        db.query(ScoreDirtyCompany)
+        .filter(ScoreDirtyCompany.enqueued_at < cutoff)
+        .delete(synchronize_session=False)
+    )
@@ -10,6 +10,7 @@ cross-pack leakage; only events with pack_id == core_pack_id are included.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import UTC, date, datetime, timedelta
 from typing import Any
 from uuid import UUID
@@ -20,6 +21,8 @@ from app.models import SignalEvent, SignalInstance
 
 # Cap evidence_event_ids resolved per company to avoid huge IN clauses (Issue #287 follow-up).
 MAX_EVIDENCE_EVENT_IDS_PER_COMPANY: int = 2000
+# Companies per instance/evidence query in get_event_like_lists_from_core_instances
+COMPANY_CHUNK_SIZE: int = 500
 
 
 def get_event_like_list_from_core_instances(
@@ -41,67 +44,94 @@ def get_event_like_list_from_core_instances(
     Returns list of objects with .event_type, .event_time, .confidence (compatible
     with readiness_engine _EventLike protocol).
     """
+    by_company = get_event_like_lists_from_core_instances(db, [company_id], as_of, core_pack_id)
+    return by_company.get(company_id, [])
+
+
+def get_event_like_lists_from_core_instances(
+    db: Session,
+    company_ids: Sequence[int],
+    as_of: date,
+    core_pack_id: UUID,
+) -> dict[int, list[Any]]:
+    """get_event_like_list_from_core_instances for many companies in two queries per chunk.
+
+    Returns company_id -> event-like list (same content and order as the
+    single-company function); companies without core instances are omitted.
+    """
     cutoff_dt = datetime.combine(as_of - timedelta(days=365), datetime.min.time())
     cutoff_dt = cutoff_dt.replace(tzinfo=UTC)
 
-    instances = (
-        db.query(SignalInstance)
-        .filter(
-            SignalInstance.entity_id == company_id,
+    by_company: dict[int, list[Any]] = {}
+    ids = list(dict.fromkeys(company_ids))
+    for i in range(0, len(ids), COMPANY_CHUNK_SIZE):
+        chunk = ids[i : i + COMPANY_CHUNK_SIZE]
+        instances_by_company: dict[int, list[SignalInstance]] = {}
+        for inst in db.query(SignalInstance).filter(
+            SignalInstance.entity_id.in_(chunk),
             SignalInstance.pack_id == core_pack_id,
-        )
-        .all()
-    )
-    if not instances:
-        return []
-
-    event_like: list[Any] = []
-    all_evidence_ids: list[int] = []
-    for inst in instances:
-        if inst.evidence_event_ids:
-            ids = [x for x in inst.evidence_event_ids if isinstance(x, int)]
-            all_evidence_ids.extend(ids)
-
-    if all_evidence_ids:
-        # Batch load: one query for all evidence events in window (avoids N+1).
-        # Pack-scoped: only load events in core pack to prevent cross-pack leakage (M2).
-        unique_ids = list(dict.fromkeys(all_evidence_ids))[:MAX_EVIDENCE_EVENT_IDS_PER_COMPANY]
-        events_batch = (
-            db.query(SignalEvent)
-            .filter(
-                SignalEvent.id.in_(unique_ids),
-                SignalEvent.event_time >= cutoff_dt,
-                SignalEvent.pack_id == core_pack_id,
-            )
-            .order_by(SignalEvent.event_time.desc())
-            .all()
-        )
-        seen: set[int] = set()
-        for ev in events_batch:
-            if ev.id in seen:
-                continue
-            seen.add(ev.id)
-            event_like.append(ev)
-
-    for inst in instances:
-        if inst.evidence_event_ids:
-            continue
-        # Fallback: one synthetic event per instance (Issue #287 compatibility)
-        t = inst.last_seen or inst.first_seen
-        if t is None:
+        ):
+            instances_by_company.setdefault(inst.entity_id, []).append(inst)
+        if not instances_by_company:
             continue
-        if t.tzinfo is None:
-            t = t.replace(tzinfo=UTC)
-        if t < cutoff_dt:
-            continue
-        conf = inst.confidence if inst.confidence is not None else 0.7
-        event_like.append(_SyntheticEvent(inst.signal_id, t, conf))
-
-    # Sort by event_time desc to match existing snapshot_writer behavior
-    event_like.sort(
-        key=lambda e: getattr(e, "event_time", datetime.min.replace(tzinfo=UTC)), reverse=True
-    )
-    return event_like
+
+        # Evidence IDs per company (deduped, capped), and which companies cite each ID
+        citing: dict[int, list[int]] = {}
+        for company_id, instances in instances_by_company.items():
+            all_evidence_ids: list[int] = []
+            for inst in instances:
+                if inst.evidence_event_ids:
+                    all_evidence_ids.extend(
+                        x for x in inst.evidence_event_ids if isinstance(x, int)
+                    )
+            unique_ids = list(dict.fromkeys(all_evidence_ids))[:MAX_EVIDENCE_EVENT_IDS_PER_COMPANY]
+            for event_id in unique_ids:
+                citing.setdefault(event_id, []).append(company_id)
+
+        event_like: dict[int, list[Any]] = {cid: [] for cid in instances_by_company}
+        if citing:
+            # Batch load: one query for all evidence events in window (avoids N+1).
+            # Pack-scoped: only load events in core pack to prevent cross-pack leakage (M2).
+            events_batch = (
+                db.query(SignalEvent)
+                .filter(
+                    SignalEvent.id.in_(list(citing)),
+                    SignalEvent.event_time >= cutoff_dt,
+                    SignalEvent.pack_id == core_pack_id,
+                )
+                .order_by(SignalEvent.event_time.desc())
+                .all()
+            )
+            for ev in events_batch:
+                for company_id in citing.get(ev.id, ()):
+                    event_like[company_id].append(ev)
+
+        for company_id, instances in instances_by_company.items():
+            events = event_like[company_id]
+            for inst in instances:
+                if inst.evidence_event_ids:
+                    continue
+                # Fallback: one synthetic event per instance (Issue #287 compatibility)
+                t = inst.last_seen or inst.first_seen
+                if t is None:
+                    continue
+                if t.tzinfo is None:
+                    t = t.replace(tzinfo=UTC)
+                if t < cutoff_dt:
+                    continue
+                conf = inst.confidence if inst.confidence is not None else 0.7
+                events.append(_SyntheticEvent(inst.signal_id, t, conf))
+
+            # Sort by event_time desc to match existing snapshot_writer behavior
+            events.sort(key=_event_time_key, reverse=True)
+            by_company[company_id] = events
+    return by_company
+
+
+def _event_time_key(ev: Any) -> datetime:
+    """event_time as aware UTC: SignalEvent times are naive UTC, synthetic ones aware."""
+    t = getattr(ev, "event_time", None) or datetime.min
+    return t if t.tzinfo is not None else t.replace(tzinfo=UTC)
 
 
 class _SyntheticEvent:
@@ -3,6 +3,10 @@
 Computes M, C, P, G from SignalEvent-like objects. Uses scoring_constants
 for base scores, caps, and decay. No magic numbers.
 
+compute_readiness() runs a single-pass kernel over the events using the pack's
+precompiled ScoringProfile (scoring_profile.py). The per-dimension functions
+below are the reference definitions; the kernel must match them exactly.
+
 Reference: docs/v2-spec.md §4.3.
 """
 
@@ -28,8 +32,8 @@ from app.services.readiness.scoring_constants import (
     decay_complexity,
     decay_momentum,
     decay_pressure,
-    from_pack,
 )
+from app.services.readiness.scoring_profile import ScoringProfile, get_scoring_profile
 
 if TYPE_CHECKING:
     from app.packs.loader import Pack
@@ -496,29 +500,170 @@ def compute_readiness(
     Issue #113: quiet signal amplification applied when no funding in lookback.
     When pack is provided, uses pack scoring config; otherwise uses default constants.
     """
-    _cfg: dict | None = None
-    if pack is not None:
-        _cfg = from_pack(pack.scoring)
+    return evaluate_readiness(
+        get_scoring_profile(pack), events, as_of, company_status, top_events_limit
+    )
 
-    M = compute_momentum(events, as_of, _cfg=_cfg)
-    C = compute_complexity(events, as_of, _cfg=_cfg)
-    P = compute_pressure(events, as_of, _cfg=_cfg)
-    G = compute_leadership_gap(events, as_of, _cfg=_cfg)
 
-    M, C, P, G, suppressors_applied = apply_global_suppressors(M, C, P, G, company_status)
+def evaluate_readiness(
+    profile: ScoringProfile,
+    events: list[Any],
+    as_of: date,
+    company_status: str | None = None,
+    top_events_limit: int = 8,
+) -> dict[str, Any]:
+    """Single pass over events computing all dimensions, contributions and explain data.
+
+    Whether the company had funding in the quiet-signal lookback is only known after
+    the pass, so momentum/complexity sums and contributions are accumulated for both
+    outcomes (in event order, so float results match the per-dimension functions).
+    """
+    bs_m = profile.base_momentum
+    bs_c = profile.base_complexity
+    bs_p = profile.base_pressure
+    bs_g = profile.base_leadership_gap
+    dq = profile.disqualifier_windows
+
+    m_jobs = m_jobs_q = m_other = m_other_q = 0.0
+    c_jobs = c_jobs_q = c_other = c_other_q = 0.0
+    p_founder = p_other = 0.0
+    raw_g = 0.0
+    cto_hired_days: int | None = None
+    has_funding = False
+    disqualifiers: list[str] = []
+    event_types_present: set[Any] = set()
+    # (total if funded, total if quiet-amplified, confidence, event)
+    contributions: list[tuple[float, float, float, Any]] = []
+
+    for ev in events:
+        etype = getattr(ev, "event_type", None)
+        event_types_present.add(getattr(ev, "event_type", ""))
+        ev_time = getattr(ev, "event_time", None)
+        if ev_time is None:
+            continue
+        days = _days_since(ev_time, as_of)
+
+        if etype == "funding_raised" and days <= profile.quiet_lookback_days:
+            has_funding = True
+        if etype is None:
+            continue
+        if etype in dq and days <= dq[etype]:
+            disqualifiers.append(etype)
+
+        conf = _get_confidence(ev)
+        m_n = m_q = c_n = c_q = p_contrib = g_contrib = 0.0
+
+        if etype in bs_m:
+            base = bs_m[etype]
+            base_q = profile.quiet_momentum.get(etype) or base
+            decay = profile.decay_momentum(days)
+            m_n = base * decay * conf
+            m_q = base_q * decay * conf
+            if days <= WINDOW_MOMENTUM_DAYS:
+                if etype in MOMENTUM_JOB_TYPES:
+                    m_jobs += m_n
+                    m_jobs_q += m_q
+                else:
+                    m_other += m_n
+                    m_other_q += m_q
+
+        if etype in bs_c:
+            base = bs_c[etype]
+            base_q = profile.quiet_complexity.get(etype) or base
+            decay = profile.decay_complexity(days)
+            c_n = base * decay * conf
+            c_q = base_q * decay * conf
+            if days <= WINDOW_COMPLEXITY_DAYS:
+                if etype in COMPLEXITY_JOB_TYPES:
+                    c_jobs += c_n
+                    c_jobs_q += c_q
+                else:
+                    c_other += c_n
+                    c_other_q += c_q
+
+        if etype in bs_p:
+            p_contrib = bs_p[etype] * profile.decay_pressure(days) * conf
+            if days <= WINDOW_PRESSURE_DAYS:
+                if etype in PRESSURE_FOUNDER_URGENCY_TYPES:
+                    p_founder += p_contrib
+                else:
+                    p_other += p_contrib
 
-    R = compute_composite(M, C, P, G, _cfg=_cfg)
+        if etype == "cto_hired":
+            if days <= WINDOW_LEADERSHIP_CTO_HIRED_DAYS:
+                if cto_hired_days is None or days < cto_hired_days:
+                    cto_hired_days = days
+        elif etype in bs_g:
+            g_contrib = bs_g[etype]
+            if etype in ("cto_role_posted", "fractional_request", "advisor_request"):
+                if days <= WINDOW_LEADERSHIP_POSITIVE_DAYS:
+                    raw_g += g_contrib
+            elif etype == "no_cto_detected":
+                if days <= 365:
+                    raw_g += g_contrib
+
+        total_n = 0.0
+        total_n += m_n
+        total_n += c_n
+        total_n += p_contrib
+        total_n += g_contrib
+        total_q = 0.0
+        total_q += m_q
+        total_q += c_q
+        total_q += p_contrib
+        total_q += g_contrib
+        if total_n > 0 or total_q > 0:
+            contributions.append((total_n, total_q, conf, ev))
+
+    cap_dim = profile.cap_dimension_max
+    if has_funding:
+        m_jobs_sum, m_other_sum, c_jobs_sum, c_other_sum = m_jobs, m_other, c_jobs, c_other
+    else:
+        m_jobs_sum, m_other_sum, c_jobs_sum, c_other_sum = m_jobs_q, m_other_q, c_jobs_q, c_other_q
+
+    M = int(round(max(0, min(min(m_jobs_sum, profile.cap_jobs_momentum) + m_other_sum, cap_dim))))
+    C = int(round(max(0, min(min(c_jobs_sum, profile.cap_jobs_complexity) + c_other_sum, cap_dim))))
+    P = int(round(max(0, min(min(p_founder, profile.cap_founder_urgency) + p_other, cap_dim))))
+    G = int(round(max(0, min(raw_g, cap_dim))))
+    if cto_hired_days is not None:
+        if cto_hired_days <= 60:
+            G = max(0, G - profile.suppress_cto_hired_60)
+        else:
+            G = max(0, G - profile.suppress_cto_hired_180)
+
+    M, C, P, G, suppressors_applied = apply_global_suppressors(M, C, P, G, company_status)
 
-    disqualified, disqualifiers_applied = _check_disqualifier_signals(events, as_of, _cfg)
-    if disqualified:
+    w_m, w_c, w_p, w_g = profile.weights
+    R = int(round(max(0, min(w_m * M + w_c * C + w_p * P + w_g * G, cap_dim))))
+    if disqualifiers:
         R = 0
 
-    top_events = compute_event_contributions(events, as_of, limit=top_events_limit, _cfg=_cfg)
+    scored = [
+        (total_n if has_funding else total_q, conf, ev)
+        for total_n, total_q, conf, ev in contributions
+    ]
+    scored = [entry for entry in scored if entry[0] > 0]
+    scored.sort(key=lambda x: -x[0])
+    top_events: list[dict[str, Any]] = []
+    for contrib, conf, ev in scored[:top_events_limit]:
+        ev_time = getattr(ev, "event_time", None)
+        event_time_iso = ev_time.isoformat() if ev_time and hasattr(ev_time, "isoformat") else ""
+        top_events.append(
+            {
+                "event_type": getattr(ev, "event_type", ""),
+                "event_time": event_time_iso,
+                "source": getattr(ev, "source", "") or "",
+                "url": getattr(ev, "url", "") or "",
+                "contribution_points": round(contrib, 1),
+                "confidence": conf,
+            }
+        )
 
-    has_funding = _has_funding_in_window(events, as_of, _cfg=_cfg)
-    quiet_base = (_cfg or {}).get("quiet_signal_amplified_base", QUIET_SIGNAL_AMPLIFIED_BASE)
-    event_types_present = {getattr(ev, "event_type", "") for ev in events}
-    quiet_amplified = [t for t in quiet_base if t in event_types_present] if not has_funding else []
+    quiet_amplified = (
+        [t for t in profile.quiet_explain_types if t in event_types_present]
+        if not has_funding
+        else []
+    )
 
     explain = build_explain_payload(
         M,
@@ -529,8 +674,8 @@ def compute_readiness(
         top_events,
         suppressors_applied,
         quiet_amplified,
-        disqualifiers_applied=disqualifiers_applied or None,
-        _cfg=_cfg,
+        disqualifiers_applied=disqualifiers or None,
+        _cfg=profile.cfg,
     )
 
     return {
@@ -2,31 +2,307 @@
 
 Scores all companies with SignalEvents in last 365 days OR on watchlist.
 Writes readiness snapshots with explain payload and delta_1d.
-Incrementally updates lead_feed projection after each company (Phase 3, Issue #225).
+Updates the lead_feed projection for scored companies (Phase 3, Issue #225).
+
+mode="incremental" rescores only companies whose inputs changed since the pack's
+previous score run: companies in the dirty queue (ingest, derive, outreach,
+watchlist and company edits; see dirty_queue) plus companies with an event, signal
+instance, outreach or pressure snapshot that crosses a scoring breakpoint today
+(decay bound, dimension window, suppression window, 365-day cutoff, ESL
+cadence/SVI/SPI window). Every other company's readiness and engagement
+snapshots are copied forward from yesterday and its lead_feed row is moved to
+today. Needs a completed score run for the same pack and workspace from yesterday
+or today; otherwise the run falls back to full. Run full periodically to pick up
+changes that bypass the queue (pack scoring edits, direct SQL).
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Collection
 from datetime import UTC, date, datetime, timedelta
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy import and_, literal, literal_column, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from app.models import JobRun, SignalEvent, Watchlist
+from app.db.profiling import track_queries
+from app.metrics import COMPANIES_SCORED
+from app.models import (
+    EngagementSnapshot,
+    JobRun,
+    LeadFeed,
+    OutreachHistory,
+    ReadinessSnapshot,
+    SignalEvent,
+    SignalInstance,
+    Watchlist,
+)
 from app.pipeline.stages import DEFAULT_WORKSPACE_ID
-from app.services.esl.engagement_snapshot_writer import write_engagement_snapshot
-from app.services.lead_feed.projection_builder import upsert_lead_feed_from_snapshots
-from app.services.pack_resolver import get_core_pack_id, get_default_pack_id, get_pack_for_workspace
+from app.services.esl.engagement_snapshot_writer import write_engagement_snapshots_batch
+from app.services.esl.esl_constants import (
+    CADENCE_COOLDOWN_DAYS,
+    SPI_PRESSURE_THRESHOLD,
+    SPI_SUSTAINED_DAYS,
+    SVI_WINDOW_DAYS,
+)
+from app.services.job_metrics import collect_job_metrics, job_span, store_run_stats
+from app.services.lead_feed.projection_builder import build_lead_feed_from_snapshots
+from app.services.pack_resolver import (
+    get_core_pack_id,
+    get_default_pack_id,
+    get_pack_for_workspace,
+    resolve_pack,
+)
+from app.services.read_cache import bump_read_generation
+from app.services.readiness.dirty_queue import dirty_company_ids_since, prune_dirty_companies
+from app.services.readiness.readiness_engine import (
+    WINDOW_LEADERSHIP_CTO_HIRED_DAYS,
+    WINDOW_LEADERSHIP_POSITIVE_DAYS,
+    WINDOW_MOMENTUM_DAYS,
+    WINDOW_PRESSURE_DAYS,
+)
+from app.services.readiness.scoring_profile import ScoringProfile, get_scoring_profile
 from app.services.readiness.snapshot_writer import write_readiness_snapshot
 
 logger = logging.getLogger(__name__)
 
+SCORE_MODES = ("full", "incremental")
+# Companies per ESL batch (one set of ESL queries and one upsert per batch)
+ESL_BATCH_SIZE = 500
+
+# Snapshots only see events dated within the last 365 days
+_SNAPSHOT_WINDOW_DAYS = 365
+# Leadership gap suppression for a CTO hired within 60 days (readiness_engine)
+_CTO_HIRED_SUPPRESS_DAYS = 60
+# Enqueues that committed while the previous run was starting may have been missed by it
+INCREMENTAL_WATERMARK_SLACK = timedelta(hours=1)
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time()).replace(tzinfo=UTC)
+
+
+def _eligible_company_ids(
+    db: Session,
+    pack_id: UUID | None,
+    as_of: date,
+    company_ids: set[int] | None = None,
+) -> set[int]:
+    """Companies with SignalEvents in the last 365 days or on the watchlist.
+
+    company_ids restricts the check to those companies (incremental runs).
+    """
+    # Company IDs with SignalEvents in last 365 days (pack-scoped when pack resolved)
+    event_filters = [
+        SignalEvent.company_id.isnot(None),
+        SignalEvent.event_time >= _day_start(as_of - timedelta(days=_SNAPSHOT_WINDOW_DAYS)),
+    ]
+    if pack_id is not None:
+        event_filters.append(SignalEvent.pack_id == pack_id)
+    watchlist_filters = [Watchlist.is_active]
+    if company_ids is not None:
+        if not company_ids:
+            return set()
+        event_filters.append(SignalEvent.company_id.in_(company_ids))
+        watchlist_filters.append(Watchlist.company_id.in_(company_ids))
+    ids_from_events = {
+        row[0]
+        for row in db.query(SignalEvent.company_id).filter(*event_filters).distinct().all()
+        if row[0] is not None
+    }
+
+    # Company IDs on watchlist (v2-spec §12: OR on watchlist)
+    ids_from_watchlist = {
+        row[0] for row in db.query(Watchlist.company_id).filter(*watchlist_filters).distinct().all()
+    }
+    return ids_from_events | ids_from_watchlist
+
+
+def _incremental_watermark(db: Session, job: JobRun, as_of: date) -> datetime | None:
+    """Start of the previous score run for this pack/workspace (minus slack), or None.
+
+    Only a run started yesterday or today qualifies: carry-forward copies
+    yesterday's snapshots, which must be complete.
+    """
+    workspace_filter = (
+        JobRun.workspace_id == job.workspace_id
+        if job.workspace_id is not None
+        else JobRun.workspace_id.is_(None)
+    )
+    previous = (
+        db.query(JobRun.started_at)
+        .filter(
+            JobRun.job_type == "score",
+            JobRun.status == "completed",
+            JobRun.pack_id == job.pack_id,
+            workspace_filter,
+            JobRun.id != job.id,
+            JobRun.started_at >= datetime.combine(as_of - timedelta(days=1), datetime.min.time()),
+        )
+        .order_by(JobRun.started_at.desc())
+        .limit(1)
+        .scalar()
+    )
+    if previous is None:
+        return None
+    if previous.tzinfo is None:
+        previous = previous.replace(tzinfo=UTC)
+    return previous - INCREMENTAL_WATERMARK_SLACK
+
+
+def breakpoint_ages(profile: ScoringProfile) -> set[int]:
+    """Event ages (days) at which a readiness or ESL input changes for the same events.
+
+    Scoring thresholds are inclusive (days <= bound), so an event changes its
+    contribution on the day it turns bound + 1; age 0 covers future-dated events
+    entering the window.
+    """
+    bounds = {
+        *profile.decay_momentum.bounds,
+        *profile.decay_complexity.bounds,
+        *profile.decay_pressure.bounds,
+        *profile.disqualifier_windows.values(),
+        profile.quiet_lookback_days,
+        WINDOW_MOMENTUM_DAYS,
+        WINDOW_PRESSURE_DAYS,
+        WINDOW_LEADERSHIP_POSITIVE_DAYS,
+        WINDOW_LEADERSHIP_CTO_HIRED_DAYS,
+        _CTO_HIRED_SUPPRESS_DAYS,
+        SVI_WINDOW_DAYS,
+        _SNAPSHOT_WINDOW_DAYS,
+    }
+    return {0} | {int(bound) + 1 for bound in bounds if bound is not None and bound >= 0}
+
+
+def _breakpoint_company_ids(
+    db: Session,
+    as_of: date,
+    profile: ScoringProfile,
+    pack_id: UUID | None,
+    core_pack_id: UUID | None,
+) -> set[int]:
+    """Companies whose unchanged inputs still score differently today than yesterday."""
+
+    def on_ages(column, ages) -> Any:
+        return or_(
+            *(
+                and_(
+                    column >= _day_start(as_of - timedelta(days=age)),
+                    column < _day_start(as_of - timedelta(days=age - 1)),
+                )
+                for age in sorted(ages)
+            )
+        )
+
+    ages = breakpoint_ages(profile)
+    pack_ids = [pid for pid in (pack_id, core_pack_id) if pid is not None]
+    event_filters = [SignalEvent.company_id.isnot(None), on_ages(SignalEvent.event_time, ages)]
+    if pack_ids:
+        event_filters.append(SignalEvent.pack_id.in_(pack_ids))
+    ids = {row[0] for row in db.query(SignalEvent.company_id).filter(*event_filters).distinct()}
+    if core_pack_id is not None:
+        ids |= {
+            row[0]
+            for row in db.query(SignalInstance.entity_id)
+            .filter(
+                SignalInstance.pack_id == core_pack_id,
+                on_ages(SignalInstance.last_seen, ages),
+            )
+            .distinct()
+        }
+    # ESL cadence cooldown ends
+    ids |= {
+        row[0]
+        for row in db.query(OutreachHistory.company_id)
+        .filter(on_ages(OutreachHistory.sent_at, [CADENCE_COOLDOWN_DAYS + 1]))
+        .distinct()
+    }
+    # A high-pressure snapshot leaves the SPI window
+    spi_filters = [
+        ReadinessSnapshot.as_of == as_of - timedelta(days=SPI_SUSTAINED_DAYS + 1),
+        ReadinessSnapshot.pressure >= SPI_PRESSURE_THRESHOLD,
+    ]
+    if pack_id is not None:
+        spi_filters.append(ReadinessSnapshot.pack_id == pack_id)
+    ids |= {row[0] for row in db.query(ReadinessSnapshot.company_id).filter(*spi_filters)}
+    return ids
+
+
+def _copy_snapshots_forward(
+    db: Session,
+    model: type[ReadinessSnapshot] | type[EngagementSnapshot],
+    as_of: date,
+    pack_id: UUID | None,
+    exclude_ids: set[int],
+    overrides: dict[str, Any] | None = None,
+) -> list[Any]:
+    """INSERT ... SELECT yesterday's pack snapshots as today's, skipping exclude_ids.
+
+    Existing rows for today are kept. Returns the inserted rows (company_id, plus
+    esl_decision for engagement snapshots).
+    """
+    overrides = {"as_of": literal(as_of), **(overrides or {})}
+    columns = [col.name for col in model.__table__.columns if col.name != "id"]
+    table = model.__table__
+    source = select(
+        *(overrides[name].label(name) if name in overrides else table.c[name] for name in columns)
+    ).where(table.c.as_of == as_of - timedelta(days=1))
+    if pack_id is not None:
+        source = source.where(table.c.pack_id == pack_id)
+    if exclude_ids:
+        source = source.where(table.c.company_id.notin_(exclude_ids))
+    returning = [table.c.company_id]
+    if "esl_decision" in table.c:
+        returning.append(table.c.esl_decision)
+    stmt = insert(model).from_select(columns, source).on_conflict_do_nothing()
+    return db.execute(stmt.returning(*returning)).all()
+
+
+def _carry_forward(
+    db: Session,
+    as_of: date,
+    pack_id: UUID | None,
+    workspace_id: str,
+    rescored_ids: set[int],
+) -> tuple[int, int]:
+    """Move unchanged companies to as_of. Returns (companies carried, ESL suppressed)."""
+    readiness_rows = _copy_snapshots_forward(
+        db,
+        ReadinessSnapshot,
+        as_of,
+        pack_id,
+        rescored_ids,
+        # Unchanged composite
+        {
+            "explain": literal_column(
+                "jsonb_set(readiness_snapshots.explain, '{delta_1d}', '0'::jsonb)"
+            )
+        },
+    )
+    engagement_rows = _copy_snapshots_forward(db, EngagementSnapshot, as_of, pack_id, rescored_ids)
+    lead_feed = update(LeadFeed).where(
+        LeadFeed.workspace_id == UUID(workspace_id),
+        LeadFeed.as_of == as_of - timedelta(days=1),
+    )
+    if pack_id is not None:
+        lead_feed = lead_feed.where(LeadFeed.pack_id == pack_id)
+    if rescored_ids:
+        lead_feed = lead_feed.where(LeadFeed.entity_id.notin_(rescored_ids))
+    db.execute(lead_feed.values(as_of=as_of).execution_options(synchronize_session=False))
+    suppressed = sum(1 for row in engagement_rows if row.esl_decision == "suppress")
+    return len(readiness_rows), suppressed
+
 
 def run_score_nightly(
     db: Session,
     workspace_id: str | UUID | None = None,
     pack_id: str | UUID | None = None,
+    mode: str = "full",
+    company_ids: Collection[int] | None = None,
+    skip_company_ids: Collection[int] | None = None,
 ) -> dict:
     """Run nightly TRS scoring for all eligible companies (v2-spec §12, Issue #104).
 
@@ -34,12 +310,26 @@ def run_score_nightly(
     - Companies with any SignalEvent in last 365 days
     - OR companies on watchlist (is_active=True)
 
+    mode="incremental" scores only eligible companies that changed or cross a
+    scoring breakpoint and carries the rest forward (see module docstring).
+
+    company_ids scores just those companies (when eligible) as a partition run:
+    JobRun job_type "score_partition", mode "partition", nothing carried forward,
+    and not a watermark for later incremental runs. The pipelined daily
+    aggregation scores each derive partition this way, then runs the nightly
+    score with skip_company_ids (already scored today: neither rescored nor
+    carried forward).
+
     One company failure does not stop the run (PRD error handling).
-    Creates JobRun record for audit.
+    Creates JobRun record for audit, with the run's SQL statement count, DB
+    time and span metrics (also when called directly, e.g. by the cron script).
 
     Returns:
-        dict with status, job_run_id, companies_scored, companies_skipped, error
+        dict with status, job_run_id, mode, companies_scored,
+        companies_carried_forward, companies_skipped, error
     """
+    if mode not in SCORE_MODES:
+        raise ValueError(f"mode must be one of {SCORE_MODES}, got {mode!r}")
     if pack_id is not None:
         resolved_pack_id = pack_id
     elif workspace_id is not None:
@@ -49,7 +339,8 @@ def run_score_nightly(
     if isinstance(resolved_pack_id, str):
         resolved_pack_id = UUID(resolved_pack_id) if resolved_pack_id else None
 
-    job = JobRun(job_type="score", status="running")
+    partition = company_ids is not None
+    job = JobRun(job_type="score_partition" if partition else "score", status="running")
     if workspace_id is not None:
         job.workspace_id = (
             UUID(str(workspace_id)) if isinstance(workspace_id, str) else workspace_id
@@ -60,118 +351,189 @@ def run_score_nightly(
     db.commit()
     db.refresh(job)
 
-    try:
-        as_of = date.today()
-        logger.info("Starting nightly score job, as_of=%s", as_of)
-        cutoff_dt = datetime.combine(as_of - timedelta(days=365), datetime.min.time()).replace(
-            tzinfo=UTC
-        )
+    with track_queries() as queries, collect_job_metrics() as metrics:
+        try:
+            as_of = date.today()
+            core_pack_id = get_core_pack_id(db)
+            ws_id = str(workspace_id or DEFAULT_WORKSPACE_ID)
 
-        # Company IDs with SignalEvents in last 365 days (pack-scoped when pack resolved)
-        event_filters = [
-            SignalEvent.company_id.isnot(None),
-            SignalEvent.event_time >= cutoff_dt,
-        ]
-        if resolved_pack_id is not None:
-            event_filters.append(SignalEvent.pack_id == resolved_pack_id)
-        ids_from_events = {
-            row[0]
-            for row in db.query(SignalEvent.company_id).filter(*event_filters).distinct().all()
-            if row[0] is not None
-        }
+            since = (
+                _incremental_watermark(db, job, as_of)
+                if mode == "incremental" and not partition
+                else None
+            )
+            if mode == "incremental" and not partition and since is None:
+                logger.info(
+                    "No score run since yesterday for pack %s; running full", resolved_pack_id
+                )
+            run_mode = "partition" if partition else "incremental" if since is not None else "full"
+            logger.info("Starting nightly score job, as_of=%s mode=%s", as_of, run_mode)
 
-        # Company IDs on watchlist (v2-spec §12: OR on watchlist)
-        ids_from_watchlist = {
-            row[0]
-            for row in db.query(Watchlist.company_id).filter(Watchlist.is_active).distinct().all()
-        }
+            # Incremental: only companies whose inputs changed or cross a breakpoint today
+            rescore_ids: set[int] | None = None
+            skip_ids = set(skip_company_ids or ())
+            with job_span("score.select"):
+                if since is not None:
+                    profile = get_scoring_profile(
+                        resolve_pack(db, resolved_pack_id) if resolved_pack_id else None
+                    )
+                    rescore_ids = dirty_company_ids_since(db, since) | _breakpoint_company_ids(
+                        db, as_of, profile, resolved_pack_id, core_pack_id
+                    )
+                score_ids = _eligible_company_ids(
+                    db, resolved_pack_id, as_of, set(company_ids) if partition else rescore_ids
+                )
+                score_ids -= skip_ids
 
-        company_ids = ids_from_events | ids_from_watchlist
+            companies_scored = 0
+            companies_skipped = 0
+            errors: list[str] = []
 
-        companies_scored = 0
-        companies_skipped = 0
-        errors: list[str] = []
+            companies_engagement = 0
+            companies_esl_suppressed = 0
+            engaged_ids: list[int] = []
+            # company_id -> composite of the snapshot just written (not the snapshot:
+            # each company's commit expires the earlier ones)
+            pending: dict[int, int] = {}
 
-        companies_engagement = 0
-        companies_esl_suppressed = 0
-        ws_id = str(workspace_id or DEFAULT_WORKSPACE_ID)
-        core_pack_id = get_core_pack_id(db)
-        for company_id in company_ids:
-            try:
-                snapshot = write_readiness_snapshot(
-                    db,
-                    company_id,
-                    as_of,
-                    pack_id=resolved_pack_id,
-                    core_pack_id=core_pack_id,
+            def flush_engagement() -> None:
+                # EngagementSnapshots for the scored chunk in one batch (Issue #106)
+                nonlocal companies_engagement, companies_esl_suppressed
+                try:
+                    with job_span("score.esl"):
+                        results = write_engagement_snapshots_batch(
+                            db,
+                            pending,
+                            as_of,
+                            pack_id=resolved_pack_id,
+                            core_pack_id=core_pack_id,
+                        )
+                        db.commit()
+                except Exception:
+                    # Retry one company at a time so a bad company does not lose
+                    # ESL and lead_feed for the rest of the chunk
+                    db.rollback()
+                    logger.exception("ESL batch failed; retrying %d companies singly", len(pending))
+                    results = {}
+                    for cid, composite in pending.items():
+                        try:
+                            results.update(
+                                write_engagement_snapshots_batch(
+                                    db,
+                                    {cid: composite},
+                                    as_of,
+                                    pack_id=resolved_pack_id,
+                                    core_pack_id=core_pack_id,
+                                )
+                            )
+                            db.commit()
+                        except Exception as exc:
+                            db.rollback()
+                            logger.exception("ESL failed for company %s", cid)
+                            errors.append(f"ESL for company {cid}: {exc}")
+                companies_engagement += len(results)
+                engaged_ids.extend(results)
+                companies_esl_suppressed += sum(
+                    1 for ctx in results.values() if ctx["esl_decision"] == "suppress"
                 )
-                if snapshot is not None:
-                    companies_scored += 1
-                    # Write EngagementSnapshot after ReadinessSnapshot (Issue #106)
-                    eng_snap = write_engagement_snapshot(
-                        db,
-                        company_id,
-                        as_of,
-                        pack_id=resolved_pack_id,
-                        core_pack_id=core_pack_id,
-                    )
-                    if eng_snap is not None:
-                        companies_engagement += 1
-                        if eng_snap.esl_decision == "suppress":
-                            companies_esl_suppressed += 1
-                        # Incremental lead_feed update (Phase 3, Issue #225); M5: last_seen from core
-                        upsert_lead_feed_from_snapshots(
+                pending.clear()
+
+            for company_id in score_ids:
+                try:
+                    with job_span("score.company", company_id=company_id):
+                        snapshot = write_readiness_snapshot(
                             db,
-                            workspace_id=ws_id,
+                            company_id,
+                            as_of,
                             pack_id=resolved_pack_id,
-                            as_of=as_of,
-                            readiness_snapshot=snapshot,
-                            engagement_snapshot=eng_snap,
                             core_pack_id=core_pack_id,
                         )
-                else:
+                    if snapshot is not None:
+                        companies_scored += 1
+                        COMPANIES_SCORED.labels(job.job_type).inc()
+                        pending[company_id] = snapshot.composite
+                    else:
+                        companies_skipped += 1
+                except Exception as exc:
+                    msg = f"Company {company_id}: {exc}"
+                    logger.exception("Score failed for company %s", company_id)
+                    errors.append(msg)
                     companies_skipped += 1
-            except Exception as exc:
-                msg = f"Company {company_id}: {exc}"
-                logger.exception("Score failed for company %s", company_id)
-                errors.append(msg)
-                companies_skipped += 1
-
-        job.finished_at = datetime.now(UTC)
-        job.status = "completed"
-        job.companies_processed = companies_scored
-        job.companies_esl_suppressed = companies_esl_suppressed
-        job.error_message = "; ".join(errors[:10]) if errors else None
-        db.commit()
-
-        logger.info(
-            "Nightly score completed: scored=%d, skipped=%d, esl_suppressed=%d",
-            companies_scored,
-            companies_skipped,
-            companies_esl_suppressed,
-        )
-        return {
-            "status": "completed",
-            "job_run_id": job.id,
-            "companies_scored": companies_scored,
-            "companies_engagement": companies_engagement,
-            "companies_esl_suppressed": companies_esl_suppressed,
-            "companies_skipped": companies_skipped,
-            "error": "; ".join(errors) if errors else None,
-        }
+                if len(pending) >= ESL_BATCH_SIZE:
+                    flush_engagement()
+            if pending:
+                flush_engagement()
 
-    except Exception as exc:
-        logger.exception("Nightly score job failed")
-        job.finished_at = datetime.now(UTC)
-        job.status = "failed"
-        job.error_message = str(exc)
-        db.commit()
-        return {
-            "status": "failed",
-            "job_run_id": job.id,
-            "companies_scored": 0,
-            "companies_engagement": 0,
-            "companies_esl_suppressed": 0,
-            "companies_skipped": 0,
-            "error": str(exc),
-        }
+            # lead_feed for scored companies in one set-based pass (Phase 3, Issue #225);
+            # M5: last_seen from core
+            with job_span("score.lead_feed"):
+                build_lead_feed_from_snapshots(
+                    db,
+                    workspace_id=ws_id,
+                    pack_id=resolved_pack_id,
+                    as_of=as_of,
+                    core_pack_id=core_pack_id,
+                    entity_ids=engaged_ids,
+                )
+                db.commit()
+
+            companies_carried_forward = 0
+            if rescore_ids is not None:
+                with job_span("score.carry_forward"):
+                    companies_carried_forward, carried_suppressed = _carry_forward(
+                        db, as_of, resolved_pack_id, ws_id, rescore_ids | skip_ids
+                    )
+                companies_esl_suppressed += carried_suppressed
+            if not partition:
+                prune_dirty_companies(db)
+
+            job.finished_at = datetime.now(UTC)
+            job.status = "completed"
+            job.companies_processed = companies_scored + companies_carried_forward
+            job.companies_esl_suppressed = companies_esl_suppressed
+            job.error_message = "; ".join(errors[:10]) if errors else None
+            store_run_stats(job, queries, metrics)
+            bump_read_generation(db)
+            db.commit()
+
+            logger.info(
+                "Nightly score completed: mode=%s scored=%d, carried_forward=%d, skipped=%d, "
+                "esl_suppressed=%d",
+                run_mode,
+                companies_scored,
+                companies_carried_forward,
+                companies_skipped,
+                companies_esl_suppressed,
+            )
+            return {
+                "status": "completed",
+                "job_run_id": job.id,
+                "mode": run_mode,
+                "companies_scored": companies_scored,
+                "companies_carried_forward": companies_carried_forward,
+                "companies_engagement": companies_engagement,
+                "companies_esl_suppressed": companies_esl_suppressed,
+                "companies_skipped": companies_skipped,
+                "error": "; ".join(errors) if errors else None,
+            }
+
+        except Exception as exc:
+            logger.exception("Nightly score job failed")
+            job.finished_at = datetime.now(UTC)
+            job.status = "failed"
+            job.error_message = str(exc)
+            store_run_stats(job, queries, metrics)
+            # Snapshot chunks committed before the failure are visible to readers
+            bump_read_generation(db)
+            db.commit()
+            return {
+                "status": "failed",
+                "job_run_id": job.id,
+                "mode": mode,
+                "companies_scored": 0,
+                "companies_carried_forward": 0,
+                "companies_engagement": 0,
+                "companies_esl_suppressed": 0,
+                "companies_skipped": 0,
+                "error": str(exc),
+            }
@@ -0,0 +1,179 @@
+"""Precompiled readiness scoring profile (per pack).
+
+from_pack() rebuilds a config dict on every call and the dimension calculators
+re-read it per event. A ScoringProfile resolves everything the readiness kernel
+needs once: base-score tables, quiet-signal bases, decay breakpoint arrays, caps,
+composite weights, suppressors and disqualifier windows. get_scoring_profile()
+caches one profile per pack scoring config.
+
+Pack scoring config is treated as immutable once loaded (replace pack.scoring to
+change it; in-place edits are not detected).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from app.metrics import record_cache
+from app.services.readiness.scoring_constants import (
+    BASE_SCORES_COMPLEXITY,
+    BASE_SCORES_LEADERSHIP_GAP,
+    BASE_SCORES_MOMENTUM,
+    BASE_SCORES_PRESSURE,
+    CAP_DIMENSION_MAX,
+    CAP_FOUNDER_URGENCY,
+    CAP_JOBS_COMPLEXITY,
+    CAP_JOBS_MOMENTUM,
+    COMPOSITE_WEIGHTS,
+    DEFAULT_DECAY_COMPLEXITY,
+    DEFAULT_DECAY_MOMENTUM,
+    DEFAULT_DECAY_PRESSURE,
+    QUIET_SIGNAL_AMPLIFIED_BASE,
+    QUIET_SIGNAL_LOOKBACK_DAYS,
+    SUPPRESS_CTO_HIRED_60_DAYS,
+    SUPPRESS_CTO_HIRED_180_DAYS,
+    from_pack,
+)
+
+if TYPE_CHECKING:
+    from app.packs.loader import Pack
+
+_PROFILE_CACHE_MAX = 64
+
+
+@dataclass(frozen=True)
+class DecayCurve:
+    """Step decay: values[i] for days <= bounds[i] (bounds ascending); tail beyond the last."""
+
+    bounds: tuple[int, ...]
+    values: tuple[float, ...]
+    tail: float
+
+    def __call__(self, days: int) -> float:
+        i = bisect_left(self.bounds, days)
+        return self.values[i] if i < len(self.bounds) else self.tail
+
+    @classmethod
+    def from_breakpoints(cls, breakpoints: list[tuple[int, float]], tail: float) -> DecayCurve:
+        ordered = sorted(breakpoints, key=lambda bp: bp[0])
+        return cls(
+            bounds=tuple(int(max_days) for max_days, _ in ordered),
+            values=tuple(float(mult) for _, mult in ordered),
+            tail=tail,
+        )
+
+
+@dataclass(frozen=True)
+class ScoringProfile:
+    """Everything compute_readiness needs from a pack's scoring config, resolved once."""
+
+    cfg: dict | None  # from_pack() output (None = module defaults); used for explain payload
+    base_momentum: dict[str, Any]
+    base_complexity: dict[str, Any]
+    base_pressure: dict[str, Any]
+    base_leadership_gap: dict[str, Any]
+    quiet_momentum: dict[str, Any]  # etype -> amplified M base when no funding in lookback
+    quiet_complexity: dict[str, Any]
+    quiet_explain_types: tuple[str, ...]  # reported in explain when amplification applies
+    quiet_lookback_days: int
+    cap_jobs_momentum: Any
+    cap_jobs_complexity: Any
+    cap_founder_urgency: Any
+    cap_dimension_max: Any
+    weights: tuple[Any, Any, Any, Any]  # M, C, P, G
+    decay_momentum: DecayCurve
+    decay_complexity: DecayCurve
+    decay_pressure: DecayCurve
+    suppress_cto_hired_60: Any
+    suppress_cto_hired_180: Any
+    disqualifier_windows: dict[str, int]
+
+    @classmethod
+    def from_config(cls, cfg: dict | None) -> ScoringProfile:
+        """Build a profile from a from_pack() dict, or module defaults when cfg is None."""
+        c = cfg or {}
+        amplified = c.get("quiet_signal_amplified_base") or QUIET_SIGNAL_AMPLIFIED_BASE
+        cw = c.get("composite_weights", COMPOSITE_WEIGHTS)
+        dq = c.get("disqualifier_signals") or {}
+        return cls(
+            cfg=cfg,
+            base_momentum=c.get("base_scores_momentum", BASE_SCORES_MOMENTUM),
+            base_complexity=c.get("base_scores_complexity", BASE_SCORES_COMPLEXITY),
+            base_pressure=c.get("base_scores_pressure", BASE_SCORES_PRESSURE),
+            base_leadership_gap=c.get("base_scores_leadership_gap", BASE_SCORES_LEADERSHIP_GAP),
+            quiet_momentum={etype: dims.get("M") for etype, dims in amplified.items()},
+            quiet_complexity={etype: dims.get("C") for etype, dims in amplified.items()},
+            quiet_explain_types=tuple(
+                c.get("quiet_signal_amplified_base", QUIET_SIGNAL_AMPLIFIED_BASE)
+            ),
+            quiet_lookback_days=c.get("quiet_signal_lookback_days", QUIET_SIGNAL_LOOKBACK_DAYS),
+            cap_jobs_momentum=c.get("cap_jobs_momentum", CAP_JOBS_MOMENTUM),
+            cap_jobs_complexity=c.get("cap_jobs_complexity", CAP_JOBS_COMPLEXITY),
+            cap_founder_urgency=c.get("cap_founder_urgency", CAP_FOUNDER_URGENCY),
+            cap_dimension_max=c.get("cap_dimension_max", CAP_DIMENSION_MAX),
+            weights=(
+                cw.get("M", COMPOSITE_WEIGHTS["M"]),
+                cw.get("C", COMPOSITE_WEIGHTS["C"]),
+                cw.get("P", COMPOSITE_WEIGHTS["P"]),
+                cw.get("G", COMPOSITE_WEIGHTS["G"]),
+            ),
+            decay_momentum=_decay_curve(cfg, "decay_momentum", DEFAULT_DECAY_MOMENTUM),
+            decay_complexity=_decay_curve(cfg, "decay_complexity", DEFAULT_DECAY_COMPLEXITY),
+            decay_pressure=_decay_curve(cfg, "decay_pressure", DEFAULT_DECAY_PRESSURE),
+            suppress_cto_hired_60=c.get("suppress_cto_hired_60_days", SUPPRESS_CTO_HIRED_60_DAYS),
+            suppress_cto_hired_180=c.get(
+                "suppress_cto_hired_180_days", SUPPRESS_CTO_HIRED_180_DAYS
+            ),
+            disqualifier_windows=_disqualifier_windows(dq),
+        )
+
+
+def _decay_curve(cfg: dict | None, key: str, default: list[tuple[int, float]]) -> DecayCurve:
+    """Mirror readiness_engine._decay_from_cfg: pack breakpoints decay to 0.0 past the last
+    bound; module defaults keep their last multiplier (decay_* functions)."""
+    breakpoints = cfg.get(key) if cfg else None
+    if breakpoints and isinstance(breakpoints, list):
+        return DecayCurve.from_breakpoints(breakpoints, tail=0.0)
+    return DecayCurve.from_breakpoints(default, tail=float(default[-1][1]))
+
+
+def _disqualifier_windows(dq: Any) -> dict[str, int]:
+    if not dq or not isinstance(dq, dict):
+        return {}
+    return {
+        etype: int(window)
+        for etype, window in dq.items()
+        if isinstance(window, (int, float)) and window > 0
+    }
+
+
+_DEFAULT_PROFILE: ScoringProfile | None = None
+# id(pack.scoring) -> (scoring dict, profile); the dict is held so its id is not reused
+_profile_cache: dict[int, tuple[dict, ScoringProfile]] = {}
+
+
+def get_scoring_profile(pack: Pack | None) -> ScoringProfile:
+    """Return the compiled ScoringProfile for pack (module defaults when pack is None)."""
+    global _DEFAULT_PROFILE
+    if pack is None:
+        if _DEFAULT_PROFILE is None:
+            _DEFAULT_PROFILE = ScoringProfile.from_config(None)
+        return _DEFAULT_PROFILE
+    scoring = pack.scoring
+    cached = _profile_cache.get(id(scoring))
+    hit = cached is not None and cached[0] is scoring
+    record_cache("scoring_profile", hit)
+    if hit:
+        return cached[1]
+    profile = ScoringProfile.from_config(from_pack(scoring))
+    if len(_profile_cache) >= _PROFILE_CACHE_MAX:
+        _profile_cache.clear()
+    _profile_cache[id(scoring)] = (scoring, profile)
+    return profile
+
+
+def clear_scoring_profile_cache() -> None:
+    """Drop cached profiles. Useful for testing."""
+    _profile_cache.clear()
@@ -8,6 +8,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from app.models import Company, ReadinessSnapshot, SignalEvent
+from app.services.job_metrics import job_span
 from app.services.pack_resolver import get_default_pack_id, resolve_pack
 from app.services.readiness.event_resolver import get_event_like_list_from_core_instances
 from app.services.readiness.readiness_engine import compute_readiness
@@ -33,10 +34,36 @@ def write_readiness_snapshot(
     if pack_id is None:
         return None
 
-    company = db.query(Company).filter(Company.id == company_id).first()
-    if not company:
+    with job_span("score.events"):
+        company = db.query(Company).filter(Company.id == company_id).first()
+        if not company:
+            return None
+        events = _load_events(db, company_id, as_of, pack_id, core_pack_id)
+    if not events:
         return None
 
+    with job_span("score.readiness"):
+        pack = resolve_pack(db, pack_id) if pack_id else None
+        result = compute_readiness(
+            events=events,
+            as_of=as_of,
+            company_status=company_status,
+            pack=pack,
+        )
+
+        # Recommendation band (Issue #242): store when pack defines bands
+        band = resolve_band(result["composite"], pack)
+        if band is not None:
+            result["explain"]["recommendation_band"] = band
+
+    with job_span("score.upsert"):
+        return _upsert_snapshot(db, company_id, as_of, pack_id, result)
+
+
+def _load_events(
+    db: Session, company_id: int, as_of: date, pack_id, core_pack_id: UUID | None
+) -> list:
+    """Events in the 365-day window: core instances, else pack-scoped SignalEvents."""
     cutoff_dt = datetime.combine(as_of - timedelta(days=365), datetime.min.time())
     cutoff_dt = cutoff_dt.replace(tzinfo=UTC)
 
@@ -44,45 +71,24 @@ def write_readiness_snapshot(
         events = get_event_like_list_from_core_instances(db, company_id, as_of, core_pack_id)
         # TODO(Issue #287): Remove fallback after backfill. When core instances exist
         # for all scored companies, delete this block so empty core => no snapshot.
-        if not events:
-            events = (
-                db.query(SignalEvent)
-                .filter(
-                    SignalEvent.company_id == company_id,
-                    SignalEvent.event_time >= cutoff_dt,
-                    SignalEvent.pack_id == pack_id,
-                )
-                .order_by(SignalEvent.event_time.desc())
-                .all()
-            )
-    else:
-        events = (
-            db.query(SignalEvent)
-            .filter(
-                SignalEvent.company_id == company_id,
-                SignalEvent.event_time >= cutoff_dt,
-                SignalEvent.pack_id == pack_id,
-            )
-            .order_by(SignalEvent.event_time.desc())
-            .all()
+        if events:
+            return events
+    return (
+        db.query(SignalEvent)
+        .filter(
+            SignalEvent.company_id == company_id,
+            SignalEvent.event_time >= cutoff_dt,
+            SignalEvent.pack_id == pack_id,
         )
-
-    if not events:
-        return None
-
-    pack = resolve_pack(db, pack_id) if pack_id else None
-    result = compute_readiness(
-        events=events,
-        as_of=as_of,
-        company_status=company_status,
-        pack=pack,
+        .order_by(SignalEvent.event_time.desc())
+        .all()
     )
 
-    # Recommendation band (Issue #242): store when pack defines bands
-    band = resolve_band(result["composite"], pack)
-    if band is not None:
-        result["explain"]["recommendation_band"] = band
 
+def _upsert_snapshot(
+    db: Session, company_id: int, as_of: date, pack_id, result: dict
+) -> ReadinessSnapshot:
+    """Set delta_1d from yesterday's snapshot, then insert or update today's. Commits."""
     # Delta: today.composite - prev.composite (v2-spec §6.4, Issue #104)
     prev_snapshot = (
         db.query(ReadinessSnapshot)
@@ -0,0 +1,442 @@
+"""Vectorized readiness scoring over many companies and as_of dates (NumPy).
+
+evaluate_readiness scores one company on one day. Backfills and what-if runs score
+thousands of companies across a date range; doing that with per-company Python
+loops re-reads every event once per (company, day). Here the events are loaded
+once into columnar arrays (company index, event-type code, event date ordinal,
+confidence) and each day is scored for all companies at once:
+
+- decay multipliers come from ``np.searchsorted`` over the profile's breakpoints;
+- per-company sums (momentum/complexity job and non-job parts, pressure, raw
+  leadership gap) are ``np.bincount`` reductions, then caps, rounding, the
+  cto_hired suppressor, status suppression, composite and disqualifiers are
+  applied elementwise.
+
+``np.bincount`` accumulates in input order, and events are kept in each
+company's original order, so dimension values are identical to
+evaluate_readiness for the same events (tests/test_readiness_vectorized.py).
+
+Window: a day's score uses the events known on that day, dated in
+[as_of - 365, as_of] (snapshot_window, shared with backfill.iter_window_events);
+events dated after as_of are left out, so a historical day is not scored on
+what happened later.
+
+NumPy is an optional dependency (``pip install 'signalforge[analytics]'``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+from app.services.readiness.readiness_engine import (
+    COMPLEXITY_JOB_TYPES,
+    MOMENTUM_JOB_TYPES,
+    PRESSURE_FOUNDER_URGENCY_TYPES,
+    WINDOW_COMPLEXITY_DAYS,
+    WINDOW_LEADERSHIP_CTO_HIRED_DAYS,
+    WINDOW_LEADERSHIP_POSITIVE_DAYS,
+    WINDOW_MOMENTUM_DAYS,
+    WINDOW_PRESSURE_DAYS,
+    _get_confidence,
+    build_explain_payload,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from app.services.readiness.scoring_profile import DecayCurve, ScoringProfile
+
+# Events older than this (days before as_of) are not part of a snapshot (snapshot_writer)
+SNAPSHOT_WINDOW_DAYS = 365
+
+_LEADERSHIP_POSITIVE_TYPES = ("cto_role_posted", "fractional_request", "advisor_request")
+_NO_CTO_WINDOW_DAYS = 365
+
+
+def snapshot_window(as_of: date) -> tuple[int, int]:
+    """Date ordinals (oldest, newest) of the events known on as_of: [as_of - 365, as_of]."""
+    newest = as_of.toordinal()
+    return newest - SNAPSHOT_WINDOW_DAYS, newest
+
+
+def _require_numpy():
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - exercised only without numpy
+        raise ImportError(
+            "Vectorized readiness scoring requires numpy. "
+            "Install it with: pip install 'signalforge[analytics]'"
+        ) from exc
+    return numpy
+
+
+def _event_ordinal(ev_time: Any) -> int:
+    """Date ordinal of event_time (same calendar date as readiness_engine._days_since)."""
+    ev_date = (
+        ev_time.date()
+        if hasattr(ev_time, "date")
+        else date(ev_time.year, ev_time.month, ev_time.day)
+    )
+    return ev_date.toordinal()
+
+
+@dataclass
+class EventColumns:
+    """Events of many companies as parallel arrays, grouped by company index.
+
+    Rows are sorted by company_index and keep each company's original event order
+    (float sums and top-event tie-breaks depend on it). ``events`` holds the source
+    objects for explain payloads (event_time, source, url).
+    """
+
+    company_index: np.ndarray  # int64
+    type_code: np.ndarray  # int64, index into type_names
+    event_ordinal: np.ndarray  # int64, date.toordinal() of event_time
+    confidence: np.ndarray  # float64, clamped; default when missing
+    type_names: list[str]
+    events: list[Any]
+    n_companies: int
+
+    @classmethod
+    def from_event_lists(cls, event_lists: Sequence[Sequence[Any]]) -> EventColumns:
+        """Build columns from one event list per company (list position = company index).
+
+        Events without event_type or event_time cannot affect any dimension and are
+        dropped.
+        """
+        np = _require_numpy()
+        codes: dict[str, int] = {}
+        company_index: list[int] = []
+        type_code: list[int] = []
+        ordinals: list[int] = []
+        confidence: list[float] = []
+        events: list[Any] = []
+        for idx, company_events in enumerate(event_lists):
+            for ev in company_events:
+                etype = getattr(ev, "event_type", None)
+                ev_time = getattr(ev, "event_time", None)
+                if etype is None or ev_time is None:
+                    continue
+                company_index.append(idx)
+                type_code.append(codes.setdefault(etype, len(codes)))
+                ordinals.append(_event_ordinal(ev_time))
+                confidence.append(_get_confidence(ev))
+                events.append(ev)
+        return cls(
+            company_index=np.asarray(company_index, dtype=np.int64),
+            type_code=np.asarray(type_code, dtype=np.int64),
+            event_ordinal=np.asarray(ordinals, dtype=np.int64),
+            confidence=np.asarray(confidence, dtype=np.float64),
+            type_names=list(codes),
+            events=events,
+            n_companies=len(event_lists),
+        )
+
+
+@dataclass
+class _ProfileTables:
+    """ScoringProfile lookups as arrays indexed by event-type code."""
+
+    base_m: np.ndarray
+    base_m_quiet: np.ndarray
+    in_m: np.ndarray
+    job_m: np.ndarray
+    base_c: np.ndarray
+    base_c_quiet: np.ndarray
+    in_c: np.ndarray
+    job_c: np.ndarray
+    base_p: np.ndarray
+    in_p: np.ndarray
+    founder_p: np.ndarray
+    base_g: np.ndarray  # contribution points (0 for cto_hired)
+    g_positive: np.ndarray
+    g_no_cto: np.ndarray
+    is_cto_hired: np.ndarray
+    is_funding: np.ndarray
+    dq_window: np.ndarray  # -1 when the type is not a disqualifier
+    decay_m: tuple[np.ndarray, np.ndarray]
+    decay_c: tuple[np.ndarray, np.ndarray]
+    decay_p: tuple[np.ndarray, np.ndarray]
+
+    @classmethod
+    def build(cls, np: Any, profile: ScoringProfile, type_names: list[str]) -> _ProfileTables:
+        def floats(values):
+            return np.asarray(values, dtype=np.float64)
+
+        def flags(values):
+            return np.asarray(values, dtype=bool)
+
+        bs_m, bs_c = profile.base_momentum, profile.base_complexity
+        bs_p, bs_g = profile.base_pressure, profile.base_leadership_gap
+        dq = profile.disqualifier_windows
+        names = type_names
+        return cls(
+            base_m=floats([bs_m.get(t, 0) for t in names]),
+            base_m_quiet=floats(
+                [(profile.quiet_momentum.get(t) or bs_m[t]) if t in bs_m else 0 for t in names]
+            ),
+            in_m=flags([t in bs_m for t in names]),
+            job_m=flags([t in MOMENTUM_JOB_TYPES for t in names]),
+            base_c=floats([bs_c.get(t, 0) for t in names]),
+            base_c_quiet=floats(
+                [(profile.quiet_complexity.get(t) or bs_c[t]) if t in bs_c else 0 for t in names]
+            ),
+            in_c=flags([t in bs_c for t in names]),
+            job_c=flags([t in COMPLEXITY_JOB_TYPES for t in names]),
+            base_p=floats([bs_p.get(t, 0) for t in names]),
+            in_p=flags([t in bs_p for t in names]),
+            founder_p=flags([t in PRESSURE_FOUNDER_URGENCY_TYPES for t in names]),
+            base_g=floats([bs_g.get(t, 0) if t != "cto_hired" else 0 for t in names]),
+            g_positive=flags([t in bs_g and t in _LEADERSHIP_POSITIVE_TYPES for t in names]),
+            g_no_cto=flags([t in bs_g and t == "no_cto_detected" for t in names]),
+            is_cto_hired=flags([t == "cto_hired" for t in names]),
+            is_funding=flags([t == "funding_raised" for t in names]),
+            dq_window=np.asarray([dq.get(t, -1) for t in names], dtype=np.int64),
+            decay_m=_decay_arrays(np, profile.decay_momentum),
+            decay_c=_decay_arrays(np, profile.decay_complexity),
+            decay_p=_decay_arrays(np, profile.decay_pressure),
+        )
+
+
+def _decay_arrays(np: Any, curve: DecayCurve) -> tuple[np.ndarray, np.ndarray]:
+    """(bounds, values + [tail]) so values[searchsorted(bounds, days)] == curve(days)."""
+    return (
+        np.asarray(curve.bounds, dtype=np.int64),
+        np.asarray((*curve.values, curve.tail), dtype=np.float64),
+    )
+
+
+def _decay(np: Any, arrays: tuple[np.ndarray, np.ndarray], days: np.ndarray) -> np.ndarray:
+    bounds, values = arrays
+    return values[np.searchsorted(bounds, days, side="left")]
+
+
+@dataclass
+class ReadinessDay:
+    """Scores of every company for one as_of date.
+
+    Dimension arrays are indexed by company index; ``has_events`` marks companies
+    with at least one event in the snapshot window (the nightly writer skips the
+    others). result()/explain() build the per-company snapshot payload on demand.
+    """
+
+    as_of: date
+    momentum: np.ndarray
+    complexity: np.ndarray
+    pressure: np.ndarray
+    leadership_gap: np.ndarray
+    composite: np.ndarray
+    has_events: np.ndarray
+    has_funding: np.ndarray
+    suppressed: np.ndarray
+    # Active (in-window) events, grouped by company: offsets[c]:offsets[c + 1]
+    _profile: ScoringProfile
+    _columns: EventColumns
+    _positions: np.ndarray
+    _offsets: np.ndarray
+    _contribution: np.ndarray
+    _disqualifier_hit: np.ndarray
+
+    def result(self, company_index: int, top_events_limit: int = 8) -> dict[str, Any]:
+        """Same shape as compute_readiness for one company."""
+        c = company_index
+        return {
+            "momentum": self.momentum[c].item(),
+            "complexity": self.complexity[c].item(),
+            "pressure": self.pressure[c].item(),
+            "leadership_gap": self.leadership_gap[c].item(),
+            "composite": self.composite[c].item(),
+            "explain": self.explain(c, top_events_limit),
+        }
+
+    def explain(self, company_index: int, top_events_limit: int = 8) -> dict[str, Any]:
+        """Explain payload for one company (top events, suppressors, quiet amplification)."""
+        np = _require_numpy()
+        c = company_index
+        start, end = int(self._offsets[c]), int(self._offsets[c + 1])
+        cols = self._columns
+        positions = self._positions[start:end]
+        totals = self._contribution[start:end]
+
+        ranked = np.argsort(-totals, kind="stable")
+        ranked = ranked[totals[ranked] > 0][:top_events_limit]
+        top_events: list[dict[str, Any]] = []
+        for i in ranked:
+            ev = cols.events[positions[i]]
+            ev_time = getattr(ev, "event_time", None)
+            top_events.append(
+                {
+                    "event_type": getattr(ev, "event_type", ""),
+                    "event_time": ev_time.isoformat() if hasattr(ev_time, "isoformat") else "",
+                    "source": getattr(ev, "source", "") or "",
+                    "url": getattr(ev, "url", "") or "",
+                    "contribution_points": round(float(totals[i]), 1),
+                    "confidence": float(cols.confidence[positions[i]]),
+                }
+            )
+
+        codes = cols.type_code[positions]
+        if self.has_funding[c]:
+            quiet_amplified: list[str] = []
+        else:
+            present = {cols.type_names[code] for code in np.unique(codes)}
+            quiet_amplified = [t for t in self._profile.quiet_explain_types if t in present]
+        disqualifiers = [cols.type_names[code] for code in codes[self._disqualifier_hit[start:end]]]
+        return build_explain_payload(
+            self.momentum[c].item(),
+            self.complexity[c].item(),
+            self.pressure[c].item(),
+            self.leadership_gap[c].item(),
+            self.composite[c].item(),
+            top_events,
+            ["company_status_suppressed"] if self.suppressed[c] else [],
+            quiet_amplified,
+            disqualifiers_applied=disqualifiers or None,
+            _cfg=self._profile.cfg,
+        )
+
+
+def _status_suppressed(np: Any, statuses: Sequence[str | None] | None, n: int) -> np.ndarray:
+    """apply_global_suppressors as a mask: acquired/dead companies score zero."""
+    if statuses is None:
+        return np.zeros(n, dtype=bool)
+    return np.asarray(
+        [bool(s) and s.strip().lower() in ("acquired", "dead") for s in statuses], dtype=bool
+    )
+
+
+def iter_readiness_days(
+    profile: ScoringProfile,
+    columns: EventColumns,
+    as_of_dates: Sequence[date],
+    company_status: Sequence[str | None] | None = None,
+) -> Iterator[ReadinessDay]:
+    """Yield a ReadinessDay per as_of date, scoring all companies in columns at once.
+
+    company_status (optional) is aligned with company index. Only one day's
+    intermediate arrays are held at a time.
+    """
+    np = _require_numpy()
+    t = _ProfileTables.build(np, profile, columns.type_names)
+    n = columns.n_companies
+    suppressed = _status_suppressed(np, company_status, n)
+    cap_dim = profile.cap_dimension_max
+    w_m, w_c, w_p, w_g = profile.weights
+
+    def per_company(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(comp, weights=weights, minlength=n)
+
+    def clamp_round(values: np.ndarray) -> np.ndarray:
+        return np.rint(np.maximum(0, np.minimum(values, cap_dim))).astype(np.int64)
+
+    for as_of in as_of_dates:
+        oldest, newest = snapshot_window(as_of)
+        ordinals = columns.event_ordinal
+        positions = np.flatnonzero((ordinals >= oldest) & (ordinals <= newest))
+        days = newest - ordinals[positions]
+        comp = columns.company_index[positions]
+        code = columns.type_code[positions]
+        conf = columns.confidence[positions]
+
+        funding = t.is_funding[code] & (days <= profile.quiet_lookback_days)
+        has_funding = np.bincount(comp[funding], minlength=n) > 0
+        funded = has_funding[comp]
+
+        decay_m = _decay(np, t.decay_m, days)
+        m_n = t.base_m[code] * decay_m * conf
+        m_q = t.base_m_quiet[code] * decay_m * conf
+        m = np.where(funded, m_n, m_q)
+        in_m = t.in_m[code] & (days <= WINDOW_MOMENTUM_DAYS)
+        job_m = t.job_m[code]
+        m_jobs = per_company(np.where(in_m & job_m, m, 0.0))
+        m_other = per_company(np.where(in_m & ~job_m, m, 0.0))
+
+        decay_c = _decay(np, t.decay_c, days)
+        c_n = t.base_c[code] * decay_c * conf
+        c_q = t.base_c_quiet[code] * decay_c * conf
+        c = np.where(funded, c_n, c_q)
+        in_c = t.in_c[code] & (days <= WINDOW_COMPLEXITY_DAYS)
+        job_c = t.job_c[code]
+        c_jobs = per_company(np.where(in_c & job_c, c, 0.0))
+        c_other = per_company(np.where(in_c & ~job_c, c, 0.0))
+
+        p = t.base_p[code] * _decay(np, t.decay_p, days) * conf
+        in_p = t.in_p[code] & (days <= WINDOW_PRESSURE_DAYS)
+        founder = t.founder_p[code]
+        p_founder = per_company(np.where(in_p & founder, p, 0.0))
+        p_other = per_company(np.where(in_p & ~founder, p, 0.0))
+
+        g = t.base_g[code]
+        in_g = (t.g_positive[code] & (days <= WINDOW_LEADERSHIP_POSITIVE_DAYS)) | (
+            t.g_no_cto[code] & (days <= _NO_CTO_WINDOW_DAYS)
+        )
+        raw_g = per_company(np.where(in_g, g, 0.0))
+        cto_hired = t.is_cto_hired[code] & (days <= WINDOW_LEADERSHIP_CTO_HIRED_DAYS)
+        cto_days = np.full(n, WINDOW_LEADERSHIP_CTO_HIRED_DAYS + 1, dtype=np.int64)
+        np.minimum.at(cto_days, comp[cto_hired], days[cto_hired])
+
+        M = clamp_round(np.minimum(m_jobs, profile.cap_jobs_momentum) + m_other)
+        C = clamp_round(np.minimum(c_jobs, profile.cap_jobs_complexity) + c_other)
+        P = clamp_round(np.minimum(p_founder, profile.cap_founder_urgency) + p_other)
+        G = clamp_round(raw_g)
+        G = np.where(
+            cto_days <= 60,
+            np.maximum(0, G - profile.suppress_cto_hired_60),
+            np.where(
+                cto_days <= WINDOW_LEADERSHIP_CTO_HIRED_DAYS,
+                np.maximum(0, G - profile.suppress_cto_hired_180),
+                G,
+            ),
+        )
+        M, C, P, G = (np.where(suppressed, 0, dim) for dim in (M, C, P, G))
+
+        R = clamp_round(w_m * M + w_c * C + w_p * P + w_g * G)
+        disqualifier_hit = days <= t.dq_window[code]
+        R = np.where(np.bincount(comp[disqualifier_hit], minlength=n) > 0, 0, R)
+
+        contribution = np.where(funded, 0.0 + m_n + c_n + p + g, 0.0 + m_q + c_q + p + g)
+        offsets = np.searchsorted(comp, np.arange(n + 1), side="left")
+        yield ReadinessDay(
+            as_of=as_of,
+            momentum=M,
+            complexity=C,
+            pressure=P,
+            leadership_gap=G,
+            composite=R,
+            has_events=np.diff(offsets) > 0,
+            has_funding=has_funding,
+            suppressed=suppressed,
+            _profile=profile,
+            _columns=columns,
+            _positions=positions,
+            _offsets=offsets,
+            _contribution=contribution,
+            _disqualifier_hit=disqualifier_hit,
+        )
+
+
+def score_readiness_matrix(
+    profile: ScoringProfile,
+    columns: EventColumns,
+    as_of_dates: Sequence[date],
+    company_status: Sequence[str | None] | None = None,
+) -> dict[str, np.ndarray]:
+    """Score every (as_of date, company) pair; arrays have shape (len(dates), n_companies).
+
+    Keys: momentum, complexity, pressure, leadership_gap, composite, has_events.
+    Intended for what-if analysis (e.g. a candidate scoring config over a quarter).
+    """
+    np = _require_numpy()
+    keys = ("momentum", "complexity", "pressure", "leadership_gap", "composite", "has_events")
+    rows: dict[str, list[np.ndarray]] = {key: [] for key in keys}
+    for day in iter_readiness_days(profile, columns, as_of_dates, company_status):
+        for key in keys:
+            rows[key].append(getattr(day, key))
+    shape = (0, columns.n_companies)
+    return {
+        key: np.vstack(arrays) if arrays else np.empty(shape, dtype=np.int64)
+        for key, arrays in rows.items()
+    }
@@ -10,6 +10,8 @@ from urllib.robotparser import RobotFileParser
 
 import httpx
 
+from app.metrics import record_cache
+
 logger = logging.getLogger(__name__)
 
 # Cache TTL in seconds; avoid refetching robots.txt on every request
@@ -64,7 +66,9 @@ async def can_fetch(
     if origin in _robots_cache:
         parser, fetched_at = _robots_cache[origin]
         if now - fetched_at < _ROBOTS_CACHE_TTL_SECONDS:
+            record_cache("robots", hit=True)
             return parser.can_fetch(user_agent, url)
+    record_cache("robots", hit=False)
 
     robots_url = f"{origin.rstrip('/')}/robots.txt"
     if _http_get is not None:
@@ -18,9 +18,10 @@ from app.models.company import Company
 from app.models.job_run import JobRun
 from app.models.signal_pack import SignalPack
 from app.pipeline.stages import DEFAULT_WORKSPACE_ID
-from app.services.analysis import analyze_company
+from app.services.analysis import analyze_company, get_corpus_fingerprint
 from app.services.pack_resolver import get_default_pack, get_default_pack_id, resolve_pack
 from app.services.page_discovery import discover_pages
+from app.services.read_cache import bump_read_generation
 from app.services.scoring import (
     _get_signal_value,
     _is_signal_true,
@@ -154,6 +155,30 @@ def _analysis_changed(
     return False
 
 
+# ── Analysis reuse (corpus fingerprint) ──────────────────────────────
+
+
+def _can_reuse_analysis(
+    db: Session,
+    company_id: int,
+    new_count: int,
+    prev: AnalysisRecord | None,
+    pack: Pack | None,
+    pack_id: UUID | None,
+) -> bool:
+    """Return True if the previous analysis was built from the current corpus.
+
+    Only considered when the scan stored no new signals and the previous analysis
+    belongs to the same pack. The fingerprint also covers pack config checksum and
+    prompt templates, so pack or prompt edits still trigger re-analysis.
+    """
+    if new_count > 0 or prev is None or not prev.corpus_fingerprint:
+        return False
+    if prev.pack_id != pack_id:
+        return False
+    return get_corpus_fingerprint(db, company_id, pack) == prev.corpus_fingerprint
+
+
 # ── Per-company full pipeline (scan + analysis + scoring) ─────────────
 
 
@@ -170,6 +195,8 @@ async def run_scan_company_full(
     When pack is provided (e.g. from run_scan_all), avoids per-company resolution.
     When pack_id is provided with pack, uses it for AnalysisRecord attribution
     (Phase 3: workspace-specific scans must attribute to workspace's pack, not default).
+    When the scan found no new signals and the corpus fingerprint matches the previous
+    analysis, that analysis is returned as-is (unchanged) and no LLM calls are made.
     """
     prev_analysis = (
         db.query(AnalysisRecord)
@@ -209,6 +236,15 @@ async def run_scan_company_full(
     else:
         effective_pack_id = None
     new_count = await run_scan_company(db, company_id)
+    if _can_reuse_analysis(
+        db, company_id, new_count, prev_analysis, effective_pack, effective_pack_id
+    ):
+        logger.info(
+            "Company %s: corpus unchanged since analysis %s – skipping re-analysis",
+            company_id,
+            prev_analysis.id,
+        )
+        return new_count, prev_analysis, False
     analysis = analyze_company(db, company_id, pack=effective_pack, pack_id=effective_pack_id)
     if analysis is not None:
         score_company(db, company_id, analysis, pack=effective_pack, pack_id=effective_pack_id)
@@ -230,6 +266,8 @@ async def run_scan_company_with_job(
     a new JobRun with job_type="company_scan" and company_id. Runs
     run_scan_company, then analyze_company, then score_company. Updates
     JobRun status, finished_at, and error_message on completion or failure.
+    As in run_scan_company_full, analysis and scoring are skipped when the scan
+    found no new signals and the corpus fingerprint matches the previous analysis.
 
     Parameters
     ----------
@@ -262,8 +300,14 @@ async def run_scan_company_with_job(
         db.commit()
         db.refresh(job)
 
+    prev_analysis = (
+        db.query(AnalysisRecord)
+        .filter(AnalysisRecord.company_id == company_id)
+        .order_by(AnalysisRecord.created_at.desc())
+        .first()
+    )
     try:
-        await run_scan_company(db, company_id)
+        new_count = await run_scan_company(db, company_id)
     except Exception as exc:
         logger.error("Scan failed for company %s: %s", company_id, exc)
         job.finished_at = datetime.now(UTC)
@@ -276,14 +320,23 @@ async def run_scan_company_with_job(
     pack_id = job.pack_id if job.pack_id is not None else get_default_pack_id(db)
     pack = (resolve_pack(db, pack_id) if pack_id is not None else None) or get_default_pack(db)
     try:
-        analysis = analyze_company(db, company_id, pack=pack, pack_id=pack_id)
-        if analysis is not None:
-            score_company(db, company_id, analysis, pack=pack, pack_id=pack_id)
+        if _can_reuse_analysis(db, company_id, new_count, prev_analysis, pack, pack_id):
+            logger.info(
+                "Company %s: corpus unchanged since analysis %s – skipping re-analysis",
+                company_id,
+                prev_analysis.id,
+            )
+        else:
+            analysis = analyze_company(db, company_id, pack=pack, pack_id=pack_id)
+            if analysis is not None:
+                score_company(db, company_id, analysis, pack=pack, pack_id=pack_id)
     except Exception as exc:
         logger.error("Analysis/scoring failed for company %s: %s", company_id, exc)
         job.finished_at = datetime.now(UTC)
         job.status = "failed"
         job.error_message = str(exc)
+        # The scan itself stored signals
+        bump_read_generation(db)
         db.commit()
         db.refresh(job)
         return job
@@ -291,6 +344,7 @@ async def run_scan_company_with_job(
     job.finished_at = datetime.now(UTC)
     job.status = "completed"
     job.error_message = None
+    bump_read_generation(db)
     db.commit()
     db.refresh(job)
     return job
@@ -372,6 +426,7 @@ async def run_scan_all(db: Session, workspace_id: str | UUID | None = None) -> J
     else:
         job.status = "completed"
 
+    bump_read_generation(db)
     db.commit()
     db.refresh(job)
     return job
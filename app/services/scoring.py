@@ -18,6 +18,7 @@ from app.models.analysis_record import AnalysisRecord
 from app.models.app_settings import AppSettings
 from app.models.company import Company
 from app.packs.interfaces import PackScoringInterface, adapt_pack_for_scoring
+from app.services.read_cache import bump_read_generation
 
 if TYPE_CHECKING:
     from app.packs.loader import Pack
@@ -282,7 +283,8 @@ def score_company(
     2. Uses pack when provided; otherwise resolves from db (Issue #189, Plan Step 2.3).
     3. Computes the deterministic score.
     4. Updates ``company.cto_need_score`` and ``company.current_stage`` only when
-       the pack is the default pack (cto_need_score caches default-pack score only).
+       the pack is the default pack (cto_need_score caches default-pack score only),
+       invalidating cached read API responses that show them.
     5. Commits and returns the score.
     """
     from app.services.pack_resolver import get_default_pack_id, resolve_pack
@@ -318,6 +320,7 @@ def score_company(
     if persist_to_company:
         company.cto_need_score = score
         company.current_stage = analysis.stage
+        bump_read_generation(db)
     db.commit()
 
     if score == 0 and (pain_signals or analysis.stage):
@@ -13,6 +13,7 @@ from sqlalchemy.orm import Session
 from app.models import Company, ReadinessSnapshot, Watchlist
 from app.schemas.watchlist import WatchlistItemResponse
 from app.services.pack_resolver import get_default_pack_id
+from app.services.readiness.dirty_queue import enqueue_dirty_companies
 
 
 class WatchlistConflictError(ValueError):
@@ -51,12 +52,14 @@ def add_to_watchlist(
     if existing_inactive:
         existing_inactive.is_active = True
         existing_inactive.added_reason = reason
+        enqueue_dirty_companies(db, [company_id], "watchlist")
         db.commit()
         db.refresh(existing_inactive)
         return existing_inactive
 
     entry = Watchlist(company_id=company_id, added_reason=reason, is_active=True)
     db.add(entry)
+    enqueue_dirty_companies(db, [company_id], "watchlist")
     db.commit()
     db.refresh(entry)
     return entry
@@ -73,6 +76,7 @@ def remove_from_watchlist(db: Session, company_id: int) -> bool:
     if not entry:
         return False
     entry.is_active = False
+    enqueue_dirty_companies(db, [company_id], "watchlist")
     db.commit()
     return True
 
@@ -0,0 +1,14 @@
+"""Benchmarks for pipeline hot paths.
+
+Usage:
+    python -m benchmarks                                # micro-benchmarks
+    python -m benchmarks --stages                       # plus end-to-end stages (Postgres)
+    python -m benchmarks --output bench/HEAD.json --compare bench/main.json
+
+micro: pure functions (readiness, derivers, ESL, name normalization, text
+extraction, diff) over a synthetic dataset (benchmarks.synthetic). stages:
+ingest, derive, score and lead_feed against DATABASE_URL, rolled back after
+each pass (benchmarks.stages). Results are JSON; --compare reports the median
+change per benchmark against an earlier report and exits 1 when one is slower
+than --threshold.
+"""
@@ -0,0 +1,86 @@
+"""CLI for the benchmark suite (see benchmarks/__init__.py)."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+from benchmarks.harness import build_report, compare
+from benchmarks.synthetic import generate_dataset
+
+
+def _print_results(results: list[dict]) -> None:
+    print(f"{'benchmark':<36} {'median ms':>11} {'min ms':>11} {'items/s':>12} {'stmts':>7}")
+    for r in results:
+        print(
+            f"{r['name']:<36} {r['median_ms']:>11.3f} {r['min_ms']:>11.3f} "
+            f"{r['items_per_sec'] or 0:>12.1f} {r.get('statements', ''):>7}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    parser.add_argument("--companies", type=int, default=200, help="Synthetic companies")
+    parser.add_argument("--events", type=int, default=30, help="Events per company")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument("--stages", action="store_true", help="Also run end-to-end stages")
+    parser.add_argument("--stages-only", action="store_true", help="Run only the end-to-end stages")
+    parser.add_argument("--output", type=Path, help="Write the JSON report here")
+    parser.add_argument("--compare", type=Path, help="Baseline JSON report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Median slowdown (fraction) that counts as a regression (default 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    results: list[dict] = []
+    if not args.stages_only:
+        from benchmarks.micro import run_micro_benchmarks
+
+        dataset = generate_dataset(args.companies, args.events, seed=args.seed)
+        results += run_micro_benchmarks(dataset, repeat=args.repeat)
+    if args.stages or args.stages_only:
+        from benchmarks.stages import run_stage_benchmarks
+
+        # Scoring runs as of today; events keep the same offsets from as_of
+        dataset = generate_dataset(args.companies, args.events, seed=args.seed, as_of=date.today())
+        results += run_stage_benchmarks(dataset, repeat=min(args.repeat, 3))
+
+    params = {
+        "companies": args.companies,
+        "events_per_company": args.events,
+        "seed": args.seed,
+        "repeat": args.repeat,
+    }
+    report = build_report(params, results)
+    _print_results(results)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Wrote {args.output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if baseline["meta"]["params"] != params:
+            print("WARNING: baseline was run with different parameters", file=sys.stderr)
+        rows = compare(baseline, report, args.threshold)
+        print(f"\nvs {args.compare} (commit {baseline['meta'].get('commit')}):")
+        for row in rows:
+            flag = "  REGRESSION" if row["regressed"] else ""
+            print(
+                f"{row['name']:<36} {row['baseline_ms']:>11.3f} -> {row['current_ms']:>11.3f} "
+                f"({row['change']:+.1%}){flag}"
+            )
+        if any(row["regressed"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""Timing, JSON reports and regression comparison for benchmarks."""
+
+from __future__ import annotations
+
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+REPORT_VERSION = 1
+
+
+def measure(
+    name: str,
+    fn: Callable[[], Any],
+    *,
+    items: int = 1,
+    repeat: int = 5,
+    warmup: int = 1,
+    extra: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Time fn() repeat times after warmup calls; items is the work per call (for per-second)."""
+    for _ in range(warmup):
+        fn()
+    timings_ms: list[float] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings_ms.append((time.perf_counter() - started) * 1000)
+    return result(name, timings_ms, items, extra)
+
+
+def result(
+    name: str, timings_ms: list[float], items: int, extra: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    """One benchmark's entry in the report from its per-run timings."""
+    median_ms = statistics.median(timings_ms)
+    return {
+        "name": name,
+        "runs": len(timings_ms),
+        "items": items,
+        "min_ms": round(min(timings_ms), 3),
+        "median_ms": round(median_ms, 3),
+        "mean_ms": round(statistics.fmean(timings_ms), 3),
+        "max_ms": round(max(timings_ms), 3),
+        "items_per_sec": round(items / (median_ms / 1000), 1) if median_ms else None,
+        **(extra or {}),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def build_report(params: dict[str, Any], results: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "version": REPORT_VERSION,
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": params,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[dict[str, Any]]:
+    """Per benchmark in both reports: median change and whether it regressed past threshold.
+
+    threshold is a fraction: 0.2 flags a benchmark whose median is more than
+    20% slower than the baseline's.
+    """
+    base = {r["name"]: r for r in baseline["results"]}
+    rows = []
+    for entry in current["results"]:
+        before = base.get(entry["name"])
+        if before is None or not before["median_ms"]:
+            continue
+        change = entry["median_ms"] / before["median_ms"] - 1
+        rows.append(
+            {
+                "name": entry["name"],
+                "baseline_ms": before["median_ms"],
+                "current_ms": entry["median_ms"],
+                "change": round(change, 4),
+                "regressed": change > threshold,
+            }
+        )
+    return rows
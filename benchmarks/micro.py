@@ -0,0 +1,72 @@
+"""Micro-benchmarks for pure hot-path functions (no database)."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.core_derivers.loader import get_core_passthrough_map
+from app.monitor.diff import compute_diff
+from app.packs.loader import load_pack
+from app.pipeline.deriver_engine import _evaluate_event_derivers
+from app.services.company_resolver import normalize_name
+from app.services.esl.esl_engine import compute_csi, compute_svi
+from app.services.extractor import extract_text
+from app.services.readiness.readiness_engine import compute_readiness
+from benchmarks.harness import measure
+from benchmarks.synthetic import SyntheticDataset, pattern_derivers
+
+# Pack whose scoring config the pack-scored readiness benchmark uses
+BENCH_PACK = ("fractional_cto_v1", "1")
+
+
+def run_micro_benchmarks(dataset: SyntheticDataset, repeat: int = 5) -> list[dict[str, Any]]:
+    """Time each function over the whole dataset; items per second is per company/event/page."""
+    by_company = dataset.events_by_company()
+    as_of = dataset.as_of
+    pack = load_pack(*BENCH_PACK)
+    passthrough = dict(get_core_passthrough_map())
+    patterns = pattern_derivers()
+    names = [company.name for company in dataset.companies]
+
+    def readiness(pack=None) -> None:
+        for events in by_company:
+            compute_readiness(events, as_of, pack=pack)
+
+    def derivers() -> None:
+        for event in dataset.events:
+            _evaluate_event_derivers(event, passthrough, patterns)
+
+    def esl() -> None:
+        for events in by_company:
+            compute_svi(events, as_of, pack)
+            compute_csi(events, as_of)
+
+    def names_() -> None:
+        for name in names:
+            normalize_name(name)
+
+    def pages() -> None:
+        for html in dataset.html_pages:
+            extract_text(html)
+
+    def diffs() -> None:
+        for previous, current in dataset.text_revisions:
+            compute_diff(previous, current)
+
+    companies = len(dataset.companies)
+    return [
+        measure("micro.compute_readiness", readiness, items=companies, repeat=repeat),
+        measure(
+            "micro.compute_readiness[pack]",
+            lambda: readiness(pack),
+            items=companies,
+            repeat=repeat,
+        ),
+        measure(
+            "micro.evaluate_event_derivers", derivers, items=len(dataset.events), repeat=repeat
+        ),
+        measure("micro.esl_svi_csi", esl, items=companies, repeat=repeat),
+        measure("micro.normalize_name", names_, items=len(names), repeat=repeat),
+        measure("micro.extract_text", pages, items=len(dataset.html_pages), repeat=repeat),
+        measure("micro.compute_diff", diffs, items=len(dataset.text_revisions), repeat=repeat),
+    ]
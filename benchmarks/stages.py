@@ -0,0 +1,120 @@
+"""End-to-end stage benchmarks against Postgres (DATABASE_URL).
+
+Each repeat ingests the synthetic events (store_raw_events: normalize, resolve
+companies, store), derives signal instances, scores the synthetic companies as
+a partition (readiness and ESL snapshots) and builds their lead_feed rows, all
+inside one outer transaction that is rolled back afterwards: stage commits only
+release savepoints, so nothing is left in the database. Only the synthetic
+companies are touched (partition scoring, entity-scoped lead_feed), and each
+stage also reports its SQL statement count. Run against a migrated database.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from datetime import date
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.db.profiling import track_queries
+from app.db.session import engine
+from app.ingestion.ingest import store_raw_events
+from app.pipeline.deriver_engine import run_deriver
+from app.pipeline.stages import DEFAULT_WORKSPACE_ID
+from app.services.lead_feed.projection_builder import build_lead_feed_from_snapshots
+from app.services.pack_resolver import get_core_pack_id, get_default_pack_id
+from app.services.readiness.score_nightly import run_score_nightly
+from benchmarks.harness import result
+from benchmarks.synthetic import SyntheticDataset
+
+STAGES = ("ingest", "derive", "score", "lead_feed")
+
+
+def _run_once(dataset: SyntheticDataset, db: Session) -> dict[str, tuple[float, int]]:
+    """(duration ms, statements) per stage for one pass over the dataset."""
+    pack_id = get_default_pack_id(db)
+    core_pack_id = get_core_pack_id(db)
+    if pack_id is None or core_pack_id is None:
+        raise RuntimeError("Default and core packs not installed; run alembic upgrade head")
+
+    raw_events = [e.to_raw_event(dataset.companies[e.company_index]) for e in dataset.events]
+    company_ids: list[int] = []
+
+    def ingest() -> None:
+        out = store_raw_events(db, "benchmark", raw_events, pack_id=pack_id)
+        db.commit()
+        if out["errors"]:
+            raise RuntimeError(f"Ingest errors: {out['errors'][:3]}")
+        company_ids.extend(out["company_ids"])
+
+    def derive() -> None:
+        out = run_deriver(db, pack_id=pack_id, company_ids=company_ids)
+        if out["status"] != "completed":
+            raise RuntimeError(f"Derive failed: {out.get('error')}")
+
+    def score() -> None:
+        out = run_score_nightly(db, pack_id=pack_id, company_ids=company_ids)
+        if out["status"] != "completed":
+            raise RuntimeError(f"Score failed: {out.get('error')}")
+
+    def lead_feed() -> None:
+        build_lead_feed_from_snapshots(
+            db,
+            workspace_id=DEFAULT_WORKSPACE_ID,
+            pack_id=pack_id,
+            as_of=date.today(),
+            core_pack_id=core_pack_id,
+            entity_ids=company_ids,
+        )
+        db.commit()
+
+    steps: dict[str, Callable[[], None]] = {
+        "ingest": ingest,
+        "derive": derive,
+        "score": score,
+        "lead_feed": lead_feed,
+    }
+    timings: dict[str, tuple[float, int]] = {}
+    for name in STAGES:
+        started = time.perf_counter()
+        with track_queries() as stats:
+            steps[name]()
+        timings[name] = ((time.perf_counter() - started) * 1000, stats.count)
+    return timings
+
+
+def run_stage_benchmarks(dataset: SyntheticDataset, repeat: int = 3) -> list[dict[str, Any]]:
+    """Run every stage repeat times, each pass rolled back; items are events or companies.
+
+    The dataset's as_of should be today: scoring runs as of today.
+    """
+    runs: dict[str, list[tuple[float, int]]] = {name: [] for name in STAGES}
+    for _ in range(repeat):
+        connection = engine.connect()
+        transaction = connection.begin()
+        db = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            for name, timing in _run_once(dataset, db).items():
+                runs[name].append(timing)
+        finally:
+            db.close()
+            transaction.rollback()
+            connection.close()
+
+    items = {
+        "ingest": len(dataset.events),
+        "derive": len(dataset.events),
+        "score": len(dataset.companies),
+        "lead_feed": len(dataset.companies),
+    }
+    return [
+        result(
+            f"stage.{name}",
+            [ms for ms, _ in runs[name]],
+            items[name],
+            {"statements": max(count for _, count in runs[name])},
+        )
+        for name in STAGES
+    ]
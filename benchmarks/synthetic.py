@@ -0,0 +1,228 @@
+"""Deterministic synthetic data for benchmarks.
+
+generate_dataset(companies, events_per_company, seed) always returns the same
+companies, events, HTML pages and text revisions for the same arguments, so
+results from different commits are comparable. Event types are drawn from the
+core taxonomy (app/core_taxonomy/taxonomy.yaml) with EVENT_TYPE_WEIGHTS, a mix
+skewed like production ingest: hiring and repo activity are common, funding and
+leadership changes rare. Event times spread over the last EVENT_WINDOW_DAYS
+days so every readiness window and decay bucket is exercised.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from app.core_taxonomy.loader import load_core_taxonomy
+from app.schemas.signal import RawEvent
+
+EVENT_WINDOW_DAYS = 400
+# Relative frequency per signal_id; taxonomy types not listed get DEFAULT_WEIGHT
+EVENT_TYPE_WEIGHTS: dict[str, float] = {
+    "job_posted_engineering": 20,
+    "repo_activity": 15,
+    "job_posted_infra": 8,
+    "launch_major": 6,
+    "api_launched": 5,
+    "ai_feature_launched": 5,
+    "enterprise_feature": 5,
+    "headcount_growth": 5,
+    "enterprise_customer": 4,
+    "compliance_mentioned": 3,
+    "founder_urgency_language": 3,
+    "funding_raised": 3,
+    "revenue_milestone": 2,
+    "cto_role_posted": 2,
+    "incorporation": 2,
+    "regulatory_deadline": 1,
+    "no_cto_detected": 1,
+    "fractional_request": 1,
+    "advisor_request": 1,
+    "cto_hired": 1,
+}
+DEFAULT_WEIGHT = 1.0
+
+_NAME_WORDS = (
+    "Acme", "Blue", "Cloud", "Data", "Edge", "Flux", "Grid", "Helix", "Ion", "Jet",
+    "Kite", "Lumen", "Metric", "Nova", "Orbit", "Pixel", "Quanta", "Rocket", "Sigma", "Tide",
+)  # fmt: skip
+_NAME_SUFFIXES = ("Inc.", "LLC", "Labs", "Corp", "Co", "Ltd", "")
+_TITLE_PHRASES = (
+    "hiring a senior backend engineer",
+    "announces Series A funding",
+    "launches public API",
+    "achieves SOC 2 compliance",
+    "signs enterprise customer",
+    "ships AI assistant",
+    "looking for a fractional CTO",
+    "opens new office",
+)
+_PARAGRAPH_WORDS = (
+    "platform", "customers", "team", "launch", "product", "growth", "engineering",
+    "security", "pricing", "roadmap", "partners", "data", "integration", "release",
+)  # fmt: skip
+
+
+@dataclass
+class SyntheticCompany:
+    name: str
+    domain: str
+    website_url: str
+
+
+@dataclass
+class SyntheticEvent:
+    """SignalEvent-shaped event (what compute_readiness and the derivers read)."""
+
+    company_index: int
+    source: str
+    source_event_id: str
+    event_type: str
+    event_time: datetime
+    confidence: float
+    title: str
+    summary: str
+    url: str
+
+    def to_raw_event(self, company: SyntheticCompany) -> RawEvent:
+        return RawEvent(
+            company_name=company.name,
+            domain=company.domain,
+            website_url=company.website_url,
+            event_type_candidate=self.event_type,
+            event_time=self.event_time,
+            title=self.title,
+            summary=self.summary,
+            url=self.url,
+            source_event_id=self.source_event_id,
+        )
+
+
+@dataclass
+class SyntheticDataset:
+    seed: int
+    as_of: date
+    companies: list[SyntheticCompany]
+    events: list[SyntheticEvent]
+    html_pages: list[str]
+    # (previous, current) page text revisions for compute_diff
+    text_revisions: list[tuple[str, str]]
+
+    def events_by_company(self) -> list[list[SyntheticEvent]]:
+        grouped: list[list[SyntheticEvent]] = [[] for _ in self.companies]
+        for event in self.events:
+            grouped[event.company_index].append(event)
+        return grouped
+
+
+def event_type_mix() -> tuple[list[str], list[float]]:
+    """Core taxonomy signal_ids and their sampling weights."""
+    signal_ids = sorted(load_core_taxonomy()["signal_ids"])
+    return signal_ids, [EVENT_TYPE_WEIGHTS.get(sid, DEFAULT_WEIGHT) for sid in signal_ids]
+
+
+def pattern_derivers() -> list[dict[str, Any]]:
+    """Pattern derivers in the compiled shape _evaluate_event_derivers takes.
+
+    Core derivers are passthrough-only; these stand in for pack pattern derivers
+    so the regex path is measured too.
+    """
+    patterns = (
+        ("funding_raised", r"(?i)\bseries [a-d]\b|\bseed round\b", None),
+        ("job_posted_engineering", r"(?i)\bhiring\b.*\bengineer", 0.5),
+        ("compliance_mentioned", r"(?i)\bsoc ?2\b|\bhipaa\b|\biso ?27001\b", None),
+        ("fractional_request", r"(?i)\bfractional (cto|cfo|coo)\b", 0.6),
+    )
+    return [
+        {
+            "signal_id": signal_id,
+            "compiled": re.compile(pattern),
+            "source_fields": ["title", "summary"],
+            "min_confidence": min_confidence,
+        }
+        for signal_id, pattern, min_confidence in patterns
+    ]
+
+
+def _company(rng: random.Random, index: int) -> SyntheticCompany:
+    name = f"{rng.choice(_NAME_WORDS)}{rng.choice(_NAME_WORDS).lower()} {index}"
+    suffix = rng.choice(_NAME_SUFFIXES)
+    slug = re.sub(r"\W+", "", name.lower())
+    domain = f"{slug}.bench.example.com"
+    return SyntheticCompany(
+        name=f"{name} {suffix}".strip(), domain=domain, website_url=f"https://{domain}"
+    )
+
+
+def _paragraph(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_PARAGRAPH_WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _html_page(rng: random.Random) -> str:
+    sections = "".join(
+        f"<section><h2>{_paragraph(rng, 3)}</h2><p>{_paragraph(rng, 60)}</p>"
+        f"<ul>{''.join(f'<li>{_paragraph(rng, 6)}</li>' for _ in range(5))}</ul></section>"
+        for _ in range(8)
+    )
+    return (
+        "<html><head><title>Company</title><style>body{margin:0}</style>"
+        "<script>window.analytics=[];</script></head><body>"
+        "<header><nav><a href='/'>Home</a><a href='/about'>About</a></nav></header>"
+        f"<main>{sections}</main><footer>&copy; Company</footer></body></html>"
+    )
+
+
+def _revision(rng: random.Random, lines: int) -> tuple[str, str]:
+    previous = [_paragraph(rng, 12) for _ in range(lines)]
+    current = list(previous)
+    for _ in range(max(1, lines // 20)):
+        current[rng.randrange(lines)] = _paragraph(rng, 12)
+    current.insert(rng.randrange(lines), _paragraph(rng, 12))
+    return "\n".join(previous), "\n".join(current)
+
+
+def generate_dataset(
+    companies: int,
+    events_per_company: int,
+    seed: int = 0,
+    as_of: date | None = None,
+    pages: int = 20,
+) -> SyntheticDataset:
+    """Build the dataset for these parameters (same arguments, same data)."""
+    rng = random.Random(seed)
+    as_of = as_of or date(2026, 1, 1)
+    as_of_dt = datetime.combine(as_of, datetime.min.time(), tzinfo=UTC)
+    signal_ids, weights = event_type_mix()
+
+    company_rows = [_company(rng, i) for i in range(companies)]
+    events: list[SyntheticEvent] = []
+    for company_index in range(companies):
+        types = rng.choices(signal_ids, weights=weights, k=events_per_company)
+        for n, event_type in enumerate(types):
+            phrase = rng.choice(_TITLE_PHRASES)
+            events.append(
+                SyntheticEvent(
+                    company_index=company_index,
+                    source="benchmark",
+                    source_event_id=f"bench-{seed}-{company_index}-{n}",
+                    event_type=event_type,
+                    event_time=as_of_dt
+                    - timedelta(days=rng.randrange(EVENT_WINDOW_DAYS), hours=rng.randrange(24)),
+                    confidence=round(rng.uniform(0.4, 1.0), 2),
+                    title=f"{company_rows[company_index].name} {phrase}",
+                    summary=_paragraph(rng, 25),
+                    url=f"{company_rows[company_index].website_url}/news/{n}",
+                )
+            )
+    return SyntheticDataset(
+        seed=seed,
+        as_of=as_of,
+        companies=company_rows,
+        events=events,
+        html_pages=[_html_page(rng) for _ in range(pages)],
+        text_revisions=[_revision(rng, 200) for _ in range(pages)],
+    )
@@ -6,6 +6,8 @@ Usage:
 """
 
 import multiprocessing
+import os
+import shutil
 
 # Bind to all interfaces on port 8000
 bind = "0.0.0.0:8000"
@@ -27,3 +29,20 @@ accesslog = "-"  # stdout
 errorlog = "-"   # stderr
 loglevel = "info"
 
+# Prometheus multiprocess mode (app/metrics.py): workers write metric values to files
+# here and GET /metrics merges them. Must be set before workers import the app.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/signalforge-prometheus")
+
+
+def on_starting(server):
+    """Start each master run with an empty metrics directory."""
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Drop a dead worker's live gauges (counters and histograms are kept)."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
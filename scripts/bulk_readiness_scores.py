@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Score readiness for many companies over a date range (vectorized; requires numpy).
+
+Usage:
+    python scripts/bulk_readiness_scores.py --start 2026-01-01 --end 2026-03-31
+    python scripts/bulk_readiness_scores.py --start 2026-01-01 --end 2026-03-31 \\
+        --scoring-file candidate_scoring.yaml --csv whatif.csv
+    python scripts/bulk_readiness_scores.py --start 2026-01-01 --end 2026-03-31 --write
+
+Without --write, prints a per-day summary (and optionally a CSV of every score);
+--scoring-file scores with a candidate scoring.yaml instead of the pack's own.
+With --write, upserts ReadinessSnapshot rows for every day in the range, from the
+same events as the nightly writer (core SignalInstances, else pack SignalEvents).
+Exits 0 on success, 1 on failure.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import yaml
+
+from app.db.session import SessionLocal
+from app.services.readiness.bulk_scoring import (
+    compute_bulk_readiness,
+    write_bulk_readiness_snapshots,
+)
+
+_DIMENSIONS = ("momentum", "complexity", "pressure", "leadership_gap", "composite")
+
+
+def _print_summary(result) -> None:
+    scores = result.scores
+    for i, as_of in enumerate(result.as_of_dates):
+        scored = scores["has_events"][i]
+        composite = scores["composite"][i][scored]
+        mean = f"{composite.mean():.1f}" if composite.size else "-"
+        print(f"{as_of.isoformat()} companies={int(scored.sum())} mean_composite={mean}")
+
+
+def _write_csv(result, path: Path) -> None:
+    scores = result.scores
+    with path.open("w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["as_of", "company_id", *_DIMENSIONS])
+        for i, as_of in enumerate(result.as_of_dates):
+            for j in scores["has_events"][i].nonzero()[0]:
+                writer.writerow(
+                    [
+                        as_of.isoformat(),
+                        result.company_ids[j],
+                        *(int(scores[dim][i][j]) for dim in _DIMENSIONS),
+                    ]
+                )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk readiness scoring for a date range")
+    parser.add_argument("--start", type=date.fromisoformat, required=True)
+    parser.add_argument("--end", type=date.fromisoformat, required=True)
+    parser.add_argument("--pack-id", help="signal_packs.id UUID (default: default pack)")
+    parser.add_argument("--company-id", type=int, action="append", dest="company_ids")
+    parser.add_argument("--scoring-file", type=Path, help="Candidate scoring.yaml (what-if)")
+    parser.add_argument("--csv", type=Path, help="Write every score to this CSV file")
+    parser.add_argument("--write", action="store_true", help="Upsert ReadinessSnapshot rows")
+    args = parser.parse_args()
+
+    if args.end < args.start:
+        print("ERROR: --end must not be before --start", file=sys.stderr)
+        return 1
+    if args.write and args.scoring_file:
+        print(
+            "ERROR: --scoring-file is for what-if runs; not allowed with --write", file=sys.stderr
+        )
+        return 1
+
+    db = SessionLocal()
+    try:
+        if args.write:
+            summary = write_bulk_readiness_snapshots(
+                db, args.start, args.end, pack_id=args.pack_id, company_ids=args.company_ids
+            )
+            print(
+                f"pack_id={summary['pack_id']} days={summary['days']} "
+                f"snapshots_written={summary['snapshots_written']}"
+            )
+            return 0
+
+        scoring = None
+        if args.scoring_file:
+            scoring = yaml.safe_load(args.scoring_file.read_text(encoding="utf-8")) or {}
+        result = compute_bulk_readiness(
+            db,
+            args.start,
+            args.end,
+            pack_id=args.pack_id,
+            company_ids=args.company_ids,
+            scoring=scoring,
+        )
+        _print_summary(result)
+        if args.csv:
+            _write_csv(result, args.csv)
+            print(f"Wrote {args.csv}")
+        return 0
+    except Exception as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,7 @@
 """Run daily signal aggregation job locally (Issue #246).
 
 Usage:
-    python scripts/run_daily_aggregation.py
+    python scripts/run_daily_aggregation.py [--mode sequential|pipelined]
     uv run python scripts/run_daily_aggregation.py
     make signals-daily
 
@@ -12,6 +12,7 @@ Exits 0 on success, 1 on failure.
 
 from __future__ import annotations
 
+import argparse
 import sys
 from pathlib import Path
 
@@ -23,9 +24,16 @@ from app.services.aggregation.daily_aggregation import run_daily_aggregation
 
 
 def main() -> int:
+    parser = argparse.ArgumentParser(description="Run daily aggregation.")
+    parser.add_argument(
+        "--mode",
+        choices=("sequential", "pipelined"),
+        help="Stage scheduling (default DAILY_AGGREGATION_MODE)",
+    )
+    args = parser.parse_args()
     db = SessionLocal()
     try:
-        result = run_daily_aggregation(db)
+        result = run_daily_aggregation(db, mode=args.mode)
         print(
             f"status={result['status']} "
             f"job_run_id={result['job_run_id']} "
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""Run the pipeline job queue worker.
+
+Usage:
+    python scripts/run_worker.py [--concurrency N] [--once]
+    uv run python scripts/run_worker.py
+
+Runs jobs queued in pipeline_jobs (UI scan-all/rescan/run-ingest, POST
+/internal/jobs) until SIGTERM. --once exits when the queue is empty (cron).
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.pipeline.worker import main
+
+if __name__ == "__main__":
+    sys.exit(main())
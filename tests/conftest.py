@@ -32,17 +32,30 @@ def client() -> TestClient:
 
 @pytest.fixture
 def client_with_db(db: Session) -> TestClient:
-    """TestClient with get_db overridden to use the test db session (for integration tests)."""
-    from app.db.session import get_db
+    """TestClient with get_db and get_async_db overridden to use the test db session."""
+    from app.db.session import get_async_db, get_db
     from app.main import app
+    from tests.test_async_db import async_db_override
 
     def override_get_db():
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = async_db_override(db)
     c = TestClient(app)
     yield c
     app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_async_db, None)
+
+
+@pytest.fixture(autouse=True)
+def _clear_response_cache() -> None:
+    """Start each test with an empty read API response cache (app.services.read_cache)."""
+    from app.services.read_cache import response_cache
+
+    response_cache.clear()
+    yield
+    response_cache.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import date, timedelta
 from unittest.mock import patch
 
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.models import Alert, Company, ReadinessSnapshot
@@ -74,6 +75,7 @@ class TestRunAlertScan:
         assert alert.payload["new_composite"] == 70
         assert alert.payload["delta"] == 20
         assert alert.payload["as_of"] == str(as_of)
+        assert alert.as_of == as_of
 
     def test_no_alert_when_delta_below_threshold(self, db: Session) -> None:
         """No alert when delta < threshold."""
@@ -255,3 +257,31 @@ class TestRunAlertScan:
         assert result_a["alerts_created"] >= 1
         assert result_b["status"] == "completed"
         assert result_b["alerts_created"] == 0
+
+    def test_query_count_independent_of_company_count(self, db: Session) -> None:
+        """The scan is a count plus one INSERT ... SELECT, however many companies jump."""
+        as_of = date.today()
+        companies = [
+            Company(name=f"BulkJump{i}", website_url=f"https://bj{i}.example.com") for i in range(5)
+        ]
+        db.add_all(companies)
+        db.commit()
+        for company in companies:
+            _create_snapshots(db, company.id, as_of - timedelta(days=1), 20)
+            _create_snapshots(db, company.id, as_of, 60)
+
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        engine = db.get_bind().engine
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            result = run_alert_scan(db, as_of=as_of)
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+
+        assert result["alerts_created"] >= 5
+        assert len([sql for sql in statements if sql.lstrip().startswith("INSERT")]) == 1
+        assert not any("payload ->>" in sql for sql in statements)
@@ -16,6 +16,7 @@ from app.services.analysis import (
     ALLOWED_STAGES,
     _parse_json_safe,
     analyze_company,
+    compute_corpus_fingerprint,
 )
 
 # ---------------------------------------------------------------------------
@@ -95,6 +96,7 @@ def _make_company(**overrides):
 def _make_signal(content_text: str = "We are hiring engineers"):
     s = MagicMock(spec=SignalRecord)
     s.content_text = content_text
+    s.content_hash = f"hash:{content_text}"
     return s
 
 
@@ -123,6 +125,80 @@ class TestParseJsonSafe:
         assert _parse_json_safe(None) is None  # type: ignore[arg-type]
 
 
+# ---------------------------------------------------------------------------
+# compute_corpus_fingerprint
+# ---------------------------------------------------------------------------
+
+
+class TestComputeCorpusFingerprint:
+    def _pack(self, checksum: str = "checksum-a"):
+        pack = MagicMock()
+        pack.manifest = {"id": "fractional_cto_v1", "version": "1"}
+        pack.config_checksum = checksum
+        return pack
+
+    def test_order_and_duplicates_do_not_matter(self):
+        company = _make_company()
+        pack = self._pack()
+        a = compute_corpus_fingerprint(["h1", "h2"], pack, company, "profile")
+        b = compute_corpus_fingerprint(["h2", "h1", "h1"], pack, company, "profile")
+        assert a == b
+        assert len(a) == 64
+
+    def test_new_content_hash_changes_fingerprint(self):
+        company = _make_company()
+        pack = self._pack()
+        a = compute_corpus_fingerprint(["h1"], pack, company, "profile")
+        b = compute_corpus_fingerprint(["h1", "h2"], pack, company, "profile")
+        assert a != b
+
+    def test_pack_checksum_changes_fingerprint(self):
+        company = _make_company()
+        a = compute_corpus_fingerprint(["h1"], self._pack("a"), company, "profile")
+        b = compute_corpus_fingerprint(["h1"], self._pack("b"), company, "profile")
+        assert a != b
+
+    def test_prompt_template_changes_fingerprint(self):
+        company = _make_company()
+        pack = self._pack()
+        a = compute_corpus_fingerprint(["h1"], pack, company, "profile")
+        with patch(
+            "app.services.analysis.resolve_prompt_template",
+            side_effect=lambda name, pack: f"edited {name}",
+        ):
+            b = compute_corpus_fingerprint(["h1"], pack, company, "profile")
+        assert a != b
+
+    def test_company_fields_change_fingerprint(self):
+        pack = self._pack()
+        a = compute_corpus_fingerprint(["h1"], pack, _make_company(), "profile")
+        b = compute_corpus_fingerprint(["h1"], pack, _make_company(notes="Series A"), "profile")
+        assert a != b
+
+    @patch("app.services.analysis.get_llm_provider")
+    @patch("app.services.analysis.resolve_prompt_content")
+    def test_analyze_company_stores_fingerprint(self, mock_render, mock_get_llm):
+        mock_llm = MagicMock()
+        mock_get_llm.return_value = mock_llm
+        mock_render.side_effect = lambda name, pack, **kw: f"prompt:{name}"
+        mock_llm.complete.side_effect = [
+            _VALID_STAGE_RESPONSE,
+            _VALID_PAIN_RESPONSE,
+            _EXPLANATION_TEXT,
+        ]
+        company = _make_company()
+        signals = [_make_signal("Signal A")]
+        profile = _make_operator_profile("My profile")
+        db = _make_mock_db(company=company, signals=signals, operator_profile=profile)
+
+        analyze_company(db, company_id=1)
+
+        record = db.add.call_args[0][0]
+        assert record.corpus_fingerprint == compute_corpus_fingerprint(
+            ["hash:Signal A"], None, company, "My profile"
+        )
+
+
 # ---------------------------------------------------------------------------
 # analyze_company — happy path
 # ---------------------------------------------------------------------------
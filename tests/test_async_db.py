@@ -0,0 +1,151 @@
+"""Tests for the async session layer (app.db.session.get_async_db) and async read services."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Callable
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+from app.config import get_settings
+from app.db.session import SessionLocal, get_async_db, get_async_engine, get_engine
+from app.models import Company, User
+from app.services.auth import create_access_token
+from app.services.company import (
+    count_companies,
+    count_companies_async,
+    list_companies,
+    list_companies_async,
+)
+from app.services.lead_feed import get_leads_from_feed, get_leads_from_feed_async
+from app.services.ranked_companies import (
+    get_ranked_companies_for_api,
+    get_ranked_companies_for_api_async,
+)
+from tests.test_constants import TEST_PASSWORD
+
+
+class SyncBackedAsyncSession:
+    """AsyncSession stand-in over the rollback-isolated sync test session.
+
+    The async read services only call AsyncSession.run_sync, so endpoints on
+    get_async_db see the test transaction's uncommitted rows.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.sync_session = session
+
+    async def run_sync(self, fn: Callable, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+
+def async_db_override(session: Session) -> Callable[[], AsyncGenerator]:
+    """get_async_db override yielding SyncBackedAsyncSession(session)."""
+
+    async def override() -> AsyncGenerator[SyncBackedAsyncSession, None]:
+        yield SyncBackedAsyncSession(session)
+
+    return override
+
+
+@pytest.fixture
+async def async_db(_ensure_migrations) -> AsyncGenerator[AsyncSession, None]:
+    """Real AsyncSession (committed data only). NullPool: no connection outlives the test loop."""
+    engine = create_async_engine(get_settings().database_url, poolclass=NullPool)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+        yield session
+    await engine.dispose()
+
+
+def test_async_engine_uses_configured_pool() -> None:
+    engine = get_async_engine()
+    settings = get_settings()
+    assert engine.dialect.is_async
+    assert engine.pool.size() == settings.async_db_pool_size
+    assert engine.url.render_as_string(hide_password=False) == settings.database_url
+
+
+async def test_async_services_match_sync(async_db: AsyncSession) -> None:
+    """Async variants return what the sync services return on the same data."""
+    with SessionLocal() as sync_db:
+        expected_list = list_companies(sync_db, page_size=5, sort_by="name", sort_order="asc")
+        expected_count = count_companies(sync_db)
+        expected_ranked = get_ranked_companies_for_api(sync_db, date.today(), limit=5)
+        expected_leads = get_leads_from_feed(sync_db, uuid4(), uuid4(), date.today())
+
+    assert (
+        await list_companies_async(async_db, page_size=5, sort_by="name", sort_order="asc")
+        == expected_list
+    )
+    assert await count_companies_async(async_db) == expected_count
+    assert await get_ranked_companies_for_api_async(async_db, date.today(), limit=5) == (
+        expected_ranked
+    )
+    assert await get_leads_from_feed_async(async_db, uuid4(), uuid4(), date.today()) == (
+        expected_leads
+    )
+
+
+def test_read_endpoints_on_real_async_session(_ensure_migrations) -> None:
+    """List, top and briefing endpoints run on a real async engine (not the test shim).
+
+    Auth goes through require_auth_async on the same session, so the requests
+    check out no sync connection.
+    """
+    from app.main import app
+
+    name = f"Async Read Co {uuid4().hex[:8]}"
+    with SessionLocal() as sync_db:
+        company = Company(name=name)
+        user = User(username=f"async-read-{uuid4().hex[:8]}")
+        user.set_password(TEST_PASSWORD)
+        sync_db.add_all([company, user])
+        sync_db.commit()
+        company_id, user_id = company.id, user.id
+        token = create_access_token({"sub": user.username})
+
+    engine = create_async_engine(get_settings().database_url, poolclass=NullPool)
+
+    async def override() -> AsyncGenerator[AsyncSession, None]:
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            yield session
+
+    sync_checkouts: list[object] = []
+
+    def on_checkout(dbapi_conn, record, proxy) -> None:
+        sync_checkouts.append(dbapi_conn)
+
+    app.dependency_overrides[get_async_db] = override
+    headers = {"Authorization": f"Bearer {token}"}
+    try:
+        with TestClient(app, headers=headers) as client:
+            event.listen(get_engine(), "checkout", on_checkout)
+            try:
+                resp = client.get("/api/companies", params={"search": name})
+                assert resp.status_code == 200
+                assert [item["id"] for item in resp.json()["items"]] == [company_id]
+
+                resp = client.get("/api/companies", params={"sort_by": "score", "search": name})
+                assert resp.status_code == 200
+                assert resp.json()["total"] == 1
+
+                assert client.get("/api/companies/top").status_code == 200
+                assert client.get("/api/briefing/daily").status_code == 200
+            finally:
+                event.remove(get_engine(), "checkout", on_checkout)
+            assert sync_checkouts == []
+            assert (
+                client.get("/api/companies/top", headers={"Authorization": ""}).status_code == 401
+            )
+    finally:
+        app.dependency_overrides.pop(get_async_db, None)
+        with SessionLocal() as sync_db:
+            sync_db.query(Company).filter(Company.id == company_id).delete()
+            sync_db.query(User).filter(User.id == user_id).delete()
+            sync_db.commit()
@@ -0,0 +1,160 @@
+"""Guard: request handlers must not block the event loop (app.api.concurrency).
+
+Async handlers may only touch the sync session or call service/pipeline code
+through run_sync; everything else belongs in a plain ``def`` handler.
+"""
+
+from __future__ import annotations
+
+import ast
+import importlib
+import inspect
+import textwrap
+import threading
+import time
+from collections.abc import Callable
+from unittest.mock import patch
+
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.concurrency import run_sync
+from app.services.company import bulk_import_companies
+from tests.test_constants import TEST_INTERNAL_JOB_TOKEN
+
+# Modules whose functions do DB, network or CPU-heavy work
+BLOCKING_PACKAGES = (
+    "app.db",
+    "app.evidence",
+    "app.ingestion",
+    "app.llm",
+    "app.monitor",
+    "app.pipeline",
+    "app.scout",
+    "app.services",
+)
+OFFLOAD_FUNCS = {"run_sync", "run_in_threadpool"}
+
+
+def _resolve(node: ast.expr, namespace: dict) -> object | None:
+    if isinstance(node, ast.Name):
+        return namespace.get(node.id)
+    if isinstance(node, ast.Attribute):
+        owner = _resolve(node.value, namespace)
+        return getattr(owner, node.attr, None) if owner is not None else None
+    return None
+
+
+def _call_name(node: ast.Call) -> str:
+    func = node.func
+    return func.id if isinstance(func, ast.Name) else getattr(func, "attr", "")
+
+
+def blocking_calls(func: Callable) -> list[str]:
+    """Blocking work done directly (not via run_sync) in an async function."""
+    tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    fn = tree.body[0]
+    assert isinstance(fn, ast.AsyncFunctionDef)
+
+    namespace = dict(func.__globals__)
+    for node in ast.walk(fn):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            module = importlib.import_module(node.module)
+            for alias in node.names:
+                namespace[alias.asname or alias.name] = getattr(module, alias.name, None)
+
+    session_args = {
+        arg.arg
+        for arg in fn.args.args + fn.args.kwonlyargs
+        if arg.annotation is not None and ast.unparse(arg.annotation) in ("Session", "orm.Session")
+    }
+    awaited = {id(node.value) for node in ast.walk(fn) if isinstance(node, ast.Await)}
+    offloaded: set[int] = set()
+    for node in ast.walk(fn):
+        if isinstance(node, ast.Call) and _call_name(node) in OFFLOAD_FUNCS:
+            for arg in [*node.args, *(kw.value for kw in node.keywords)]:
+                offloaded.update(id(sub) for sub in ast.walk(arg))
+
+    problems = []
+    for node in ast.walk(fn):
+        if id(node) in offloaded:
+            continue
+        if isinstance(node, ast.Name) and node.id in session_args:
+            problems.append(f"line {node.lineno}: uses sync session {node.id!r}")
+        elif isinstance(node, ast.Call) and id(node) not in awaited:
+            target = _resolve(node.func, namespace)
+            module = getattr(target, "__module__", None) or ""
+            if module.startswith(BLOCKING_PACKAGES) and not inspect.iscoroutinefunction(target):
+                problems.append(f"line {node.lineno}: calls {module}.{_call_name(node)}")
+    return problems
+
+
+def _api_routes(routes: list) -> list[APIRoute]:
+    found = []
+    for route in routes:
+        if isinstance(route, APIRoute):
+            found.append(route)
+        elif hasattr(route, "original_router"):  # lazily included router (newer FastAPI)
+            found.extend(_api_routes(route.original_router.routes))
+    return found
+
+
+def test_async_handlers_offload_blocking_work() -> None:
+    from app.main import app
+
+    routes = _api_routes(app.routes)
+    assert {route.endpoint.__module__ for route in routes} >= {
+        "app.api.companies",
+        "app.api.internal",
+        "app.api.views",
+    }
+    problems = {
+        f"{route.endpoint.__module__}.{route.endpoint.__qualname__}": found
+        for route in routes
+        if inspect.iscoroutinefunction(route.endpoint) and (found := blocking_calls(route.endpoint))
+    }
+    assert problems == {}, (
+        "Async handlers block the event loop; make them plain def or wrap the "
+        f"work in app.api.concurrency.run_sync: {problems}"
+    )
+
+
+def test_guard_flags_direct_session_and_service_calls() -> None:
+    async def offender(db: Session, rows: list) -> None:
+        db.commit()
+        bulk_import_companies(db, rows)
+        await run_sync(bulk_import_companies, db, rows)
+
+    problems = blocking_calls(offender)
+    assert len(problems) == 3  # db.commit's db, the direct call and its db argument
+    assert any("app.services.company.bulk_import_companies" in p for p in problems)
+
+
+def test_slow_job_does_not_block_other_requests() -> None:
+    from app.main import app
+
+    started = threading.Event()
+
+    def slow_stage(*args, **kwargs):
+        started.set()
+        time.sleep(1.0)
+        return {"status": "completed", "job_run_id": None}
+
+    with (
+        patch("app.pipeline.executor.run_stage", side_effect=slow_stage),
+        TestClient(app) as client,
+    ):
+        job = threading.Thread(
+            target=client.post,
+            args=("/internal/run_derive",),
+            kwargs={"headers": {"X-Internal-Token": TEST_INTERNAL_JOB_TOKEN}},
+        )
+        job.start()
+        assert started.wait(5)
+        begin = time.perf_counter()
+        assert client.get("/health").status_code in (200, 503)
+        elapsed = time.perf_counter() - begin
+        job.join()
+
+    assert elapsed < 0.5, f"/health waited {elapsed:.2f}s behind a running job"
@@ -0,0 +1,80 @@
+"""Tests for the benchmark suite (benchmarks/)."""
+
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+
+from app.core_taxonomy.loader import load_core_taxonomy
+from benchmarks.__main__ import main
+from benchmarks.harness import build_report, compare, result
+from benchmarks.micro import run_micro_benchmarks
+from benchmarks.stages import STAGES, run_stage_benchmarks
+from benchmarks.synthetic import generate_dataset
+
+
+def test_dataset_is_deterministic_and_uses_core_taxonomy() -> None:
+    first = generate_dataset(5, 40, seed=3)
+    again = generate_dataset(5, 40, seed=3)
+
+    assert first == again
+    assert first != generate_dataset(5, 40, seed=4)
+    assert len(first.events) == 200
+    assert {e.event_type for e in first.events} <= set(load_core_taxonomy()["signal_ids"])
+    assert len(first.events_by_company()[4]) == 40
+
+
+def test_micro_benchmarks_report_every_function() -> None:
+    results = run_micro_benchmarks(generate_dataset(3, 5, pages=2), repeat=1)
+
+    assert [r["name"] for r in results] == [
+        "micro.compute_readiness",
+        "micro.compute_readiness[pack]",
+        "micro.evaluate_event_derivers",
+        "micro.esl_svi_csi",
+        "micro.normalize_name",
+        "micro.extract_text",
+        "micro.compute_diff",
+    ]
+    assert all(r["runs"] == 1 and r["median_ms"] >= 0 for r in results)
+
+
+def test_compare_flags_regressions_past_threshold() -> None:
+    baseline = build_report({}, [result("a", [10.0], 1), result("b", [10.0], 1)])
+    current = build_report(
+        {}, [result("a", [11.0], 1), result("b", [13.0], 1), result("c", [1], 1)]
+    )
+
+    rows = {row["name"]: row for row in compare(baseline, current, threshold=0.2)}
+
+    assert set(rows) == {"a", "b"}
+    assert not rows["a"]["regressed"]
+    assert rows["b"]["regressed"] and rows["b"]["change"] == pytest.approx(0.3)
+
+
+def test_cli_writes_report_and_fails_on_regression(tmp_path) -> None:
+    out = tmp_path / "run.json"
+    args = ["--companies", "2", "--events", "3", "--repeat", "1", "--output", str(out)]
+    assert main(args) == 0
+
+    assert main([*args, "--compare", str(out), "--threshold", "-1"]) == 1
+
+
+@pytest.mark.integration
+@pytest.mark.usefixtures("_ensure_migrations")
+def test_stage_benchmarks_run_and_roll_back() -> None:
+    from sqlalchemy import text
+
+    from app.db.session import engine
+
+    dataset = generate_dataset(3, 4, seed=1, as_of=date.today())
+    results = run_stage_benchmarks(dataset, repeat=1)
+
+    assert [r["name"] for r in results] == [f"stage.{name}" for name in STAGES]
+    assert all(r["statements"] > 0 for r in results)
+    with engine.connect() as conn:
+        leftover = conn.execute(
+            text("SELECT count(*) FROM companies WHERE domain LIKE '%.bench.example.com'")
+        ).scalar()
+    assert leftover == 0
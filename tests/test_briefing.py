@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import uuid
 from datetime import UTC, date, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -14,6 +15,7 @@ from app.models.analysis_record import AnalysisRecord
 from app.models.briefing_item import BriefingItem
 from app.models.company import Company
 from app.models.job_run import JobRun
+from app.models.operator_profile import OperatorProfile
 from app.services.briefing import (
     generate_briefing,
     select_top_companies,
@@ -97,11 +99,63 @@ def _make_analysis(**overrides):
     return a
 
 
+def _mock_briefing_db(
+    analyses=(),
+    existing_company_ids=(),
+    email_items=None,
+    operator_profile=None,
+):
+    """Mock Session answering generate_briefing's bulk prefetch queries by entity."""
+    db = MagicMock()
+
+    def _query(*entities):
+        q = MagicMock()
+        q.filter.return_value = q
+        q.order_by.return_value = q
+        q.options.return_value = q
+        target = entities[0] if entities else None
+        if target is BriefingItem.company_id:
+            q.all.return_value = [(cid,) for cid in existing_company_ids]
+        elif target is AnalysisRecord:
+            q.all.return_value = list(analyses)
+        elif target is OperatorProfile:
+            q.first.return_value = operator_profile
+        elif target is BriefingItem:
+            q.all.return_value = list(email_items or [])
+        return q
+
+    db.query.side_effect = _query
+    return db
+
+
 # ---------------------------------------------------------------------------
 # select_top_companies
 # ---------------------------------------------------------------------------
 
 
+def _batch_mode_settings() -> tuple[SimpleNamespace, SimpleNamespace]:
+    """(LLM router settings, briefing settings) for BRIEFING_LLM_BATCH runs."""
+    from tests.test_constants import TEST_LLM_API_KEY
+
+    router_settings = SimpleNamespace(
+        llm_provider="anthropic",
+        llm_api_key=TEST_LLM_API_KEY,
+        llm_model_reasoning="claude-3-5-sonnet",
+        llm_model_json="claude-3-5-haiku",
+        llm_model_outreach="claude-3-5-haiku",
+        llm_model_scout="claude-3-5-sonnet",
+        llm_timeout=60.0,
+        llm_max_retries=3,
+    )
+    briefing_settings = SimpleNamespace(
+        briefing_max_concurrency=4,
+        briefing_llm_batch=True,
+        llm_batch_poll_interval=0.0,
+        llm_batch_timeout=5.0,
+    )
+    return router_settings, briefing_settings
+
+
 class TestSelectTopCompanies:
     def test_returns_companies_from_query(self):
         """select_top_companies issues a query; verify it returns results."""
@@ -226,6 +280,12 @@ class TestSelectTopCompanies:
 
 
 class TestGenerateBriefing:
+    @pytest.fixture(autouse=True)
+    def _no_default_pack_load(self):
+        """Outreach default-pack fallback is resolved in prefetch; keep it off the filesystem."""
+        with patch("app.services.briefing.get_default_pack", return_value=None):
+            yield
+
     @patch("app.services.briefing.get_pack_for_workspace", return_value=None)
     @patch("app.services.briefing.get_default_pack_id", return_value=None)
     @patch("app.services.briefing.get_resolved_settings")
@@ -247,17 +307,15 @@ class TestGenerateBriefing:
         mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
         mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        # First first() = existing check (None); second first() = analysis fetch
-        query_mock.first.side_effect = [None, analysis]
+        db = _mock_briefing_db(analyses=[analysis])
 
         result = generate_briefing(db)
 
         assert len(result) == 1
-        item = db.add.call_args[0][0]
+        # All items inserted in one batch and committed once with the job
+        (batch,) = db.add_all.call_args[0]
+        assert len(batch) == 1
+        item = batch[0]
         assert isinstance(item, BriefingItem)
         assert item.company_id == company.id
         assert item.analysis_id == analysis.id
@@ -298,17 +356,13 @@ class TestGenerateBriefing:
         mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
         mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.first.side_effect = [None, analysis]
+        db = _mock_briefing_db(analyses=[analysis])
 
         ws_uuid = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
         result = generate_briefing(db, workspace_id=ws_uuid)
 
         assert len(result) == 1
-        item = db.add.call_args[0][0]
+        item = db.add_all.call_args[0][0][0]
         assert isinstance(item, BriefingItem)
         assert item.workspace_id == uuid.UUID(ws_uuid)
         mock_select.assert_called_once_with(db, workspace_id=ws_uuid)
@@ -327,12 +381,7 @@ class TestGenerateBriefing:
         company = _make_company()
         mock_select.return_value = [company]
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        # First first() = existing check (None); second first() = analysis (None)
-        query_mock.first.side_effect = [None, None]
+        db = _mock_briefing_db(analyses=[])
 
         result = generate_briefing(db)
 
@@ -355,36 +404,27 @@ class TestGenerateBriefing:
         bad_company = _make_company(id=2, name="Bad Corp")
         mock_select.return_value = [bad_company, good_company]
 
-        mock_render.return_value = "prompt"
+        mock_render.side_effect = lambda name, pack, **kw: f"prompt:{kw['COMPANY_NAME']}"
         mock_llm = MagicMock()
         mock_get_llm.return_value = mock_llm
-        mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
-        mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        analysis = _make_analysis()
-        call_count = 0
-
-        def first_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return None  # existing check for bad company
-            if call_count == 2:
-                raise RuntimeError("LLM exploded")  # analysis for bad company
-            if call_count == 3:
-                return None  # existing check for good company
-            return analysis  # analysis for good company
+        def complete_side_effect(prompt, **kwargs):
+            if "Bad Corp" in prompt:
+                raise RuntimeError("LLM exploded")
+            return _VALID_BRIEFING_RESPONSE
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.first.side_effect = first_side_effect
+        mock_llm.complete.side_effect = complete_side_effect
+        mock_outreach.return_value = _VALID_OUTREACH_RESULT
+
+        db = _mock_briefing_db(
+            analyses=[_make_analysis(id=20, company_id=2), _make_analysis(id=10, company_id=1)]
+        )
 
         result = generate_briefing(db)
 
         # Only the good company should have produced a briefing item.
         assert len(result) == 1
+        assert result[0].company_id == good_company.id
         # Per-company failures stored in job_runs (issue #32)
         job_runs = [c.args[0] for c in db.add.call_args_list if isinstance(c.args[0], JobRun)]
         assert len(job_runs) == 1
@@ -407,20 +447,14 @@ class TestGenerateBriefing:
         c2 = _make_company(id=2, name="Fail2")
         mock_select.return_value = [c1, c2]
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.first.side_effect = [
-            None,  # c1 existing
-            RuntimeError("Analysis failed"),  # c1 analysis - but first() returns, doesn't raise
-        ]
-
-        # first() returns values; to raise we need side_effect to raise. So we need a callable.
-        def first_raise(*args, **kwargs):
-            raise RuntimeError("Analysis failed")
+        mock_render.return_value = "prompt"
+        mock_llm = MagicMock()
+        mock_get_llm.return_value = mock_llm
+        mock_llm.complete.side_effect = RuntimeError("Analysis failed")
 
-        query_mock.first.side_effect = first_raise
+        db = _mock_briefing_db(
+            analyses=[_make_analysis(id=10, company_id=1), _make_analysis(id=20, company_id=2)]
+        )
 
         result = generate_briefing(db)
 
@@ -454,11 +488,7 @@ class TestGenerateBriefing:
         mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
         mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.first.side_effect = [None, analysis]
+        db = _mock_briefing_db(analyses=[analysis])
 
         generate_briefing(db)
 
@@ -502,11 +532,8 @@ class TestGenerateBriefing:
         company = _make_company()
         mock_select.return_value = [company]
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        # First query (existing check) returns an existing item -> skip
-        query_mock.filter.return_value.filter.return_value.first.return_value = MagicMock()
+        # Existing-item prefetch returns this company -> skip
+        db = _mock_briefing_db(analyses=[_make_analysis()], existing_company_ids=[company.id])
 
         result = generate_briefing(db)
 
@@ -516,6 +543,7 @@ class TestGenerateBriefing:
         # JobRun is always created (issue #27); no BriefingItem added
         add_calls = db.add.call_args_list
         assert all(isinstance(c.args[0], JobRun) for c in add_calls)
+        db.add_all.assert_not_called()
 
     @patch("app.services.briefing.get_pack_for_workspace", return_value=None)
     @patch("app.services.briefing.get_default_pack_id", return_value=None)
@@ -539,11 +567,7 @@ class TestGenerateBriefing:
         mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
         mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.first.side_effect = [None, analysis]
+        db = _mock_briefing_db(analyses=[analysis])
 
         # Track JobRun add
         added = []
@@ -598,11 +622,7 @@ class TestGenerateBriefing:
         mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
         mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.first.side_effect = [None, analysis]
+        db = _mock_briefing_db(analyses=[analysis])
 
         added = []
 
@@ -695,16 +715,10 @@ class TestGenerateBriefing:
         mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
         mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.options.return_value = query_mock
-        query_mock.first.side_effect = [None, analysis]
         # Query for items with company (for email)
         fake_item = MagicMock()
         fake_item.company = company
-        query_mock.all.return_value = [fake_item]
+        db = _mock_briefing_db(analyses=[analysis], email_items=[fake_item])
 
         def set_id_on_refresh(obj):
             if isinstance(obj, BriefingItem):
@@ -757,36 +771,25 @@ class TestGenerateBriefing:
         good = _make_company(id=1, name="Good Corp")
         bad = _make_company(id=2, name="Bad Corp")
         mock_select.return_value = [bad, good]
-        mock_render.return_value = "prompt"
+        mock_render.side_effect = lambda name, pack, **kw: f"prompt:{kw['COMPANY_NAME']}"
         mock_llm = MagicMock()
         mock_get_llm.return_value = mock_llm
-        mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
-        mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        analysis = _make_analysis()
-        call_count = 0
-
-        def first_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return None
-            if call_count == 2:
+        def complete_side_effect(prompt, **kwargs):
+            if "Bad Corp" in prompt:
                 raise RuntimeError("LLM failed")
-            if call_count == 3:
-                return None
-            return analysis
+            return _VALID_BRIEFING_RESPONSE
+
+        mock_llm.complete.side_effect = complete_side_effect
+        mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.options.return_value = query_mock
-        query_mock.first.side_effect = first_side_effect
         fake_item = MagicMock()
         fake_item.company = good
         fake_item.id = 1
-        query_mock.all.return_value = [fake_item]
+        db = _mock_briefing_db(
+            analyses=[_make_analysis(id=20, company_id=2), _make_analysis(id=10, company_id=1)],
+            email_items=[fake_item],
+        )
 
         def set_id_on_refresh(obj):
             if isinstance(obj, BriefingItem):
@@ -833,11 +836,7 @@ class TestGenerateBriefing:
         mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
         mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.first.side_effect = [None, analysis]
+        db = _mock_briefing_db(analyses=[analysis])
 
         result = generate_briefing(db)
 
@@ -886,15 +885,9 @@ class TestGenerateBriefing:
         mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
         mock_outreach.return_value = _VALID_OUTREACH_RESULT
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.options.return_value = query_mock
-        query_mock.first.side_effect = [None, analysis]
         fake_item = MagicMock()
         fake_item.company = company
-        query_mock.all.return_value = [fake_item]
+        db = _mock_briefing_db(analyses=[analysis], email_items=[fake_item])
 
         def set_id_on_refresh(obj):
             if isinstance(obj, BriefingItem):
@@ -986,11 +979,7 @@ class TestGenerateBriefing:
         mock_select.return_value = [company]
         mock_render.return_value = "prompt"
 
-        db = MagicMock()
-        query_mock = db.query.return_value
-        query_mock.filter.return_value = query_mock
-        query_mock.order_by.return_value = query_mock
-        query_mock.first.side_effect = [None, analysis]
+        db = _mock_briefing_db(analyses=[analysis])
 
         added = []
 
@@ -1014,6 +1003,312 @@ class TestGenerateBriefing:
         call_kwargs = mock_client_instance.messages.create.call_args.kwargs
         assert call_kwargs["model"] == "claude-3-5-haiku"
         assert "response_format" not in call_kwargs  # we inject JSON instruction in prompt
-        items = [a for a in added if isinstance(a, BriefingItem)]
+        items = db.add_all.call_args[0][0]
         assert len(items) == 1
         assert items[0].why_now == "The company is scaling fast."
+
+
+# ---------------------------------------------------------------------------
+# generate_briefing — concurrent LLM phase + batched write
+# ---------------------------------------------------------------------------
+
+
+class TestGenerateBriefingBatched:
+    @pytest.fixture(autouse=True)
+    def _no_default_pack_load(self):
+        with patch("app.services.briefing.get_default_pack", return_value=None):
+            yield
+
+    @patch("app.services.briefing.get_settings")
+    @patch("app.services.briefing.get_pack_for_workspace", return_value=None)
+    @patch("app.services.briefing.get_default_pack_id", return_value=None)
+    @patch("app.services.briefing.get_resolved_settings")
+    @patch("app.services.briefing.generate_outreach")
+    @patch("app.services.briefing.get_llm_provider")
+    @patch("app.services.briefing.resolve_prompt_content")
+    @patch("app.services.briefing.select_top_companies")
+    def test_llm_calls_run_concurrently_within_bound(
+        self,
+        mock_select,
+        mock_render,
+        mock_get_llm,
+        mock_outreach,
+        mock_resolved,
+        _mock_default_pack_id,
+        _mock_pack_for_ws,
+        mock_get_settings,
+    ):
+        """Briefing LLM calls overlap, never exceeding BRIEFING_MAX_CONCURRENCY."""
+        import threading
+        import time
+
+        mock_resolved.return_value = _default_resolved()
+        mock_get_settings.return_value = SimpleNamespace(
+            briefing_max_concurrency=2, briefing_llm_batch=False
+        )
+        companies = [_make_company(id=i, name=f"Co{i}") for i in range(1, 5)]
+        mock_select.return_value = companies
+        mock_render.return_value = "prompt"
+        mock_outreach.return_value = _VALID_OUTREACH_RESULT
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def slow_complete(prompt, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+            return _VALID_BRIEFING_RESPONSE
+
+        mock_llm = MagicMock()
+        mock_llm.complete.side_effect = slow_complete
+        mock_get_llm.return_value = mock_llm
+        db = _mock_briefing_db(
+            analyses=[_make_analysis(id=10 + c.id, company_id=c.id) for c in companies]
+        )
+
+        result = generate_briefing(db)
+
+        assert peak == 2
+        # Items keep selection order and are written in a single batch
+        assert [i.company_id for i in result] == [1, 2, 3, 4]
+        db.add_all.assert_called_once()
+        assert not any(isinstance(c.args[0], BriefingItem) for c in db.add.call_args_list)
+
+    @patch("app.services.briefing.get_pack_for_workspace", return_value=None)
+    @patch("app.services.briefing.get_default_pack_id", return_value=None)
+    @patch("app.services.briefing.get_resolved_settings")
+    @patch("app.services.briefing.generate_outreach")
+    @patch("app.services.briefing.get_llm_provider")
+    @patch("app.services.briefing.resolve_prompt_content")
+    @patch("app.services.briefing.select_top_companies")
+    def test_outreach_uses_prefetched_profile_without_db(
+        self, mock_select, mock_render, mock_get_llm, mock_outreach, mock_resolved, *_args
+    ):
+        """Operator profile is loaded once; generate_outreach receives it and no Session."""
+        mock_resolved.return_value = _default_resolved()
+        companies = [_make_company(id=1), _make_company(id=2, name="Beta")]
+        mock_select.return_value = companies
+        mock_render.return_value = "prompt"
+        mock_llm = MagicMock()
+        mock_llm.complete.return_value = _VALID_BRIEFING_RESPONSE
+        mock_get_llm.return_value = mock_llm
+        mock_outreach.return_value = _VALID_OUTREACH_RESULT
+        profile = MagicMock(spec=OperatorProfile)
+        profile.content = "# Operator"
+        db = _mock_briefing_db(
+            analyses=[_make_analysis(id=10, company_id=1), _make_analysis(id=20, company_id=2)],
+            operator_profile=profile,
+        )
+
+        generate_briefing(db)
+
+        assert mock_outreach.call_count == 2
+        for call in mock_outreach.call_args_list:
+            assert call.args[0] is None
+            assert call.kwargs["operator_profile_md"] == "# Operator"
+        profile_queries = [c for c in db.query.call_args_list if c.args[0] is OperatorProfile]
+        assert len(profile_queries) == 1
+
+    def test_latest_analysis_per_company_wins(self):
+        """Prefetch keeps the newest analysis per company (query ordered created_at desc)."""
+        from app.services.briefing import _prefetch_briefing_context
+
+        newest = _make_analysis(id=30, company_id=1)
+        older = _make_analysis(id=10, company_id=1)
+        db = _mock_briefing_db(analyses=[newest, older])
+        with (
+            patch("app.services.briefing.get_pack_for_workspace", return_value=None),
+            patch("app.services.briefing.get_default_pack_id", return_value=None),
+        ):
+            ctx = _prefetch_briefing_context(db, [_make_company(id=1)])
+
+        assert ctx.analyses == {1: newest}
+
+    def test_persist_falls_back_to_per_item_on_conflict(self):
+        """Unique-constraint conflict on the batch saves the rest item by item."""
+        from sqlalchemy.exc import IntegrityError
+
+        from app.services.briefing import _persist_items
+
+        conflict = IntegrityError("INSERT", {}, Exception("duplicate key"))
+        items = [BriefingItem(company_id=1), BriefingItem(company_id=2)]
+        db = MagicMock()
+        # batch fails; item 1 saves; item 2 conflicts
+        db.commit.side_effect = [conflict, None, conflict]
+
+        def assign_id(obj):
+            obj.id = obj.company_id * 100
+
+        db.add.side_effect = assign_id
+        errors: list[str] = []
+
+        saved = _persist_items(db, items, errors)
+
+        assert saved == {100}
+        assert db.rollback.call_count == 2
+        assert errors == ["Company 2: briefing item already exists"]
+
+    def test_batch_mode_sends_entry_calls_through_batch_backend(self, tmp_path):
+        """BRIEFING_LLM_BATCH routes briefing-entry calls into one batch, mapped back by company."""
+        from app.llm.batch import FileBatchBackend
+
+        router_settings, briefing_settings = _batch_mode_settings()
+        seen: list[str] = []
+
+        def responder(params):
+            seen.append(params["messages"][0]["content"])
+            return _VALID_BRIEFING_RESPONSE
+
+        backend = FileBatchBackend(tmp_path, responder)
+        companies = [_make_company(id=1), _make_company(id=2, name="Beta")]
+        db = _mock_briefing_db(
+            analyses=[_make_analysis(id=10 + c.id, company_id=c.id) for c in companies]
+        )
+
+        clear_provider_cache()
+        with (
+            patch("app.services.briefing.get_pack_for_workspace", return_value=None),
+            patch("app.services.briefing.get_default_pack_id", return_value=None),
+            patch("app.services.briefing.get_resolved_settings", return_value=_default_resolved()),
+            patch("app.services.briefing.select_top_companies", return_value=companies),
+            patch(
+                "app.services.briefing.resolve_prompt_content",
+                side_effect=lambda name, pack, **kw: f"entry for {kw['COMPANY_NAME']}",
+            ),
+            patch("app.services.briefing.generate_outreach", return_value=_VALID_OUTREACH_RESULT),
+            patch("app.services.briefing.get_settings", return_value=briefing_settings),
+            patch("app.services.briefing.get_batch_backend", return_value=backend),
+            patch("app.config.get_settings", return_value=router_settings),
+            patch("app.llm.anthropic_provider.Anthropic") as mock_anthropic,
+        ):
+            result = generate_briefing(db)
+        clear_provider_cache()
+
+        mock_anthropic.return_value.messages.create.assert_not_called()
+        assert len(list(tmp_path.glob("*.requests.jsonl"))) == 1
+        assert sorted(p.split(" Respond")[0] for p in seen) == [
+            "entry for Acme Corp",
+            "entry for Beta",
+        ]
+        assert [i.company_id for i in result] == [1, 2]
+        assert all(i.why_now == "The company is scaling fast." for i in result)
+
+    def test_batches_recorded_on_job_run_are_resumable_until_collected(self, db):
+        """_JobRunBatchStore finds an earlier run's uncollected batch for the same workspace."""
+        from app.pipeline.stages import DEFAULT_WORKSPACE_ID
+        from app.services.briefing import _JobRunBatchStore
+
+        ws = uuid.UUID(DEFAULT_WORKSPACE_ID)
+        crashed = JobRun(job_type="briefing", status="running", workspace_id=ws)
+        rerun = JobRun(job_type="briefing", status="running", workspace_id=ws)
+        db.add_all([crashed, rerun])
+        db.commit()
+
+        _JobRunBatchStore(db.get_bind(), crashed.id, ws).save(
+            "batch_1", {"company-1-0": "h1", "company-2-1": "h2"}
+        )
+        store = _JobRunBatchStore(db.get_bind(), rerun.id, ws)
+
+        assert store.find({"h2", "h1"}) == (
+            "batch_1",
+            {"company-1-0": "h1", "company-2-1": "h2"},
+        )
+        assert store.find({"h1", "h3"}) is None
+        store.mark_collected("batch_1")
+        db.refresh(crashed)
+        assert crashed.llm_batches[0]["collected"] is True
+        assert store.find({"h1"}) is None
+
+    def test_batch_mode_resumes_on_real_session_without_worker_db_access(self, db, tmp_path):
+        """Batch workers never use the run's Session, even as batch records are committed.
+
+        The Session expires on commit like SessionLocal; a first run dies while
+        polling and the rerun resumes the recorded batch for every company.
+        """
+        import threading
+
+        from sqlalchemy import event
+        from sqlalchemy.orm import Session
+
+        from app.llm.batch import FileBatchBackend
+
+        router_settings, briefing_settings = _batch_mode_settings()
+        session = Session(bind=db.connection(), join_transaction_mode="create_savepoint")
+        now = datetime.now(UTC)
+        companies = [
+            Company(
+                name=f"BatchResume {n}",
+                founder_name=f"Founder {n}",
+                website_url=f"https://batch-resume-{n}.example.com",
+                last_scan_at=now,
+            )
+            for n in range(6)
+        ]
+        session.add_all(companies)
+        session.flush()
+        session.add_all(
+            AnalysisRecord(
+                company_id=c.id,
+                source_type="full_analysis",
+                stage="scaling_team",
+                stage_confidence=80,
+                pain_signals_json={"top_risks": ["hiring"]},
+                evidence_bullets=[f"Hiring at {c.name}"],
+            )
+            for c in companies
+        )
+        session.commit()
+        company_ids = [c.id for c in companies]
+
+        query_threads: list[str] = []
+        event.listen(
+            session,
+            "do_orm_execute",
+            lambda _state: query_threads.append(threading.current_thread().name),
+        )
+        backend = FileBatchBackend(tmp_path, lambda _params: _VALID_BRIEFING_RESPONSE)
+
+        def outreach(_db, company, analysis, **_kw):
+            return {"subject": f"Hi {company.founder_name}", "message": analysis.stage}
+
+        clear_provider_cache()
+        with (
+            patch("app.services.briefing.get_resolved_settings", return_value=_default_resolved()),
+            patch(
+                "app.services.briefing.select_top_companies",
+                side_effect=lambda db, workspace_id=None: (
+                    db.query(Company).filter(Company.id.in_(company_ids)).all()
+                ),
+            ),
+            patch("app.services.briefing.generate_outreach", side_effect=outreach),
+            patch("app.services.briefing.get_settings", return_value=briefing_settings),
+            patch("app.services.briefing.get_batch_backend", return_value=backend),
+            patch("app.config.get_settings", return_value=router_settings),
+            patch("app.llm.anthropic_provider.Anthropic"),
+            patch.object(backend, "submit", wraps=backend.submit) as submit,
+        ):
+            with patch.object(backend, "is_done", side_effect=RuntimeError("worker restarted")):
+                assert generate_briefing(session, llm_batch=True) == []
+            items = generate_briefing(session, llm_batch=True)
+        clear_provider_cache()
+        briefed = {i.company_id: i.outreach_subject for i in items}
+        session.close()
+
+        assert not [t for t in query_threads if t.startswith("llm-batch")]
+        assert submit.call_count == 1
+        assert briefed == {cid: f"Hi Founder {n}" for n, cid in enumerate(company_ids)}
+        crashed, rerun = (
+            db.query(JobRun)
+            .filter(JobRun.job_type == "briefing")
+            .order_by(JobRun.id.desc())
+            .limit(2)
+            .all()[::-1]
+        )
+        assert rerun.error_message is None
+        assert [b["collected"] for b in crashed.llm_batches] == [True]
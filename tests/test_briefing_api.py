@@ -15,7 +15,9 @@ os.environ.setdefault("DATABASE_URL", "postgresql+psycopg://localhost:5432/signa
 os.environ.setdefault("SECRET_KEY", TEST_SECRET_KEY)
 
 from app.api.briefing import router  # noqa: E402
-from app.api.deps import get_db, require_auth  # noqa: E402
+from app.api.deps import require_auth_async  # noqa: E402
+from app.db.session import get_async_db  # noqa: E402
+from tests.test_async_db import async_db_override  # noqa: E402
 
 
 def _make_user():
@@ -31,16 +33,13 @@ def _create_app(mock_db, mock_user=None):
     app = FastAPI()
     app.include_router(router)
 
-    def override_get_db():
-        yield mock_db
-
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = async_db_override(mock_db)
     if mock_user is not None:
-        app.dependency_overrides[require_auth] = lambda: mock_user
+        app.dependency_overrides[require_auth_async] = lambda: mock_user
     return app
 
 
-@patch("app.api.briefing.get_briefing_data")
+@patch("app.api.briefing.get_briefing_data_async")
 def test_get_briefing_daily_returns_json(mock_get_data):
     """GET /api/briefing/daily returns 200 with valid schema."""
     mock_get_data.return_value = {
@@ -61,7 +60,7 @@ def test_get_briefing_daily_returns_json(mock_get_data):
     assert data["total"] == 0
 
 
-@patch("app.api.briefing.get_briefing_data")
+@patch("app.api.briefing.get_briefing_data_async")
 def test_briefing_json_requires_auth(mock_get_data):
     """GET /api/briefing/daily without auth returns 401."""
     mock_get_data.return_value = {
@@ -76,7 +75,7 @@ def test_briefing_json_requires_auth(mock_get_data):
     assert resp.status_code == 401
 
 
-@patch("app.api.briefing.get_briefing_data")
+@patch("app.api.briefing.get_briefing_data_async")
 def test_briefing_json_date_param(mock_get_data):
     """GET /api/briefing/daily?date=YYYY-MM-DD filters by date."""
     mock_get_data.return_value = {
@@ -96,7 +95,7 @@ def test_briefing_json_date_param(mock_get_data):
 
 
 @patch("app.api.briefing.get_settings")
-@patch("app.api.briefing.get_briefing_data")
+@patch("app.api.briefing.get_briefing_data_async")
 def test_briefing_json_invalid_workspace_id_returns_422(mock_get_data, mock_settings):
     """When multi_workspace_enabled and workspace_id invalid, return 422."""
     mock_settings.return_value = MagicMock(multi_workspace_enabled=True)
@@ -115,7 +114,7 @@ def test_briefing_json_invalid_workspace_id_returns_422(mock_get_data, mock_sett
 
 
 @patch("app.api.briefing.get_settings")
-@patch("app.api.briefing.get_briefing_data")
+@patch("app.api.briefing.get_briefing_data_async")
 def test_briefing_json_multi_workspace_scopes_by_workspace_id(mock_get_data, mock_settings):
     """When multi_workspace_enabled and valid workspace_id, get_briefing_data called with it."""
     mock_settings.return_value = MagicMock(multi_workspace_enabled=True)
@@ -135,7 +134,7 @@ def test_briefing_json_multi_workspace_scopes_by_workspace_id(mock_get_data, moc
     assert call_kwargs["workspace_id"] == ws_uuid
 
 
-@patch("app.api.briefing.get_briefing_data")
+@patch("app.api.briefing.get_briefing_data_async")
 def test_briefing_json_includes_recommendation_band(mock_get_data):
     """Briefing API emerging_companies include recommendation_band when pack defines bands (Issue #242 Phase 3)."""
     co = MagicMock()
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
+from app.models import CompanyDisplayScore, ReadinessSnapshot
 from app.models.company import Company
 from app.schemas.company import (
     CompanyCreate,
@@ -18,12 +20,15 @@ from app.services.company import (
     _model_to_read,
     _schema_to_model_data,
     bulk_import_companies,
+    count_companies,
     create_company,
     delete_company,
     get_company,
     list_companies,
+    list_companies_after,
     update_company,
 )
+from app.services.scoring import get_display_scores_for_companies
 
 # ── Helpers ──────────────────────────────────────────────────────────
 
@@ -207,9 +212,10 @@ class TestCompanyAPI:
     @pytest.fixture
     def api_client(self) -> TestClient:
         """TestClient with mocked DB and auth dependencies."""
-        from app.api.deps import require_auth
-        from app.db.session import get_db
+        from app.api.deps import require_auth, require_auth_async
+        from app.db.session import get_async_db, get_db
         from app.main import app
+        from tests.test_async_db import async_db_override
 
         self._mock_db = MagicMock()
 
@@ -220,7 +226,9 @@ class TestCompanyAPI:
             pass
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_async_db] = async_db_override(self._mock_db)
         app.dependency_overrides[require_auth] = override_auth
+        app.dependency_overrides[require_auth_async] = override_auth
         client = TestClient(app)
         yield client
         app.dependency_overrides.clear()
@@ -287,6 +295,23 @@ class TestCompanyAPI:
         response = api_client.get("/api/companies?sort_by=invalid")
         assert response.status_code == 422
 
+    def test_list_companies_cursor_requires_score_sort(self, api_client: TestClient) -> None:
+        response = api_client.get("/api/companies?sort_by=name&cursor=50:1")
+        assert response.status_code == 422
+
+    @patch("app.api.companies.count_companies_async", return_value=40)
+    @patch("app.api.companies.list_companies_after_async")
+    def test_list_companies_score_cursor(
+        self, mock_after: MagicMock, _mock_count: MagicMock, api_client: TestClient
+    ) -> None:
+        mock_after.return_value = ([_model_to_read(_make_company())], "50:1")
+        response = api_client.get("/api/companies?sort_by=score&cursor=60:9")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["next_cursor"] == "50:1"
+        assert data["total"] == 40
+        assert mock_after.call_args.kwargs["after"] == "60:9"
+
     def test_update_company_api(self, api_client: TestClient) -> None:
         company = _make_company()
         self._mock_db.query.return_value.filter.return_value.first.return_value = company
@@ -402,9 +427,10 @@ class TestBulkImportAPI:
     @pytest.fixture
     def api_client(self) -> TestClient:
         """TestClient with mocked DB and auth dependencies."""
-        from app.api.deps import require_auth
-        from app.db.session import get_db
+        from app.api.deps import require_auth, require_auth_async
+        from app.db.session import get_async_db, get_db
         from app.main import app
+        from tests.test_async_db import async_db_override
 
         self._mock_db = MagicMock()
 
@@ -415,7 +441,9 @@ class TestBulkImportAPI:
             pass
 
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_async_db] = async_db_override(self._mock_db)
         app.dependency_overrides[require_auth] = override_auth
+        app.dependency_overrides[require_auth_async] = override_auth
         client = TestClient(app)
         yield client
         app.dependency_overrides.clear()
@@ -524,3 +552,101 @@ class TestBulkImportAPI:
             json={"companies": [{"company_name": "Test"}]},
         )
         assert response.status_code == 401
+
+
+# ── Score-sorted list (DB) ──────────────────────────────────────────
+
+
+def _snapshot(db: Session, company_id: int, pack_id, as_of: date, composite: int) -> None:
+    db.add(
+        ReadinessSnapshot(
+            company_id=company_id,
+            as_of=as_of,
+            momentum=0,
+            complexity=0,
+            pressure=0,
+            leadership_gap=0,
+            composite=composite,
+            pack_id=pack_id,
+        )
+    )
+    db.commit()
+
+
+class TestScoreSortedList:
+    """Display-score sort backed by company_display_scores (keyset pagination)."""
+
+    def _seed(self, db: Session, pack_id) -> list[Company]:
+        companies = [Company(name=f"KeysetCo {i}") for i in range(7)]
+        db.add_all(companies)
+        db.commit()
+        # Ties on 50, one legacy cto_need_score fallback, one unscored
+        for company, composite in zip(companies[:5], [50, 80, 50, 10, 50], strict=True):
+            _snapshot(db, company.id, pack_id, date.today(), composite)
+        companies[5].cto_need_score = 65
+        db.commit()
+        return companies
+
+    def test_trigger_tracks_latest_snapshot(self, db: Session, fractional_cto_pack_id) -> None:
+        company = Company(name="DisplayScoreCo")
+        db.add(company)
+        db.commit()
+        today = date.today()
+        _snapshot(db, company.id, fractional_cto_pack_id, today - timedelta(days=1), 40)
+        _snapshot(db, company.id, fractional_cto_pack_id, today, 70)
+
+        def display_score() -> int | None:
+            row = db.get(CompanyDisplayScore, (company.id, fractional_cto_pack_id))
+            if row is not None:
+                db.refresh(row)
+            return row.score if row else None
+
+        assert display_score() == 70
+        db.query(ReadinessSnapshot).filter_by(company_id=company.id, as_of=today).update(
+            {ReadinessSnapshot.composite: 75}
+        )
+        assert display_score() == 75
+        db.query(ReadinessSnapshot).filter_by(company_id=company.id, as_of=today).delete()
+        assert display_score() == 40
+
+    def test_score_sort_matches_display_scores(self, db: Session, fractional_cto_pack_id) -> None:
+        companies = self._seed(db, fractional_cto_pack_id)
+        scores = get_display_scores_for_companies(db, [c.id for c in companies])
+        expected = sorted(companies, key=lambda c: (scores.get(c.id, -1), c.id), reverse=True)
+
+        items, total = list_companies(db, sort_by="score", search="KeysetCo", page_size=20)
+        assert total == 7
+        assert [item.id for item in items] == [c.id for c in expected]
+        assert scores[companies[5].id] == 65
+
+        page_two, _ = list_companies(
+            db, sort_by="score", sort_order="asc", search="KeysetCo", page=2, page_size=3
+        )
+        assert [item.id for item in page_two] == [c.id for c in reversed(expected)][3:6]
+
+    def test_keyset_pages_cover_offset_order(self, db: Session, fractional_cto_pack_id) -> None:
+        self._seed(db, fractional_cto_pack_id)
+        for order in ("desc", "asc"):
+            full, _ = list_companies(
+                db, sort_by="score", sort_order=order, search="KeysetCo", page_size=20
+            )
+            paged, cursor = [], None
+            while True:
+                items, cursor = list_companies_after(
+                    db, after=cursor, page_size=3, sort_order=order, search="KeysetCo"
+                )
+                paged.extend(items)
+                if cursor is None:
+                    break
+            assert [item.id for item in paged] == [item.id for item in full]
+
+    def test_malformed_cursor_raises(self, db: Session) -> None:
+        with pytest.raises(ValueError, match="cursor"):
+            list_companies_after(db, after="not-a-cursor")
+
+    def test_estimated_count(self, db: Session, fractional_cto_pack_id) -> None:
+        self._seed(db, fractional_cto_pack_id)
+        # Small estimates fall back to an exact count
+        assert count_companies(db, search="KeysetCo", estimate=True) == 7
+        with patch("app.services.company._estimated_count", return_value=123_456):
+            assert count_companies(db, estimate=True) == 123_456
@@ -0,0 +1,87 @@
+"""Tests for company search (app.services.company_search)."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models.company import Company
+from app.services.company import list_companies
+from app.services.company_search import (
+    company_search_filter,
+    company_search_rank,
+    normalize_search_term,
+    trigram_search_enabled,
+)
+
+
+def _seed(db: Session) -> dict[str, Company]:
+    companies = {
+        "substring": Company(name="Big Zephyrlabs Holdings"),
+        "exact": Company(name="Zephyrlabs"),
+        "prefix": Company(name="Zephyrlabs Inc"),
+        "domain": Company(name="Gale Co", domain="zephyrlabs.io"),
+        "founder": Company(name="Breeze Co", founder_name="Ann ZephyrLabs"),
+        "other": Company(name="Unrelated Co", notes="100% literal_match"),
+    }
+    db.add_all(companies.values())
+    db.commit()
+    return companies
+
+
+def test_normalize_search_term() -> None:
+    assert normalize_search_term("  Acme\tCorp  ") == "acme corp"
+
+
+def test_search_matches_all_columns(db: Session) -> None:
+    companies = _seed(db)
+    items, total = list_companies(db, search=" ZEPHYRLABS ", page_size=50)
+    found = {item.id for item in items}
+    assert total == 5
+    assert companies["domain"].id in found
+    assert companies["founder"].id in found
+    assert companies["other"].id not in found
+
+
+def test_like_wildcards_are_literal(db: Session) -> None:
+    companies = _seed(db)
+    items, _ = list_companies(db, search="100%", page_size=50)
+    assert [item.id for item in items] == [companies["other"].id]
+    assert list_companies(db, search="literal%match")[1] == 0
+
+
+def test_relevance_sort_ranks_name_matches_first(db: Session) -> None:
+    companies = _seed(db)
+    items, _ = list_companies(db, search="zephyrlabs", sort_by="relevance", page_size=50)
+    ranked = [item.id for item in items]
+    assert ranked[:3] == [companies[k].id for k in ("exact", "prefix", "substring")]
+
+
+def test_trigram_predicates_when_pg_trgm_installed(db: Session) -> None:
+    with patch("app.services.company_search.trigram_search_enabled", return_value=True):
+        stmt = (
+            select(Company.id)
+            .where(company_search_filter(db, "Zephyr"))
+            .order_by(company_search_rank(db, "Zephyr").desc())
+        )
+        sql = str(stmt.compile(dialect=postgresql.dialect())).replace("%%", "%")
+    # Index-matching expressions: lower(<column>) LIKE / %> (word similarity)
+    assert "lower(companies.name) LIKE" in sql
+    assert "lower(companies.domain) %>" in sql
+    assert "word_similarity" in sql
+    # Name tiers (exact, prefix, substring) rank ahead of similarity
+    assert "CASE WHEN (lower(companies.name) =" in sql
+
+
+def test_trigram_relevance_ranks_name_tiers_first(db: Session) -> None:
+    """On pg_trgm, exact/prefix/substring name matches outrank equal word similarity."""
+    if not trigram_search_enabled(db):
+        pytest.skip("pg_trgm not installed in the test database")
+    companies = _seed(db)
+    items, _ = list_companies(db, search="zephyrlabs", sort_by="relevance", page_size=50)
+    ranked = [item.id for item in items]
+    assert ranked[:3] == [companies[k].id for k in ("exact", "prefix", "substring")]
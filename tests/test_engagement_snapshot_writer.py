@@ -2,21 +2,24 @@
 
 from __future__ import annotations
 
-from datetime import UTC, date, datetime
+from datetime import UTC, date, datetime, timedelta
 from uuid import UUID
 
 from sqlalchemy.orm import Session
 
 from app.models import (
     Company,
+    EngagementSnapshot,
     OutreachHistory,
     ReadinessSnapshot,
     SignalEvent,
     SignalInstance,
 )
 from app.services.esl.engagement_snapshot_writer import (
+    compute_esl_batch,
     compute_esl_from_context,
     write_engagement_snapshot,
+    write_engagement_snapshots_batch,
 )
 
 
@@ -361,3 +364,105 @@ def test_esl_signal_set_from_core_instances_when_core_pack_id_provided(
     assert result is not None
     assert result.esl_decision == "suppress"
     assert result.explain["esl_reason_code"] == "blocked_signal"
+
+
+def _seed_esl_batch(db: Session, pack_id: UUID, as_of: date) -> dict[int, int]:
+    """Companies covering SVI/CSI events, SPI history, cadence, alignment and signal sets.
+
+    Returns company_id -> composite of its as_of ReadinessSnapshot.
+    """
+    at = datetime.combine(as_of, datetime.min.time(), tzinfo=UTC)
+    companies = [
+        Company(name="EslBatchCalm", source="manual"),
+        Company(name="EslBatchStressed", source="manual", alignment_ok_to_contact=False),
+        Company(name="EslBatchContacted", source="manual", alignment_ok_to_contact=True),
+    ]
+    db.add_all(companies)
+    db.commit()
+    calm, stressed, contacted = companies
+    for days_ago, etype in [
+        (3, "founder_urgency_language"),
+        (5, "regulatory_deadline"),
+        (200, "x"),
+    ]:
+        db.add(
+            SignalEvent(
+                company_id=stressed.id,
+                source="test",
+                event_type=etype,
+                event_time=at - timedelta(days=days_ago),
+                confidence=0.9,
+                pack_id=pack_id,
+            )
+        )
+    db.add(
+        OutreachHistory(
+            company_id=contacted.id, outreach_type="email", sent_at=at - timedelta(days=10)
+        )
+    )
+    db.add(
+        SignalInstance(
+            entity_id=contacted.id,
+            signal_id="funding_raised",
+            pack_id=pack_id,
+            first_seen=at - timedelta(days=20),
+            last_seen=at - timedelta(days=2),
+        )
+    )
+    composites: dict[int, int] = {}
+    for company, pressures in [(calm, [20]), (stressed, [70, 65, 30]), (contacted, [50, 10])]:
+        for days_ago, pressure in enumerate(pressures):
+            snap = ReadinessSnapshot(
+                company_id=company.id,
+                as_of=as_of - timedelta(days=days_ago),
+                momentum=50,
+                complexity=50,
+                pressure=pressure,
+                leadership_gap=50,
+                composite=60 + days_ago,
+                pack_id=pack_id,
+            )
+            db.add(snap)
+            if days_ago == 0:
+                composites[company.id] = snap.composite
+    db.commit()
+    return composites
+
+
+def test_compute_esl_batch_matches_per_company(db: Session, fractional_cto_pack_id) -> None:
+    """Batch ESL equals compute_esl_from_context for every company in the chunk."""
+    as_of = date(2026, 2, 18)
+    composites = _seed_esl_batch(db, fractional_cto_pack_id, as_of)
+
+    batch = compute_esl_batch(db, composites, as_of, pack_id=fractional_cto_pack_id)
+
+    assert set(batch) == set(composites)
+    for company_id, ctx in batch.items():
+        assert ctx == compute_esl_from_context(
+            db, company_id, as_of, pack_id=fractional_cto_pack_id
+        )
+    assert len({ctx["esl_composite"] for ctx in batch.values()}) == 3
+
+
+def test_write_engagement_snapshots_batch_upserts(db: Session, fractional_cto_pack_id) -> None:
+    as_of = date(2026, 2, 18)
+    composites = _seed_esl_batch(db, fractional_cto_pack_id, as_of)
+    ids = list(composites)
+
+    write_engagement_snapshots_batch(db, composites, as_of, pack_id=fractional_cto_pack_id)
+    db.query(EngagementSnapshot).filter(EngagementSnapshot.company_id.in_(ids)).update(
+        {EngagementSnapshot.esl_score: -1.0}
+    )
+    results = write_engagement_snapshots_batch(
+        db, composites, as_of, pack_id=fractional_cto_pack_id
+    )
+    db.commit()
+
+    rows = db.query(EngagementSnapshot).filter(EngagementSnapshot.company_id.in_(ids)).all()
+    assert len(rows) == 3
+    for row in rows:
+        db.refresh(row)
+        ctx = results[row.company_id]
+        assert row.esl_score == ctx["esl_composite"]
+        assert row.cadence_blocked == ctx["cadence_blocked"]
+        assert row.outreach_score == round(ctx["trs"] * ctx["esl_composite"])
@@ -0,0 +1,66 @@
+"""Import-time budget for cron scripts and the queue worker (python -X importtime).
+
+Short-lived entry points must not pay for the web app: importing them should
+not load the Anthropic SDK, FastAPI, templating or HTML parsing, nor create a
+database engine (psycopg is loaded by create_engine).
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that only the web app or an LLM call needs
+HEAVY_MODULES = ("anthropic", "fastapi", "jinja2", "bs4", "httpx", "psycopg")
+# Cumulative import time per entry point; generous, catches gross regressions
+BUDGET_SECONDS = 1.5
+ENTRY_POINTS = (
+    "app.services.readiness.score_nightly",
+    "app.services.readiness.alert_scan",
+    "app.pipeline.worker",
+)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Top-level package -> cumulative import microseconds, from a fresh interpreter."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    times: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        times[name] = max(times.get(name, 0), int(cumulative))
+    return times
+
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_skips_heavy_imports_and_stays_in_budget(module: str) -> None:
+    times = _import_times(module)
+
+    loaded = sorted(
+        name for name in times if name.split(".")[0] in HEAVY_MODULES and "." not in name
+    )
+    assert loaded == [], f"{module} imports {loaded}"
+    assert times[module] / 1_000_000 < BUDGET_SECONDS
+
+
+def test_lazy_exports_still_resolve() -> None:
+    from app import db, llm
+    from app.db.session import get_engine
+    from app.llm.anthropic_provider import AnthropicProvider
+    from app.services import readiness
+    from app.services.readiness.alert_scan import run_alert_scan
+
+    assert db.engine is get_engine()
+    assert llm.AnthropicProvider is AnthropicProvider
+    assert readiness.run_alert_scan is run_alert_scan
+    with pytest.raises(AttributeError):
+        _ = db.missing
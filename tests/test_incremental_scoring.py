@@ -0,0 +1,243 @@
+"""Tests for the dirty-company queue and incremental nightly scoring."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy.orm import Session
+
+from app.ingestion.event_storage import store_signal_event
+from app.ingestion.ingest import store_raw_events
+from app.models import (
+    Company,
+    EngagementSnapshot,
+    JobRun,
+    LeadFeed,
+    ReadinessSnapshot,
+    ScoreDirtyCompany,
+    SignalEvent,
+)
+from app.pipeline.stages import DEFAULT_WORKSPACE_ID
+from app.schemas.signal import RawEvent
+from app.services.outreach_history import create_outreach_record
+from app.services.pack_resolver import resolve_pack
+from app.services.readiness.dirty_queue import (
+    dirty_company_ids_since,
+    enqueue_dirty_companies,
+    prune_dirty_companies,
+)
+from app.services.readiness.score_nightly import breakpoint_ages, run_score_nightly
+from app.services.readiness.scoring_profile import get_scoring_profile
+from app.services.watchlist_service import add_to_watchlist, remove_from_watchlist
+
+TODAY = date.today()
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+def _company(db: Session, name: str) -> Company:
+    company = Company(name=name, website_url=f"https://{name.lower()}.example.com")
+    db.add(company)
+    db.commit()
+    return company
+
+
+def _reason(db: Session, company_id: int) -> str | None:
+    row = db.query(ScoreDirtyCompany).filter(ScoreDirtyCompany.company_id == company_id).first()
+    return row.reason if row else None
+
+
+def _stable_age(db: Session, pack_id) -> int:
+    """An event age (days) that crosses no scoring breakpoint today."""
+    ages = breakpoint_ages(get_scoring_profile(resolve_pack(db, pack_id)))
+    return next(age for age in range(3, 365) if age not in ages)
+
+
+def _add_event(db: Session, company_id: int, pack_id, days_ago: int, etype: str) -> None:
+    db.add(
+        SignalEvent(
+            company_id=company_id,
+            source="test",
+            event_type=etype,
+            event_time=datetime.now(UTC) - timedelta(days=days_ago),
+            confidence=0.9,
+            pack_id=pack_id,
+        )
+    )
+    db.commit()
+
+
+def _age_previous_run(db: Session) -> None:
+    """Make the run just completed look like yesterday's nightly run."""
+    day = timedelta(days=1)
+    for model in (ReadinessSnapshot, EngagementSnapshot, LeadFeed):
+        db.query(model).filter(model.as_of == TODAY).update({model.as_of: YESTERDAY})
+    for job in db.query(JobRun).filter(JobRun.job_type == "score"):
+        job.started_at -= day
+    db.query(ScoreDirtyCompany).delete()
+    db.commit()
+
+
+class TestDirtyQueue:
+    def test_enqueue_bumps_existing_entry(self, db: Session) -> None:
+        company = _company(db, "DirtyBump")
+        assert enqueue_dirty_companies(db, [company.id, None, company.id], "ingest") == 1
+        first = db.query(ScoreDirtyCompany).filter_by(company_id=company.id).one().enqueued_at
+        enqueue_dirty_companies(db, [company.id], "watchlist")
+        db.commit()
+        entry = db.query(ScoreDirtyCompany).filter_by(company_id=company.id).one()
+        db.refresh(entry)
+        assert entry.reason == "watchlist"
+        assert entry.enqueued_at > first
+        assert company.id in dirty_company_ids_since(db, datetime.now(UTC) - timedelta(minutes=1))
+
+    def test_prune_drops_old_entries(self, db: Session) -> None:
+        company = _company(db, "DirtyPrune")
+        enqueue_dirty_companies(db, [company.id], "ingest")
+        db.query(ScoreDirtyCompany).filter_by(company_id=company.id).update(
+            {ScoreDirtyCompany.enqueued_at: datetime.now(UTC) - timedelta(days=30)}
+        )
+        assert prune_dirty_companies(db) >= 1
+        assert _reason(db, company.id) is None
+
+    def test_ingest_watchlist_and_outreach_enqueue(self, db: Session) -> None:
+        ingested = _company(db, "DirtyIngest")
+        store_signal_event(
+            db,
+            company_id=ingested.id,
+            source="test",
+            source_event_id="dirty-1",
+            event_type="funding_raised",
+            event_time=datetime.now(UTC),
+        )
+        assert _reason(db, ingested.id) == "ingest"
+
+        watched = _company(db, "DirtyWatch")
+        add_to_watchlist(db, watched.id, "test")
+        assert _reason(db, watched.id) == "watchlist"
+        db.query(ScoreDirtyCompany).delete()
+        remove_from_watchlist(db, watched.id)
+        assert _reason(db, watched.id) == "watchlist"
+
+        contacted = _company(db, "DirtyOutreach")
+        create_outreach_record(
+            db,
+            company_id=contacted.id,
+            sent_at=datetime.now(UTC),
+            outreach_type="email",
+        )
+        assert _reason(db, contacted.id) == "outreach"
+
+    def test_store_raw_events_enqueues_batch_once(self, db: Session) -> None:
+        raw_events = [
+            RawEvent(
+                company_name=f"DirtyBatch{i}",
+                domain=f"dirty-batch-{i}.example.com",
+                event_type_candidate="funding_raised",
+                event_time=datetime.now(UTC),
+                source_event_id=f"dirty-batch-{i}",
+            )
+            for i in range(3)
+        ]
+
+        with patch(
+            "app.ingestion.ingest.enqueue_dirty_companies", wraps=enqueue_dirty_companies
+        ) as enqueue:
+            result = store_raw_events(db, "dirty_batch_test", raw_events)
+
+        assert result["inserted"] == 3
+        enqueue.assert_called_once()
+        assert {_reason(db, cid) for cid in result["company_ids"]} == {"ingest"}
+
+
+class TestIncrementalScore:
+    def test_rescores_dirty_and_carries_forward_others(
+        self, db: Session, fractional_cto_pack_id
+    ) -> None:
+        age = _stable_age(db, fractional_cto_pack_id)
+        changed = _company(db, "IncrChanged")
+        unchanged = _company(db, "IncrUnchanged")
+        for company in (changed, unchanged):
+            _add_event(db, company.id, fractional_cto_pack_id, age, "funding_raised")
+        assert run_score_nightly(db)["status"] == "completed"
+        _age_previous_run(db)
+        before = (
+            db.query(ReadinessSnapshot).filter_by(company_id=unchanged.id, as_of=YESTERDAY).one()
+        )
+
+        store_signal_event(
+            db,
+            company_id=changed.id,
+            source="test",
+            source_event_id="incr-1",
+            event_type="cto_role_posted",
+            event_time=datetime.now(UTC),
+            pack_id=fractional_cto_pack_id,
+        )
+        result = run_score_nightly(db, mode="incremental")
+
+        assert result["status"] == "completed"
+        assert result["mode"] == "incremental"
+        assert result["companies_carried_forward"] >= 1
+        rescored = db.query(ReadinessSnapshot).filter_by(company_id=changed.id, as_of=TODAY).one()
+        assert rescored.explain["delta_1d"] > 0
+        carried = db.query(ReadinessSnapshot).filter_by(company_id=unchanged.id, as_of=TODAY).one()
+        assert carried.composite == before.composite
+        assert carried.explain["delta_1d"] == 0
+        assert carried.explain["top_events"] == before.explain["top_events"]
+        assert (
+            db.query(EngagementSnapshot).filter_by(company_id=unchanged.id, as_of=TODAY).count()
+            == 1
+        )
+        feed = db.query(LeadFeed).filter(
+            LeadFeed.workspace_id == DEFAULT_WORKSPACE_ID,
+            LeadFeed.entity_id.in_([changed.id, unchanged.id]),
+        )
+        assert {row.as_of for row in feed} == {TODAY}
+
+    def test_breakpoint_crossing_is_rescored(self, db: Session, fractional_cto_pack_id) -> None:
+        """An event leaving the 365-day window is rescored without any new input."""
+        age = _stable_age(db, fractional_cto_pack_id)
+        aging = _company(db, "IncrAging")
+        _add_event(db, aging.id, fractional_cto_pack_id, 366, "funding_raised")
+        _add_event(db, aging.id, fractional_cto_pack_id, age, "cto_role_posted")
+        steady = _company(db, "IncrSteady")
+        _add_event(db, steady.id, fractional_cto_pack_id, age, "cto_role_posted")
+        assert run_score_nightly(db)["status"] == "completed"
+        _age_previous_run(db)
+        # Sentinel composite: carried-forward rows keep it, rescored rows do not
+        db.query(ReadinessSnapshot).filter(
+            ReadinessSnapshot.company_id.in_([aging.id, steady.id]),
+            ReadinessSnapshot.as_of == YESTERDAY,
+        ).update({ReadinessSnapshot.composite: 99})
+        db.commit()
+
+        assert run_score_nightly(db, mode="incremental")["mode"] == "incremental"
+
+        def composite(company: Company) -> int:
+            return (
+                db.query(ReadinessSnapshot)
+                .filter_by(company_id=company.id, as_of=TODAY)
+                .one()
+                .composite
+            )
+
+        assert composite(steady) == 99
+        assert composite(aging) != 99
+
+    def test_falls_back_to_full_without_recent_run(
+        self, db: Session, fractional_cto_pack_id
+    ) -> None:
+        db.query(JobRun).filter(JobRun.job_type == "score").delete()
+        company = _company(db, "IncrFallback")
+        _add_event(db, company.id, fractional_cto_pack_id, 5, "funding_raised")
+        db.query(ScoreDirtyCompany).delete()
+        db.commit()
+
+        result = run_score_nightly(db, mode="incremental")
+        assert result["status"] == "completed"
+        assert result["mode"] == "full"
+        assert result["companies_carried_forward"] == 0
+        assert (
+            db.query(ReadinessSnapshot).filter_by(company_id=company.id, as_of=TODAY).count() == 1
+        )
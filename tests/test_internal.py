@@ -114,6 +114,7 @@ class TestRunBriefing:
         assert data["items_generated"] == 3
         mock_briefing.assert_called_once()
         assert mock_briefing.call_args[1]["workspace_id"] is None
+        assert mock_briefing.call_args[1]["llm_batch"] is False
 
     def test_missing_token_returns_422(self, client: TestClient):
         """POST /internal/run_briefing without token header returns 422."""
@@ -162,6 +163,28 @@ class TestRunBriefing:
         assert data["status"] == "failed"
         assert "LLM down" in data["error"]
 
+    @patch("app.services.briefing.generate_briefing")
+    def test_batch_mode_queues_briefing_job_instead_of_running(
+        self, mock_briefing, client_with_db: TestClient, db, monkeypatch
+    ):
+        """With BRIEFING_LLM_BATCH the request never waits on a batch: it queues a worker job."""
+        from app.config import get_settings
+        from app.models import PipelineJob
+
+        monkeypatch.setattr(get_settings(), "briefing_llm_batch", True)
+
+        response = client_with_db.post(
+            "/internal/run_briefing",
+            headers={"X-Internal-Token": VALID_TOKEN},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "queued"
+        job = db.get(PipelineJob, data["job_id"])
+        assert (job.job_type, job.status) == ("briefing", "queued")
+        mock_briefing.assert_not_called()
+
 
 # ── /internal/run_score ────────────────────────────────────────────
 
@@ -274,6 +297,45 @@ class TestRunScore:
         assert "uuid" in data.get("detail", "").lower()
 
 
+# ── /internal/run_readiness_backfill ──────────────────────────────────
+
+
+class TestRunReadinessBackfill:
+    """Tests for POST /internal/run_readiness_backfill."""
+
+    @patch("app.pipeline.executor.run_stage")
+    def test_valid_token_calls_run_stage_with_range(self, mock_run_stage, client: TestClient):
+        mock_run_stage.return_value = {
+            "status": "completed",
+            "job_run_id": 7,
+            "days": 3,
+            "companies_processed": 2,
+            "snapshots_written": 6,
+            "error": None,
+        }
+
+        response = client.post(
+            "/internal/run_readiness_backfill?start=2026-02-01&end=2026-02-03",
+            headers={"X-Internal-Token": VALID_TOKEN},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "completed"
+        assert data["snapshots_written"] == 6
+        kwargs = mock_run_stage.call_args[1]
+        assert kwargs["job_type"] == "readiness_backfill"
+        assert str(kwargs["start"]) == "2026-02-01"
+        assert str(kwargs["end"]) == "2026-02-03"
+
+    def test_wrong_token_returns_403(self, client: TestClient):
+        response = client.post(
+            "/internal/run_readiness_backfill",
+            headers={"X-Internal-Token": "wrong-token"},
+        )
+        assert response.status_code == 403
+
+
 # ── /internal/run_update_lead_feed ────────────────────────────────────
 
 
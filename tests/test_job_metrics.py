@@ -0,0 +1,162 @@
+"""Tests for per-span job timing (app.services.job_metrics, JobRun.metrics)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_db, require_ui_auth
+from app.api.settings_views import router as settings_router
+from app.db.profiling import QueryStats
+from app.models import Company, JobRun, SignalEvent
+from app.pipeline.executor import run_stage
+from app.services.job_metrics import JobMetrics, collect_job_metrics, job_span
+from app.services.readiness.score_nightly import run_score_nightly
+from tests.test_constants import TEST_INTERNAL_JOB_TOKEN
+
+
+def test_job_span_is_noop_without_collector(db: Session) -> None:
+    with job_span("outside"):
+        db.execute(text("SELECT 1"))
+
+    with collect_job_metrics() as metrics:
+        pass
+    assert metrics.spans == {}
+
+
+def test_spans_aggregate_histogram_and_slowest_companies(db: Session) -> None:
+    db.execute(text("SELECT 0"))  # begin the test savepoint outside the spans
+    with collect_job_metrics() as outer:
+        with collect_job_metrics() as inner, job_span("score.company", company_id=7):
+            db.execute(text("SELECT 1"))
+        with job_span("score.company", company_id=8):
+            pass
+
+    assert inner.spans["score.company"].count == 1
+    data = outer.to_dict()
+    span = data["spans"]["score.company"]
+    assert span["count"] == 2
+    assert span["statements"] == 1
+    assert sum(span["histogram"]) == 2
+    assert len(span["histogram"]) == len(data["histogram_buckets_ms"]) + 1
+    assert [row["company_id"] for row in data["slowest_companies"]] in ([7, 8], [8, 7])
+
+
+def test_to_dict_keeps_top_companies_slowest_first() -> None:
+    metrics = JobMetrics()
+    for company_id, ms in [(1, 5.0), (2, 50.0), (3, 20.0), (1, 40.0)]:
+        metrics.record("score.company", ms, QueryStats(), company_id)
+
+    data = metrics.to_dict(top_companies=2)
+
+    assert data["slowest_companies"] == [
+        {"company_id": 2, "ms": 50.0},
+        {"company_id": 1, "ms": 45.0},
+    ]
+    assert data["spans"]["score.company"]["max_ms"] == 50.0
+    assert data["spans"]["score.company"]["histogram"][3] == 3  # 10 < ms <= 50: 20, 40, 50
+    assert data["spans"]["score.company"]["histogram"][1] == 1  # 1 < ms <= 5: 5
+
+
+def test_run_stage_stores_score_spans(db: Session, fractional_cto_pack_id) -> None:
+    company = Company(name="SpanCo", website_url="https://span.example.com")
+    db.add(company)
+    db.commit()
+    db.add(
+        SignalEvent(
+            company_id=company.id,
+            source="test",
+            event_type="funding_raised",
+            event_time=datetime.now(UTC) - timedelta(days=3),
+            confidence=0.9,
+            pack_id=fractional_cto_pack_id,
+        )
+    )
+    db.commit()
+
+    result = run_stage(db, "score", pack_id=fractional_cto_pack_id, check_rate_limit=False)
+
+    job = db.get(JobRun, result["job_run_id"])
+    db.refresh(job)
+    spans = job.metrics["spans"]
+    for name in ("score.select", "score.company", "score.events", "score.readiness"):
+        assert spans[name]["count"] >= 1, name
+    assert spans["score.lead_feed"]["count"] == 1
+    assert company.id in [row["company_id"] for row in job.metrics["slowest_companies"]]
+
+
+def test_direct_score_run_stores_spans_and_query_stats(db: Session, fractional_cto_pack_id) -> None:
+    """The cron script calls run_score_nightly directly, outside run_stage."""
+    company = Company(name="CronSpanCo", website_url="https://cronspan.example.com")
+    db.add(company)
+    db.commit()
+    db.add(
+        SignalEvent(
+            company_id=company.id,
+            source="test",
+            event_type="funding_raised",
+            event_time=datetime.now(UTC) - timedelta(days=3),
+            confidence=0.9,
+            pack_id=fractional_cto_pack_id,
+        )
+    )
+    db.commit()
+
+    result = run_score_nightly(db, pack_id=fractional_cto_pack_id)
+
+    job = db.get(JobRun, result["job_run_id"])
+    db.refresh(job)
+    assert job.query_count > 0
+    assert job.db_time_ms is not None
+    assert job.metrics["spans"]["score.company"]["count"] >= 1
+    assert company.id in [row["company_id"] for row in job.metrics["slowest_companies"]]
+
+
+def test_internal_endpoint_and_settings_page_compare_runs(
+    client_with_db: TestClient, db: Session
+) -> None:
+    metrics = JobMetrics()
+    metrics.record("score.readiness", 12.0, QueryStats(count=3, db_ms=2.0), company_id=42)
+    started = datetime(2026, 3, 1, 2, 0)
+    job = JobRun(
+        job_type="score",
+        status="completed",
+        started_at=started,
+        finished_at=started + timedelta(seconds=2),
+        query_count=3,
+        db_time_ms=2,
+        metrics=metrics.to_dict(),
+    )
+    db.add_all([job, JobRun(job_type="score", status="completed")])  # no metrics: omitted
+    db.commit()
+
+    resp = client_with_db.get(
+        "/internal/job_metrics",
+        params={"job_type": "score"},
+        headers={"X-Internal-Token": TEST_INTERNAL_JOB_TOKEN},
+    )
+    assert resp.status_code == 200
+    [run] = [r for r in resp.json()["runs"] if r["job_run_id"] == job.id]
+    assert run["duration_ms"] == 2000
+    assert run["metrics"]["spans"]["score.readiness"]["statements"] == 3
+    assert resp.json()["runs"][0]["job_run_id"] == job.id
+
+    app = FastAPI()
+    app.include_router(settings_router)
+
+    def override_get_db():
+        yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[require_ui_auth] = lambda: MagicMock()
+    page = TestClient(app).get("/settings/job-metrics", params={"job_type": "score"})
+
+    assert page.status_code == 200
+    assert "score.readiness" in page.text
+    assert f"#{job.id}" in page.text
+    assert 'href="/companies/42"' in page.text
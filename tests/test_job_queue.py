@@ -0,0 +1,262 @@
+"""Tests for the pipeline job queue (app.pipeline.queue) and worker (app.pipeline.worker)."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.models import JobRun, PipelineJob, User
+from app.pipeline.queue import (
+    claim_jobs,
+    complete_job,
+    enqueue_job,
+    fail_job,
+    heartbeat_job,
+)
+from app.pipeline.stages import STAGE_REGISTRY, StageResult
+from app.pipeline.worker import execute_job, run_worker
+from tests.test_constants import TEST_INTERNAL_JOB_TOKEN, TEST_PASSWORD_INTEGRATION
+
+WORKER = "test-worker:1"
+
+
+@pytest.fixture
+def empty_queue(db: Session) -> None:
+    """Claims see only this test's jobs."""
+    db.query(PipelineJob).delete()
+    db.commit()
+
+
+def _job(db: Session, job_id: int) -> PipelineJob:
+    return db.get(PipelineJob, job_id, populate_existing=True)
+
+
+def _expire_lease(db: Session, job_id: int) -> None:
+    db.execute(
+        update(PipelineJob)
+        .where(PipelineJob.id == job_id)
+        .values(lease_expires_at=datetime.now(UTC) - timedelta(seconds=1))
+    )
+    db.commit()
+
+
+class TestQueue:
+    def test_enqueue_rejects_unknown_job_type(self, db: Session) -> None:
+        with pytest.raises(ValueError, match="Unknown job_type"):
+            enqueue_job(db, "no_such_stage")
+
+    def test_claim_in_order_up_to_limit(self, db: Session, empty_queue) -> None:
+        ids = [enqueue_job(db, "derive") for _ in range(3)]
+        db.commit()
+
+        assert claim_jobs(db, WORKER, limit=2) == ids[:2]
+        assert claim_jobs(db, "other-worker", limit=2) == ids[2:]
+        assert claim_jobs(db, WORKER) == []
+        job = _job(db, ids[0])
+        assert (job.status, job.locked_by, job.attempts) == ("running", WORKER, 1)
+        assert job.lease_expires_at > datetime.now(UTC)
+
+    def test_dedupe_key_returns_active_job(self, db: Session, empty_queue) -> None:
+        first = enqueue_job(db, "scan", dedupe_key="scan:ws")
+        assert enqueue_job(db, "scan", dedupe_key="scan:ws") == first
+        db.commit()
+        claim_jobs(db, WORKER)
+        assert enqueue_job(db, "scan", dedupe_key="scan:ws") == first
+
+        complete_job(db, first, WORKER, {"status": "completed"})
+        assert enqueue_job(db, "scan", dedupe_key="scan:ws") != first
+
+    def test_lapsed_lease_is_reclaimed_then_failed(self, db: Session, empty_queue) -> None:
+        job_id = enqueue_job(db, "derive", max_attempts=2)
+        db.commit()
+        claim_jobs(db, WORKER)
+
+        _expire_lease(db, job_id)
+        assert claim_jobs(db, "rescuer") == [job_id]
+        assert _job(db, job_id).attempts == 2
+        assert not heartbeat_job(db, job_id, WORKER)
+        assert heartbeat_job(db, job_id, "rescuer")
+
+        _expire_lease(db, job_id)
+        assert claim_jobs(db, "rescuer") == []
+        job = _job(db, job_id)
+        assert job.status == "failed"
+        assert "Lease expired" in job.error_message
+
+    def test_fail_job_retries_with_backoff_until_max_attempts(
+        self, db: Session, empty_queue
+    ) -> None:
+        job_id = enqueue_job(db, "derive", max_attempts=2)
+        db.commit()
+        claim_jobs(db, WORKER)
+
+        assert fail_job(db, job_id, "not-the-owner", "boom") is None
+        assert fail_job(db, job_id, WORKER, "boom") == "queued"
+        job = _job(db, job_id)
+        assert job.run_after > datetime.now(UTC)
+        assert claim_jobs(db, WORKER) == []  # backing off
+
+        db.execute(
+            update(PipelineJob).where(PipelineJob.id == job_id).values(run_after=datetime.now(UTC))
+        )
+        db.commit()
+        assert claim_jobs(db, WORKER) == [job_id]
+        assert fail_job(db, job_id, WORKER, "boom again") == "failed"
+        job = _job(db, job_id)
+        assert (job.status, job.error_message, job.attempts) == ("failed", "boom again", 2)
+
+    def _scan_job(self, db: Session) -> tuple[int, JobRun]:
+        run = JobRun(job_type="company_scan", status="running")
+        db.add(run)
+        db.commit()
+        job_id = enqueue_job(
+            db, "company_scan", params={"company_id": 1, "job_run_id": run.id}, max_attempts=1
+        )
+        db.commit()
+        claim_jobs(db, WORKER)
+        return job_id, run
+
+    def test_lapsed_company_scan_fails_its_job_run(self, db: Session, empty_queue) -> None:
+        job_id, run = self._scan_job(db)
+
+        _expire_lease(db, job_id)
+        assert claim_jobs(db, "rescuer") == []
+        db.refresh(run)
+        assert _job(db, job_id).status == run.status == "failed"
+        assert run.finished_at is not None
+        assert "Lease expired" in run.error_message
+
+    def test_failed_company_scan_fails_its_job_run(self, db: Session, empty_queue) -> None:
+        job_id, run = self._scan_job(db)
+
+        assert fail_job(db, job_id, WORKER, "scan crashed") == "failed"
+        db.refresh(run)
+        assert (run.status, run.error_message) == ("failed", "scan crashed")
+
+
+class TestWorker:
+    def test_execute_job_runs_stage_with_decoded_params(
+        self, db: Session, empty_queue, fractional_cto_pack_id
+    ) -> None:
+        calls = []
+
+        def stage(db, workspace_id, pack_id, **kwargs):
+            calls.append((workspace_id, pack_id, kwargs))
+            return StageResult(
+                {"status": "completed", "job_run_id": None, "as_of": kwargs["as_of"]}
+            )
+
+        with patch.dict(STAGE_REGISTRY, {"update_lead_feed": stage}):
+            job_id = enqueue_job(
+                db,
+                "update_lead_feed",
+                pack_id=fractional_cto_pack_id,
+                params={"as_of": date(2026, 3, 1)},
+            )
+            db.commit()
+            claim_jobs(db, WORKER)
+            assert execute_job(db, job_id, WORKER) == "completed"
+
+        [(_, pack_id, kwargs)] = calls
+        assert pack_id == str(fractional_cto_pack_id)
+        assert kwargs["as_of"] == date(2026, 3, 1)
+        job = _job(db, job_id)
+        assert job.status == "completed"
+        assert job.result == {"status": "completed", "job_run_id": None, "as_of": "2026-03-01"}
+        assert job.locked_by is None
+
+    def test_execute_job_requeues_on_exception(self, db: Session, empty_queue) -> None:
+        def stage(db, workspace_id, pack_id, **kwargs):
+            raise RuntimeError("adapter down")
+
+        with patch.dict(STAGE_REGISTRY, {"ingest": stage}):
+            job_id = enqueue_job(db, "ingest")
+            db.commit()
+            claim_jobs(db, WORKER)
+            assert execute_job(db, job_id, WORKER) == "queued"
+
+        job = _job(db, job_id)
+        assert (job.status, job.attempts, job.error_message) == ("queued", 1, "adapter down")
+
+    def test_run_worker_once_drains_queue(self, db: Session, empty_queue) -> None:
+        ran = []
+
+        def stage(db, workspace_id, pack_id, **kwargs):
+            ran.append(kwargs["n"])
+            return StageResult({"status": "completed"})
+
+        class _SharedSession:
+            """Hands the worker the test session; close() is a no-op."""
+
+            def __call__(self):
+                return self
+
+            def __getattr__(self, name):
+                return getattr(db, name)
+
+            def close(self) -> None:
+                pass
+
+        with patch.dict(STAGE_REGISTRY, {"derive": stage}):
+            for n in range(3):
+                enqueue_job(db, "derive", params={"n": n})
+            db.commit()
+            assert run_worker(concurrency=1, once=True, session_factory=_SharedSession()) == 3
+
+        assert ran == [0, 1, 2]
+        assert {job.status for job in db.query(PipelineJob)} == {"completed"}
+
+
+class TestEndpoints:
+    HEADERS = {"X-Internal-Token": TEST_INTERNAL_JOB_TOKEN}
+
+    def test_enqueue_returns_job_id_and_status_is_readable(
+        self, client_with_db, db: Session
+    ) -> None:
+        resp = client_with_db.post(
+            "/internal/jobs",
+            json={"job_type": "score", "params": {"mode": "incremental"}},
+            headers=self.HEADERS,
+        )
+        assert resp.status_code == 202
+        job_id = resp.json()["job_id"]
+        assert resp.json()["status"] == "queued"
+
+        resp = client_with_db.get(f"/internal/jobs/{job_id}", headers=self.HEADERS)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert (body["job_type"], body["status"]) == ("score", "queued")
+        assert body["params"] == {"mode": "incremental"}
+
+    def test_enqueue_unknown_job_type_is_422(self, client_with_db) -> None:
+        resp = client_with_db.post(
+            "/internal/jobs", json={"job_type": "nope"}, headers=self.HEADERS
+        )
+        assert resp.status_code == 422
+        assert client_with_db.get("/internal/jobs/0", headers=self.HEADERS).status_code == 404
+
+    def test_scan_all_view_enqueues_once(self, client_with_db, db: Session, empty_queue) -> None:
+        user = User(username=f"queue_{uuid4().hex[:12]}")
+        user.set_password(TEST_PASSWORD_INTEGRATION)
+        db.add(user)
+        db.commit()
+        client_with_db.post(
+            "/login",
+            data={"username": user.username, "password": TEST_PASSWORD_INTEGRATION},
+            follow_redirects=False,
+        )
+        scan_runs = db.query(JobRun).filter(JobRun.job_type == "scan").count()
+        for _ in range(2):
+            resp = client_with_db.post("/companies/scan-all", follow_redirects=False)
+            assert resp.status_code == 303
+            assert "scan_all=queued" in resp.headers["location"]
+
+        jobs = db.query(PipelineJob).filter(PipelineJob.job_type == "scan").all()
+        assert [job.status for job in jobs] == ["queued"]
+        # Nothing ran in the web process
+        assert db.query(JobRun).filter(JobRun.job_type == "scan").count() == scan_runs
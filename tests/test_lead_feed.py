@@ -26,6 +26,7 @@ from app.services.briefing import (
 )
 from app.services.esl.esl_engine import compute_outreach_score
 from app.services.lead_feed import (
+    build_lead_feed_for_workspaces,
     build_lead_feed_from_snapshots,
     refresh_outreach_summary_for_entity,
     upsert_lead_feed_from_snapshots,
@@ -1222,6 +1223,7 @@ class TestLeadFeedIndices:
 
         assert "ix_lead_feed_workspace_pack_composite" in idx_names
         assert "ix_lead_feed_workspace_pack_last_seen" in idx_names
+        assert "ix_lead_feed_workspace_pack_as_of_outreach" in idx_names
 
     @pytest.mark.integration
     def test_get_leads_from_feed_performance_with_many_rows(
@@ -1499,3 +1501,215 @@ def test_refresh_outreach_summary_requires_workspace_id_when_multi_workspace(db:
         mock_settings.return_value.multi_workspace_enabled = True
         with pytest.raises(ValueError, match="workspace_id is required"):
             refresh_outreach_summary_for_entity(db, company.id, workspace_id=None)
+
+
+class TestSetBasedProjection:
+    """build_lead_feed_for_workspaces: INSERT ... SELECT matches the per-entity upsert."""
+
+    FIELDS = (
+        "composite_score",
+        "top_signal_ids",
+        "esl_decision",
+        "sensitivity_level",
+        "recommendation_band",
+        "last_seen",
+        "outreach_status_summary",
+        "as_of",
+    )
+
+    def _companies(self, db: Session, n: int) -> list[Company]:
+        companies = [
+            Company(name=f"SetBased {i}", website_url=f"https://setbased{i}.example.com")
+            for i in range(n)
+        ]
+        db.add_all(companies)
+        db.commit()
+        return companies
+
+    def _rows(self, db: Session, pack_id: UUID, ids: list[int]) -> dict[int, tuple]:
+        rows = db.query(LeadFeed).filter(
+            LeadFeed.workspace_id == UUID(DEFAULT_WORKSPACE_ID),
+            LeadFeed.pack_id == pack_id,
+            LeadFeed.entity_id.in_(ids),
+        )
+        return {row.entity_id: tuple(getattr(row, f) for f in self.FIELDS) for row in rows}
+
+    def test_matches_per_entity_upsert(self, db: Session, fractional_cto_pack_id: UUID) -> None:
+        from app.models import OutreachHistory
+
+        as_of = date(2099, 3, 1)
+        companies = self._companies(db, 5)
+        ids = [c.id for c in companies]
+        top_events = [{"event_type": t} for t in ["a", "b", "a", "", "c", "d", "e", "f", "g", "h"]]
+        pairs = [
+            _add_snapshots(db, ids[0], as_of, top_events=top_events),
+            _add_snapshots(db, ids[1], as_of, composite=40),
+            _add_snapshots(db, ids[2], as_of),
+            _add_snapshots(db, ids[3], as_of, composite=65),
+            _add_snapshots(db, ids[4], as_of),
+        ]
+        pairs[0][0].explain = {
+            "top_events": top_events,
+            "recommendation_band": "WATCH",
+            "minimum_threshold": 50,
+        }
+        pairs[0][1].sensitivity_level = "high"
+        pairs[1][0].explain = {"minimum_threshold": 50}  # below threshold: excluded
+        pairs[2][1].esl_decision = None
+        pairs[2][1].explain = {"esl_decision": "suppress"}  # suppressed via explain
+        pairs[3][0].explain = {"recommendation_band": "NOT_A_BAND"}
+        pairs[3][1].esl_decision = None
+        pairs[3][1].explain = {"esl_decision": "allow_with_constraints", "sensitivity_level": "low"}
+        db.add(
+            SignalInstance(
+                entity_id=ids[0],
+                signal_id="cto_role_posted",
+                pack_id=fractional_cto_pack_id,
+                last_seen=datetime(2099, 2, 20, 8, 30, tzinfo=UTC),
+            )
+        )
+        for company_id, sent_at in [
+            (ids[0], datetime(2099, 2, 1, 9, 0, 0, 123456, tzinfo=UTC)),
+            (ids[0], datetime(2099, 1, 1, tzinfo=UTC)),
+            (ids[3], datetime(2099, 2, 3, 17, 45, tzinfo=UTC)),
+        ]:
+            db.add(
+                OutreachHistory(
+                    company_id=company_id,
+                    outreach_type="email",
+                    sent_at=sent_at,
+                    outcome="replied",
+                    workspace_id=UUID(DEFAULT_WORKSPACE_ID),
+                )
+            )
+        db.commit()
+
+        for rs, es in pairs:
+            upsert_lead_feed_from_snapshots(
+                db, DEFAULT_WORKSPACE_ID, fractional_cto_pack_id, as_of, rs, es
+            )
+        db.commit()
+        expected = self._rows(db, fractional_cto_pack_id, ids)
+        db.execute(delete(LeadFeed).where(LeadFeed.entity_id.in_(ids)))
+        db.commit()
+
+        count = build_lead_feed_from_snapshots(
+            db, DEFAULT_WORKSPACE_ID, fractional_cto_pack_id, as_of
+        )
+        db.commit()
+
+        assert count == 3
+        assert set(expected) == {ids[0], ids[3], ids[4]}
+        assert self._rows(db, fractional_cto_pack_id, ids) == expected
+        assert expected[ids[0]][1] == ["a", "b", "c", "d", "e", "f"]
+
+    def test_chunks_across_workspaces(self, db: Session, fractional_cto_pack_id: UUID) -> None:
+        as_of = date(2099, 3, 2)
+        other = Workspace(name="Set-based other")
+        db.add(other)
+        companies = self._companies(db, 3)
+        for c in companies:
+            _add_snapshots(db, c.id, as_of)
+
+        count = build_lead_feed_for_workspaces(
+            db, [DEFAULT_WORKSPACE_ID, other.id], fractional_cto_pack_id, as_of, chunk_size=2
+        )
+        db.commit()
+
+        assert count == 6
+        rows = db.query(LeadFeed).filter(LeadFeed.as_of == as_of).all()
+        assert {(row.workspace_id, row.entity_id) for row in rows} == {
+            (ws, c.id) for ws in (UUID(DEFAULT_WORKSPACE_ID), other.id) for c in companies
+        }
+
+    def test_backfill_groups_workspaces_by_pack(
+        self, db: Session, fractional_cto_pack_id: UUID
+    ) -> None:
+        from app.services.lead_feed.run_update import run_backfill_lead_feed
+
+        as_of = date(2099, 3, 3)
+        workspace = Workspace(name="Backfill pack ws", active_pack_id=fractional_cto_pack_id)
+        db.add(workspace)
+        (company,) = self._companies(db, 1)
+        _add_snapshots(db, company.id, as_of)
+
+        result = run_backfill_lead_feed(db, as_of=as_of)
+
+        assert result["status"] == "completed"
+        assert result["total_rows_upserted"] >= 1
+        assert (
+            db.query(LeadFeed)
+            .filter(LeadFeed.workspace_id == workspace.id, LeadFeed.entity_id == company.id)
+            .count()
+            == 1
+        )
+
+
+class TestOutreachScoreKeyset:
+    """outreach_score materialized on lead_feed; keyset-paginated lead list."""
+
+    def test_projection_materializes_outreach_score(
+        self, db: Session, lead_feed_company: Company, fractional_cto_pack_id: UUID
+    ) -> None:
+        as_of = date(2099, 4, 1)
+        _, es = _add_snapshots(db, lead_feed_company.id, as_of, composite=75, esl_score=0.5)
+        es.cadence_blocked = True
+        db.commit()
+
+        build_lead_feed_from_snapshots(db, DEFAULT_WORKSPACE_ID, fractional_cto_pack_id, as_of)
+        db.commit()
+
+        row = db.query(LeadFeed).filter(LeadFeed.entity_id == lead_feed_company.id).one()
+        assert row.outreach_score == compute_outreach_score(75, 0.5) == 38
+        assert row.esl_score == 0.5
+        assert row.cadence_blocked is True
+
+    def test_keyset_pages_cover_feed_in_outreach_order(
+        self, db: Session, fractional_cto_pack_id: UUID
+    ) -> None:
+        from app.services.lead_feed import get_leads_from_feed, lead_cursor
+
+        as_of = date(2099, 4, 2)
+        companies = [
+            Company(name=f"Keyset {i}", website_url=f"https://keyset{i}.example.com")
+            for i in range(7)
+        ]
+        db.add_all(companies)
+        db.commit()
+        scores = [90, 20, 55, 55, 70, 10, 55]
+        for c, score in zip(companies, scores, strict=True):
+            upsert_lead_feed_row(
+                db,
+                DEFAULT_WORKSPACE_ID,
+                fractional_cto_pack_id,
+                c.id,
+                composite_score=80,
+                outreach_score=score,
+                cadence_blocked=score == 10,
+                as_of=as_of,
+            )
+        db.commit()
+
+        pages: list[list[dict]] = []
+        after = None
+        while True:
+            page = get_leads_from_feed(
+                db,
+                DEFAULT_WORKSPACE_ID,
+                fractional_cto_pack_id,
+                as_of,
+                limit=2,
+                outreach_score_threshold=30,
+                after=after,
+            )
+            if not page:
+                break
+            pages.append(page)
+            after = lead_cursor(page[-1])
+
+        leads = [lead for page in pages for lead in page]
+        # 20 is below threshold; 10 is kept because cadence_blocked (Observe Only)
+        assert [lead["outreach_score"] for lead in leads] == [90, 70, 55, 55, 55, 10]
+        assert all(len(page) == 2 for page in pages)
+        ties = [lead["entity_id"] for lead in leads if lead["outreach_score"] == 55]
+        assert ties == sorted(ties, reverse=True)
@@ -360,6 +360,102 @@ class TestAnthropicProviderComplete:
         assert call_kwargs["max_tokens"] == 4096
 
 
+class TestAnthropicProviderPromptCaching:
+    """Cache-break prompts are sent as a cached prefix block plus a dynamic block."""
+
+    # Long enough to clear the 1024-token minimum (Sonnet/Opus) but not Haiku's 2048
+    LONG_PREFIX = "Static instructions. " * 250
+
+    def _provider(self, MockAnthropic, **response_fields):
+        mock_client = MagicMock()
+        MockAnthropic.return_value = mock_client
+        mock_client.messages.create.return_value = SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="ok")], **response_fields
+        )
+        return AnthropicProvider(api_key="k"), mock_client
+
+    def test_split_prompt_sends_cached_prefix_block(self):
+        with patch("app.llm.anthropic_provider.Anthropic") as MockAnthropic:
+            provider, mock_client = self._provider(MockAnthropic)
+            provider.complete(
+                f"{self.LONG_PREFIX}\n<!-- cache-break -->\nCompany: Acme",
+                response_format={"type": "json_object"},
+            )
+        content = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert content[0] == {
+            "type": "text",
+            "text": f"{self.LONG_PREFIX}\n",
+            "cache_control": {"type": "ephemeral"},
+        }
+        assert content[1]["type"] == "text"
+        assert content[1]["text"].startswith("Company: Acme")
+        assert "JSON only" in content[1]["text"]
+        assert "cache_control" not in content[1]
+
+    def test_prefix_below_cache_minimum_is_sent_unmarked(self):
+        with patch("app.llm.anthropic_provider.Anthropic") as MockAnthropic:
+            provider, mock_client = self._provider(MockAnthropic)
+            provider.complete("Static instructions\n<!-- cache-break -->\nCompany: Acme")
+        content = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert isinstance(content, str)
+        assert content.startswith("Static instructions\nCompany: Acme")
+        assert "cache-break" not in content
+
+    def test_haiku_needs_a_longer_prefix_to_cache(self):
+        prompt = f"{self.LONG_PREFIX}\n<!-- cache-break -->\nCompany: Acme"
+        with patch("app.llm.anthropic_provider.Anthropic") as MockAnthropic:
+            provider, mock_client = self._provider(MockAnthropic)
+            provider.model = "claude-3-5-haiku-20241022"
+            provider.complete(prompt)
+            assert isinstance(
+                mock_client.messages.create.call_args.kwargs["messages"][0]["content"], str
+            )
+            provider.complete(self.LONG_PREFIX + prompt)
+        content = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert content[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_prompt_without_marker_is_sent_as_string(self):
+        with patch("app.llm.anthropic_provider.Anthropic") as MockAnthropic:
+            provider, mock_client = self._provider(MockAnthropic)
+            provider.complete("Hi", system_prompt="sys")
+        call_kwargs = mock_client.messages.create.call_args.kwargs
+        assert call_kwargs["messages"] == [{"role": "user", "content": "Hi"}]
+        assert call_kwargs["system"] == "sys"
+
+    def test_cache_system_prompt_sends_cached_system_block(self):
+        with patch("app.llm.anthropic_provider.Anthropic") as MockAnthropic:
+            provider, mock_client = self._provider(MockAnthropic)
+            provider.complete("Hi", system_prompt=self.LONG_PREFIX, cache_system_prompt=True)
+        assert mock_client.messages.create.call_args.kwargs["system"] == [
+            {"type": "text", "text": self.LONG_PREFIX, "cache_control": {"type": "ephemeral"}}
+        ]
+
+    def test_short_system_prompt_is_not_marked_cacheable(self):
+        with patch("app.llm.anthropic_provider.Anthropic") as MockAnthropic:
+            provider, mock_client = self._provider(MockAnthropic)
+            provider.complete("Hi", system_prompt="pack system", cache_system_prompt=True)
+        assert mock_client.messages.create.call_args.kwargs["system"] == "pack system"
+
+    def test_usage_accumulates_cache_tokens(self):
+        usage = SimpleNamespace(
+            input_tokens=20,
+            output_tokens=5,
+            cache_creation_input_tokens=1200,
+            cache_read_input_tokens=0,
+        )
+        with patch("app.llm.anthropic_provider.Anthropic") as MockAnthropic:
+            provider, mock_client = self._provider(MockAnthropic, usage=usage)
+            provider.complete("a\n<!-- cache-break -->\nb")
+            usage.cache_creation_input_tokens = 0
+            usage.cache_read_input_tokens = 1200
+            provider.complete("a\n<!-- cache-break -->\nc")
+        assert provider.usage.calls == 2
+        assert provider.usage.input_tokens == 40
+        assert provider.usage.output_tokens == 10
+        assert provider.usage.cache_creation_input_tokens == 1200
+        assert provider.usage.cache_read_input_tokens == 1200
+
+
 class TestAnthropicProviderRetry:
     """AnthropicProvider retries on rate-limit and timeout (mocked SDK)."""
 
@@ -0,0 +1,241 @@
+"""Tests for offline batch LLM execution (app.llm.batch). No network calls."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.llm.anthropic_provider import AnthropicProvider
+from app.llm.batch import (
+    AnthropicBatchBackend,
+    BatchSession,
+    BatchStore,
+    FileBatchBackend,
+    LLMBatchError,
+    current_batch_session,
+)
+from app.llm.router import ModelRole, clear_provider_cache, get_llm_provider
+
+_SETTINGS = SimpleNamespace(
+    llm_provider="anthropic",
+    llm_api_key="test-key",
+    llm_model_reasoning="claude-3-5-sonnet",
+    llm_model_json="claude-3-5-haiku",
+    llm_model_outreach="claude-3-5-haiku",
+    llm_model_scout="claude-3-5-sonnet",
+    llm_timeout=60.0,
+    llm_max_retries=3,
+)
+
+
+@pytest.fixture(autouse=True)
+def _anthropic_client():
+    clear_provider_cache()
+    with patch("app.llm.anthropic_provider.Anthropic") as mock_anthropic:
+        yield mock_anthropic.return_value
+    clear_provider_cache()
+
+
+def _user_text(params: dict) -> str:
+    return params["messages"][0]["content"]
+
+
+class _MemoryStore(BatchStore):
+    def __init__(self) -> None:
+        self.batches: dict[str, dict[str, str]] = {}
+        self.collected: set[str] = set()
+
+    def find(self, request_hashes):
+        for batch_id, requests in self.batches.items():
+            if batch_id not in self.collected and request_hashes <= set(requests.values()):
+                return batch_id, requests
+        return None
+
+    def save(self, batch_id, requests):
+        self.batches[batch_id] = requests
+
+    def mark_collected(self, batch_id):
+        self.collected.add(batch_id)
+
+
+class TestFileBatchBackend:
+    def test_round_trip_writes_requests_and_results(self, tmp_path):
+        backend = FileBatchBackend(tmp_path, lambda params: params["prompt"].upper())
+        batch_id = backend.submit([("a-0", {"prompt": "x"}), ("b-0", {"prompt": "y"})])
+
+        requests = (tmp_path / f"{batch_id}.requests.jsonl").read_text().splitlines()
+        assert [json.loads(r)["custom_id"] for r in requests] == ["a-0", "b-0"]
+        assert backend.is_done(batch_id)
+        results = backend.results(batch_id)
+        assert results["a-0"].text == "X"
+        assert results["b-0"].text == "Y"
+
+    def test_responder_error_is_recorded_per_request(self, tmp_path):
+        def responder(params):
+            if params["prompt"] == "bad":
+                raise RuntimeError("boom")
+            return "ok"
+
+        backend = FileBatchBackend(tmp_path, responder)
+        batch_id = backend.submit([("a-0", {"prompt": "bad"}), ("b-0", {"prompt": "good"})])
+        backend.is_done(batch_id)
+        results = backend.results(batch_id)
+        assert results["a-0"].error == "boom"
+        assert results["b-0"].text == "ok"
+
+
+class TestBatchSession:
+    def _session(self, tmp_path, responder):
+        backend = FileBatchBackend(tmp_path, responder)
+        return BatchSession(backend, poll_interval=0.0, timeout=5.0)
+
+    def test_calls_from_all_workers_share_one_batch_per_round(self, tmp_path):
+        """Two sequential calls per worker produce two batches; results map back by worker."""
+        session = self._session(tmp_path, lambda params: f"re: {_user_text(params)}")
+
+        def work(company_id):
+            llm = get_llm_provider(ModelRole.JSON, settings=_SETTINGS)
+            first = llm.complete(f"first {company_id}")
+            second = llm.complete(f"second {company_id}")
+            return first, second
+
+        futures = session.run(
+            work, [(1,), (2,), (3,)], keys=["company-1", "company-2", "company-3"]
+        )
+
+        assert [f.result() for f in futures] == [
+            (f"re: first {i}", f"re: second {i}") for i in (1, 2, 3)
+        ]
+        assert session.batches_submitted == 2
+        batch_files = list(tmp_path.glob("*.requests.jsonl"))
+        ids = sorted(
+            json.loads(line)["custom_id"]
+            for path in batch_files
+            for line in path.read_text().splitlines()
+        )
+        assert len(ids) == 6
+        assert all(cid.startswith("company-") for cid in ids)
+
+    def test_workers_finishing_early_do_not_stall_others(self, tmp_path):
+        """A worker that makes no LLM call still lets the remaining calls flush."""
+        session = self._session(tmp_path, lambda params: "done")
+
+        def work(call_llm):
+            if not call_llm:
+                return "skipped"
+            return get_llm_provider(ModelRole.JSON, settings=_SETTINGS).complete("p")
+
+        futures = session.run(work, [(False,), (True,)], keys=["a", "b"])
+        assert [f.result() for f in futures] == ["skipped", "done"]
+
+    def test_failed_request_raises_in_its_worker_only(self, tmp_path):
+        def responder(params):
+            if "bad" in _user_text(params):
+                raise RuntimeError("overloaded")
+            return "ok"
+
+        session = self._session(tmp_path, responder)
+
+        def work(prompt):
+            return get_llm_provider(ModelRole.JSON, settings=_SETTINGS).complete(prompt)
+
+        futures = session.run(work, [("good",), ("bad",)], keys=["a", "b"])
+        assert futures[0].result() == "ok"
+        with pytest.raises(LLMBatchError, match="overloaded"):
+            futures[1].result()
+
+    def test_backend_failure_fails_every_pending_call(self, tmp_path):
+        backend = MagicMock()
+        backend.submit.side_effect = RuntimeError("batch API down")
+        session = BatchSession(backend, poll_interval=0.0, timeout=5.0)
+
+        def work():
+            return get_llm_provider(ModelRole.JSON, settings=_SETTINGS).complete("p")
+
+        futures = session.run(work, [(), ()], keys=["a", "b"])
+        for future in futures:
+            with pytest.raises(LLMBatchError, match="batch API down"):
+                future.result()
+
+    def test_restarted_run_resumes_stored_batch_instead_of_resubmitting(self, tmp_path):
+        """A batch orphaned by a crash is polled again on rerun, not paid for twice."""
+        store = _MemoryStore()
+        backend = FileBatchBackend(tmp_path, lambda params: f"re: {_user_text(params)}")
+        lost = MagicMock(wraps=backend)
+        lost.is_done.side_effect = RuntimeError("worker lost")
+
+        def work(company_id):
+            return get_llm_provider(ModelRole.JSON, settings=_SETTINGS).complete(f"p {company_id}")
+
+        crashed = BatchSession(lost, poll_interval=0.0, timeout=5.0, store=store)
+        for future in crashed.run(work, [(1,), (2,)], keys=["company-1", "company-2"]):
+            with pytest.raises(LLMBatchError, match="worker lost"):
+                future.result()
+        (batch_id,) = store.batches
+
+        resumed_backend = MagicMock(wraps=backend)
+        resumed = BatchSession(resumed_backend, poll_interval=0.0, timeout=5.0, store=store)
+        futures = resumed.run(work, [(2,), (1,)], keys=["company-2", "company-1"])
+
+        assert [f.result() for f in futures] == ["re: p 2", "re: p 1"]
+        resumed_backend.submit.assert_not_called()
+        assert resumed.batches_submitted == 0
+        assert store.collected == {batch_id}
+        assert len(list(tmp_path.glob("*.requests.jsonl"))) == 1
+
+    def test_provider_outside_session_is_not_wrapped(self, _anthropic_client):
+        assert current_batch_session() is None
+        provider = get_llm_provider(ModelRole.JSON, settings=_SETTINGS)
+        assert isinstance(provider, AnthropicProvider)
+
+
+class TestAnthropicBatchBackend:
+    def test_submit_poll_and_map_results(self):
+        client = MagicMock()
+        client.messages.batches.create.return_value = SimpleNamespace(id="msgbatch_1")
+        client.messages.batches.retrieve.return_value = SimpleNamespace(processing_status="ended")
+        client.messages.batches.results.return_value = [
+            SimpleNamespace(
+                custom_id="company-1-0",
+                result=SimpleNamespace(
+                    type="succeeded",
+                    message=SimpleNamespace(content=[SimpleNamespace(type="text", text="hi")]),
+                ),
+            ),
+            SimpleNamespace(
+                custom_id="company-2-1",
+                result=SimpleNamespace(
+                    type="errored",
+                    error=SimpleNamespace(error=SimpleNamespace(message="invalid request")),
+                ),
+            ),
+            SimpleNamespace(custom_id="company-3-2", result=SimpleNamespace(type="expired")),
+        ]
+        backend = AnthropicBatchBackend(client)
+
+        batch_id = backend.submit([("company-1-0", {"model": "m"})])
+        assert batch_id == "msgbatch_1"
+        client.messages.batches.create.assert_called_once_with(
+            requests=[{"custom_id": "company-1-0", "params": {"model": "m"}}]
+        )
+        assert backend.is_done(batch_id)
+        results = backend.results(batch_id)
+        assert results["company-1-0"].text == "hi"
+        assert results["company-2-1"].error == "errored: invalid request"
+        assert results["company-3-2"].error == "expired"
+
+
+def test_build_message_params_matches_sync_request(_anthropic_client):
+    """Batch params are exactly what complete() would send synchronously."""
+    _anthropic_client.messages.create.return_value = SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="ok")]
+    )
+    provider = AnthropicProvider(api_key="k", model="claude-3-5-haiku")
+    params = provider.build_message_params(
+        "a\n<!-- cache-break -->\nb", system_prompt="s", temperature=0.2
+    )
+    provider.complete("a\n<!-- cache-break -->\nb", system_prompt="s", temperature=0.2)
+    assert _anthropic_client.messages.create.call_args.kwargs == params
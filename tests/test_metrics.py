@@ -0,0 +1,102 @@
+"""Tests for Prometheus metrics (app.metrics, GET /metrics)."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.ingestion.ingest import store_raw_events
+from app.llm.anthropic_provider import AnthropicProvider
+from app.metrics import OTHER_HOST, host_label
+from app.services import robots
+from tests.test_constants import TEST_INTERNAL_JOB_TOKEN
+
+
+def _value(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint_requires_token_and_reports_requests(
+    client_with_db: TestClient,
+) -> None:
+    assert client_with_db.get("/metrics").status_code == 422
+    assert client_with_db.get("/metrics", headers={"X-Internal-Token": "wrong"}).status_code == 403
+
+    client_with_db.get("/health")
+    resp = client_with_db.get("/metrics", headers={"X-Internal-Token": TEST_INTERNAL_JOB_TOKEN})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert 'signalforge_http_requests_total{method="GET",route="/health",status="200"}' in resp.text
+    assert "signalforge_db_pool_checkout_seconds_bucket" in resp.text
+
+
+def test_ingest_counts_outcomes_per_source(db: Session) -> None:
+    before = _value("signalforge_ingest_events_total", source="metrics_test", outcome="invalid")
+
+    with patch("app.ingestion.ingest.normalize_raw_event", return_value=None):
+        store_raw_events(db, "metrics_test", [MagicMock(), MagicMock()])
+
+    after = _value("signalforge_ingest_events_total", source="metrics_test", outcome="invalid")
+    assert after - before == 2
+
+
+def test_llm_calls_and_tokens_labelled_by_role() -> None:
+    labels = {"role": "metrics_test"}
+    calls = _value("signalforge_llm_calls_total", outcome="ok", **labels)
+    tokens = _value("signalforge_llm_tokens_total", kind="output", **labels)
+
+    with patch("app.llm.anthropic_provider.Anthropic") as MockAnthropic:
+        MockAnthropic.return_value.messages.create.return_value = SimpleNamespace(
+            content=[SimpleNamespace(type="text", text="ok")], input_tokens=10, output_tokens=5
+        )
+        AnthropicProvider(api_key="k", role="metrics_test").complete("Hi")
+
+    assert _value("signalforge_llm_calls_total", outcome="ok", **labels) - calls == 1
+    assert _value("signalforge_llm_tokens_total", kind="output", **labels) - tokens == 5
+    assert _value("signalforge_llm_request_seconds_count", **labels) >= 1
+
+
+@pytest.mark.asyncio
+async def test_robots_cache_hits_and_misses() -> None:
+    robots.clear_robots_cache()
+    hits = _value("signalforge_cache_requests_total", cache="robots", result="hit")
+    misses = _value("signalforge_cache_requests_total", cache="robots", result="miss")
+
+    async def http_get(url: str) -> str:
+        return "User-agent: *\nDisallow: /private"
+
+    for _ in range(3):
+        await robots.can_fetch("https://metrics.example.com/a", "ua", _http_get=http_get)
+
+    assert _value("signalforge_cache_requests_total", cache="robots", result="miss") - misses == 1
+    assert _value("signalforge_cache_requests_total", cache="robots", result="hit") - hits == 2
+    robots.clear_robots_cache()
+
+
+def test_host_label_caps_distinct_hosts() -> None:
+    with patch.object(get_settings(), "metrics_max_hosts", 0):
+        assert host_label("https://never-seen.example.org/page") == OTHER_HOST
+
+
+def test_multiprocess_mode_sums_across_processes(tmp_path) -> None:
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    increment = "from app.metrics import DERIVE_INSTANCES; DERIVE_INSTANCES.inc(3)"
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", increment], env=env, check=True)
+
+    render = "from app.metrics import render_metrics; print(render_metrics()[0].decode())"
+    out = subprocess.run(
+        [sys.executable, "-c", render], env=env, check=True, capture_output=True, text=True
+    ).stdout
+
+    assert "signalforge_derive_instances_upserted_total 6.0" in out
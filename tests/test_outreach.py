@@ -189,6 +189,29 @@ class TestGenerateOutreachHappyPath:
         call_kwargs = mock_render.call_args[1]
         assert call_kwargs["OFFER_TYPE"] == "fractional CTO services"
 
+    @patch("app.services.outreach.get_llm_provider")
+    @patch("app.services.outreach.resolve_prompt_content")
+    def test_prefetched_operator_profile_skips_db(self, mock_render, mock_get_llm):
+        """Batch briefing passes operator_profile_md and pack; no Session is needed."""
+        mock_llm = MagicMock()
+        mock_get_llm.return_value = mock_llm
+        mock_render.return_value = "prompt"
+        mock_llm.complete.return_value = _VALID_OUTREACH_RESPONSE
+        pack = MagicMock()
+        pack.manifest = {"offer_type": "fractional CTO"}
+
+        result = generate_outreach(
+            None,
+            _make_company(),
+            _make_analysis(),
+            pack=pack,
+            operator_profile_md="# CTO\n15 years experience",
+        )
+
+        assert result["subject"] == "Quick question about your scaling plans"
+        call_kwargs = mock_render.call_args[1]
+        assert call_kwargs["OPERATOR_PROFILE_MARKDOWN"] == "# CTO\n15 years experience"
+
 
 # ---------------------------------------------------------------------------
 # Edge cases
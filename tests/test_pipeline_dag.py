@@ -0,0 +1,244 @@
+"""Tests for the pipeline DAG runner (app.pipeline.dag) and pipelined daily aggregation."""
+
+from __future__ import annotations
+
+import threading
+from datetime import UTC, date, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.ingestion.adapters.test_adapter import TestAdapter
+from app.ingestion.base import SourceAdapter
+from app.models import (
+    Company,
+    EngagementSnapshot,
+    JobRun,
+    ReadinessSnapshot,
+    SignalEvent,
+    SignalInstance,
+)
+from app.pipeline.dag import PipelineDag
+from app.schemas.signal import RawEvent
+from app.services.aggregation.daily_aggregation import run_daily_aggregation
+
+# Test domains used by TestAdapter (same as test_daily_aggregation)
+_TEST_DOMAINS = ("testa.example.com", "testb.example.com", "testc.example.com")
+
+# Fixed date matching TestAdapter event times (2026-02-18) for deterministic scoring
+_AS_OF = date(2026, 2, 18)
+
+
+class _FailingAdapter(SourceAdapter):
+    @property
+    def source_name(self) -> str:
+        return "failing"
+
+    def fetch_events(self, since) -> list[RawEvent]:
+        raise RuntimeError("Adapter fetch failed")
+
+
+@pytest.fixture(autouse=True)
+def _cleanup_test_adapter_data(db: Session) -> None:
+    """Remove test adapter data before each test."""
+    company_ids = [
+        row[0] for row in db.query(Company.id).filter(Company.domain.in_(_TEST_DOMAINS)).all()
+    ]
+    if company_ids:
+        db.query(SignalInstance).filter(SignalInstance.entity_id.in_(company_ids)).delete(
+            synchronize_session="fetch"
+        )
+        db.query(EngagementSnapshot).filter(EngagementSnapshot.company_id.in_(company_ids)).delete(
+            synchronize_session="fetch"
+        )
+        db.query(ReadinessSnapshot).filter(ReadinessSnapshot.company_id.in_(company_ids)).delete(
+            synchronize_session="fetch"
+        )
+    db.query(SignalEvent).filter(SignalEvent.source == "test").delete(synchronize_session="fetch")
+    db.query(Company).filter(Company.domain.in_(_TEST_DOMAINS)).delete(synchronize_session="fetch")
+    db.commit()
+
+
+class TestPipelineDag:
+    def test_runs_in_dependency_order_and_passes_results(self) -> None:
+        dag = PipelineDag(MagicMock())
+        dag.add("a", lambda inputs: 1)
+        dag.add("b", lambda inputs: inputs["a"] + 1, deps=["a"])
+        dag.add("c", lambda inputs: inputs["a"] + inputs["b"], deps=["a", "b"])
+
+        runs = dag.run()
+
+        assert {name: run.result for name, run in runs.items()} == {"a": 1, "b": 2, "c": 3}
+        assert all(run.status == "completed" for run in runs.values())
+
+    def test_add_rejects_duplicate_and_unknown_deps(self) -> None:
+        dag = PipelineDag(MagicMock())
+        dag.add("a", lambda inputs: None)
+        with pytest.raises(ValueError, match="Duplicate"):
+            dag.add("a", lambda inputs: None)
+        with pytest.raises(ValueError, match="unknown"):
+            dag.add("b", lambda inputs: None, deps=["missing"])
+
+    def test_io_nodes_run_concurrently(self) -> None:
+        # Each fetch waits for the other: only passes if both run at once
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(_inputs):
+            barrier.wait()
+            return threading.current_thread().name
+
+        dag = PipelineDag(MagicMock(), max_workers=2)
+        dag.add("fetch:a", fetch, io=True)
+        dag.add("fetch:b", fetch, io=True)
+        runs = dag.run()
+
+        assert [run.status for run in runs.values()] == ["completed", "completed"]
+        assert runs["fetch:a"].result != runs["fetch:b"].result
+
+    def test_failure_skips_dependents_unless_run_on_failure(self) -> None:
+        def boom(_inputs):
+            raise RuntimeError("boom")
+
+        db = MagicMock()
+        dag = PipelineDag(db)
+        dag.add("fetch", boom, io=True)
+        dag.add("stage", lambda inputs: {"status": "failed", "error": "bad"})
+        dag.add("after_fetch", lambda inputs: "x", deps=["fetch"])
+        dag.add("after_stage", lambda inputs: "x", deps=["stage"])
+        dag.add(
+            "final", lambda inputs: sorted(inputs), deps=["fetch", "stage"], run_on_failure=True
+        )
+
+        runs = dag.run()
+
+        assert (runs["fetch"].status, runs["fetch"].error) == ("failed", "boom")
+        assert (runs["stage"].status, runs["stage"].error) == ("failed", "bad")
+        assert runs["after_fetch"].status == "skipped"
+        assert runs["after_stage"].status == "skipped"
+        assert (runs["final"].status, runs["final"].result) == ("completed", ["fetch", "stage"])
+
+    def test_records_child_job_runs(self, db: Session, fractional_cto_pack_id) -> None:
+        parent = JobRun(
+            job_type="daily_aggregation", status="running", pack_id=fractional_cto_pack_id
+        )
+        db.add(parent)
+        db.commit()
+
+        dag = PipelineDag(db, parent=parent)
+        dag.add("one", lambda inputs: None)
+        dag.add("two", lambda inputs: None, deps=["one"])
+        runs = dag.run()
+
+        children = db.query(JobRun).filter(JobRun.parent_id == parent.id).order_by(JobRun.id).all()
+        assert [(c.job_type, c.status) for c in children] == [
+            ("one", "completed"),
+            ("two", "completed"),
+        ]
+        assert [c.id for c in children] == [runs["one"].job_run_id, runs["two"].job_run_id]
+        assert all(c.pack_id == fractional_cto_pack_id for c in children)
+        assert all(c.finished_at >= c.started_at for c in children)
+
+
+class TestPipelinedDailyAggregation:
+    def test_pipelined_run_scores_partitions_and_records_nodes(
+        self, db: Session, fractional_cto_pack_id, core_pack_id
+    ) -> None:
+        with (
+            patch(
+                "app.services.ingestion.ingest_daily._get_adapters",
+                return_value=[TestAdapter(), _FailingAdapter()],
+            ),
+            patch("app.services.readiness.score_nightly.date") as mock_date,
+            patch("app.services.aggregation.daily_aggregation.date") as mock_date_da,
+        ):
+            mock_date.today.return_value = _AS_OF
+            mock_date_da.today.return_value = _AS_OF
+            result = run_daily_aggregation(db, pack_id=fractional_cto_pack_id, mode="pipelined")
+
+        assert result["status"] == "completed"
+        assert result["mode"] == "pipelined"
+        assert result["ingest_result"]["inserted"] == 3
+        assert result["ingest_result"]["errors_count"] == 1
+        assert "failing: Adapter fetch failed" in result["ingest_result"]["error"]
+        assert result["derive_result"]["status"] == "completed"
+        assert result["derive_result"]["instances_upserted"] >= 1
+        assert result["score_result"]["partitions_scored"] >= 1
+        assert result["ranked_count"] >= 1
+
+        nodes = result["nodes"]
+        assert {name: node["status"] for name, node in nodes.items()} == {
+            "fetch:test": "completed",
+            "store:test": "completed",
+            "derive:test": "completed",
+            "score:test": "completed",
+            "fetch:failing": "failed",
+            "store:failing": "skipped",
+            "derive:failing": "skipped",
+            "score:failing": "skipped",
+            "derive": "completed",
+            "score": "completed",
+        }
+        children = db.query(JobRun).filter(JobRun.parent_id == result["job_run_id"]).all()
+        assert {c.id for c in children} == {node["job_run_id"] for node in nodes.values()}
+
+        company_ids = [
+            c.id for c in db.query(Company).filter(Company.domain.in_(_TEST_DOMAINS)).all()
+        ]
+        snapshots = (
+            db.query(ReadinessSnapshot)
+            .filter(
+                ReadinessSnapshot.company_id.in_(company_ids),
+                ReadinessSnapshot.as_of == _AS_OF,
+                ReadinessSnapshot.pack_id == fractional_cto_pack_id,
+            )
+            .count()
+        )
+        assert snapshots >= 1
+        assert db.get(JobRun, result["score_result"]["job_run_id"]).job_type == "score"
+        assert (
+            db.query(JobRun)
+            .filter(JobRun.job_type == "score_partition", JobRun.id > result["job_run_id"])
+            .count()
+            == 1
+        )
+
+    def test_pipelined_run_derives_events_stored_outside_ingest(
+        self, db: Session, fractional_cto_pack_id, core_pack_id
+    ) -> None:
+        """Events from scans, /internal evidence or the watchlist seed are derived too."""
+        company = Company(name="External Evidence Co", domain="external-evidence.example.com")
+        db.add(company)
+        db.flush()
+        db.add(
+            SignalEvent(
+                company_id=company.id,
+                source="manual",
+                event_type="funding_raised",
+                event_time=datetime(2026, 2, 10, tzinfo=UTC),
+                confidence=0.9,
+                pack_id=fractional_cto_pack_id,
+            )
+        )
+        db.commit()
+
+        with patch(
+            "app.services.ingestion.ingest_daily._get_adapters", return_value=[TestAdapter()]
+        ):
+            result = run_daily_aggregation(db, pack_id=fractional_cto_pack_id, mode="pipelined")
+
+        assert result["nodes"]["derive"]["status"] == "completed"
+        instance = (
+            db.query(SignalInstance)
+            .filter(
+                SignalInstance.entity_id == company.id,
+                SignalInstance.signal_id == "funding_raised",
+                SignalInstance.pack_id == core_pack_id,
+            )
+            .one_or_none()
+        )
+        assert instance is not None
+
+    def test_unknown_mode_raises(self, db: Session) -> None:
+        with pytest.raises(ValueError, match="mode must be one of"):
+            run_daily_aggregation(db, mode="parallel")
@@ -6,10 +6,12 @@ import pytest
 
 from app.prompts.loader import (
     _PLACEHOLDER_RE,
+    CACHE_BREAK_MARKER,
     load_prompt,
     load_prompt_from_pack,
     render_prompt,
     resolve_prompt_content,
+    split_cache_prefix,
 )
 
 # ---------------------------------------------------------------------------
@@ -359,3 +361,93 @@ def test_pack_ore_outreach_v1_override_includes_required_placeholders() -> None:
             f"Pack {pack_dir.name} overrides ore_outreach_v1 but is missing required placeholders: {sorted(missing)}. "
             "See docs/Outreach-Recommendation-Engine-ORE-design-spec.md: pack overrides must include {{TONE_INSTRUCTION}} and all app placeholders."
         )
+
+
+# ---------------------------------------------------------------------------
+# Prompt caching: cache-break marker
+# ---------------------------------------------------------------------------
+
+CACHE_SPLIT_TEMPLATES = [
+    "stage_classification_v1",
+    "pain_signals_v1",
+    "briefing_entry_v1",
+    "outreach_v1",
+    "ore_outreach_v1",
+]
+
+
+@pytest.mark.parametrize("template_name", CACHE_SPLIT_TEMPLATES)
+def test_cache_split_prefix_is_static(template_name: str) -> None:
+    """Static prefix only holds deployment-level placeholders (operator profile, offer type)."""
+    template = load_prompt(template_name)
+    assert template.count(CACHE_BREAK_MARKER) == 1
+    prefix, _ = split_cache_prefix(template)
+    assert set(_PLACEHOLDER_RE.findall(prefix)) <= {"OPERATOR_PROFILE_MARKDOWN", "OFFER_TYPE"}
+
+
+@pytest.mark.parametrize("template_name", CACHE_SPLIT_TEMPLATES)
+def test_cache_split_round_trips_to_default_render(template_name: str) -> None:
+    """prefix + suffix of a cache_split render equals the default (marker-free) render."""
+    placeholders = set(_PLACEHOLDER_RE.findall(load_prompt(template_name)))
+    variables = {name: f"<{name}>" for name in placeholders}
+    plain = resolve_prompt_content(template_name, None, **variables)
+    split = resolve_prompt_content(template_name, None, cache_split=True, **variables)
+
+    assert CACHE_BREAK_MARKER not in plain
+    assert CACHE_BREAK_MARKER in split
+    prefix, suffix = split_cache_prefix(split)
+    assert prefix
+    assert prefix + suffix == plain
+
+
+def test_render_prompt_strips_cache_break() -> None:
+    variables = dict.fromkeys(TEMPLATE_PLACEHOLDERS["briefing_entry_v1"], "x")
+    assert CACHE_BREAK_MARKER not in render_prompt("briefing_entry_v1", **variables)
+
+
+def test_split_cache_prefix_without_marker() -> None:
+    assert split_cache_prefix("plain prompt") == ("", "plain prompt")
+
+
+# ---------------------------------------------------------------------------
+# Compiled template cache
+# ---------------------------------------------------------------------------
+
+
+def test_pack_template_is_recompiled_when_file_changes(tmp_path) -> None:
+    """Pack prompt files are cached per (path, mtime) and reloaded after an edit."""
+    import os
+
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir()
+    path = prompts_dir / "custom_v1.md"
+    path.write_text("Hello {{NAME}}", encoding="utf-8")
+    assert load_prompt_from_pack(tmp_path, "custom_v1") == "Hello {{NAME}}"
+
+    with patch("pathlib.Path.read_text", side_effect=AssertionError("re-read")):
+        assert load_prompt_from_pack(tmp_path, "custom_v1") == "Hello {{NAME}}"
+
+    path.write_text("Bye {{NAME}}", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_prompt_from_pack(tmp_path, "custom_v1") == "Bye {{NAME}}"
+
+
+def test_render_inserts_values_verbatim() -> None:
+    """Values are not rescanned: placeholder-like text in a value is kept as-is."""
+    variables = {name: f"<{name}>" for name in TEMPLATE_PLACEHOLDERS["pain_signals_v1"]}
+    variables["COMPANY_NOTES"] = "notes mention {{SIGNALS_TEXT}} literally"
+    result = render_prompt("pain_signals_v1", **variables)
+    assert "notes mention {{SIGNALS_TEXT}} literally" in result
+    assert "<SIGNALS_TEXT>" in result
+
+
+def test_render_matches_sequential_replacement() -> None:
+    """Single-join render equals the old replace-per-variable output for every template."""
+    for template_name in TEMPLATE_PLACEHOLDERS:
+        template = load_prompt(template_name).replace(f"{CACHE_BREAK_MARKER}\n", "")
+        variables = {name: f"<{name.lower()}>" for name in TEMPLATE_PLACEHOLDERS[template_name]}
+        expected = template
+        for name, value in variables.items():
+            expected = expected.replace(f"{{{{{name}}}}}", value)
+        assert render_prompt(template_name, **variables) == expected
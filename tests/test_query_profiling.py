@@ -0,0 +1,138 @@
+"""Tests for SQL statement counting and slow-query profiling (app.db.profiling)."""
+
+from __future__ import annotations
+
+import logging
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.api.middleware import route_template
+from app.config import get_settings
+from app.db.profiling import fingerprint, query_profile, track_queries
+from app.models import JobRun
+from app.pipeline.executor import run_stage
+from tests.test_constants import TEST_INTERNAL_JOB_TOKEN
+
+
+@pytest.fixture(autouse=True)
+def _reset_query_profile() -> None:
+    query_profile.reset()
+    yield
+    query_profile.reset()
+
+
+class TestFingerprint:
+    def test_replaces_literals_and_params(self) -> None:
+        sql = "SELECT * FROM companies\n  WHERE name = 'O''Brien' AND id > 42 AND x = %(x_1)s"
+        assert fingerprint(sql) == "SELECT * FROM companies WHERE name = ? AND id > ? AND x = ?"
+
+    def test_collapses_in_and_values_lists(self) -> None:
+        assert fingerprint("SELECT id FROM t WHERE id IN (%(id_1_1)s, %(id_1_2)s, %(id_1_3)s)") == (
+            "SELECT id FROM t WHERE id IN (...)"
+        )
+        assert fingerprint("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)") == (
+            "INSERT INTO t (a, b) VALUES (...)"
+        )
+
+    def test_keeps_identifiers_and_casts(self) -> None:
+        sql = "SELECT job_runs_2.id, CAST(x AS VARCHAR(32))::text FROM job_runs_2"
+        assert (
+            fingerprint(sql) == "SELECT job_runs_2.id, CAST(x AS VARCHAR(?))::text FROM job_runs_2"
+        )
+
+
+class TestTrackQueries:
+    def test_counts_statements_in_nested_blocks(self, db: Session) -> None:
+        db.execute(text("SELECT 0"))  # begin the test savepoint outside the blocks
+        with track_queries() as outer:
+            db.execute(text("SELECT 1"))
+            with track_queries() as inner:
+                db.execute(text("SELECT 2"))
+                db.execute(text("SELECT 3"))
+        db.execute(text("SELECT 4"))
+
+        assert (outer.count, inner.count) == (3, 2)
+        assert outer.db_ms >= inner.db_ms > 0
+
+    def test_slow_statement_logged_by_fingerprint(
+        self, db: Session, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        with (
+            patch.object(get_settings(), "slow_query_ms", 5),
+            caplog.at_level(logging.WARNING, logger="app.db.profiling"),
+            track_queries() as stats,
+        ):
+            db.execute(text("SELECT pg_sleep(0.02), 'secret'"))
+            db.execute(text("SELECT 1"))
+
+        assert stats.slow == 1
+        assert "Slow query" in caplog.text and "'secret'" not in caplog.text
+        [slow] = query_profile.snapshot()["slow_queries"]
+        assert slow["fingerprint"] == "SELECT pg_sleep(?), ?"
+        assert slow["count"] == 1 and slow["max_ms"] >= 5
+
+
+def test_route_template_restores_router_prefix() -> None:
+    class Route:
+        path_format = "/{company_id}"
+
+    scope = {"route": Route(), "path": "/api/companies/7", "path_params": {"company_id": "7"}}
+    assert route_template(scope) == "/api/companies/{company_id}"
+    assert route_template({"path": "/nope"}) == "<unmatched>"
+
+
+def test_run_stage_stores_query_stats_on_job_run(db: Session, fractional_cto_pack_id) -> None:
+    result = run_stage(
+        db, "update_lead_feed", pack_id=fractional_cto_pack_id, check_rate_limit=False
+    )
+
+    job = db.get(JobRun, result["job_run_id"])
+    db.refresh(job)
+    assert job.query_count > 0
+    assert job.db_time_ms is not None
+
+
+def test_middleware_aggregates_per_route(client_with_db: TestClient, db: Session) -> None:
+    from app.api.deps import require_auth
+    from app.main import app
+
+    job = JobRun(job_type="score", status="completed", query_count=12, db_time_ms=34)
+    db.add(job)
+    db.commit()
+
+    app.dependency_overrides[require_auth] = lambda: None
+    try:
+        assert client_with_db.get("/api/companies/999999999").status_code == 404
+        client_with_db.get("/api/companies/999999998")
+    finally:
+        app.dependency_overrides.pop(require_auth, None)
+
+    resp = client_with_db.get(
+        "/internal/query_stats", headers={"X-Internal-Token": TEST_INTERNAL_JOB_TOKEN}
+    )
+    assert resp.status_code == 200
+    data = resp.json()
+    [route] = [r for r in data["routes"] if r["route"] == "GET /api/companies/{company_id}"]
+    assert route["requests"] == 2
+    assert route["statements"] >= 2
+    assert data["jobs"][0] == {
+        "job_run_id": job.id,
+        "job_type": "score",
+        "status": "completed",
+        "started_at": job.started_at.isoformat(),
+        "finished_at": None,
+        "query_count": 12,
+        "db_time_ms": 34,
+    }
+
+    client_with_db.get(
+        "/internal/query_stats",
+        params={"reset": True},
+        headers={"X-Internal-Token": TEST_INTERNAL_JOB_TOKEN},
+    )
+    # Only the resetting request itself, recorded after the reset
+    assert [r["route"] for r in query_profile.snapshot()["routes"]] == ["GET /internal/query_stats"]
@@ -315,19 +315,22 @@ def _make_mock_user() -> MagicMock:
 @pytest.fixture
 def api_client_with_auth(db: Session) -> TestClient:
     """TestClient with real db and auth override for /api/companies/top."""
-    from app.api.deps import require_auth
-    from app.db.session import get_db
+    from app.api.deps import require_auth_async
+    from app.db.session import get_async_db, get_db
     from app.main import app
+    from tests.test_async_db import async_db_override
 
     def override_get_db():
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
-    app.dependency_overrides[require_auth] = lambda: _make_mock_user()
+    app.dependency_overrides[get_async_db] = async_db_override(db)
+    app.dependency_overrides[require_auth_async] = lambda: _make_mock_user()
     client = TestClient(app)
     yield client
     app.dependency_overrides.pop(get_db, None)
-    app.dependency_overrides.pop(require_auth, None)
+    app.dependency_overrides.pop(get_async_db, None)
+    app.dependency_overrides.pop(require_auth_async, None)
 
 
 def test_api_companies_top_returns_sorted_list(
@@ -470,7 +473,7 @@ def test_api_companies_top_since_limit_params(api_client_with_auth: TestClient)
     from unittest.mock import patch
 
     with patch(
-        "app.api.companies.get_ranked_companies_for_api",
+        "app.api.companies.get_ranked_companies_for_api_async",
         return_value=[
             RankedCompanyTop(
                 company_id=1,
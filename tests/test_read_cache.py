@@ -0,0 +1,192 @@
+"""Tests for the read API response cache (app.services.read_cache, app.api.caching)."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.caching import etag_matches, make_etag
+from app.models import AnalysisRecord, Company
+from app.schemas.ranked_companies import RankedCompanyTop
+from app.services.lead_feed.run_update import run_update_lead_feed
+from app.services.outreach_history import create_outreach_record
+from app.services.read_cache import (
+    ResponseCache,
+    bump_read_generation,
+    get_read_generation,
+    response_cache,
+)
+from app.services.scan_orchestrator import run_scan_company_with_job
+
+
+def _briefing_data() -> dict:
+    return {"items": [], "emerging_companies": [], "display_scores": {}, "esl_by_company": {}}
+
+
+def _top_company() -> RankedCompanyTop:
+    return RankedCompanyTop(
+        company_id=1,
+        company_name="Cached Co",
+        website_url=None,
+        composite_score=80,
+        recommendation_band="WATCH",
+        top_signals=[],
+    )
+
+
+@pytest.fixture
+def api_client(client_with_db: TestClient) -> TestClient:
+    from app.api.deps import require_auth, require_auth_async
+    from app.main import app
+
+    app.dependency_overrides[require_auth] = lambda: None
+    app.dependency_overrides[require_auth_async] = lambda: None
+    yield client_with_db
+    app.dependency_overrides.pop(require_auth, None)
+    app.dependency_overrides.pop(require_auth_async, None)
+
+
+class TestGeneration:
+    def test_bump_increments_from_zero(self, db: Session) -> None:
+        before = get_read_generation(db)
+        bump_read_generation(db)
+        bump_read_generation(db)
+        assert get_read_generation(db) == before + 2
+        assert get_read_generation(db, scope="other") == 0
+
+    def test_jobs_and_outreach_bump(self, db: Session, fractional_cto_pack_id) -> None:
+        before = get_read_generation(db)
+        assert run_update_lead_feed(db, pack_id=fractional_cto_pack_id)["status"] == "completed"
+        assert get_read_generation(db) == before + 1
+
+        company = Company(name="ReadCacheOutreach")
+        db.add(company)
+        db.commit()
+        create_outreach_record(
+            db, company_id=company.id, sent_at=datetime.now(UTC), outreach_type="email"
+        )
+        assert get_read_generation(db) == before + 2
+
+
+class TestResponseCache:
+    def test_misses_on_other_generation_and_evicts_lru(self) -> None:
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", 1, b"A")
+        cache.put("b", 1, b"B")
+        assert cache.get("a", 1) == b"A"
+        assert cache.get("a", 2) is None
+
+        cache.put("c", 1, b"C")  # evicts b, the least recently used
+        assert cache.get("b", 1) is None
+        assert (cache.get("a", 1), cache.get("c", 1)) == (b"A", b"C")
+
+    def test_zero_max_entries_stores_nothing(self) -> None:
+        cache = ResponseCache(max_entries=0)
+        cache.put("a", 1, b"A")
+        assert len(cache) == 0
+
+    def test_etag_matching(self) -> None:
+        etag = make_etag(("top", None), 3)
+        assert etag.startswith('W/"')
+        assert etag != make_etag(("top", None), 4)
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", {etag.removeprefix("W/")}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+        assert not etag_matches('"other"', etag)
+
+
+class TestCachedEndpoints:
+    def test_companies_top_served_from_cache_and_304(
+        self, api_client: TestClient, db: Session
+    ) -> None:
+        with patch(
+            "app.api.companies.get_ranked_companies_for_api_async",
+            new=AsyncMock(return_value=[_top_company()]),
+        ) as mock_ranked:
+            first = api_client.get("/api/companies/top", params={"limit": 5})
+            assert first.status_code == 200
+            assert first.json()["companies"][0]["company_name"] == "Cached Co"
+            etag = first.headers["etag"]
+            assert first.headers["cache-control"] == "private, no-cache"
+
+            assert api_client.get("/api/companies/top", params={"limit": 5}).json() == (
+                first.json()
+            )
+            not_modified = api_client.get(
+                "/api/companies/top", params={"limit": 5}, headers={"If-None-Match": etag}
+            )
+            assert not_modified.status_code == 304
+            assert not_modified.headers["etag"] == etag
+            assert mock_ranked.await_count == 1
+
+            # Other params are a separate entry
+            api_client.get("/api/companies/top", params={"limit": 6})
+            assert mock_ranked.await_count == 2
+
+            bump_read_generation(db)
+            changed = api_client.get(
+                "/api/companies/top", params={"limit": 5}, headers={"If-None-Match": etag}
+            )
+            assert changed.status_code == 200
+            assert changed.headers["etag"] != etag
+            assert mock_ranked.await_count == 3
+
+    def test_briefing_daily_cached_per_date_and_sort(
+        self, api_client: TestClient, db: Session
+    ) -> None:
+        with patch(
+            "app.api.briefing.get_briefing_data_async",
+            new=AsyncMock(return_value=_briefing_data()),
+        ) as mock_data:
+            params = {"date": date(2026, 3, 1).isoformat()}
+            first = api_client.get("/api/briefing/daily", params=params)
+            assert first.status_code == 200
+            assert first.json()["date"] == "2026-03-01"
+            api_client.get("/api/briefing/daily", params=params)
+            assert mock_data.await_count == 1
+
+            api_client.get("/api/briefing/daily", params={**params, "sort": "recent"})
+            assert mock_data.await_count == 2
+
+            etag = first.headers["etag"]
+            bump_read_generation(db)
+            resp = api_client.get(
+                "/api/briefing/daily", params=params, headers={"If-None-Match": etag}
+            )
+            assert resp.status_code == 200
+            assert mock_data.await_count == 3
+            assert len(response_cache) == 2  # the new generation replaced the stale entry
+
+    def test_company_rescan_invalidates_briefing_etag(
+        self, api_client: TestClient, db: Session
+    ) -> None:
+        company = Company(name="RescanCache", website_url="https://rescan-cache.example.com")
+        db.add(company)
+        db.commit()
+        analysis = AnalysisRecord(
+            company_id=company.id, stage="scaling_team", pain_signals_json={"signals": {}}
+        )
+        with patch(
+            "app.api.briefing.get_briefing_data_async",
+            new=AsyncMock(return_value=_briefing_data()),
+        ):
+            etag = api_client.get("/api/briefing/daily").headers["etag"]
+            with (
+                patch(
+                    "app.services.scan_orchestrator.run_scan_company",
+                    new=AsyncMock(return_value=0),
+                ),
+                patch("app.services.scan_orchestrator.analyze_company", return_value=analysis),
+            ):
+                job = asyncio.run(run_scan_company_with_job(db, company.id))
+            assert job.status == "completed"
+
+            resp = api_client.get("/api/briefing/daily", headers={"If-None-Match": etag})
+            assert resp.status_code == 200
+            assert resp.headers["etag"] != etag
@@ -0,0 +1,180 @@
+"""Tests for historical readiness backfill (app.services.readiness.backfill)."""
+
+from __future__ import annotations
+
+from datetime import UTC, date, datetime, timedelta
+from types import SimpleNamespace
+
+from sqlalchemy.orm import Session
+
+from app.db.profiling import track_queries
+from app.models import Company, JobRun, ReadinessSnapshot, SignalEvent, SignalInstance
+from app.pipeline.executor import run_stage
+from app.services.pack_resolver import get_core_pack_id
+from app.services.readiness.backfill import iter_window_events, run_readiness_backfill
+from app.services.readiness.snapshot_writer import write_readiness_snapshot
+
+START = date(2026, 2, 1)
+END = START + timedelta(days=4)
+
+
+def _at(day: date, hour: int = 12) -> datetime:
+    return datetime.combine(day, datetime.min.time(), tzinfo=UTC) + timedelta(hours=hour)
+
+
+def test_iter_window_events_slides_365_day_window() -> None:
+    events = [
+        SimpleNamespace(event_type="a", event_time=_at(START + timedelta(days=2))),
+        SimpleNamespace(event_type="b", event_time=_at(START, hour=3)),
+        SimpleNamespace(event_type="c", event_time=_at(START, hour=9)),
+        SimpleNamespace(event_type="d", event_time=_at(START - timedelta(days=365))),
+        SimpleNamespace(event_type="e", event_time=None),
+    ]
+    windows = dict(iter_window_events(events, [START, START + timedelta(days=1), END]))
+    # Same-day events keep their input order
+    assert [ev.event_type for ev in windows[START]] == ["b", "c", "d"]
+    assert [ev.event_type for ev in windows[START + timedelta(days=1)]] == ["b", "c"]
+    assert [ev.event_type for ev in windows[END]] == ["a", "b", "c"]
+
+
+def _seed_company(db: Session, name: str, pack_id) -> Company:
+    company = Company(name=name, website_url=f"https://{name.lower()}.example.com")
+    db.add(company)
+    db.flush()
+    for days_ago, etype, conf in [
+        (0, "cto_role_posted", 0.9),
+        (2, "job_posted_infra", 0.8),
+        (40, "funding_raised", 0.95),
+        (119, "api_launched", None),
+        (200, "compliance_mentioned", 0.6),
+        (364, "enterprise_customer", 0.7),
+    ]:
+        db.add(
+            SignalEvent(
+                company_id=company.id,
+                source="test",
+                event_type=etype,
+                event_time=_at(START - timedelta(days=days_ago)),
+                confidence=conf,
+                pack_id=pack_id,
+            )
+        )
+    db.commit()
+    return company
+
+
+def test_backfill_matches_daily_snapshot_writer(db: Session, fractional_cto_pack_id) -> None:
+    """Each backfilled day equals write_readiness_snapshot run day by day (incl. delta_1d)."""
+    companies = [_seed_company(db, f"Backfill{i}", fractional_cto_pack_id) for i in range(2)]
+    ids = [c.id for c in companies]
+
+    result = run_readiness_backfill(db, START, END, pack_id=fractional_cto_pack_id, company_ids=ids)
+    assert result["status"] == "completed"
+    assert result["days"] == 5
+    assert result["companies_processed"] == 2
+    assert result["snapshots_written"] == 10
+    job = db.query(JobRun).filter(JobRun.id == result["job_run_id"]).one()
+    assert job.job_type == "readiness_backfill"
+    assert job.status == "completed"
+
+    def snapshots():
+        return {
+            (s.company_id, s.as_of): (s.momentum, s.pressure, s.composite, s.explain)
+            for s in db.query(ReadinessSnapshot).filter(ReadinessSnapshot.company_id.in_(ids))
+        }
+
+    backfilled = snapshots()
+    db.query(ReadinessSnapshot).filter(ReadinessSnapshot.company_id.in_(ids)).delete()
+    db.commit()
+
+    core_pack_id = get_core_pack_id(db)
+    for offset in range(5):
+        for company_id in ids:
+            write_readiness_snapshot(
+                db,
+                company_id,
+                START + timedelta(days=offset),
+                pack_id=fractional_cto_pack_id,
+                core_pack_id=core_pack_id,
+            )
+    assert snapshots() == backfilled
+    assert any(explain["delta_1d"] != 0 for *_, explain in backfilled.values())
+
+
+def test_backfill_loads_core_events_per_chunk_not_per_company(
+    db: Session, fractional_cto_pack_id, core_pack_id
+) -> None:
+    """Statement count does not grow with the number of companies on the core path."""
+    ids = []
+    for i in range(4):
+        company = Company(name=f"BackfillCore{i}", website_url=f"https://bfcore{i}.example.com")
+        db.add(company)
+        db.flush()
+        db.add(
+            SignalInstance(
+                entity_id=company.id,
+                signal_id="cto_role_posted",
+                pack_id=core_pack_id,
+                last_seen=_at(START - timedelta(days=10 + i)),
+                confidence=0.9,
+            )
+        )
+        ids.append(company.id)
+    db.commit()
+
+    def statements(company_ids: list[int]) -> int:
+        with track_queries() as queries:
+            result = run_readiness_backfill(
+                db, START, END, pack_id=fractional_cto_pack_id, company_ids=company_ids
+            )
+        assert result["companies_processed"] == len(company_ids)
+        return queries.count
+
+    assert statements(ids[:1]) == statements(ids)
+
+
+def test_backfill_seeds_delta_from_stored_previous_day(db: Session, fractional_cto_pack_id) -> None:
+    company = _seed_company(db, "BackfillPrev", fractional_cto_pack_id)
+    db.add(
+        ReadinessSnapshot(
+            company_id=company.id,
+            as_of=START - timedelta(days=1),
+            momentum=0,
+            complexity=0,
+            pressure=0,
+            leadership_gap=0,
+            composite=5,
+            pack_id=fractional_cto_pack_id,
+        )
+    )
+    db.commit()
+
+    run_readiness_backfill(
+        db, START, START, pack_id=fractional_cto_pack_id, company_ids=[company.id]
+    )
+    snapshot = (
+        db.query(ReadinessSnapshot)
+        .filter(ReadinessSnapshot.company_id == company.id, ReadinessSnapshot.as_of == START)
+        .one()
+    )
+    assert snapshot.explain["delta_1d"] == snapshot.composite - 5
+
+
+def test_backfill_rejects_inverted_range(db: Session, fractional_cto_pack_id) -> None:
+    result = run_readiness_backfill(db, END, START, pack_id=fractional_cto_pack_id)
+    assert result["status"] == "failed"
+    assert "end must not be before start" in result["error"]
+
+
+def test_run_stage_readiness_backfill(db: Session, fractional_cto_pack_id) -> None:
+    company = _seed_company(db, "BackfillStage", fractional_cto_pack_id)
+    result = run_stage(
+        db,
+        job_type="readiness_backfill",
+        pack_id=fractional_cto_pack_id,
+        start=START,
+        end=START + timedelta(days=1),
+        company_ids=[company.id],
+    )
+    assert result["status"] == "completed"
+    assert result["snapshots_written"] == 2
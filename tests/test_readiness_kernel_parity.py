@@ -0,0 +1,251 @@
+"""Parity: single-pass readiness kernel vs per-dimension reference functions.
+
+compute_readiness runs the precompiled ScoringProfile kernel. These tests rebuild
+the previous multi-pass composition from the public dimension calculators and
+require identical snapshots (including float contribution points) across seeded
+random event sets, every shipped pack, and edge-case scoring configs.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.packs.loader import get_pack_dir, load_pack
+from app.services.readiness.readiness_engine import (
+    _check_disqualifier_signals,
+    _has_funding_in_window,
+    apply_global_suppressors,
+    build_explain_payload,
+    compute_complexity,
+    compute_composite,
+    compute_event_contributions,
+    compute_leadership_gap,
+    compute_momentum,
+    compute_pressure,
+    compute_readiness,
+)
+from app.services.readiness.scoring_constants import QUIET_SIGNAL_AMPLIFIED_BASE, from_pack
+from app.services.readiness.scoring_profile import (
+    ScoringProfile,
+    clear_scoring_profile_cache,
+    get_scoring_profile,
+)
+
+AS_OF = date(2026, 3, 1)
+
+EVENT_TYPES = [
+    "funding_raised",
+    "job_posted_engineering",
+    "job_posted_infra",
+    "headcount_growth",
+    "launch_major",
+    "api_launched",
+    "ai_feature_launched",
+    "enterprise_feature",
+    "compliance_mentioned",
+    "enterprise_customer",
+    "regulatory_deadline",
+    "founder_urgency_language",
+    "revenue_milestone",
+    "cto_role_posted",
+    "fractional_request",
+    "advisor_request",
+    "no_cto_detected",
+    "cto_hired",
+    "repo_activity",
+    "unknown_type",
+]
+
+
+@dataclass
+class _Event:
+    event_type: Any
+    event_time: Any
+    confidence: float | None
+    source: str | None = None
+    url: str | None = None
+
+
+def _reference_readiness(
+    events: list[Any],
+    as_of: date,
+    company_status: str | None = None,
+    top_events_limit: int = 8,
+    pack: Any = None,
+) -> dict[str, Any]:
+    """compute_readiness as composed before the single-pass kernel."""
+    _cfg = from_pack(pack.scoring) if pack is not None else None
+    M = compute_momentum(events, as_of, _cfg=_cfg)
+    C = compute_complexity(events, as_of, _cfg=_cfg)
+    P = compute_pressure(events, as_of, _cfg=_cfg)
+    G = compute_leadership_gap(events, as_of, _cfg=_cfg)
+    M, C, P, G, suppressors_applied = apply_global_suppressors(M, C, P, G, company_status)
+    R = compute_composite(M, C, P, G, _cfg=_cfg)
+    disqualified, disqualifiers_applied = _check_disqualifier_signals(events, as_of, _cfg)
+    if disqualified:
+        R = 0
+    top_events = compute_event_contributions(events, as_of, limit=top_events_limit, _cfg=_cfg)
+    has_funding = _has_funding_in_window(events, as_of, _cfg=_cfg)
+    quiet_base = (_cfg or {}).get("quiet_signal_amplified_base", QUIET_SIGNAL_AMPLIFIED_BASE)
+    present = {getattr(ev, "event_type", "") for ev in events}
+    quiet_amplified = [t for t in quiet_base if t in present] if not has_funding else []
+    explain = build_explain_payload(
+        M,
+        C,
+        P,
+        G,
+        R,
+        top_events,
+        suppressors_applied,
+        quiet_amplified,
+        disqualifiers_applied=disqualifiers_applied or None,
+        _cfg=_cfg,
+    )
+    return {
+        "momentum": M,
+        "complexity": C,
+        "pressure": P,
+        "leadership_gap": G,
+        "composite": R,
+        "explain": explain,
+    }
+
+
+def _random_events(rng: random.Random, n: int) -> list[_Event]:
+    events = []
+    for i in range(n):
+        days = rng.choice(
+            [rng.randint(0, 130), rng.randint(0, 420), rng.randint(9990, 10010), 30, 60, 90, 120]
+        )
+        when = datetime.combine(AS_OF, datetime.min.time(), tzinfo=UTC) - timedelta(
+            days=days, hours=rng.randint(0, 23)
+        )
+        if rng.random() < 0.1:
+            when = when.date()  # date-only event_time
+        if rng.random() < 0.03:
+            when = None
+        confidence = rng.choice([None, 0.0, 0.35, 0.7, 0.91, 1.0, 1.4, rng.random()])
+        events.append(
+            _Event(
+                event_type=rng.choice(EVENT_TYPES),
+                event_time=when,
+                confidence=confidence,
+                source=rng.choice([None, "crunchbase", "news"]),
+                url=f"https://example.com/{i}",
+            )
+        )
+    return events
+
+
+def _shipped_packs() -> list[Any]:
+    packs = []
+    for pack_id in (
+        "example_v1",
+        "example_v2",
+        "fractional_cto_v1",
+        "fractional_cfo_v1",
+        "fractional_cmo_v1",
+        "fractional_coo_v1",
+    ):
+        if (get_pack_dir(pack_id) / "pack.json").exists():
+            packs.append(load_pack(pack_id, "1"))
+    return packs
+
+
+_EDGE_SCORING = {
+    "base_scores": {
+        "momentum": {"funding_raised": 40, "job_posted_infra": 12, "repo_activity": 7},
+        "complexity": {"api_launched": 25, "job_posted_infra": 10, "compliance_mentioned": 15},
+        "pressure": {"founder_urgency_language": 18, "funding_raised": 20},
+        "leadership_gap": {"cto_role_posted": 70, "no_cto_detected": 40, "cto_hired": 10},
+    },
+    "quiet_signal": {
+        "lookback_days": 200,
+        "amplified_base": {"job_posted_infra": {"M": 25, "C": 0}, "api_launched": {"C": 33}},
+    },
+    "caps": {"jobs_momentum": 25, "jobs_complexity": 15, "founder_urgency": 20},
+    "composite_weights": {"M": 0.4, "C": 0.2, "P": 0.25},
+    "decay": {
+        "momentum": {"0-14": 1.0, "15-45": 0.5, "46+": 0.1},
+        "pressure": {"0-60": 0.9, "61-90": 0.3},
+    },
+    "suppressors": {"cto_hired_60_days": 60, "cto_hired_180_days": 30},
+    "minimum_threshold": 20,
+    "disqualifier_signals": {"cto_hired": 90, "unknown_type": 10, "launch_major": 0},
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_profiles():
+    clear_scoring_profile_cache()
+    yield
+    clear_scoring_profile_cache()
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_default_profile_matches_reference(seed: int) -> None:
+    rng = random.Random(seed)
+    events = _random_events(rng, rng.randint(0, 40))
+    status = rng.choice([None, "active", "acquired", " Dead "])
+    limit = rng.choice([3, 8, 50])
+    assert compute_readiness(events, AS_OF, status, limit) == _reference_readiness(
+        events, AS_OF, status, limit
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_shipped_packs_match_reference(seed: int) -> None:
+    rng = random.Random(1000 + seed)
+    events = _random_events(rng, 30)
+    for pack in _shipped_packs():
+        assert compute_readiness(events, AS_OF, pack=pack) == _reference_readiness(
+            events, AS_OF, pack=pack
+        ), pack.manifest.get("id")
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_edge_case_scoring_config_matches_reference(seed: int) -> None:
+    rng = random.Random(2000 + seed)
+    events = _random_events(rng, rng.randint(1, 40))
+    pack = SimpleNamespace(scoring=_EDGE_SCORING)
+    assert compute_readiness(events, AS_OF, pack=pack) == _reference_readiness(
+        events, AS_OF, pack=pack
+    )
+
+
+def test_without_funding_quiet_amplification_matches_reference() -> None:
+    """No funding_raised in lookback: amplified bases and explain list match."""
+    events = [
+        _Event("job_posted_infra", datetime(2026, 2, 20, tzinfo=UTC), 0.8),
+        _Event("api_launched", datetime(2026, 1, 1, tzinfo=UTC), None),
+        _Event("compliance_mentioned", datetime(2025, 6, 1, tzinfo=UTC), 0.6),
+        _Event("funding_raised", datetime(2024, 1, 1, tzinfo=UTC), 0.9),
+    ]
+    result = compute_readiness(events, AS_OF)
+    assert result == _reference_readiness(events, AS_OF)
+    assert result["explain"]["quiet_signal_amplification_applied"]
+
+
+def test_profile_is_cached_per_pack_scoring() -> None:
+    pack = SimpleNamespace(scoring=dict(_EDGE_SCORING))
+    profile = get_scoring_profile(pack)
+    assert isinstance(profile, ScoringProfile)
+    assert get_scoring_profile(pack) is profile
+    pack.scoring = dict(_EDGE_SCORING)
+    assert get_scoring_profile(pack) is not profile
+    assert get_scoring_profile(None) is get_scoring_profile(None)
+
+
+def test_decay_curve_matches_breakpoint_scan() -> None:
+    profile = get_scoring_profile(SimpleNamespace(scoring=_EDGE_SCORING))
+    for days in range(0, 200):
+        expected = next(
+            (float(m) for max_days, m in profile.cfg["decay_momentum"] if days <= max_days), 0.0
+        )
+        assert profile.decay_momentum(days) == expected
@@ -0,0 +1,300 @@
+"""Vectorized readiness scoring (app.services.readiness.vectorized, bulk_scoring).
+
+Each (company, as_of) score must equal compute_readiness on the events known that
+day, dated in [as_of - 365, as_of], including the explain payload.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import UTC, date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from app.models import Company, ReadinessSnapshot, SignalEvent, SignalInstance  # noqa: E402
+from app.services.pack_resolver import resolve_pack  # noqa: E402
+from app.services.readiness.backfill import run_readiness_backfill  # noqa: E402
+from app.services.readiness.bulk_scoring import (  # noqa: E402
+    compute_bulk_readiness,
+    date_range,
+    write_bulk_readiness_snapshots,
+)
+from app.services.readiness.readiness_engine import compute_readiness  # noqa: E402
+from app.services.readiness.scoring_profile import get_scoring_profile  # noqa: E402
+from app.services.readiness.snapshot_writer import write_readiness_snapshot  # noqa: E402
+from app.services.readiness.vectorized import (  # noqa: E402
+    EventColumns,
+    iter_readiness_days,
+    score_readiness_matrix,
+)
+from tests.test_readiness_kernel_parity import (  # noqa: E402
+    _EDGE_SCORING,
+    EVENT_TYPES,
+    _Event,
+    _shipped_packs,
+)
+
+START = date(2026, 1, 20)
+DATES = date_range(START, START + timedelta(days=40))
+
+
+def _company_events(rng: random.Random, n: int) -> list[_Event]:
+    events = []
+    for i in range(n):
+        days = rng.choice([rng.randint(-30, 130), rng.randint(-30, 420), 0, 60, 120, 365, 366])
+        when = datetime.combine(START, datetime.min.time(), tzinfo=UTC) - timedelta(
+            days=days, hours=rng.randint(0, 23)
+        )
+        events.append(
+            _Event(
+                event_type=rng.choice(EVENT_TYPES),
+                event_time=when.date() if rng.random() < 0.1 else when,
+                confidence=rng.choice([None, 0.0, 0.35, 0.7, 1.0, 1.4, rng.random()]),
+                source=rng.choice([None, "news"]),
+                url=f"https://example.com/{i}",
+            )
+        )
+    events.sort(key=lambda ev: ev.event_time.isoformat()[:10], reverse=True)
+    return events
+
+
+def _known_on(events: list[_Event], as_of: date) -> list[_Event]:
+    out = []
+    for ev in events:
+        ev_date = ev.event_time if not hasattr(ev.event_time, "date") else ev.event_time.date()
+        if 0 <= (as_of - ev_date).days <= 365:
+            out.append(ev)
+    return out
+
+
+def _assert_matches_reference(event_lists, pack=None, statuses=None) -> None:
+    columns = EventColumns.from_event_lists(event_lists)
+    profile = get_scoring_profile(pack)
+    for day in iter_readiness_days(profile, columns, DATES, statuses):
+        for idx, events in enumerate(event_lists):
+            known = _known_on(events, day.as_of)
+            assert bool(day.has_events[idx]) == bool(known)
+            if not known:
+                continue
+            status = statuses[idx] if statuses else None
+            expected = compute_readiness(known, day.as_of, status, pack=pack)
+            assert day.result(idx) == expected, (day.as_of, idx)
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_default_profile_matches_compute_readiness(seed: int) -> None:
+    rng = random.Random(seed)
+    event_lists = [_company_events(rng, rng.randint(0, 25)) for _ in range(12)]
+    statuses = [rng.choice([None, "active", "acquired", " Dead "]) for _ in event_lists]
+    _assert_matches_reference(event_lists, statuses=statuses)
+
+
+def test_shipped_packs_match_compute_readiness() -> None:
+    rng = random.Random(77)
+    event_lists = [_company_events(rng, 20) for _ in range(6)]
+    for pack in _shipped_packs():
+        _assert_matches_reference(event_lists, pack=pack)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_edge_scoring_config_matches_compute_readiness(seed: int) -> None:
+    rng = random.Random(500 + seed)
+    event_lists = [_company_events(rng, rng.randint(1, 25)) for _ in range(8)]
+    _assert_matches_reference(event_lists, pack=SimpleNamespace(scoring=_EDGE_SCORING))
+
+
+def test_matrix_shape_and_empty_inputs() -> None:
+    profile = get_scoring_profile(None)
+    columns = EventColumns.from_event_lists([[], [_Event("api_launched", START, 0.9)]])
+    scores = score_readiness_matrix(profile, columns, DATES[:3])
+    assert scores["composite"].shape == (3, 2)
+    assert scores["has_events"][:, 0].tolist() == [False, False, False]
+    assert scores["has_events"][:, 1].all()
+
+    empty = score_readiness_matrix(profile, EventColumns.from_event_lists([]), [])
+    assert empty["composite"].shape == (0, 0)
+
+
+def test_bulk_snapshots_match_nightly_writer(db, fractional_cto_pack_id) -> None:
+    """Bulk-written snapshots equal write_readiness_snapshot for each day."""
+    rng = random.Random(9)
+    companies = []
+    for i in range(3):
+        company = Company(name=f"BulkCo{i}", website_url=f"https://bulk{i}.example.com")
+        db.add(company)
+        db.flush()
+        companies.append(company)
+        for ev in _company_events(rng, 15):
+            # The nightly writer runs on today, so it never sees events dated after as_of
+            if not hasattr(ev.event_time, "date") or ev.event_time.date() > START:
+                continue
+            db.add(
+                SignalEvent(
+                    company_id=company.id,
+                    source=ev.source or "test",
+                    event_type=ev.event_type,
+                    event_time=ev.event_time,
+                    confidence=ev.confidence,
+                    url=ev.url,
+                    pack_id=fractional_cto_pack_id,
+                )
+            )
+    db.commit()
+    ids = [c.id for c in companies]
+    end = START + timedelta(days=2)
+
+    summary = write_bulk_readiness_snapshots(db, START, end, fractional_cto_pack_id, ids)
+    bulk = {
+        (s.company_id, s.as_of): (s.composite, s.momentum, s.explain)
+        for s in db.query(ReadinessSnapshot).filter(ReadinessSnapshot.company_id.in_(ids))
+    }
+    assert summary["snapshots_written"] == len(bulk) > 0
+    db.query(ReadinessSnapshot).filter(ReadinessSnapshot.company_id.in_(ids)).delete()
+    db.commit()
+
+    pack = resolve_pack(db, fractional_cto_pack_id)
+    assert pack is not None
+    for as_of in date_range(START, end):
+        for company_id in ids:
+            snapshot = write_readiness_snapshot(
+                db, company_id, as_of, pack_id=fractional_cto_pack_id
+            )
+            if snapshot is None:
+                assert (company_id, as_of) not in bulk
+                continue
+            assert bulk[(company_id, as_of)] == (
+                snapshot.composite,
+                snapshot.momentum,
+                snapshot.explain,
+            )
+
+    whatif = compute_bulk_readiness(
+        db, START, end, fractional_cto_pack_id, ids, scoring={"composite_weights": {"M": 1.0}}
+    )
+    assert whatif.company_ids == ids
+    assert whatif.scores["composite"].shape == (3, 3)
+
+
+def test_bulk_snapshots_match_nightly_writer_with_core_instances(
+    db, fractional_cto_pack_id, core_pack_id
+) -> None:
+    """Core instances are the event source (pack events only as fallback), as nightly."""
+    rng = random.Random(21)
+    end = START + timedelta(days=2)
+    ids = []
+    for i in range(3):
+        company = Company(name=f"BulkCore{i}", website_url=f"https://bulkcore{i}.example.com")
+        db.add(company)
+        db.flush()
+        ids.append(company.id)
+        events = [
+            ev
+            for ev in _company_events(rng, 12)
+            if hasattr(ev.event_time, "date") and ev.event_time.date() <= START
+        ]
+        for ev in events:
+            # Pack copies are ignored while the company has core instances
+            for pack_id in (core_pack_id, fractional_cto_pack_id):
+                db.add(
+                    SignalEvent(
+                        company_id=company.id,
+                        source="test",
+                        event_type=ev.event_type,
+                        event_time=ev.event_time,
+                        confidence=ev.confidence,
+                        url=ev.url,
+                        pack_id=pack_id,
+                    )
+                )
+        db.flush()
+        if i == 2:
+            continue  # no core instances: pack-event fallback
+        core_events = (
+            db.query(SignalEvent)
+            .filter(SignalEvent.company_id == company.id, SignalEvent.pack_id == core_pack_id)
+            .all()
+        )
+        db.add(
+            SignalInstance(
+                entity_id=company.id,
+                signal_id="evidence",
+                pack_id=core_pack_id,
+                evidence_event_ids=[ev.id for ev in core_events[: len(core_events) // 2]],
+            )
+        )
+        db.add(
+            SignalInstance(
+                entity_id=company.id,
+                signal_id="cto_role_posted",
+                pack_id=core_pack_id,
+                last_seen=datetime.combine(START, datetime.min.time(), tzinfo=UTC),
+                confidence=0.9,
+            )
+        )
+    db.commit()
+
+    write_bulk_readiness_snapshots(db, START, end, fractional_cto_pack_id, ids)
+    bulk = {
+        (s.company_id, s.as_of): (s.composite, s.momentum, s.explain)
+        for s in db.query(ReadinessSnapshot).filter(ReadinessSnapshot.company_id.in_(ids))
+    }
+    db.query(ReadinessSnapshot).filter(ReadinessSnapshot.company_id.in_(ids)).delete()
+    db.commit()
+
+    nightly = {}
+    for as_of in date_range(START, end):
+        for company_id in ids:
+            snapshot = write_readiness_snapshot(
+                db, company_id, as_of, pack_id=fractional_cto_pack_id, core_pack_id=core_pack_id
+            )
+            if snapshot is not None:
+                nightly[(company_id, as_of)] = (
+                    snapshot.composite,
+                    snapshot.momentum,
+                    snapshot.explain,
+                )
+    assert bulk == nightly
+    assert len(nightly) == 9
+
+
+def test_bulk_snapshots_match_backfill_with_events_after_as_of(db, fractional_cto_pack_id) -> None:
+    """An event dated after a day is not known that day, in bulk scoring as in the backfill."""
+    as_of = date(2026, 2, 1)
+    company = Company(name="BulkLater", website_url="https://bulklater.example.com")
+    db.add(company)
+    db.flush()
+    for event_type, day in (
+        ("funding_raised", date(2026, 3, 10)),
+        ("cto_role_posted", date(2026, 1, 5)),
+    ):
+        db.add(
+            SignalEvent(
+                company_id=company.id,
+                source="test",
+                event_type=event_type,
+                event_time=datetime.combine(day, datetime.min.time(), tzinfo=UTC),
+                confidence=0.9,
+                pack_id=fractional_cto_pack_id,
+            )
+        )
+    db.commit()
+
+    def snapshot() -> tuple:
+        row = (
+            db.query(ReadinessSnapshot)
+            .filter(ReadinessSnapshot.company_id == company.id, ReadinessSnapshot.as_of == as_of)
+            .one()
+        )
+        return row.composite, row.momentum, row.explain
+
+    write_bulk_readiness_snapshots(db, as_of, as_of, fractional_cto_pack_id, [company.id])
+    bulk = snapshot()
+    run_readiness_backfill(
+        db, as_of, as_of, pack_id=fractional_cto_pack_id, company_ids=[company.id]
+    )
+    assert snapshot() == bulk
+    assert bulk[1] == 0
+    assert [e["event_type"] for e in bulk[2]["top_events"]] == ["cto_role_posted"]
@@ -213,6 +213,85 @@ class TestRunScanCompanyFull:
         assert call_kwargs["pack_id"] == workspace_pack_uuid
         assert call_kwargs["pack"] == mock_pack
 
+    @pytest.mark.asyncio
+    @patch("app.services.scan_orchestrator.get_corpus_fingerprint")
+    @patch("app.services.scan_orchestrator.score_company")
+    @patch("app.services.scan_orchestrator.analyze_company")
+    @patch("app.services.scan_orchestrator.run_scan_company", new_callable=AsyncMock)
+    async def test_reuses_previous_analysis_when_corpus_unchanged(
+        self, mock_scan, mock_analyze, mock_score, mock_fingerprint
+    ):
+        """No new signals + matching fingerprint → previous analysis reused, no LLM calls."""
+        from app.services.scan_orchestrator import run_scan_company_full
+
+        pack_uuid = uuid4()
+        mock_pack = MagicMock()
+        prev = _analysis("scaling_team")
+        prev.id = 7
+        prev.pack_id = pack_uuid
+        prev.corpus_fingerprint = "abc123"
+        db = MagicMock()
+        db.query.return_value.filter.return_value.order_by.return_value.first.return_value = prev
+        mock_scan.return_value = 0
+        mock_fingerprint.return_value = "abc123"
+
+        new_count, result_analysis, changed = await run_scan_company_full(
+            db, 1, pack=mock_pack, pack_id=pack_uuid
+        )
+
+        assert new_count == 0
+        assert result_analysis is prev
+        assert changed is False
+        mock_fingerprint.assert_called_once_with(db, 1, mock_pack)
+        mock_analyze.assert_not_called()
+        mock_score.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "new_count, current_fingerprint, prev_pack_matches",
+        [
+            (1, "abc123", True),  # new signals stored
+            (0, "def456", True),  # corpus/pack/prompt inputs changed
+            (0, "abc123", False),  # previous analysis belongs to another pack
+        ],
+    )
+    @patch("app.services.scan_orchestrator.get_corpus_fingerprint")
+    @patch("app.services.scan_orchestrator.score_company")
+    @patch("app.services.scan_orchestrator.analyze_company")
+    @patch("app.services.scan_orchestrator.run_scan_company", new_callable=AsyncMock)
+    async def test_reanalyzes_when_corpus_changed(
+        self,
+        mock_scan,
+        mock_analyze,
+        mock_score,
+        mock_fingerprint,
+        new_count,
+        current_fingerprint,
+        prev_pack_matches,
+    ):
+        """Re-analysis runs unless no new signals, same pack and identical fingerprint."""
+        from app.services.scan_orchestrator import run_scan_company_full
+
+        pack_uuid = uuid4()
+        mock_pack = MagicMock()
+        prev = _analysis("scaling_team")
+        prev.pack_id = pack_uuid if prev_pack_matches else uuid4()
+        prev.corpus_fingerprint = "abc123"
+        db = MagicMock()
+        db.query.return_value.filter.return_value.order_by.return_value.first.return_value = prev
+        mock_scan.return_value = new_count
+        mock_fingerprint.return_value = current_fingerprint
+        analysis = _analysis("scaling_team")
+        mock_analyze.return_value = analysis
+
+        _, result_analysis, _ = await run_scan_company_full(
+            db, 1, pack=mock_pack, pack_id=pack_uuid
+        )
+
+        assert result_analysis is analysis
+        mock_analyze.assert_called_once_with(db, 1, pack=mock_pack, pack_id=pack_uuid)
+        mock_score.assert_called_once()
+
 
 # ── run_scan_company tests ───────────────────────────────────────────
 
@@ -610,3 +689,36 @@ class TestRunScanCompanyWithJob:
         assert added_job.pack_id == pack_uuid
         assert added_job.workspace_id == UUID(DEFAULT_WORKSPACE_ID)
         mock_get_pack_id.assert_called_once_with(db)
+
+    @pytest.mark.asyncio
+    @patch("app.services.scan_orchestrator.get_corpus_fingerprint")
+    @patch("app.services.scan_orchestrator.resolve_pack")
+    @patch("app.services.scan_orchestrator.get_default_pack_id")
+    @patch("app.services.scan_orchestrator.score_company")
+    @patch("app.services.scan_orchestrator.analyze_company")
+    @patch("app.services.scan_orchestrator.run_scan_company", new_callable=AsyncMock)
+    async def test_reuses_previous_analysis_when_corpus_unchanged(
+        self, mock_scan, mock_analyze, mock_score, mock_get_pack_id, mock_resolve, mock_fingerprint
+    ):
+        """UI rescan with no new signals and a matching fingerprint makes no LLM calls."""
+        from app.services.scan_orchestrator import run_scan_company_with_job
+
+        pack_uuid = uuid4()
+        mock_pack = MagicMock()
+        mock_get_pack_id.return_value = pack_uuid
+        mock_resolve.return_value = mock_pack
+        prev = _analysis("scaling_team")
+        prev.id = 7
+        prev.pack_id = pack_uuid
+        prev.corpus_fingerprint = "abc123"
+        db = MagicMock()
+        db.query.return_value.filter.return_value.order_by.return_value.first.return_value = prev
+        mock_scan.return_value = 0
+        mock_fingerprint.return_value = "abc123"
+
+        job = await run_scan_company_with_job(db, 1)
+
+        assert job.status == "completed"
+        mock_fingerprint.assert_called_once_with(db, 1, mock_pack)
+        mock_analyze.assert_not_called()
+        mock_score.assert_not_called()
@@ -19,6 +19,9 @@ from app.models import (
     Watchlist,
     Workspace,
 )
+from app.services.esl.engagement_snapshot_writer import (
+    write_engagement_snapshots_batch as real_batch,
+)
 from app.services.readiness.score_nightly import run_score_nightly
 from app.services.readiness.snapshot_writer import write_readiness_snapshot as real_write
 
@@ -365,6 +368,88 @@ class TestRunScoreNightly:
         )
         assert count_after == count_before
 
+    def test_esl_batch_failure_skips_only_the_bad_company(
+        self, db: Session, fractional_cto_pack_id
+    ) -> None:
+        """A failing ESL batch is retried per company; only the bad one loses its snapshot."""
+        good = Company(name="EslGoodCo", website_url="https://esl-good.example.com")
+        bad = Company(name="EslBadCo", website_url="https://esl-bad.example.com")
+        db.add_all([good, bad])
+        db.commit()
+        for company in (good, bad):
+            db.add(
+                SignalEvent(
+                    company_id=company.id,
+                    source="test",
+                    event_type="funding_raised",
+                    event_time=_days_ago(5),
+                    confidence=0.9,
+                    pack_id=fractional_cto_pack_id,
+                )
+            )
+        db.commit()
+
+        def failing_batch(db, composites, *args, **kwargs):
+            if bad.id in composites:
+                raise RuntimeError("bad ESL input")
+            return real_batch(db, composites, *args, **kwargs)
+
+        with patch(
+            "app.services.readiness.score_nightly.write_engagement_snapshots_batch",
+            side_effect=failing_batch,
+        ):
+            result = run_score_nightly(db)
+
+        assert result["status"] == "completed"
+        engaged = {
+            row.company_id
+            for row in db.query(EngagementSnapshot).filter(
+                EngagementSnapshot.company_id.in_([good.id, bad.id]),
+                EngagementSnapshot.as_of == date.today(),
+            )
+        }
+        assert engaged == {good.id}
+        job = db.query(JobRun).filter(JobRun.id == result["job_run_id"]).one()
+        assert f"ESL for company {bad.id}" in job.error_message
+
+    def test_esl_statements_do_not_grow_with_chunk_size(
+        self, db: Session, fractional_cto_pack_id
+    ) -> None:
+        """The ESL phase issues a fixed number of statements, even on an expiring Session.
+
+        Each company's readiness commit expires the snapshots scored before it
+        (SessionLocal expires on commit), so the ESL batch must not read them back.
+        """
+        session = Session(bind=db.connection(), join_transaction_mode="create_savepoint")
+        ids = []
+        for i in range(8):
+            company = Company(name=f"EslChunk{i}", website_url=f"https://esl-chunk{i}.example.com")
+            session.add(company)
+            session.flush()
+            session.add(
+                SignalEvent(
+                    company_id=company.id,
+                    source="test",
+                    event_type="funding_raised",
+                    event_time=_days_ago(5 + i),
+                    confidence=0.9,
+                    pack_id=fractional_cto_pack_id,
+                )
+            )
+            ids.append(company.id)
+        session.commit()
+
+        def esl_statements(company_ids: list[int]) -> int:
+            result = run_score_nightly(session, company_ids=company_ids)
+            assert result["companies_engagement"] == len(company_ids)
+            job = session.get(JobRun, result["job_run_id"])
+            return job.metrics["spans"]["score.esl"]["statements"]
+
+        try:
+            assert esl_statements(ids[:2]) == esl_statements(ids)
+        finally:
+            session.close()
+
     def test_scores_match_golden_values(self, db: Session, fractional_cto_pack_id) -> None:
         """Snapshot dimensions match expected values from engine (Issue #91, v2-spec §11)."""
         company = Company(